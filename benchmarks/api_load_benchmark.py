@@ -0,0 +1,308 @@
+import argparse
+import asyncio
+import json
+import multiprocessing
+import platform
+import socket
+import statistics
+import sys
+import tempfile
+import time
+from multiprocessing.context import SpawnProcess
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Iterator
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1].joinpath('src', 'backend')))
+
+import uvicorn
+from dependency_injector.providers import Singleton
+from httpx import AsyncClient, Limits, Response as HttpResponse, TransportError
+
+from app import App
+from container import Container
+from fake_audio_downloader import FakeAudioDownloader
+from fake_audio_sources_repository import FakeAudioSourcesRepository
+
+
+default_baseline_path: Path = Path(__file__).resolve().parent.joinpath('baselines', 'api_load_benchmark.json')
+scenario_names: list[str] = ['login', 'search', 'add', 'listing', 'stream']
+user_password: str = 'benchmark_password'
+
+
+def get_free_port() -> int:
+    server_socket: socket.socket
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as server_socket:
+        server_socket.bind(('127.0.0.1', 0))
+        return server_socket.getsockname()[1]
+
+
+def run_app(port: int, directory_path: Path, configuration: dict[str, Any]) -> None:
+    container: Container = Container()
+    container.configuration.database_path.override(directory_path.joinpath('audio-nest.db'))
+    container.configuration.audio_directory_path.override(directory_path.joinpath('audio'))
+    container.configuration.password_hashing_rounds.override(configuration['password_hashing_rounds'])
+    container.audio_downloader.override(
+        Singleton(
+            FakeAudioDownloader,
+            bit_rate_kbps=container.configuration.audio_bit_rate_kbps,
+            codec=container.configuration.audio_codec,
+            download_directory_path=container.configuration.audio_directory_path,
+            latency_seconds=configuration['download_latency_seconds'],
+            file_size_bytes=configuration['file_size_bytes']
+        )
+    )
+    # Only the search provider is faked, so the search cache in front of it is measured as deployed
+    container.audio_sources_repository.add_kwargs(
+        audio_sources_repository=Singleton(
+            FakeAudioSourcesRepository,
+            latency_seconds=configuration['search_latency_seconds'],
+            max_results=container.configuration.youtube_search_max_results
+        )
+    )
+    uvicorn.run(app=App(container), host='127.0.0.1', port=port, log_level='warning', access_log=False)
+
+
+async def wait_for_app(client: AsyncClient, app_process: SpawnProcess, timeout_seconds: float = 30) -> None:
+    deadline: float = time.monotonic() + timeout_seconds
+    while time.monotonic() < deadline:
+        if not app_process.is_alive():
+            raise RuntimeError(f'Application process exited with code {app_process.exitcode}')
+        try:
+            if (await client.get('/metrics')).is_success:
+                return
+        except TransportError:
+            pass
+        await asyncio.sleep(0.1)
+    raise TimeoutError(f'Application not ready after {timeout_seconds}s')
+
+
+async def log_user_in(client: AsyncClient, username: str, semaphore: asyncio.Semaphore) -> str:
+    async with semaphore:
+        response: HttpResponse
+        path: str
+        for path in ('/api/auth/register', '/api/auth/token'):
+            response = await client.post(path, data={'username': username, 'password': user_password})
+            # Password hashing sheds load with 503 responses, setup simply waits for it to drain
+            while response.status_code == 503:
+                await asyncio.sleep(1)
+                response = await client.post(path, data={'username': username, 'password': user_password})
+            response.raise_for_status()
+        return response.json()['access_token']
+
+
+def get_scenario_requests(
+    client: AsyncClient,
+    arguments: argparse.Namespace,
+    usernames: list[str],
+    access_tokens: list[str]
+) -> dict[str, Callable[[int], Awaitable[HttpResponse]]]:
+    def get_headers(request_index: int) -> dict[str, str]:
+        return {'Authorization': f'Bearer {access_tokens[request_index % len(access_tokens)]}'}
+
+    def get_source_id(source_index: int) -> str:
+        return f'benchmark_source_{source_index % arguments.sources:04d}'
+
+    return {
+        'login': lambda request_index: client.post(
+            '/api/auth/token',
+            data={'username': usernames[request_index % len(usernames)], 'password': user_password}
+        ),
+        'search': lambda request_index: client.get(
+            '/api/sources',
+            params={'search_query': f'benchmark query {request_index % arguments.search_queries}'}
+        ),
+        # Each request adds a distinct source for its user, so adds never conflict
+        'add': lambda request_index: client.put(
+            f'/api/sources/{get_source_id(request_index // len(usernames))}/audio',
+            json={'audioName': f'Benchmark audio {request_index}'},
+            headers=get_headers(request_index)
+        ),
+        'listing': lambda request_index: client.get(
+            '/api/user-audio',
+            params={'limit': 100},
+            headers=get_headers(request_index)
+        ),
+        'stream': lambda request_index: client.get(
+            f'/api/sources/{get_source_id(request_index)}/audio',
+            params={'stream': 'true'}
+        )
+    }
+
+
+async def send_requests(
+    request_indexes: Iterator[int],
+    send_request: Callable[[int], Awaitable[HttpResponse]],
+    latencies_seconds: list[float],
+    results: dict[str, int]
+) -> None:
+    request_index: int
+    for request_index in request_indexes:
+        start_time: float = time.perf_counter()
+        response: HttpResponse = await send_request(request_index)
+        latencies_seconds.append(time.perf_counter() - start_time)
+        results['errors'] += response.is_error
+        results['response_bytes'] += len(response.content)
+
+
+async def run_scenario(
+    send_request: Callable[[int], Awaitable[HttpResponse]],
+    request_count: int,
+    concurrency: int
+) -> dict[str, float]:
+    request_indexes: Iterator[int] = iter(range(request_count))
+    latencies_seconds: list[float] = []
+    results: dict[str, int] = {'errors': 0, 'response_bytes': 0}
+    start_time: float = time.perf_counter()
+    await asyncio.gather(
+        *(send_requests(request_indexes, send_request, latencies_seconds, results) for _ in range(concurrency))
+    )
+    elapsed_seconds: float = time.perf_counter() - start_time
+    percentiles_seconds: list[float] = statistics.quantiles(latencies_seconds, n=100, method='inclusive')
+    return {
+        'requests': request_count,
+        'errors': results['errors'],
+        'elapsed_seconds': round(elapsed_seconds, 3),
+        'throughput_rps': round(request_count / elapsed_seconds, 1),
+        'throughput_mib_per_second': round(results['response_bytes'] / 1024 ** 2 / elapsed_seconds, 1),
+        'p50_ms': round(percentiles_seconds[49] * 1000, 1),
+        'p95_ms': round(percentiles_seconds[94] * 1000, 1),
+        'p99_ms': round(percentiles_seconds[98] * 1000, 1)
+    }
+
+
+async def run_benchmark(base_url: str, app_process: SpawnProcess, arguments: argparse.Namespace) -> dict[str, Any]:
+    client: AsyncClient
+    async with AsyncClient(
+        base_url=base_url,
+        limits=Limits(max_connections=arguments.concurrency),
+        timeout=60
+    ) as client:
+        await wait_for_app(client, app_process)
+        usernames: list[str] = [f'benchmark_user_{user_index}@audio-nest.local' for user_index in range(arguments.users)]
+        semaphore: asyncio.Semaphore = asyncio.Semaphore(arguments.concurrency)
+        access_tokens: list[str] = list(
+            await asyncio.gather(*(log_user_in(client, username, semaphore) for username in usernames))
+        )
+        scenario_requests: dict[str, Callable[[int], Awaitable[HttpResponse]]] = get_scenario_requests(
+            client=client,
+            arguments=arguments,
+            usernames=usernames,
+            access_tokens=access_tokens
+        )
+        scenario_results: dict[str, dict[str, float]] = {}
+        scenario_name: str
+        for scenario_name in arguments.scenarios:
+            scenario_results[scenario_name] = await run_scenario(
+                send_request=scenario_requests[scenario_name],
+                request_count=arguments.login_requests if scenario_name == 'login' else arguments.requests,
+                concurrency=arguments.concurrency
+            )
+            print_scenario_results(scenario_name, scenario_results[scenario_name])
+        return scenario_results
+
+
+def print_scenario_results(scenario_name: str, results: dict[str, float]) -> None:
+    print(
+        f'{scenario_name:<8} {results["requests"]} requests in {results["elapsed_seconds"]:.2f}s '
+        f'({results["throughput_rps"]:.1f} requests/s, {results["throughput_mib_per_second"]:.1f} MiB/s, '
+        f'{results["errors"]} errors): p50 {results["p50_ms"]:.1f}ms, p95 {results["p95_ms"]:.1f}ms, '
+        f'p99 {results["p99_ms"]:.1f}ms'
+    )
+
+
+def compare_with_baseline(
+    baseline: dict[str, Any],
+    configuration: dict[str, Any],
+    scenario_results: dict[str, dict[str, float]],
+    max_regression: float
+) -> bool:
+    if baseline['configuration'] != configuration:
+        print(f'Baseline was recorded with a different configuration: {baseline["configuration"]}')
+    is_regressed: bool = False
+    scenario_name: str
+    results: dict[str, float]
+    for scenario_name, results in scenario_results.items():
+        baseline_results: dict[str, float] | None = baseline['scenarios'].get(scenario_name)
+        if baseline_results is None:
+            continue
+        p95_change: float = results['p95_ms'] / baseline_results['p95_ms'] - 1
+        throughput_change: float = results['throughput_rps'] / baseline_results['throughput_rps'] - 1
+        is_scenario_regressed: bool = p95_change > max_regression or throughput_change < -max_regression
+        is_regressed = is_regressed or is_scenario_regressed
+        print(
+            f'{scenario_name:<8} p95 {baseline_results["p95_ms"]:.1f}ms -> {results["p95_ms"]:.1f}ms '
+            f'({p95_change:+.0%}), throughput {baseline_results["throughput_rps"]:.1f} -> '
+            f'{results["throughput_rps"]:.1f} requests/s ({throughput_change:+.0%})'
+            f'{" REGRESSION" if is_scenario_regressed else ""}'
+        )
+    return is_regressed
+
+
+def main() -> None:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        description='Measure API latency and throughput under concurrent clients, with fake download and search '
+                    'providers so runs are offline and repeatable'
+    )
+    parser.add_argument('--scenarios', nargs='+', choices=scenario_names, default=scenario_names)
+    parser.add_argument('--concurrency', type=int, default=8)
+    parser.add_argument('--requests', type=int, default=200)
+    parser.add_argument('--login-requests', type=int, default=50)
+    parser.add_argument('--users', type=int, default=20)
+    parser.add_argument('--sources', type=int, default=50)
+    parser.add_argument('--search-queries', type=int, default=50)
+    parser.add_argument('--download-latency-seconds', type=float, default=0.2)
+    parser.add_argument('--search-latency-seconds', type=float, default=0.3)
+    parser.add_argument('--file-size-bytes', type=int, default=1024 * 1024)
+    parser.add_argument('--password-hashing-rounds', type=int, default=12)
+    parser.add_argument('--baseline-path', type=Path, default=default_baseline_path)
+    parser.add_argument('--save-baseline', action='store_true')
+    parser.add_argument('--max-regression', type=float, default=0.2)
+    arguments: argparse.Namespace = parser.parse_args()
+    if min(arguments.requests, arguments.login_requests) < 2:
+        parser.error('at least 2 requests per scenario are needed to compute percentiles')
+    configuration: dict[str, Any] = {
+        name: value
+        for name, value in vars(arguments).items()
+        if name not in ('baseline_path', 'save_baseline', 'max_regression')
+    }
+    port: int = get_free_port()
+    directory: str
+    with tempfile.TemporaryDirectory() as directory:
+        app_process: SpawnProcess = multiprocessing.get_context('spawn').Process(
+            target=run_app,
+            args=(port, Path(directory), configuration)
+        )
+        app_process.start()
+        try:
+            scenario_results: dict[str, dict[str, float]] = asyncio.run(
+                run_benchmark(base_url=f'http://127.0.0.1:{port}', app_process=app_process, arguments=arguments)
+            )
+        finally:
+            app_process.terminate()
+            app_process.join(timeout=30)
+    if arguments.save_baseline:
+        arguments.baseline_path.parent.mkdir(parents=True, exist_ok=True)
+        arguments.baseline_path.write_text(
+            json.dumps(
+                {
+                    'configuration': configuration,
+                    'platform': platform.platform(),
+                    'python': platform.python_version(),
+                    'scenarios': scenario_results
+                },
+                indent=2
+            )
+        )
+        print(f'Baseline saved to {arguments.baseline_path}')
+    elif arguments.baseline_path.is_file():
+        if compare_with_baseline(
+            baseline=json.loads(arguments.baseline_path.read_text()),
+            configuration=configuration,
+            scenario_results=scenario_results,
+            max_regression=arguments.max_regression
+        ):
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
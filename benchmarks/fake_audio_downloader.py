@@ -0,0 +1,91 @@
+import asyncio
+import hashlib
+import math
+from pathlib import Path
+from typing import AsyncGenerator
+from uuid import uuid4
+
+from yt_dlp.postprocessor.ffmpeg import ACODECS
+
+from audio_nest.domain.audio import Audio
+from audio_nest.domain.audio_codec import AudioCodec
+from audio_nest.domain.audio_download_priority import AudioDownloadPriority
+from audio_nest.domain.audio_download_progress import AudioDownloadProgress
+from audio_nest.domain.audio_download_status import AudioDownloadStatus
+from audio_nest.domain.audio_stream import AudioStream
+from audio_nest.services.i_audio_downloader import IAudioDownloader
+
+
+class FakeAudioDownloader(IAudioDownloader):
+    _bit_rate_kbps: int
+    _codec: AudioCodec
+    _file_extension: str
+    _download_directory_path: Path
+    _latency_seconds: float
+    _file_size_bytes: int
+    _chunk_size_bytes: int
+
+    def __init__(
+        self,
+        bit_rate_kbps: int,
+        codec: AudioCodec,
+        download_directory_path: Path,
+        latency_seconds: float,
+        file_size_bytes: int,
+        chunk_size_bytes: int = 64 * 1024
+    ) -> None:
+        self._bit_rate_kbps = bit_rate_kbps
+        self._codec = codec
+        self._file_extension = ACODECS[codec][0]
+        self._download_directory_path = download_directory_path
+        self._latency_seconds = latency_seconds
+        self._file_size_bytes = file_size_bytes
+        self._chunk_size_bytes = chunk_size_bytes
+
+    async def download_audio_from_source(
+        self,
+        source_id: str,
+        progress: AudioDownloadProgress | None = None,
+        priority: AudioDownloadPriority = AudioDownloadPriority.preview
+    ) -> Audio:
+        progress = progress or AudioDownloadProgress()
+        progress.status = AudioDownloadStatus.downloading
+        progress.total_bytes = self._file_size_bytes
+        audio: Audio = self._get_audio(source_id)
+        await asyncio.sleep(self._latency_seconds)
+        await asyncio.to_thread(self._write_audio_file, audio)
+        progress.downloaded_bytes = self._file_size_bytes
+        return audio
+
+    def stream_audio_from_source(
+        self,
+        source_id: str,
+        priority: AudioDownloadPriority = AudioDownloadPriority.preview
+    ) -> AudioStream:
+        audio: Audio = self._get_audio(source_id)
+        return AudioStream(audio=audio, chunks=self._stream_audio_content(source_id))
+
+    def _get_audio(self, source_id: str) -> Audio:
+        return Audio(
+            source_id=source_id,
+            file_path=self._download_directory_path.joinpath(f'{source_id}.{uuid4().hex}.{self._file_extension}'),
+            bit_rate_kbps=self._bit_rate_kbps,
+            codec=self._codec
+        )
+
+    def _get_audio_content(self, source_id: str) -> bytes:
+        # Deterministic per source, so repeated runs store and serve identical files
+        seed: bytes = hashlib.sha256(source_id.encode()).digest()
+        return (seed * math.ceil(self._file_size_bytes / len(seed)))[:self._file_size_bytes]
+
+    def _write_audio_file(self, audio: Audio) -> None:
+        audio.file_path.parent.mkdir(parents=True, exist_ok=True)
+        audio.file_path.write_bytes(self._get_audio_content(audio.source_id))
+
+    async def _stream_audio_content(self, source_id: str) -> AsyncGenerator[bytes, None]:
+        content: bytes = self._get_audio_content(source_id)
+        chunk_latency_seconds: float = self._latency_seconds / max(1, math.ceil(len(content) / self._chunk_size_bytes))
+        offset: int
+        for offset in range(0, len(content), self._chunk_size_bytes):
+            await asyncio.sleep(chunk_latency_seconds)
+            yield content[offset:offset + self._chunk_size_bytes]
@@ -0,0 +1,26 @@
+import asyncio
+import hashlib
+
+from audio_nest.domain.audio_source import AudioSource
+from audio_nest.services.i_audio_sources_repository import IAudioSourcesRepository
+
+
+class FakeAudioSourcesRepository(IAudioSourcesRepository):
+    _latency_seconds: float
+    _max_results: int
+
+    def __init__(self, latency_seconds: float, max_results: int) -> None:
+        self._latency_seconds = latency_seconds
+        self._max_results = max_results
+
+    async def get_audio_sources(self, search_query: str) -> list[AudioSource]:
+        await asyncio.sleep(self._latency_seconds)
+        query_hash: str = hashlib.sha256(search_query.encode()).hexdigest()[:8]
+        return [
+            AudioSource(
+                id=f'{query_hash}{result_index:03d}',
+                name=f'{search_query} #{result_index + 1}',
+                thumbnail_url=f'https://i.ytimg.com/vi/{query_hash}{result_index:03d}/hqdefault.jpg'
+            )
+            for result_index in range(self._max_results)
+        ]
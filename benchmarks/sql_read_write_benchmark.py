@@ -0,0 +1,127 @@
+import argparse
+import asyncio
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import AsyncGenerator, Sequence
+from uuid import uuid4
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1].joinpath('src', 'backend')))
+
+from sqlalchemy import select
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from sql.domain.sql_audio import SqlAudio
+from sql.domain.sql_user_audio import SqlUserAudio
+from sql.sql_pool_type import SqlPoolType
+from sql.sql_session_maker_handler import handle_sql_session_maker
+
+
+profiles: dict[str, dict[str, str | int | SqlPoolType]] = {
+    'default': {
+        'journal_mode': 'DELETE',
+        'synchronous': 'FULL',
+        'busy_timeout_ms': 0,
+        'cache_size_kib': 2000,
+        'mmap_size_bytes': 0,
+        'pool_type': SqlPoolType.queue
+    },
+    'tuned': {}
+}
+
+
+async def write_user_audio(
+    session_maker: async_sessionmaker[AsyncSession],
+    user_id: str,
+    deadline: float,
+    results: dict[str, int]
+) -> None:
+    while time.monotonic() < deadline:
+        source_id: str = uuid4().hex
+        session: AsyncSession
+        try:
+            async with session_maker() as session:
+                async with session.begin():
+                    sql_audio: SqlAudio = SqlAudio(
+                        source_id=source_id,
+                        file_path=f'{source_id}.ogg',
+                        bit_rate_kbps=320,
+                        codec='vorbis'
+                    )
+                    session.add(
+                        SqlUserAudio(
+                            id=str(uuid4()),
+                            user_id=user_id,
+                            audio_name=source_id,
+                            source_id=source_id,
+                            audio=sql_audio
+                        )
+                    )
+            results['writes'] += 1
+        except OperationalError:
+            results['write_errors'] += 1
+
+
+async def read_user_audio(
+    session_maker: async_sessionmaker[AsyncSession],
+    user_id: str,
+    deadline: float,
+    results: dict[str, int]
+) -> None:
+    while time.monotonic() < deadline:
+        session: AsyncSession
+        try:
+            async with session_maker() as session:
+                rows: Sequence[tuple[str, str]] = (
+                    await session.execute(
+                        select(SqlUserAudio.id, SqlAudio.file_path)
+                        .join(SqlAudio, SqlUserAudio.source_id == SqlAudio.source_id)
+                        .where(SqlUserAudio.user_id == user_id)
+                    )
+                ).all()
+            results['reads'] += 1
+            results['rows'] += len(rows)
+        except OperationalError:
+            results['read_errors'] += 1
+
+
+async def run_profile(name: str, readers: int, writers: int, seconds: float) -> None:
+    directory: str
+    with tempfile.TemporaryDirectory() as directory:
+        session_makers: AsyncGenerator[async_sessionmaker[AsyncSession], None] = handle_sql_session_maker(
+            database_path=Path(directory).joinpath('benchmark.db'),
+            **profiles[name]
+        )
+        session_maker: async_sessionmaker[AsyncSession] = await anext(session_makers)
+        user_id: str = str(uuid4())
+        results: dict[str, int] = {'reads': 0, 'rows': 0, 'read_errors': 0, 'writes': 0, 'write_errors': 0}
+        deadline: float = time.monotonic() + seconds
+        await asyncio.gather(
+            *(write_user_audio(session_maker, user_id, deadline, results) for _ in range(writers)),
+            *(read_user_audio(session_maker, user_id, deadline, results) for _ in range(readers))
+        )
+        await anext(session_makers, None)
+    print(
+        f'{name:>8}: {results["reads"] / seconds:8.1f} reads/s ({results["read_errors"]} errors), '
+        f'{results["writes"] / seconds:8.1f} writes/s ({results["write_errors"]} errors)'
+    )
+
+
+async def main() -> None:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        description='Measure SQLite read throughput while user audio is being written'
+    )
+    parser.add_argument('--readers', type=int, default=8)
+    parser.add_argument('--writers', type=int, default=1)
+    parser.add_argument('--seconds', type=float, default=5)
+    parser.add_argument('--profile', choices=[*profiles, 'all'], default='all')
+    arguments: argparse.Namespace = parser.parse_args()
+    name: str
+    for name in profiles if arguments.profile == 'all' else [arguments.profile]:
+        await run_profile(name=name, readers=arguments.readers, writers=arguments.writers, seconds=arguments.seconds)
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
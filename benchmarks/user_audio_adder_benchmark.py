@@ -0,0 +1,77 @@
+import argparse
+import asyncio
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import AsyncGenerator
+from uuid import UUID, uuid4
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1].joinpath('src', 'backend')))
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from audio_nest.domain.audio_codec import AudioCodec
+from audio_nest.domain.user_audio import UserAudio
+from audio_nest.exceptions.user_audio_already_added_exception import UserAudioAlreadyAddedException
+from audio_nest.use_cases.user_audio_adder import UserAudioAdder
+from sql.sql_session_maker_handler import handle_sql_session_maker
+from sql.sql_user_audio_repository import SqlUserAudioRepository
+
+
+async def add_user_audio(user_audio_adder: UserAudioAdder, user_audio: UserAudio, results: dict[str, int]) -> None:
+    try:
+        await user_audio_adder.add_user_audio(user_audio)
+        results['added'] += 1
+    except UserAudioAlreadyAddedException:
+        results['conflicts'] += 1
+
+
+async def main() -> None:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        description='Measure concurrent user audio adds, including duplicate adds of the same source'
+    )
+    parser.add_argument('--users', type=int, default=20)
+    parser.add_argument('--sources', type=int, default=50)
+    parser.add_argument('--duplicates', type=int, default=3)
+    arguments: argparse.Namespace = parser.parse_args()
+    directory: str
+    with tempfile.TemporaryDirectory() as directory:
+        session_makers: AsyncGenerator[async_sessionmaker[AsyncSession], None] = handle_sql_session_maker(
+            Path(directory).joinpath('benchmark.db')
+        )
+        user_audio_repository: SqlUserAudioRepository = SqlUserAudioRepository(await anext(session_makers))
+        user_audio_adder: UserAudioAdder = UserAudioAdder(user_audio_repository)
+        user_ids: list[UUID] = [uuid4() for _ in range(arguments.users)]
+        user_audio_list: list[UserAudio] = [
+            UserAudio(
+                source_id=f'source_{source_index}',
+                file_path=Path(f'source_{source_index}.ogg'),
+                bit_rate_kbps=320,
+                codec=AudioCodec.vorbis,
+                user_id=user_id,
+                audio_name=f'Source {source_index}'
+            )
+            for user_id in user_ids
+            for source_index in range(arguments.sources)
+            for _ in range(arguments.duplicates)
+        ]
+        results: dict[str, int] = {'added': 0, 'conflicts': 0}
+        start_time: float = time.perf_counter()
+        await asyncio.gather(
+            *(add_user_audio(user_audio_adder, user_audio, results) for user_audio in user_audio_list)
+        )
+        elapsed_seconds: float = time.perf_counter() - start_time
+        stored_count: int = sum(
+            [len(await user_audio_repository.get_user_audio_list(user_id)) for user_id in user_ids]
+        )
+        await anext(session_makers, None)
+    print(
+        f'{len(user_audio_list)} adds in {elapsed_seconds:.2f}s ({len(user_audio_list) / elapsed_seconds:.1f} adds/s): '
+        f'{results["added"]} added, {results["conflicts"]} conflicts, {stored_count} stored '
+        f'(expected {arguments.users * arguments.sources})'
+    )
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
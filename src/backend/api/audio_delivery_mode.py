@@ -0,0 +1,7 @@
+from enum import StrEnum
+
+
+class AudioDeliveryMode(StrEnum):
+    direct = 'direct'
+    x_accel_redirect = 'x_accel_redirect'
+    x_sendfile = 'x_sendfile'
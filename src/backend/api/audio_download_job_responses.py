@@ -0,0 +1,33 @@
+from fastapi.responses import JSONResponse
+
+from api.dtos.audio_download_job_dto import AudioDownloadJobDto
+from audio_nest.domain.audio_download_job import AudioDownloadJob
+
+
+audio_download_jobs_path: str = '/api/jobs'
+
+
+def is_async_response_preferred(prefer: str | None) -> bool:
+    return prefer is not None and any(
+        preference.split(';')[0].strip().lower() == 'respond-async' for preference in prefer.split(',')
+    )
+
+
+def create_audio_download_job_accepted_response(audio_download_job: AudioDownloadJob) -> JSONResponse:
+    return JSONResponse(
+        status_code=202,
+        content=to_audio_download_job_dto(audio_download_job).model_dump(mode='json', by_alias=True),
+        headers={'Location': f'{audio_download_jobs_path}/{audio_download_job.id}'}
+    )
+
+
+def to_audio_download_job_dto(audio_download_job: AudioDownloadJob) -> AudioDownloadJobDto:
+    return AudioDownloadJobDto(
+        id=audio_download_job.id,
+        source_id=audio_download_job.source_id,
+        status=audio_download_job.progress.status,
+        downloaded_bytes=audio_download_job.progress.downloaded_bytes,
+        total_bytes=audio_download_job.progress.total_bytes,
+        percent=audio_download_job.progress.percent,
+        error=audio_download_job.error
+    )
@@ -0,0 +1,68 @@
+import logging
+import mimetypes
+from logging import Logger
+from pathlib import Path
+from urllib.parse import quote
+
+from fastapi.responses import FileResponse, RedirectResponse, Response
+
+from api.audio_delivery_mode import AudioDeliveryMode
+from audio_nest.domain.audio import Audio
+from audio_nest.services.i_audio_storage import IAudioStorage
+
+
+class AudioFileResponseFactory:
+    _log: Logger = logging.getLogger(__name__)
+    _audio_storage: IAudioStorage
+    _delivery_mode: AudioDeliveryMode
+    _directory_path: Path
+    _internal_path_prefix: str
+
+    def __init__(
+        self,
+        audio_storage: IAudioStorage,
+        delivery_mode: AudioDeliveryMode,
+        directory_path: Path,
+        internal_path_prefix: str
+    ) -> None:
+        self._audio_storage = audio_storage
+        self._delivery_mode = delivery_mode
+        self._directory_path = directory_path.resolve()
+        self._internal_path_prefix = internal_path_prefix.rstrip('/')
+
+    async def create_audio_file_response(
+        self,
+        audio: Audio,
+        cache_control: str,
+        if_none_match: str | None
+    ) -> Response:
+        headers: dict[str, str] = {'Cache-Control': cache_control, 'Vary': 'Accept'}
+        if audio.content_hash is not None:
+            # Replaces the modification time based ETag, so If-Range is also checked against the content hash
+            headers['ETag'] = f'"{audio.content_hash}"'
+            if self._is_etag_matched(if_none_match, headers['ETag']):
+                return Response(status_code=304, headers=headers)
+        audio_file_url: str | None = await self._audio_storage.get_audio_file_url(audio.file_path)
+        if audio_file_url is not None:
+            # Presigned URLs expire, so only the redirect target is fetched fresh and the blob itself stays cacheable
+            return RedirectResponse(audio_file_url, headers={**headers, 'Cache-Control': 'no-store'})
+        if self._delivery_mode == AudioDeliveryMode.direct:
+            return FileResponse(audio.file_path, headers=headers)
+        file_path: Path = audio.file_path.resolve()
+        if not file_path.is_relative_to(self._directory_path):
+            self._log.warning(f'Audio file \'{file_path}\' outside audio directory served directly')
+            return FileResponse(file_path, headers=headers)
+        if self._delivery_mode == AudioDeliveryMode.x_accel_redirect:
+            headers['X-Accel-Redirect'] = (
+                f'{self._internal_path_prefix}/{quote(file_path.relative_to(self._directory_path).as_posix())}'
+            )
+        else:
+            headers['X-Sendfile'] = str(file_path)
+        # Body left to the fronting web server, which also answers range requests
+        return Response(media_type=mimetypes.guess_type(file_path)[0], headers=headers)
+
+    @staticmethod
+    def _is_etag_matched(if_none_match: str | None, etag: str) -> bool:
+        return if_none_match is not None and any(
+            entity_tag.strip().removeprefix('W/') in ('*', etag) for entity_tag in if_none_match.split(',')
+        )
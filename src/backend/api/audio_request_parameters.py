@@ -0,0 +1,45 @@
+from audio_nest.domain.audio_codec import AudioCodec
+from audio_nest.domain.audio_quality import AudioQuality
+from audio_nest.use_cases.audio_rendition_getter import AudioRenditionGetter
+
+
+audio_codec_media_types: dict[str, AudioCodec] = {'audio/flac': AudioCodec.flac, 'audio/opus': AudioCodec.opus}
+audio_cache_max_age_seconds: int = 365 * 24 * 60 * 60
+
+
+def get_accepted_audio_codecs(accept: str | None) -> set[AudioCodec]:
+    accepted_codecs: set[AudioCodec] = set()
+    media_range: str
+    for media_range in (accept or '').split(','):
+        media_type: str
+        parameters: list[str]
+        media_type, *parameters = [part.strip().lower() for part in media_range.split(';')]
+        parameter_values: dict[str, str] = {}
+        parameter: str
+        for parameter in parameters:
+            name: str
+            value: str
+            name, _, value = parameter.partition('=')
+            parameter_values[name.strip()] = value.strip().strip('"')
+        if parameter_values.get('q') in ('0', '0.0', '0.00', '0.000'):
+            continue
+        if media_type in audio_codec_media_types:
+            accepted_codecs.add(audio_codec_media_types[media_type])
+        if parameter_values.get('codecs') in AudioCodec.__members__:
+            accepted_codecs.add(AudioCodec(parameter_values['codecs']))
+    return accepted_codecs
+
+
+def get_audio_quality(
+    quality: AudioQuality | None,
+    accept: str | None,
+    audio_rendition_getter: AudioRenditionGetter
+) -> AudioQuality:
+    return quality or audio_rendition_getter.get_preferred_audio_quality(get_accepted_audio_codecs(accept))
+
+
+def get_audio_cache_control(scope: str, quality: AudioQuality | None) -> str:
+    # Explicit quality URLs always name the same rendition, negotiated ones must be revalidated against the ETag
+    if quality is None:
+        return f'{scope}, no-cache'
+    return f'{scope}, max-age={audio_cache_max_age_seconds}, immutable'
@@ -0,0 +1,13 @@
+from uuid import UUID
+
+from api.dtos.base_dto import BaseDto
+
+
+class AudioDownloadJobDto(BaseDto):
+    id: UUID
+    source_id: str
+    status: str
+    downloaded_bytes: int
+    total_bytes: int | None = None
+    percent: float | None = None
+    error: str | None = None
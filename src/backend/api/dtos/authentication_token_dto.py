@@ -4,3 +4,4 @@ from pydantic import BaseModel
 class AuthenticationTokenDto(BaseModel):
     access_token: str
     token_type: str
+    refresh_token: str
@@ -2,14 +2,18 @@ import logging
 from logging import Logger
 
 from dependency_injector.wiring import inject, Provide
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, Form, HTTPException
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
 
 from api.dtos.authentication_token_dto import AuthenticationTokenDto
+from auth.domain.authentication_tokens import AuthenticationTokens
 from auth.exceptions.invalid_user_credentials_exception import InvalidUserCredentialsException
+from auth.exceptions.password_hasher_overloaded_exception import PasswordHasherOverloadedException
 from auth.exceptions.user_already_registered_exception import UserAlreadyRegisteredException
 from auth.use_cases.user_login_handler import UserLoginHandler
+from auth.use_cases.user_logout_handler import UserLogoutHandler
 from auth.use_cases.user_registration_handler import UserRegistrationHandler
+from auth.use_cases.user_token_refresher import UserTokenRefresher
 
 
 log: Logger = logging.getLogger(__name__)
@@ -29,6 +33,13 @@ async def register_user(
         log.info(f'User \'{user_data.username}\' registered')
     except UserAlreadyRegisteredException as ex:
         log.warning(f'Registration failed for user \'{user_data.username}\': {ex}')
+    except PasswordHasherOverloadedException as ex:
+        log.warning(f'Registration rejected for user \'{user_data.username}\': {ex}')
+        raise HTTPException(
+            status_code=503,
+            detail='Too many authentication attempts, please retry later',
+            headers={'Retry-After': '1'}
+        )
     except Exception as ex:
         log.error(f'Exception found while registering user \'{user_data.username}\': {ex.__class__.__name__} - {ex}')
         raise HTTPException(status_code=500, detail='An unexpected error occurred while registering user')
@@ -42,8 +53,15 @@ async def log_user_in(
 ) -> AuthenticationTokenDto:
     log.info(f'Logging user \'{user_data.username}\' in...')
     try:
-        access_token: str = await user_login_handler.log_user_in(email=user_data.username, password=user_data.password)
-        return AuthenticationTokenDto(access_token=access_token, token_type='bearer')
+        authentication_tokens: AuthenticationTokens = await user_login_handler.log_user_in(
+            email=user_data.username,
+            password=user_data.password
+        )
+        return AuthenticationTokenDto(
+            access_token=authentication_tokens.access_token,
+            token_type='bearer',
+            refresh_token=authentication_tokens.refresh_token
+        )
     except InvalidUserCredentialsException as ex:
         log.error(f'Login failed for user \'{user_data.username}\': {ex}')
         raise HTTPException(
@@ -51,6 +69,68 @@ async def log_user_in(
             detail='Could not validate user credentials',
             headers={'WWW-Authenticate': 'Bearer'}
         )
+    except PasswordHasherOverloadedException as ex:
+        log.warning(f'Login rejected for user \'{user_data.username}\': {ex}')
+        raise HTTPException(
+            status_code=503,
+            detail='Too many authentication attempts, please retry later',
+            headers={'Retry-After': '1'}
+        )
     except Exception as ex:
         log.error(f'Exception found while logging user \'{user_data.username}\' in: {ex.__class__.__name__} - {ex}')
         raise HTTPException(status_code=500, detail='An unexpected error occurred while logging user in')
+
+
+@router.post('/refresh')
+@inject
+async def refresh_authentication_tokens(
+    refresh_token: str = Form(),
+    user_token_refresher: UserTokenRefresher = Depends(Provide['user_token_refresher'])
+) -> AuthenticationTokenDto:
+    log.info('Refreshing authentication tokens...')
+    try:
+        authentication_tokens: AuthenticationTokens = await user_token_refresher.refresh_authentication_tokens(
+            refresh_token
+        )
+        log.info('Authentication tokens refreshed')
+        return AuthenticationTokenDto(
+            access_token=authentication_tokens.access_token,
+            token_type='bearer',
+            refresh_token=authentication_tokens.refresh_token
+        )
+    except InvalidUserCredentialsException as ex:
+        log.error(f'Authentication tokens refresh failed: {ex}')
+        raise HTTPException(
+            status_code=401,
+            detail='Could not validate user credentials',
+            headers={'WWW-Authenticate': 'Bearer'}
+        )
+    except Exception as ex:
+        log.error(f'Exception found while refreshing authentication tokens: {ex.__class__.__name__} - {ex}')
+        raise HTTPException(
+            status_code=500,
+            detail='An unexpected error occurred while refreshing authentication tokens'
+        )
+
+
+@router.post('/logout')
+@inject
+async def log_user_out(
+    refresh_token: str | None = Form(default=None),
+    token: str = Depends(oauth2_scheme),
+    user_logout_handler: UserLogoutHandler = Depends(Provide['user_logout_handler'])
+) -> None:
+    log.info('Logging user out...')
+    try:
+        await user_logout_handler.log_user_out(access_token=token, refresh_token=refresh_token)
+        log.info('User logged out')
+    except InvalidUserCredentialsException as ex:
+        log.error(f'Logout failed: {ex}')
+        raise HTTPException(
+            status_code=401,
+            detail='Could not validate user credentials',
+            headers={'WWW-Authenticate': 'Bearer'}
+        )
+    except Exception as ex:
+        log.error(f'Exception found while logging user out: {ex.__class__.__name__} - {ex}')
+        raise HTTPException(status_code=500, detail='An unexpected error occurred while logging user out')
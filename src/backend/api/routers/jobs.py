@@ -0,0 +1,37 @@
+import logging
+from logging import Logger
+from uuid import UUID
+
+from dependency_injector.wiring import inject, Provide
+from fastapi import APIRouter, Depends, HTTPException
+
+from api.audio_download_job_responses import audio_download_jobs_path, to_audio_download_job_dto
+from api.dtos.audio_download_job_dto import AudioDownloadJobDto
+from audio_nest.domain.audio_download_job import AudioDownloadJob
+from audio_nest.exceptions.audio_download_job_not_found_exception import AudioDownloadJobNotFoundException
+from audio_nest.use_cases.audio_download_job_getter import AudioDownloadJobGetter
+
+
+log: Logger = logging.getLogger(__name__)
+router: APIRouter = APIRouter(prefix=audio_download_jobs_path)
+
+
+@router.get('/{audio_download_job_id}')
+@inject
+async def get_audio_download_job(
+    audio_download_job_id: UUID,
+    audio_download_job_getter: AudioDownloadJobGetter = Depends(Provide['audio_download_job_getter'])
+) -> AudioDownloadJobDto:
+    log.info(f'Getting audio download job \'{audio_download_job_id}\'...')
+    try:
+        audio_download_job: AudioDownloadJob = await audio_download_job_getter.get_audio_download_job(
+            audio_download_job_id
+        )
+        log.info(f'Audio download job \'{audio_download_job_id}\' retrieved')
+        return to_audio_download_job_dto(audio_download_job)
+    except AudioDownloadJobNotFoundException as ex:
+        log.error(f'Failed to get audio download job: {ex}')
+        raise HTTPException(status_code=404, detail='Audio download job not found')
+    except Exception as ex:
+        log.error(f'Exception found while getting audio download job: {ex.__class__.__name__} - {ex}')
+        raise HTTPException(status_code=500, detail='An unexpected error occurred while getting audio download job')
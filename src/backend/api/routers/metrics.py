@@ -0,0 +1,25 @@
+import asyncio
+import logging
+from logging import Logger
+
+from dependency_injector.wiring import inject, Provide
+from fastapi import APIRouter, Depends
+from fastapi.responses import Response
+
+from prometheus.prometheus_metrics_exporter import PrometheusMetricsExporter
+
+
+log: Logger = logging.getLogger(__name__)
+router: APIRouter = APIRouter(prefix='/metrics')
+
+
+@router.get('')
+@inject
+async def get_metrics(
+    metrics_exporter: PrometheusMetricsExporter = Depends(Provide['metrics_exporter'])
+) -> Response:
+    log.debug('Exporting metrics...')
+    # Aggregating worker metric files reads from disk, so it is kept off the event loop
+    metrics: bytes = await asyncio.to_thread(metrics_exporter.export_metrics)
+    log.debug('Metrics exported')
+    return Response(content=metrics, media_type=metrics_exporter.content_type)
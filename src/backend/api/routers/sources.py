@@ -1,17 +1,27 @@
 import logging
+import mimetypes
 from logging import Logger
 
 from dependency_injector.wiring import inject, Provide
-from fastapi import APIRouter, Depends, HTTPException
-from fastapi.responses import FileResponse
+from fastapi import APIRouter, Depends, Header, HTTPException
+from fastapi.responses import Response, StreamingResponse
 
+from api.audio_download_job_responses import create_audio_download_job_accepted_response, is_async_response_preferred
+from api.audio_file_response_factory import AudioFileResponseFactory
+from api.audio_request_parameters import get_audio_cache_control, get_audio_quality
 from api.dtos.audio_source_dto import AudioSourceDto
 from api.dtos.user_audio_dto import UserAudioDto
 from api.routers.auth import oauth2_scheme
 from audio_nest.domain.audio import Audio
+from audio_nest.domain.audio_download_job import AudioDownloadJob
+from audio_nest.domain.audio_download_priority import AudioDownloadPriority
+from audio_nest.domain.audio_quality import AudioQuality
+from audio_nest.domain.audio_stream import AudioStream
 from audio_nest.domain.user_audio import UserAudio
 from audio_nest.exceptions.user_audio_already_added_exception import UserAudioAlreadyAddedException
+from audio_nest.use_cases.audio_download_job_scheduler import AudioDownloadJobScheduler
 from audio_nest.use_cases.audio_getter import AudioGetter
+from audio_nest.use_cases.audio_rendition_getter import AudioRenditionGetter
 from audio_nest.use_cases.audio_sources_getter import AudioSourcesGetter
 from audio_nest.use_cases.user_audio_adder import UserAudioAdder
 from auth.domain.user import User
@@ -49,42 +59,86 @@ async def get_audio_sources(
 @inject
 async def get_audio_from_source(
     source_id: str,
-    audio_getter: AudioGetter = Depends(Provide['audio_getter'])
-) -> FileResponse:
+    stream: bool = False,
+    quality: AudioQuality | None = None,
+    prefer: str | None = Header(default=None),
+    accept: str | None = Header(default=None),
+    if_none_match: str | None = Header(default=None),
+    audio_file_response_factory: AudioFileResponseFactory = Depends(Provide['audio_file_response_factory']),
+    audio_download_job_scheduler: AudioDownloadJobScheduler = Depends(Provide['audio_download_job_scheduler']),
+    audio_getter: AudioGetter = Depends(Provide['audio_getter']),
+    audio_rendition_getter: AudioRenditionGetter = Depends(Provide['audio_rendition_getter'])
+) -> Response:
     log.info(f'Getting audio from source \'{source_id}\'...')
     try:
-        audio: Audio = await audio_getter.get_audio_from_source(source_id)
-        log.info(f'Audio from source \'{source_id}\' retrieved')
-        return FileResponse(audio.file_path)
+        if is_async_response_preferred(prefer):
+            audio_download_job: AudioDownloadJob = await audio_download_job_scheduler.schedule_audio_download(
+                source_id
+            )
+            log.info(f'Audio from source \'{source_id}\' scheduled for download')
+            return create_audio_download_job_accepted_response(audio_download_job)
+        audio_quality: AudioQuality = get_audio_quality(quality, accept, audio_rendition_getter)
+        if stream and audio_quality == AudioQuality.high:
+            audio_stream: AudioStream = await audio_getter.stream_audio_from_source(source_id)
+            log.info(f'Audio from source \'{source_id}\' streaming')
+            return StreamingResponse(
+                content=audio_stream.chunks,
+                media_type=mimetypes.guess_type(audio_stream.audio.file_path)[0],
+                headers={'Vary': 'Accept'}
+            )
+        audio: Audio = await audio_rendition_getter.get_audio_rendition(source_id=source_id, quality=audio_quality)
+        log.info(f'{audio_quality.capitalize()} quality audio from source \'{source_id}\' retrieved')
+        return await audio_file_response_factory.create_audio_file_response(
+            audio=audio,
+            cache_control=get_audio_cache_control(scope='public', quality=quality),
+            if_none_match=if_none_match
+        )
     except Exception as ex:
         log.error(f'Exception found while getting audio from source \'{source_id}\': {ex.__class__.__name__} - {ex}')
         raise HTTPException(status_code=500, detail='An unexpected error occurred while getting audio from source')
 
 
-@router.put('/{source_id}/audio')
+@router.put('/{source_id}/audio', response_model=None)
 @inject
 async def add_user_audio_from_source(
     source_id: str,
     user_audio_dto: UserAudioDto,
+    prefer: str | None = Header(default=None),
     token: str = Depends(oauth2_scheme),
+    audio_download_job_scheduler: AudioDownloadJobScheduler = Depends(Provide['audio_download_job_scheduler']),
     audio_getter: AudioGetter = Depends(Provide['audio_getter']),
     user_audio_adder: UserAudioAdder = Depends(Provide['user_audio_adder']),
     user_getter: UserGetter = Depends(Provide['user_getter'])
-) -> None:
+) -> Response | None:
     log.info(f'Adding {user_audio_dto} from source \'{source_id}\'...')
     try:
         user: User = await user_getter.get_user_from_access_token(token)
-        audio: Audio = await audio_getter.get_audio_from_source(source_id)
-        user_audio: UserAudio = UserAudio(
-            user_id=user.id,
-            audio_name=user_audio_dto.audio_name,
-            source_id=audio.source_id,
-            file_path=audio.file_path,
-            bit_rate_kbps=audio.bit_rate_kbps,
-            codec=audio.codec
+
+        async def add_user_audio(audio: Audio) -> None:
+            user_audio: UserAudio = UserAudio(
+                user_id=user.id,
+                audio_name=user_audio_dto.audio_name,
+                source_id=audio.source_id,
+                file_path=audio.file_path,
+                bit_rate_kbps=audio.bit_rate_kbps,
+                codec=audio.codec,
+                content_hash=audio.content_hash
+            )
+            await user_audio_adder.add_user_audio(user_audio)
+
+        if is_async_response_preferred(prefer):
+            audio_download_job: AudioDownloadJob = await audio_download_job_scheduler.schedule_audio_download(
+                source_id=source_id,
+                on_audio_downloaded=add_user_audio,
+                priority=AudioDownloadPriority.library
+            )
+            log.info(f'{user_audio_dto} from source \'{source_id}\' scheduled for download')
+            return create_audio_download_job_accepted_response(audio_download_job)
+        await add_user_audio(
+            await audio_getter.get_audio_from_source(source_id=source_id, priority=AudioDownloadPriority.library)
         )
-        await user_audio_adder.add_user_audio(user_audio)
         log.info(f'{user_audio_dto} from source \'{source_id}\' added')
+        return None
     except InvalidUserCredentialsException as ex:
         log.error(f'Authentication failed: {ex}')
         raise HTTPException(
@@ -3,13 +3,20 @@ from logging import Logger
 from uuid import UUID
 
 from dependency_injector.wiring import inject, Provide
-from fastapi import APIRouter, Depends, HTTPException
-from fastapi.responses import FileResponse
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response
 
+from api.audio_file_response_factory import AudioFileResponseFactory
+from api.audio_request_parameters import get_audio_cache_control, get_audio_quality
 from api.dtos.user_audio_dto import UserAudioDto
 from api.routers.auth import oauth2_scheme
+from audio_nest.domain.audio import Audio
+from audio_nest.domain.audio_download_priority import AudioDownloadPriority
+from audio_nest.domain.audio_quality import AudioQuality
 from audio_nest.domain.user_audio import UserAudio
+from audio_nest.domain.user_audio_page import UserAudioPage
+from audio_nest.exceptions.invalid_user_audio_cursor_exception import InvalidUserAudioCursorException
 from audio_nest.exceptions.user_audio_not_found_exception import UserAudioNotFoundException
+from audio_nest.use_cases.audio_rendition_getter import AudioRenditionGetter
 from audio_nest.use_cases.user_audio_deleter import UserAudioDeleter
 from audio_nest.use_cases.user_audio_getter import UserAudioGetter
 from audio_nest.use_cases.user_audio_list_getter import UserAudioListGetter
@@ -25,6 +32,9 @@ router: APIRouter = APIRouter(prefix='/api/user-audio')
 @router.get('')
 @inject
 async def get_user_audio_list(
+    response: Response,
+    limit: int = Query(default=100, ge=1, le=1000),
+    cursor: str | None = None,
     token: str = Depends(oauth2_scheme),
     user_audio_list_getter: UserAudioListGetter = Depends(Provide['user_audio_list_getter']),
     user_getter: UserGetter = Depends(Provide['user_getter'])
@@ -32,10 +42,16 @@ async def get_user_audio_list(
     log.info(f'Getting user audio list...')
     try:
         user: User = await user_getter.get_user_from_access_token(token)
+        user_audio_page: UserAudioPage = await user_audio_list_getter.get_user_audio_list(
+            user_id=user.id,
+            limit=limit,
+            cursor=cursor
+        )
         user_audio_list: list[UserAudioDto] = [
-            UserAudioDto.model_validate(user_audio.__dict__)
-            for user_audio in await user_audio_list_getter.get_user_audio_list(user.id)
+            UserAudioDto.model_validate(user_audio.__dict__) for user_audio in user_audio_page.user_audio_list
         ]
+        if user_audio_page.next_cursor is not None:
+            response.headers['X-Next-Cursor'] = user_audio_page.next_cursor
         log.info(f'User \'{user.id}\' audio list retrieved')
         return user_audio_list
     except InvalidUserCredentialsException as ex:
@@ -45,6 +61,9 @@ async def get_user_audio_list(
             detail='Could not validate user credentials',
             headers={'WWW-Authenticate': 'Bearer'}
         )
+    except InvalidUserAudioCursorException as ex:
+        log.error(f'Failed to get user audio list: {ex}')
+        raise HTTPException(status_code=400, detail='Invalid user audio cursor')
     except Exception as ex:
         log.error(f'Exception found while getting user audio list: {ex.__class__.__name__} - {ex}')
         raise HTTPException(status_code=500, detail='An unexpected error occurred while getting user audio list')
@@ -54,16 +73,33 @@ async def get_user_audio_list(
 @inject
 async def get_user_audio(
     user_audio_id: UUID,
+    quality: AudioQuality | None = None,
+    accept: str | None = Header(default=None),
+    if_none_match: str | None = Header(default=None),
     token: str = Depends(oauth2_scheme),
+    audio_file_response_factory: AudioFileResponseFactory = Depends(Provide['audio_file_response_factory']),
+    audio_rendition_getter: AudioRenditionGetter = Depends(Provide['audio_rendition_getter']),
     user_audio_getter: UserAudioGetter = Depends(Provide['user_audio_getter']),
     user_getter: UserGetter = Depends(Provide['user_getter'])
-) -> FileResponse:
+) -> Response:
     log.info(f'Getting user audio \'{user_audio_id}\'...')
     try:
         await user_getter.get_user_from_access_token(token)
         user_audio: UserAudio = await user_audio_getter.get_user_audio(user_audio_id)
-        log.info(f'User audio \'{user_audio_id}\' retrieved')
-        return FileResponse(user_audio.file_path)
+        audio_quality: AudioQuality = get_audio_quality(quality, accept, audio_rendition_getter)
+        audio: Audio = user_audio
+        if audio_quality != AudioQuality.high:
+            audio = await audio_rendition_getter.get_audio_rendition(
+                source_id=user_audio.source_id,
+                quality=audio_quality,
+                priority=AudioDownloadPriority.library
+            )
+        log.info(f'{audio_quality.capitalize()} quality user audio \'{user_audio_id}\' retrieved')
+        return await audio_file_response_factory.create_audio_file_response(
+            audio=audio,
+            cache_control=get_audio_cache_control(scope='private', quality=quality),
+            if_none_match=if_none_match
+        )
     except InvalidUserCredentialsException as ex:
         log.error(f'Authentication failed: {ex}')
         raise HTTPException(
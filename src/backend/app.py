@@ -1,6 +1,8 @@
 import logging
+import os
 from contextlib import asynccontextmanager
 from logging import Logger
+from pathlib import Path
 from typing import AsyncGenerator
 
 import uvicorn
@@ -8,12 +10,16 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from api import routers
-from api.routers import auth, sources, user_audio
+from api.routers import auth, jobs, metrics, sources, user_audio
 from container import Container
+from open_telemetry.open_telemetry_tracing_middleware import OpenTelemetryTracingMiddleware
+from prometheus.prometheus_metrics_exporter import PrometheusMetricsExporter
+from prometheus.prometheus_metrics_middleware import PrometheusMetricsMiddleware
 
 
 class App(FastAPI):
     _log: Logger = logging.getLogger(__name__)
+    _factory_import_string: str = f'{__name__}:App.create'
     _container: Container
 
     def __init__(self, container: Container) -> None:
@@ -31,25 +37,55 @@ class App(FastAPI):
             allow_origins=['*'],
             allow_credentials=True,
             allow_methods=['*'],
-            allow_headers=['*']
+            allow_headers=['*'],
+            expose_headers=['Location', 'X-Next-Cursor']
         )
+        self.add_middleware(middleware_class=PrometheusMetricsMiddleware)
+        self.add_middleware(middleware_class=OpenTelemetryTracingMiddleware, tracer=self._container.tracer())
         self.include_router(auth.router)
+        self.include_router(jobs.router)
+        self.include_router(metrics.router)
         self.include_router(sources.router)
         self.include_router(user_audio.router)
 
+    @classmethod
+    def create(cls) -> 'App':
+        return cls(Container())
+
     def run(self) -> None:
+        workers: int = self._container.configuration.app_workers()
+        reload: bool = self._container.configuration.app_reload()
+        self._log.info(f'Starting {workers} application worker(s){" with reload" if reload else ""}...')
+        if workers > 1:
+            PrometheusMetricsExporter.prepare_multiprocess_directory(
+                self._container.configuration.metrics_multiprocess_directory_path()
+            )
         uvicorn.run(
-            app=self,
+            # Workers and reloader rebuild the application in each process, so they need an importable factory
+            app=self._factory_import_string if workers > 1 or reload else self,
+            factory=workers > 1 or reload,
+            app_dir=str(Path(__file__).parent),
             host=self._container.configuration.app_host(),
             port=self._container.configuration.app_port(),
+            workers=workers,
+            reload=reload,
+            backlog=self._container.configuration.app_backlog(),
+            timeout_keep_alive=self._container.configuration.app_keep_alive_timeout_seconds(),
+            timeout_graceful_shutdown=self._container.configuration.app_graceful_shutdown_timeout_seconds(),
             log_config=self._container.configuration.logging_config()
         )
 
     @asynccontextmanager
     async def _handle_resources(self, app: FastAPI) -> AsyncGenerator[None, None]:
-        self._log.info('Initializing application resources...')
+        self._log.info(f'Initializing application resources in worker {os.getpid()}...')
         await self._container.sql_session_maker.init()
+        await self._container.audio_download_job_scheduler().fail_stale_audio_download_jobs()
+        await self._container.audio_eviction.init()
         yield
         self._log.info('Shutting down application resources...')
+        self._container.metrics_exporter().shut_down_worker()
+        await self._container.audio_download_job_scheduler().cancel_audio_download_jobs()
+        await self._container.audio_eviction.shutdown()
         await self._container.sql_session_maker.shutdown()
+        self._container.tracer().shut_down()
         self._log.info('Application resources shut down')
@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 
 from audio_nest.domain.audio_codec import AudioCodec
@@ -10,3 +10,5 @@ class Audio:
     file_path: Path
     bit_rate_kbps: int
     codec: AudioCodec
+    size_bytes: int | None = field(default=None, kw_only=True, compare=False)
+    content_hash: str | None = field(default=None, kw_only=True)
@@ -0,0 +1,12 @@
+from dataclasses import dataclass, field
+from uuid import UUID, uuid4
+
+from audio_nest.domain.audio_download_progress import AudioDownloadProgress
+
+
+@dataclass
+class AudioDownloadJob:
+    source_id: str
+    progress: AudioDownloadProgress = field(default_factory=AudioDownloadProgress)
+    error: str | None = None
+    id: UUID = field(default_factory=uuid4)
@@ -0,0 +1,6 @@
+from enum import IntEnum
+
+
+class AudioDownloadPriority(IntEnum):
+    library = 0
+    preview = 1
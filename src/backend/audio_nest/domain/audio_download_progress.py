@@ -0,0 +1,16 @@
+from dataclasses import dataclass
+
+from audio_nest.domain.audio_download_status import AudioDownloadStatus
+
+
+@dataclass
+class AudioDownloadProgress:
+    status: AudioDownloadStatus = AudioDownloadStatus.queued
+    downloaded_bytes: int = 0
+    total_bytes: int | None = None
+
+    @property
+    def percent(self) -> float | None:
+        if not self.total_bytes:
+            return None
+        return min(100.0, round(100 * self.downloaded_bytes / self.total_bytes, 1))
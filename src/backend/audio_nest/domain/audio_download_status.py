@@ -0,0 +1,9 @@
+from enum import StrEnum
+
+
+class AudioDownloadStatus(StrEnum):
+    queued = 'queued'
+    downloading = 'downloading'
+    transcoding = 'transcoding'
+    done = 'done'
+    failed = 'failed'
@@ -0,0 +1,7 @@
+from enum import StrEnum
+
+
+class AudioQuality(StrEnum):
+    low = 'low'
+    medium = 'medium'
+    high = 'high'
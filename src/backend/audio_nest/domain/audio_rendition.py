@@ -0,0 +1,13 @@
+from dataclasses import dataclass
+
+from audio_nest.domain.audio import Audio
+from audio_nest.domain.audio_quality import AudioQuality
+
+
+@dataclass
+class AudioRendition(Audio):
+    quality: AudioQuality
+
+    @property
+    def rendition_id(self) -> str:
+        return f'{self.source_id}.{self.quality}'
@@ -0,0 +1,10 @@
+from dataclasses import dataclass
+from typing import AsyncGenerator
+
+from audio_nest.domain.audio import Audio
+
+
+@dataclass
+class AudioStream:
+    audio: Audio
+    chunks: AsyncGenerator[bytes, None]
@@ -0,0 +1,11 @@
+from dataclasses import dataclass
+from datetime import datetime
+
+from audio_nest.domain.audio import Audio
+
+
+@dataclass
+class StoredAudio:
+    audio: Audio
+    size_bytes: int
+    accessed_at: datetime | None = None
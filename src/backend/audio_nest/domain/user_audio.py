@@ -1,4 +1,5 @@
 from dataclasses import dataclass, field
+from datetime import datetime, timezone
 from uuid import UUID, uuid4
 
 from audio_nest.domain.audio import Audio
@@ -9,3 +10,4 @@ class UserAudio(Audio):
     user_id: UUID
     audio_name: str
     id: UUID = field(default_factory=uuid4)
+    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc), kw_only=True, compare=False)
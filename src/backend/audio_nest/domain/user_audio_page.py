@@ -0,0 +1,9 @@
+from dataclasses import dataclass
+
+from audio_nest.domain.user_audio import UserAudio
+
+
+@dataclass
+class UserAudioPage:
+    user_audio_list: list[UserAudio]
+    next_cursor: str | None = None
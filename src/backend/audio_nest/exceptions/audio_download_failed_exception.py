@@ -0,0 +1,3 @@
+class AudioDownloadFailedException(Exception):
+    def __init__(self, source_id: str, reason: str) -> None:
+        super().__init__(f'Audio download from source \'{source_id}\' failed: {reason}')
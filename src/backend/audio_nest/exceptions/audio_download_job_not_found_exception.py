@@ -0,0 +1,6 @@
+from uuid import UUID
+
+
+class AudioDownloadJobNotFoundException(Exception):
+    def __init__(self, audio_download_job_id: UUID) -> None:
+        super().__init__(f'Audio download job \'{audio_download_job_id}\' not found')
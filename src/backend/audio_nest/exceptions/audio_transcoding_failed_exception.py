@@ -0,0 +1,3 @@
+class AudioTranscodingFailedException(Exception):
+    def __init__(self, source_id: str, reason: str) -> None:
+        super().__init__(f'Audio transcoding from source \'{source_id}\' failed: {reason}')
@@ -0,0 +1,3 @@
+class InvalidUserAudioCursorException(Exception):
+    def __init__(self, cursor: str) -> None:
+        super().__init__(f'Invalid user audio cursor \'{cursor}\'')
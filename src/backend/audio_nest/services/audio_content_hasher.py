@@ -0,0 +1,16 @@
+import hashlib
+from pathlib import Path
+from typing import BinaryIO
+
+
+read_chunk_size: int = 1024 * 1024
+
+
+def get_audio_content_hash(file_path: Path) -> str:
+    content_hash: hashlib._Hash = hashlib.sha256()
+    file: BinaryIO
+    with file_path.open('rb') as file:
+        chunk: bytes
+        while chunk := file.read(read_chunk_size):
+            content_hash.update(chunk)
+    return content_hash.hexdigest()
@@ -0,0 +1,89 @@
+import asyncio
+import contextvars
+import heapq
+import itertools
+import logging
+import time
+from asyncio import Future
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from functools import partial
+from logging import Logger
+from typing import AsyncGenerator, Callable, Iterator, TypeVar
+
+from audio_nest.domain.audio_download_priority import AudioDownloadPriority
+from audio_nest.services.i_stage_timer import IStageTimer
+
+
+T = TypeVar('T')
+
+
+class AudioDownloadWorkerPool:
+    _log: Logger = logging.getLogger(__name__)
+    _max_concurrency: int
+    _stage_timer: IStageTimer
+    _executor: ThreadPoolExecutor
+    _waiters: list[tuple[AudioDownloadPriority, int, Future[None]]]
+    _waiter_sequence: Iterator[int]
+    _active_count: int
+
+    def __init__(self, max_concurrency: int, stage_timer: IStageTimer) -> None:
+        self._max_concurrency = max_concurrency
+        self._stage_timer = stage_timer
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix='audio-download')
+        self._waiters = []
+        self._waiter_sequence = itertools.count()
+        self._active_count = 0
+
+    @property
+    def max_concurrency(self) -> int:
+        return self._max_concurrency
+
+    @property
+    def active_count(self) -> int:
+        return self._active_count
+
+    @property
+    def queue_depth(self) -> int:
+        return sum(1 for _, _, waiter in self._waiters if not waiter.done())
+
+    @asynccontextmanager
+    async def acquire(self, priority: AudioDownloadPriority) -> AsyncGenerator[None, None]:
+        waiting_start_time: float = time.monotonic()
+        if self._active_count < self._max_concurrency and self.queue_depth == 0:
+            self._active_count += 1
+        else:
+            self._log.debug(f'Waiting for audio download worker with {priority.name} priority...')
+            waiter: Future[None] = asyncio.get_running_loop().create_future()
+            heapq.heappush(self._waiters, (priority, next(self._waiter_sequence), waiter))
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                if waiter.done() and not waiter.cancelled():
+                    self._release()
+                raise
+        self._stage_timer.observe_stage_duration('audio_download_queue_wait', time.monotonic() - waiting_start_time)
+        try:
+            yield
+        finally:
+            self._release()
+
+    async def run(self, priority: AudioDownloadPriority, function: Callable[..., T], *args, **kwargs) -> T:
+        async with self.acquire(priority):
+            return await self.run_acquired(function, *args, **kwargs)
+
+    async def run_acquired(self, function: Callable[..., T], *args, **kwargs) -> T:
+        # Run in a copy of the caller context, as asyncio.to_thread does, so trace spans keep their parent
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor,
+            partial(contextvars.copy_context().run, function, *args, **kwargs)
+        )
+
+    def _release(self) -> None:
+        while self._waiters:
+            waiter: Future[None]
+            _, _, waiter = heapq.heappop(self._waiters)
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self._active_count -= 1
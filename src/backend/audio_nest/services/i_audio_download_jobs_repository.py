@@ -0,0 +1,23 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from uuid import UUID
+
+from audio_nest.domain.audio_download_job import AudioDownloadJob
+
+
+class IAudioDownloadJobsRepository(ABC):
+    @abstractmethod
+    async def add_audio_download_job(self, audio_download_job: AudioDownloadJob) -> None:
+        pass
+
+    @abstractmethod
+    async def get_audio_download_job(self, audio_download_job_id: UUID) -> AudioDownloadJob | None:
+        pass
+
+    @abstractmethod
+    async def update_audio_download_job(self, audio_download_job: AudioDownloadJob) -> None:
+        pass
+
+    @abstractmethod
+    async def fail_stale_audio_download_jobs(self, updated_before: datetime, error: str) -> int:
+        pass
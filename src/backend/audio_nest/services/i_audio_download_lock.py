@@ -0,0 +1,11 @@
+from abc import ABC, abstractmethod
+
+
+class IAudioDownloadLock(ABC):
+    @abstractmethod
+    async def acquire(self, source_id: str, blocking: bool = True) -> bool:
+        pass
+
+    @abstractmethod
+    async def release(self, source_id: str) -> None:
+        pass
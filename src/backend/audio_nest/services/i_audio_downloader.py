@@ -1,9 +1,25 @@
 from abc import ABC, abstractmethod
 
+from audio_nest.domain.audio_download_priority import AudioDownloadPriority
+from audio_nest.domain.audio_download_progress import AudioDownloadProgress
+from audio_nest.domain.audio_stream import AudioStream
 from audio_nest.domain.user_audio import Audio
 
 
 class IAudioDownloader(ABC):
     @abstractmethod
-    async def download_audio_from_source(self, source_id: str) -> Audio:
+    async def download_audio_from_source(
+        self,
+        source_id: str,
+        progress: AudioDownloadProgress | None = None,
+        priority: AudioDownloadPriority = AudioDownloadPriority.preview
+    ) -> Audio:
+        pass
+
+    @abstractmethod
+    def stream_audio_from_source(
+        self,
+        source_id: str,
+        priority: AudioDownloadPriority = AudioDownloadPriority.preview
+    ) -> AudioStream:
         pass
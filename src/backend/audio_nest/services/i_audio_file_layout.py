@@ -0,0 +1,10 @@
+from abc import ABC, abstractmethod
+from pathlib import Path
+
+from audio_nest.domain.audio import Audio
+
+
+class IAudioFileLayout(ABC):
+    @abstractmethod
+    async def store_audio_file(self, audio: Audio) -> Path:
+        pass
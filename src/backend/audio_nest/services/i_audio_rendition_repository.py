@@ -0,0 +1,18 @@
+from abc import ABC, abstractmethod
+
+from audio_nest.domain.audio_quality import AudioQuality
+from audio_nest.domain.audio_rendition import AudioRendition
+
+
+class IAudioRenditionRepository(ABC):
+    @abstractmethod
+    async def add_audio_rendition(self, audio_rendition: AudioRendition) -> None:
+        pass
+
+    @abstractmethod
+    async def get_audio_rendition(self, source_id: str, quality: AudioQuality) -> AudioRendition | None:
+        pass
+
+    @abstractmethod
+    async def delete_audio_renditions(self, source_id: str) -> list[AudioRendition]:
+        pass
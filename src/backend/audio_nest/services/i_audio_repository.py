@@ -1,9 +1,48 @@
 from abc import ABC, abstractmethod
+from datetime import datetime
+from pathlib import Path
 
+from audio_nest.domain.stored_audio import StoredAudio
 from audio_nest.domain.user_audio import Audio
 
 
 class IAudioRepository(ABC):
+    @abstractmethod
+    async def add_audio(self, audio: Audio) -> None:
+        pass
+
     @abstractmethod
     async def get_audio_from_source(self, source_id: str) -> Audio | None:
         pass
+
+    @abstractmethod
+    async def get_audio_list(self, limit: int, after_source_id: str | None = None) -> list[Audio]:
+        pass
+
+    @abstractmethod
+    async def update_audio_file_paths(self, file_paths: dict[str, Path]) -> None:
+        pass
+
+    @abstractmethod
+    async def is_audio_file_in_use(self, file_path: Path) -> bool:
+        pass
+
+    @abstractmethod
+    async def update_audio_access_time(self, source_id: str) -> None:
+        pass
+
+    @abstractmethod
+    async def get_total_audio_size_bytes(self) -> int:
+        pass
+
+    @abstractmethod
+    async def get_least_recently_used_unreferenced_audio(self, limit: int) -> list[StoredAudio]:
+        pass
+
+    @abstractmethod
+    async def get_orphaned_audio(self, orphaned_before: datetime, limit: int) -> list[StoredAudio]:
+        pass
+
+    @abstractmethod
+    async def delete_unreferenced_audio(self, source_id: str) -> bool:
+        pass
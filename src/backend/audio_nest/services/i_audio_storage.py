@@ -0,0 +1,32 @@
+from abc import ABC, abstractmethod
+from contextlib import AbstractAsyncContextManager
+from pathlib import Path
+from typing import AsyncGenerator
+
+from audio_nest.domain.audio import Audio
+
+
+class IAudioStorage(ABC):
+    @abstractmethod
+    async def store_audio_file(self, audio: Audio) -> Path:
+        pass
+
+    @abstractmethod
+    async def is_audio_file_stored(self, file_path: Path) -> bool:
+        pass
+
+    @abstractmethod
+    def read_audio_file(self, file_path: Path) -> AsyncGenerator[bytes, None]:
+        pass
+
+    @abstractmethod
+    def open_local_audio_file(self, file_path: Path) -> AbstractAsyncContextManager[Path]:
+        pass
+
+    @abstractmethod
+    async def get_audio_file_url(self, file_path: Path) -> str | None:
+        pass
+
+    @abstractmethod
+    async def delete_audio_file(self, file_path: Path) -> int:
+        pass
@@ -0,0 +1,17 @@
+from abc import ABC, abstractmethod
+
+from audio_nest.domain.audio import Audio
+from audio_nest.domain.audio_codec import AudioCodec
+from audio_nest.domain.audio_download_priority import AudioDownloadPriority
+
+
+class IAudioTranscoder(ABC):
+    @abstractmethod
+    async def transcode_audio(
+        self,
+        audio: Audio,
+        codec: AudioCodec,
+        bit_rate_kbps: int,
+        priority: AudioDownloadPriority = AudioDownloadPriority.preview
+    ) -> Audio:
+        pass
@@ -0,0 +1,12 @@
+from abc import ABC, abstractmethod
+from contextlib import AbstractContextManager
+
+
+class IStageTimer(ABC):
+    @abstractmethod
+    def time_stage(self, stage: str) -> AbstractContextManager[None]:
+        pass
+
+    @abstractmethod
+    def observe_stage_duration(self, stage: str, duration_seconds: float) -> None:
+        pass
@@ -0,0 +1,13 @@
+from abc import ABC, abstractmethod
+from contextlib import AbstractContextManager
+from typing import Any
+
+
+class ITracer(ABC):
+    @abstractmethod
+    def trace_span(
+        self,
+        name: str,
+        attributes: dict[str, str | int | float | bool] | None = None
+    ) -> AbstractContextManager[Any]:
+        pass
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from datetime import datetime
 from uuid import UUID
 
 from audio_nest.domain.user_audio import UserAudio
@@ -6,15 +7,17 @@ from audio_nest.domain.user_audio import UserAudio
 
 class IUserAudioRepository(ABC):
     @abstractmethod
-    async def add_user_audio(self, user_audio: UserAudio) -> None:
+    async def add_user_audio(self, user_audio: UserAudio) -> bool:
         pass
 
     @abstractmethod
-    async def get_user_audio_from_source(self, source_id: str) -> UserAudio | None:
-        pass
-
-    @abstractmethod
-    async def get_user_audio_list(self, user_id: UUID) -> list[UserAudio]:
+    async def get_user_audio_list(
+        self,
+        user_id: UUID,
+        limit: int | None = None,
+        after_created_at: datetime | None = None,
+        after_id: UUID | None = None
+    ) -> list[UserAudio]:
         pass
 
     @abstractmethod
@@ -0,0 +1,49 @@
+import dataclasses
+import logging
+from logging import Logger
+from uuid import UUID
+
+from audio_nest.domain.audio_download_job import AudioDownloadJob
+from audio_nest.domain.audio_download_progress import AudioDownloadProgress
+from audio_nest.domain.audio_download_status import AudioDownloadStatus
+from audio_nest.exceptions.audio_download_job_not_found_exception import AudioDownloadJobNotFoundException
+from audio_nest.services.i_audio_download_jobs_repository import IAudioDownloadJobsRepository
+from audio_nest.services.i_tracer import ITracer
+from audio_nest.use_cases.audio_getter import AudioGetter
+
+
+class AudioDownloadJobGetter:
+    _log: Logger = logging.getLogger(__name__)
+    _audio_download_jobs_repository: IAudioDownloadJobsRepository
+    _audio_getter: AudioGetter
+    _tracer: ITracer
+
+    def __init__(
+        self,
+        audio_download_jobs_repository: IAudioDownloadJobsRepository,
+        audio_getter: AudioGetter,
+        tracer: ITracer
+    ) -> None:
+        self._audio_download_jobs_repository = audio_download_jobs_repository
+        self._audio_getter = audio_getter
+        self._tracer = tracer
+
+    async def get_audio_download_job(self, audio_download_job_id: UUID) -> AudioDownloadJob:
+        with self._tracer.trace_span(
+            'AudioDownloadJobGetter.get_audio_download_job',
+            {'audio_nest.audio_download_job_id': str(audio_download_job_id)}
+        ):
+            self._log.debug(f'Getting audio download job \'{audio_download_job_id}\'...')
+            audio_download_job: AudioDownloadJob | None = (
+                await self._audio_download_jobs_repository.get_audio_download_job(audio_download_job_id)
+            )
+            if not audio_download_job:
+                raise AudioDownloadJobNotFoundException(audio_download_job_id)
+            if audio_download_job.progress.status not in (AudioDownloadStatus.done, AudioDownloadStatus.failed):
+                progress: AudioDownloadProgress | None = self._audio_getter.get_audio_download_progress(
+                    audio_download_job.source_id
+                )
+                if progress is not None:
+                    audio_download_job = dataclasses.replace(audio_download_job, progress=dataclasses.replace(progress))
+            self._log.debug(f'Audio download job \'{audio_download_job_id}\' retrieved')
+            return audio_download_job
@@ -0,0 +1,145 @@
+import asyncio
+import dataclasses
+import logging
+from asyncio import Task
+from contextlib import suppress
+from datetime import datetime, timedelta, timezone
+from logging import Logger
+from typing import Awaitable, Callable
+
+from audio_nest.domain.audio import Audio
+from audio_nest.domain.audio_download_job import AudioDownloadJob
+from audio_nest.domain.audio_download_priority import AudioDownloadPriority
+from audio_nest.domain.audio_download_progress import AudioDownloadProgress
+from audio_nest.domain.audio_download_status import AudioDownloadStatus
+from audio_nest.services.i_audio_download_jobs_repository import IAudioDownloadJobsRepository
+from audio_nest.services.i_tracer import ITracer
+from audio_nest.use_cases.audio_getter import AudioGetter
+
+
+class AudioDownloadJobScheduler:
+    _log: Logger = logging.getLogger(__name__)
+    _audio_download_jobs_repository: IAudioDownloadJobsRepository
+    _audio_getter: AudioGetter
+    _progress_interval_seconds: float
+    _stale_period: timedelta
+    _tracer: ITracer
+    _audio_download_job_tasks: set[Task[None]]
+
+    def __init__(
+        self,
+        audio_download_jobs_repository: IAudioDownloadJobsRepository,
+        audio_getter: AudioGetter,
+        progress_interval_seconds: float,
+        stale_seconds: float,
+        tracer: ITracer
+    ) -> None:
+        self._audio_download_jobs_repository = audio_download_jobs_repository
+        self._audio_getter = audio_getter
+        self._progress_interval_seconds = progress_interval_seconds
+        self._stale_period = timedelta(seconds=stale_seconds)
+        self._tracer = tracer
+        self._audio_download_job_tasks = set()
+
+    async def schedule_audio_download(
+        self,
+        source_id: str,
+        on_audio_downloaded: Callable[[Audio], Awaitable[None]] | None = None,
+        priority: AudioDownloadPriority = AudioDownloadPriority.preview
+    ) -> AudioDownloadJob:
+        with self._tracer.trace_span(
+            'AudioDownloadJobScheduler.schedule_audio_download',
+            {'audio_nest.source_id': source_id, 'audio_nest.priority': priority.name}
+        ):
+            self._log.debug(f'Scheduling audio download from source \'{source_id}\'...')
+            audio_download_job: AudioDownloadJob = AudioDownloadJob(source_id)
+            await self._audio_download_jobs_repository.add_audio_download_job(audio_download_job)
+            audio_download_job_task: Task[None] = asyncio.create_task(
+                self._run_audio_download_job(audio_download_job, on_audio_downloaded, priority)
+            )
+            audio_download_job_task.add_done_callback(self._audio_download_job_tasks.discard)
+            self._audio_download_job_tasks.add(audio_download_job_task)
+            self._log.debug(f'{audio_download_job} scheduled')
+            return audio_download_job
+
+    async def fail_stale_audio_download_jobs(self) -> int:
+        with self._tracer.trace_span('AudioDownloadJobScheduler.fail_stale_audio_download_jobs'):
+            self._log.debug('Failing stale audio download jobs...')
+            # Jobs in progress are updated every progress interval, so stale ones were left behind by a stopped worker
+            stale_jobs_count: int = await self._audio_download_jobs_repository.fail_stale_audio_download_jobs(
+                updated_before=datetime.now(timezone.utc) - self._stale_period,
+                error='Audio download job interrupted'
+            )
+            if stale_jobs_count > 0:
+                self._log.warning(f'{stale_jobs_count} stale audio download job(s) failed')
+            self._log.debug('Stale audio download jobs failed')
+            return stale_jobs_count
+
+    async def cancel_audio_download_jobs(self) -> None:
+        self._log.debug('Cancelling audio download jobs...')
+        audio_download_job_task: Task[None]
+        for audio_download_job_task in list(self._audio_download_job_tasks):
+            audio_download_job_task.cancel()
+        await asyncio.gather(*self._audio_download_job_tasks, return_exceptions=True)
+        self._log.debug('Audio download jobs cancelled')
+
+    async def _run_audio_download_job(
+        self,
+        audio_download_job: AudioDownloadJob,
+        on_audio_downloaded: Callable[[Audio], Awaitable[None]] | None,
+        priority: AudioDownloadPriority
+    ) -> None:
+        with self._tracer.trace_span(
+            'AudioDownloadJobScheduler.run_audio_download_job',
+            {
+                'audio_nest.source_id': audio_download_job.source_id,
+                'audio_nest.audio_download_job_id': str(audio_download_job.id)
+            }
+        ):
+            self._log.debug(f'Running {audio_download_job}...')
+            progress_reporting: Task[None] = asyncio.create_task(
+                self._report_audio_download_progress(audio_download_job)
+            )
+            try:
+                audio: Audio = await self._audio_getter.get_audio_from_source(
+                    source_id=audio_download_job.source_id,
+                    priority=priority
+                )
+                if on_audio_downloaded is not None:
+                    await on_audio_downloaded(audio)
+                audio_download_job.progress = AudioDownloadProgress(
+                    status=AudioDownloadStatus.done,
+                    downloaded_bytes=audio.size_bytes or audio_download_job.progress.downloaded_bytes,
+                    total_bytes=audio.size_bytes
+                )
+                self._log.debug(f'{audio_download_job} done')
+            except asyncio.CancelledError:
+                self._log.warning(f'{audio_download_job} cancelled')
+                audio_download_job.progress.status = AudioDownloadStatus.failed
+                audio_download_job.error = 'Audio download job cancelled'
+                raise
+            except Exception as ex:
+                self._log.error(f'Exception found while running {audio_download_job}: {ex.__class__.__name__} - {ex}')
+                audio_download_job.progress.status = AudioDownloadStatus.failed
+                audio_download_job.error = str(ex)
+            finally:
+                progress_reporting.cancel()
+                with suppress(asyncio.CancelledError):
+                    await progress_reporting
+                await self._audio_download_jobs_repository.update_audio_download_job(audio_download_job)
+
+    async def _report_audio_download_progress(self, audio_download_job: AudioDownloadJob) -> None:
+        while True:
+            await asyncio.sleep(self._progress_interval_seconds)
+            try:
+                progress: AudioDownloadProgress | None = self._audio_getter.get_audio_download_progress(
+                    audio_download_job.source_id
+                )
+                if progress is not None:
+                    audio_download_job.progress = dataclasses.replace(progress)
+                # Written even without new progress, so other workers can tell the job is still running
+                await self._audio_download_jobs_repository.update_audio_download_job(audio_download_job)
+            except Exception as ex:
+                self._log.error(
+                    f'Exception found while reporting progress of {audio_download_job}: {ex.__class__.__name__} - {ex}'
+                )
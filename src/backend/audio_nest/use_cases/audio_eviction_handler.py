@@ -0,0 +1,55 @@
+import asyncio
+import logging
+from asyncio import Task
+from contextlib import suppress
+from logging import Logger
+from typing import AsyncGenerator
+
+from audio_nest.services.i_audio_download_lock import IAudioDownloadLock
+from audio_nest.use_cases.audio_evictor import AudioEvictor
+
+
+log: Logger = logging.getLogger(__name__)
+audio_eviction_lock_name: str = 'audio_eviction'
+
+
+async def handle_audio_eviction(
+    audio_evictor: AudioEvictor,
+    audio_eviction_lock: IAudioDownloadLock,
+    interval_seconds: float
+) -> AsyncGenerator[Task[None], None]:
+    log.debug('Starting audio eviction...')
+    audio_eviction: Task[None] = asyncio.create_task(
+        run_audio_eviction(audio_evictor, audio_eviction_lock, interval_seconds)
+    )
+    log.debug('Audio eviction started')
+    yield audio_eviction
+    log.debug('Stopping audio eviction...')
+    audio_eviction.cancel()
+    with suppress(asyncio.CancelledError):
+        await audio_eviction
+    log.debug('Audio eviction stopped')
+
+
+async def run_audio_eviction(
+    audio_evictor: AudioEvictor,
+    audio_eviction_lock: IAudioDownloadLock,
+    interval_seconds: float
+) -> None:
+    while True:
+        try:
+            # Every application worker runs this loop, the lock lets a single one evict at a time
+            if await audio_eviction_lock.acquire(audio_eviction_lock_name, blocking=False):
+                try:
+                    reclaimed_bytes: int = (
+                        await audio_evictor.evict_orphaned_audio() + await audio_evictor.evict_audio()
+                    )
+                    if reclaimed_bytes > 0:
+                        log.info(f'Audio eviction reclaimed {reclaimed_bytes} bytes')
+                finally:
+                    await audio_eviction_lock.release(audio_eviction_lock_name)
+            else:
+                log.debug('Audio eviction already running in another worker')
+        except Exception as ex:
+            log.error(f'Exception found while evicting audio: {ex.__class__.__name__} - {ex}')
+        await asyncio.sleep(interval_seconds)
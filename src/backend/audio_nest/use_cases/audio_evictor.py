@@ -0,0 +1,115 @@
+import logging
+from datetime import datetime, timedelta, timezone
+from logging import Logger
+
+from audio_nest.domain.audio_rendition import AudioRendition
+from audio_nest.domain.stored_audio import StoredAudio
+from audio_nest.services.i_audio_rendition_repository import IAudioRenditionRepository
+from audio_nest.services.i_audio_repository import IAudioRepository
+from audio_nest.services.i_audio_storage import IAudioStorage
+from audio_nest.services.i_tracer import ITracer
+
+
+class AudioEvictor:
+    _log: Logger = logging.getLogger(__name__)
+    _audio_repository: IAudioRepository
+    _audio_rendition_repository: IAudioRenditionRepository
+    _audio_storage: IAudioStorage
+    _quota_bytes: int
+    _max_evictions_per_run: int
+    _tracer: ITracer
+    _orphan_grace_period: timedelta
+    _evicted_audio_count: int
+    _reclaimed_bytes: int
+    _last_run_reclaimed_bytes: int
+
+    def __init__(
+        self,
+        audio_repository: IAudioRepository,
+        audio_rendition_repository: IAudioRenditionRepository,
+        audio_storage: IAudioStorage,
+        quota_bytes: int,
+        max_evictions_per_run: int,
+        orphan_grace_seconds: float,
+        tracer: ITracer
+    ) -> None:
+        self._audio_repository = audio_repository
+        self._audio_rendition_repository = audio_rendition_repository
+        self._audio_storage = audio_storage
+        self._quota_bytes = quota_bytes
+        self._max_evictions_per_run = max_evictions_per_run
+        self._tracer = tracer
+        self._orphan_grace_period = timedelta(seconds=orphan_grace_seconds)
+        self._evicted_audio_count = 0
+        self._reclaimed_bytes = 0
+        self._last_run_reclaimed_bytes = 0
+
+    @property
+    def evicted_audio_count(self) -> int:
+        return self._evicted_audio_count
+
+    @property
+    def reclaimed_bytes(self) -> int:
+        return self._reclaimed_bytes
+
+    @property
+    def last_run_reclaimed_bytes(self) -> int:
+        return self._last_run_reclaimed_bytes
+
+    async def evict_audio(self) -> int:
+        with self._tracer.trace_span('AudioEvictor.evict_audio'):
+            self._log.debug('Evicting audio...')
+            used_bytes: int = await self._audio_repository.get_total_audio_size_bytes()
+            reclaimed_bytes: int = 0
+            if used_bytes > self._quota_bytes:
+                stored_audio: StoredAudio
+                for stored_audio in await self._audio_repository.get_least_recently_used_unreferenced_audio(
+                    self._max_evictions_per_run
+                ):
+                    if used_bytes <= self._quota_bytes:
+                        break
+                    if not await self._audio_repository.delete_unreferenced_audio(stored_audio.audio.source_id):
+                        continue
+                    audio_reclaimed_bytes: int = await self._delete_audio_file(stored_audio)
+                    audio_reclaimed_bytes += await self._delete_audio_renditions(stored_audio.audio.source_id)
+                    used_bytes -= audio_reclaimed_bytes
+                    reclaimed_bytes += audio_reclaimed_bytes
+                    self._evicted_audio_count += 1
+            self._reclaimed_bytes += reclaimed_bytes
+            self._last_run_reclaimed_bytes = reclaimed_bytes
+            self._log.debug(f'Audio evicted: {reclaimed_bytes} bytes reclaimed, {used_bytes} bytes used')
+            if used_bytes > self._quota_bytes:
+                self._log.warning(
+                    f'Audio storage still over quota after eviction: {used_bytes} of {self._quota_bytes} bytes used'
+                )
+            return reclaimed_bytes
+
+    async def evict_orphaned_audio(self) -> int:
+        with self._tracer.trace_span('AudioEvictor.evict_orphaned_audio'):
+            self._log.debug('Evicting orphaned audio...')
+            reclaimed_bytes: int = 0
+            stored_audio: StoredAudio
+            for stored_audio in await self._audio_repository.get_orphaned_audio(
+                orphaned_before=datetime.now(timezone.utc) - self._orphan_grace_period,
+                limit=self._max_evictions_per_run
+            ):
+                if await self._audio_repository.delete_unreferenced_audio(stored_audio.audio.source_id):
+                    reclaimed_bytes += await self._delete_audio_file(stored_audio)
+                    reclaimed_bytes += await self._delete_audio_renditions(stored_audio.audio.source_id)
+                    self._evicted_audio_count += 1
+            self._reclaimed_bytes += reclaimed_bytes
+            self._log.debug(f'Orphaned audio evicted: {reclaimed_bytes} bytes reclaimed')
+            return reclaimed_bytes
+
+    async def _delete_audio_file(self, stored_audio: StoredAudio) -> int:
+        if await self._audio_repository.is_audio_file_in_use(stored_audio.audio.file_path):
+            self._log.debug(f'File of audio from source \'{stored_audio.audio.source_id}\' still in use')
+            return 0
+        return await self._audio_storage.delete_audio_file(stored_audio.audio.file_path)
+
+    async def _delete_audio_renditions(self, source_id: str) -> int:
+        reclaimed_bytes: int = 0
+        audio_rendition: AudioRendition
+        for audio_rendition in await self._audio_rendition_repository.delete_audio_renditions(source_id):
+            reclaimed_bytes += await self._audio_storage.delete_audio_file(audio_rendition.file_path)
+        return reclaimed_bytes
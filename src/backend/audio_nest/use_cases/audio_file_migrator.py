@@ -0,0 +1,56 @@
+import logging
+from logging import Logger
+from pathlib import Path
+
+from audio_nest.domain.audio import Audio
+from audio_nest.services.i_audio_file_layout import IAudioFileLayout
+from audio_nest.services.i_audio_repository import IAudioRepository
+from audio_nest.services.i_tracer import ITracer
+
+
+class AudioFileMigrator:
+    _log: Logger = logging.getLogger(__name__)
+    _audio_repository: IAudioRepository
+    _audio_file_layout: IAudioFileLayout
+    _batch_size: int
+    _tracer: ITracer
+
+    def __init__(
+        self,
+        audio_repository: IAudioRepository,
+        audio_file_layout: IAudioFileLayout,
+        batch_size: int,
+        tracer: ITracer
+    ) -> None:
+        self._audio_repository = audio_repository
+        self._audio_file_layout = audio_file_layout
+        self._batch_size = batch_size
+        self._tracer = tracer
+
+    async def migrate_audio_files(self) -> int:
+        with self._tracer.trace_span('AudioFileMigrator.migrate_audio_files'):
+            self._log.debug('Migrating audio files...')
+            migrated_audio_count: int = 0
+            after_source_id: str | None = None
+            audio_list: list[Audio]
+            while audio_list := await self._audio_repository.get_audio_list(
+                limit=self._batch_size,
+                after_source_id=after_source_id
+            ):
+                file_paths: dict[str, Path] = {}
+                audio: Audio
+                for audio in audio_list:
+                    if not audio.file_path.is_file():
+                        self._log.warning(
+                            f'File of audio from source \'{audio.source_id}\' not found: {audio.file_path}'
+                        )
+                        continue
+                    file_path: Path = await self._audio_file_layout.store_audio_file(audio)
+                    if file_path != audio.file_path:
+                        file_paths[audio.source_id] = file_path
+                await self._audio_repository.update_audio_file_paths(file_paths)
+                migrated_audio_count += len(file_paths)
+                after_source_id = audio_list[-1].source_id
+                self._log.info(f'{migrated_audio_count} audio files migrated so far')
+            self._log.debug(f'Audio files migrated: {migrated_audio_count}')
+            return migrated_audio_count
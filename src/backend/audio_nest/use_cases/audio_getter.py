@@ -1,25 +1,304 @@
+import asyncio
 import logging
+from asyncio import Event, Task
+from dataclasses import dataclass, field
 from logging import Logger
+from pathlib import Path
+from typing import AsyncGenerator, BinaryIO
 
+from audio_nest.domain.audio_download_priority import AudioDownloadPriority
+from audio_nest.domain.audio_download_progress import AudioDownloadProgress
+from audio_nest.domain.audio_download_status import AudioDownloadStatus
+from audio_nest.domain.audio_stream import AudioStream
+from audio_nest.services.audio_content_hasher import get_audio_content_hash
+from audio_nest.services.i_audio_download_lock import IAudioDownloadLock
 from audio_nest.services.i_audio_downloader import IAudioDownloader
 from audio_nest.services.i_audio_repository import IAudioRepository
+from audio_nest.services.i_audio_storage import IAudioStorage
+from audio_nest.services.i_stage_timer import IStageTimer
+from audio_nest.services.i_tracer import ITracer
 from audio_nest.domain.user_audio import Audio
 
 
+@dataclass
+class _PartialAudio:
+    audio: Audio
+    file_path: Path
+    size_bytes: int = 0
+    updated: Event = field(default_factory=Event)
+
+
 class AudioGetter:
     _log: Logger = logging.getLogger(__name__)
+    _partial_file_suffix: str = '.part'
+    _read_chunk_size: int = 64 * 1024
     _audio_downloader: IAudioDownloader
     _audio_repository: IAudioRepository
+    _audio_storage: IAudioStorage
+    _audio_download_lock: IAudioDownloadLock
+    _stage_timer: IStageTimer
+    _tracer: ITracer
+    _audio_downloads: dict[str, Task[Audio]]
+    _audio_download_progress: dict[str, AudioDownloadProgress]
+    _partial_audio: dict[str, _PartialAudio]
+    _started_audio_downloads_count: int
+    _coalesced_audio_downloads_count: int
 
-    def __init__(self, audio_downloader: IAudioDownloader, audio_repository: IAudioRepository) -> None:
+    def __init__(
+        self,
+        audio_downloader: IAudioDownloader,
+        audio_repository: IAudioRepository,
+        audio_storage: IAudioStorage,
+        audio_download_lock: IAudioDownloadLock,
+        stage_timer: IStageTimer,
+        tracer: ITracer
+    ) -> None:
         self._audio_downloader = audio_downloader
         self._audio_repository = audio_repository
+        self._audio_storage = audio_storage
+        self._audio_download_lock = audio_download_lock
+        self._stage_timer = stage_timer
+        self._tracer = tracer
+        self._audio_downloads = {}
+        self._audio_download_progress = {}
+        self._partial_audio = {}
+        self._started_audio_downloads_count = 0
+        self._coalesced_audio_downloads_count = 0
+
+    @property
+    def in_flight_audio_downloads_count(self) -> int:
+        return len(self._audio_downloads)
+
+    @property
+    def started_audio_downloads_count(self) -> int:
+        return self._started_audio_downloads_count
+
+    @property
+    def coalesced_audio_downloads_count(self) -> int:
+        return self._coalesced_audio_downloads_count
+
+    def get_audio_download_progress(self, source_id: str) -> AudioDownloadProgress | None:
+        return self._audio_download_progress.get(source_id)
+
+    async def get_audio_from_source(
+        self,
+        source_id: str,
+        priority: AudioDownloadPriority = AudioDownloadPriority.preview
+    ) -> Audio:
+        with self._tracer.trace_span(
+            'AudioGetter.get_audio_from_source',
+            {'audio_nest.source_id': source_id, 'audio_nest.priority': priority.name}
+        ):
+            self._log.debug(f'Getting audio from source \'{source_id}\'...')
+            audio: Audio | None = await self._audio_repository.get_audio_from_source(source_id)
+            if audio is None or not await self._audio_storage.is_audio_file_stored(audio.file_path):
+                audio = await self._download_audio_from_source(source_id=source_id, priority=priority)
+            else:
+                await self._audio_repository.update_audio_access_time(source_id)
+            self._log.debug(f'Audio from source \'{source_id}\' retrieved')
+            return audio
+
+    async def stream_audio_from_source(
+        self,
+        source_id: str,
+        priority: AudioDownloadPriority = AudioDownloadPriority.preview
+    ) -> AudioStream:
+        with self._tracer.trace_span(
+            'AudioGetter.stream_audio_from_source',
+            {'audio_nest.source_id': source_id, 'audio_nest.priority': priority.name}
+        ):
+            self._log.debug(f'Streaming audio from source \'{source_id}\'...')
+            audio: Audio | None = await self._audio_repository.get_audio_from_source(source_id)
+            if audio is None or not await self._audio_storage.is_audio_file_stored(audio.file_path):
+                partial_audio: _PartialAudio | None = self._partial_audio.get(source_id)
+                if partial_audio is None and source_id not in self._audio_downloads:
+                    # Another process already downloading this source: wait for its file instead of tailing our own
+                    if await self._audio_download_lock.acquire(source_id, blocking=False):
+                        try:
+                            partial_audio = self._start_partial_audio_download(source_id=source_id, priority=priority)
+                        except BaseException:
+                            # Released here until the download task takes over the lock, so it is never held stale
+                            await self._audio_download_lock.release(source_id)
+                            raise
+                if partial_audio is not None:
+                    self._log.debug(f'Tailing partial audio from source \'{source_id}\'...')
+                    # Opened before returning, so the file cannot be renamed away before the reader starts tailing it
+                    partial_file: BinaryIO = await asyncio.to_thread(partial_audio.file_path.open, 'rb')
+                    return AudioStream(
+                        audio=partial_audio.audio,
+                        chunks=self._read_partial_audio(
+                            partial_audio=partial_audio,
+                            partial_file=partial_file,
+                            audio_download=self._audio_downloads[source_id]
+                        )
+                    )
+                audio = await self._download_audio_from_source(source_id=source_id, priority=priority)
+            else:
+                await self._audio_repository.update_audio_access_time(source_id)
+            return AudioStream(audio=audio, chunks=self._audio_storage.read_audio_file(audio.file_path))
+
+    async def _download_audio_from_source(self, source_id: str, priority: AudioDownloadPriority) -> Audio:
+        audio_download: Task[Audio] | None = self._audio_downloads.get(source_id)
+        if audio_download is None:
+            progress: AudioDownloadProgress = AudioDownloadProgress()
+            audio_download = self._add_audio_download(
+                source_id=source_id,
+                audio_download=asyncio.create_task(
+                    self._download_and_add_audio_from_source(source_id=source_id, progress=progress, priority=priority)
+                ),
+                progress=progress
+            )
+        else:
+            self._log.debug(f'Joining in-flight download of audio from source \'{source_id}\'...')
+            self._coalesced_audio_downloads_count += 1
+        # Shielded so a disconnecting client does not cancel the download shared with other waiters
+        return await asyncio.shield(audio_download)
+
+    async def _download_and_add_audio_from_source(
+        self,
+        source_id: str,
+        progress: AudioDownloadProgress,
+        priority: AudioDownloadPriority
+    ) -> Audio:
+        with self._tracer.trace_span(
+            'AudioGetter.download_audio_from_source',
+            {'audio_nest.source_id': source_id, 'audio_nest.priority': priority.name}
+        ):
+            with (
+                self._stage_timer.time_stage('audio_download_lock_wait'),
+                self._tracer.trace_span('AudioGetter.acquire_audio_download_lock')
+            ):
+                await self._audio_download_lock.acquire(source_id)
+            try:
+                audio: Audio | None = await self._audio_repository.get_audio_from_source(source_id)
+                if audio is not None and await self._audio_storage.is_audio_file_stored(audio.file_path):
+                    self._log.debug(f'Audio from source \'{source_id}\' downloaded by another process')
+                    return audio
+                with self._stage_timer.time_stage('audio_download'):
+                    audio = await self._audio_downloader.download_audio_from_source(
+                        source_id,
+                        progress=progress,
+                        priority=priority
+                    )
+                await self._store_audio_file(audio)
+                await self._audio_repository.add_audio(audio)
+                return audio
+            finally:
+                await self._audio_download_lock.release(source_id)
 
-    async def get_audio_from_source(self, source_id: str) -> Audio:
-        self._log.debug(f'Getting audio from source \'{source_id}\'...')
-        audio: Audio = (
-            await self._audio_repository.get_audio_from_source(source_id) or
-            await self._audio_downloader.download_audio_from_source(source_id)
+    def _start_partial_audio_download(self, source_id: str, priority: AudioDownloadPriority) -> _PartialAudio:
+        audio_stream: AudioStream = self._audio_downloader.stream_audio_from_source(source_id, priority=priority)
+        partial_audio: _PartialAudio = _PartialAudio(
+            audio=audio_stream.audio,
+            file_path=audio_stream.audio.file_path.with_name(
+                f'{audio_stream.audio.file_path.name}{self._partial_file_suffix}'
+            )
         )
-        self._log.debug(f'Audio from source \'{source_id}\' retrieved')
-        return audio
+        partial_audio.file_path.parent.mkdir(parents=True, exist_ok=True)
+        partial_file: BinaryIO = partial_audio.file_path.open('wb')
+        progress: AudioDownloadProgress = AudioDownloadProgress(status=AudioDownloadStatus.transcoding)
+        audio_download: Task[Audio] = self._add_audio_download(
+            source_id=source_id,
+            audio_download=asyncio.create_task(
+                self._write_and_add_partial_audio(partial_audio, partial_file, audio_stream.chunks, progress)
+            ),
+            progress=progress
+        )
+        self._partial_audio[source_id] = partial_audio
+        audio_download.add_done_callback(lambda _: self._remove_partial_audio(partial_audio))
+        return partial_audio
+
+    def _add_audio_download(
+        self,
+        source_id: str,
+        audio_download: Task[Audio],
+        progress: AudioDownloadProgress
+    ) -> Task[Audio]:
+        audio_download.add_done_callback(lambda _: self._remove_audio_download(source_id))
+        self._audio_downloads[source_id] = audio_download
+        self._audio_download_progress[source_id] = progress
+        self._started_audio_downloads_count += 1
+        return audio_download
+
+    async def _write_and_add_partial_audio(
+        self,
+        partial_audio: _PartialAudio,
+        partial_file: BinaryIO,
+        chunks: AsyncGenerator[bytes, None],
+        progress: AudioDownloadProgress
+    ) -> Audio:
+        with self._tracer.trace_span(
+            'AudioGetter.write_partial_audio',
+            {'audio_nest.source_id': partial_audio.audio.source_id}
+        ):
+            try:
+                try:
+                    with partial_file:
+                        chunk: bytes
+                        async for chunk in chunks:
+                            await asyncio.to_thread(self._write_partial_audio_chunk, partial_file, chunk)
+                            partial_audio.size_bytes += len(chunk)
+                            progress.downloaded_bytes = partial_audio.size_bytes
+                            self._notify_partial_audio_updated(partial_audio)
+                    self._remove_partial_audio(partial_audio)
+                    partial_audio.file_path.replace(partial_audio.audio.file_path)
+                except BaseException:
+                    partial_audio.file_path.unlink(missing_ok=True)
+                    raise
+                await self._store_audio_file(partial_audio.audio)
+                await self._audio_repository.add_audio(partial_audio.audio)
+                return partial_audio.audio
+            finally:
+                await self._audio_download_lock.release(partial_audio.audio.source_id)
+
+    async def _read_partial_audio(
+        self,
+        partial_audio: _PartialAudio,
+        partial_file: BinaryIO,
+        audio_download: Task[Audio]
+    ) -> AsyncGenerator[bytes, None]:
+        read_bytes: int = 0
+        with partial_file:
+            while True:
+                is_download_done: bool = audio_download.done()
+                chunk: bytes = await asyncio.to_thread(partial_file.read, self._read_chunk_size)
+                read_bytes += len(chunk)
+                if chunk:
+                    yield chunk
+                elif is_download_done:
+                    break
+                # Updates notified while reading off the event loop would be missed by waiting, so they are read first
+                elif read_bytes == partial_audio.size_bytes and not audio_download.done():
+                    await partial_audio.updated.wait()
+        audio_download.result()
+
+    async def _store_audio_file(self, audio: Audio) -> None:
+        with (
+            self._stage_timer.time_stage('audio_storage'),
+            self._tracer.trace_span('AudioGetter.store_audio_file', {'audio_nest.source_id': audio.source_id})
+        ):
+            # Measured while the downloaded file is still local, as storage may move it off this host
+            if audio.file_path.is_file():
+                audio.size_bytes = audio.file_path.stat().st_size
+                audio.content_hash = await asyncio.to_thread(get_audio_content_hash, audio.file_path)
+            audio.file_path = await self._audio_storage.store_audio_file(audio)
+
+    def _remove_audio_download(self, source_id: str) -> None:
+        self._audio_downloads.pop(source_id, None)
+        self._audio_download_progress.pop(source_id, None)
+
+    def _remove_partial_audio(self, partial_audio: _PartialAudio) -> None:
+        if self._partial_audio.get(partial_audio.audio.source_id) is partial_audio:
+            del self._partial_audio[partial_audio.audio.source_id]
+        self._notify_partial_audio_updated(partial_audio)
+
+    @staticmethod
+    def _write_partial_audio_chunk(partial_file: BinaryIO, chunk: bytes) -> None:
+        # Flushed with every chunk, so concurrent readers tailing the file see it before being notified
+        partial_file.write(chunk)
+        partial_file.flush()
+
+    @staticmethod
+    def _notify_partial_audio_updated(partial_audio: _PartialAudio) -> None:
+        partial_audio.updated.set()
+        partial_audio.updated.clear()
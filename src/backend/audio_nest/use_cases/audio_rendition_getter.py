@@ -0,0 +1,139 @@
+import asyncio
+import logging
+from dataclasses import replace
+from logging import Logger
+from pathlib import Path
+
+from audio_nest.domain.audio import Audio
+from audio_nest.domain.audio_codec import AudioCodec
+from audio_nest.domain.audio_download_priority import AudioDownloadPriority
+from audio_nest.domain.audio_quality import AudioQuality
+from audio_nest.domain.audio_rendition import AudioRendition
+from audio_nest.services.audio_content_hasher import get_audio_content_hash
+from audio_nest.services.i_audio_download_lock import IAudioDownloadLock
+from audio_nest.services.i_audio_rendition_repository import IAudioRenditionRepository
+from audio_nest.services.i_audio_storage import IAudioStorage
+from audio_nest.services.i_audio_transcoder import IAudioTranscoder
+from audio_nest.services.i_tracer import ITracer
+from audio_nest.use_cases.audio_getter import AudioGetter
+
+
+class AudioRenditionGetter:
+    _log: Logger = logging.getLogger(__name__)
+    _audio_getter: AudioGetter
+    _audio_transcoder: IAudioTranscoder
+    _audio_rendition_repository: IAudioRenditionRepository
+    _audio_storage: IAudioStorage
+    _audio_download_lock: IAudioDownloadLock
+    _codec: AudioCodec
+    _rendition_codec: AudioCodec
+    _rendition_bit_rates_kbps: dict[AudioQuality, int]
+    _tracer: ITracer
+
+    def __init__(
+        self,
+        audio_getter: AudioGetter,
+        audio_transcoder: IAudioTranscoder,
+        audio_rendition_repository: IAudioRenditionRepository,
+        audio_storage: IAudioStorage,
+        audio_download_lock: IAudioDownloadLock,
+        codec: AudioCodec,
+        rendition_codec: AudioCodec,
+        rendition_bit_rates_kbps: dict[AudioQuality, int],
+        tracer: ITracer
+    ) -> None:
+        self._audio_getter = audio_getter
+        self._audio_transcoder = audio_transcoder
+        self._audio_rendition_repository = audio_rendition_repository
+        self._audio_storage = audio_storage
+        self._audio_download_lock = audio_download_lock
+        self._codec = codec
+        self._rendition_codec = rendition_codec
+        self._tracer = tracer
+        self._rendition_bit_rates_kbps = {
+            AudioQuality(quality): bit_rate_kbps
+            for quality, bit_rate_kbps in rendition_bit_rates_kbps.items()
+            if quality != AudioQuality.high
+        }
+
+    def get_preferred_audio_quality(self, accepted_codecs: set[AudioCodec]) -> AudioQuality:
+        if self._codec in accepted_codecs or self._rendition_codec not in accepted_codecs:
+            return AudioQuality.high
+        return max(self._rendition_bit_rates_kbps, key=self._rendition_bit_rates_kbps.get, default=AudioQuality.high)
+
+    async def get_audio_rendition(
+        self,
+        source_id: str,
+        quality: AudioQuality = AudioQuality.high,
+        priority: AudioDownloadPriority = AudioDownloadPriority.preview
+    ) -> Audio:
+        with self._tracer.trace_span(
+            'AudioRenditionGetter.get_audio_rendition',
+            {
+                'audio_nest.source_id': source_id,
+                'audio_nest.quality': quality.value,
+                'audio_nest.priority': priority.name
+            }
+        ):
+            self._log.debug(f'Getting {quality} quality audio rendition from source \'{source_id}\'...')
+            # Always resolved first, so renditions keep their source audio recently used and present to transcode from
+            audio: Audio = await self._audio_getter.get_audio_from_source(source_id=source_id, priority=priority)
+            if quality not in self._rendition_bit_rates_kbps:
+                self._log.debug(f'{quality.capitalize()} quality audio from source \'{source_id}\' retrieved')
+                return audio
+            audio_rendition: AudioRendition | None = await self._audio_rendition_repository.get_audio_rendition(
+                source_id=source_id,
+                quality=quality
+            )
+            if audio_rendition is None or not await self._audio_storage.is_audio_file_stored(audio_rendition.file_path):
+                audio_rendition = await self._transcode_audio_rendition(audio=audio, quality=quality, priority=priority)
+            self._log.debug(f'{quality.capitalize()} quality audio rendition from source \'{source_id}\' retrieved')
+            return audio_rendition
+
+    async def _transcode_audio_rendition(
+        self,
+        audio: Audio,
+        quality: AudioQuality,
+        priority: AudioDownloadPriority
+    ) -> AudioRendition:
+        audio_rendition: AudioRendition = AudioRendition(
+            source_id=audio.source_id,
+            file_path=audio.file_path,
+            bit_rate_kbps=self._rendition_bit_rates_kbps[quality],
+            codec=self._rendition_codec,
+            quality=quality
+        )
+        await self._audio_download_lock.acquire(audio_rendition.rendition_id)
+        try:
+            stored_audio_rendition: AudioRendition | None = await self._audio_rendition_repository.get_audio_rendition(
+                source_id=audio.source_id,
+                quality=quality
+            )
+            if stored_audio_rendition is not None and await self._audio_storage.is_audio_file_stored(
+                stored_audio_rendition.file_path
+            ):
+                return stored_audio_rendition
+            local_file_path: Path
+            async with self._audio_storage.open_local_audio_file(audio.file_path) as local_file_path:
+                transcoded_audio: Audio = await self._audio_transcoder.transcode_audio(
+                    replace(audio, file_path=local_file_path),
+                    codec=audio_rendition.codec,
+                    bit_rate_kbps=audio_rendition.bit_rate_kbps,
+                    priority=priority
+                )
+            audio_rendition.size_bytes = transcoded_audio.file_path.stat().st_size
+            audio_rendition.content_hash = await asyncio.to_thread(get_audio_content_hash, transcoded_audio.file_path)
+            # Stored under the rendition id, so flat layouts keep it apart from the source audio file
+            audio_rendition.file_path = await self._audio_storage.store_audio_file(
+                Audio(
+                    source_id=audio_rendition.rendition_id,
+                    file_path=transcoded_audio.file_path,
+                    bit_rate_kbps=transcoded_audio.bit_rate_kbps,
+                    codec=transcoded_audio.codec,
+                    content_hash=audio_rendition.content_hash
+                )
+            )
+            await self._audio_rendition_repository.add_audio_rendition(audio_rendition)
+            return audio_rendition
+        finally:
+            await self._audio_download_lock.release(audio_rendition.rendition_id)
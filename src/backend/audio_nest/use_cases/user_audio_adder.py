@@ -1,6 +1,7 @@
 import logging
 from logging import Logger
 
+from audio_nest.services.i_tracer import ITracer
 from audio_nest.services.i_user_audio_repository import IUserAudioRepository
 from audio_nest.domain.user_audio import UserAudio
 from audio_nest.exceptions.user_audio_already_added_exception import UserAudioAlreadyAddedException
@@ -9,13 +10,18 @@ from audio_nest.exceptions.user_audio_already_added_exception import UserAudioAl
 class UserAudioAdder:
     _log: Logger = logging.getLogger(__name__)
     _user_audio_repository: IUserAudioRepository
+    _tracer: ITracer
 
-    def __init__(self, user_audio_repository: IUserAudioRepository) -> None:
+    def __init__(self, user_audio_repository: IUserAudioRepository, tracer: ITracer) -> None:
         self._user_audio_repository = user_audio_repository
+        self._tracer = tracer
 
     async def add_user_audio(self, user_audio: UserAudio) -> None:
-        self._log.debug(f'Adding {user_audio}...')
-        if await self._user_audio_repository.get_user_audio_from_source(user_audio.source_id) is not None:
-            raise UserAudioAlreadyAddedException(user_audio)
-        await self._user_audio_repository.add_user_audio(user_audio)
-        self._log.debug(f'{user_audio} added')
+        with self._tracer.trace_span(
+            'UserAudioAdder.add_user_audio',
+            {'audio_nest.source_id': user_audio.source_id, 'audio_nest.user_id': str(user_audio.user_id)}
+        ):
+            self._log.debug(f'Adding {user_audio}...')
+            if not await self._user_audio_repository.add_user_audio(user_audio):
+                raise UserAudioAlreadyAddedException(user_audio)
+            self._log.debug(f'{user_audio} added')
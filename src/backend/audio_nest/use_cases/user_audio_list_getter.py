@@ -1,20 +1,58 @@
+import base64
+import binascii
 import logging
+import struct
+from datetime import datetime, timedelta, timezone
 from logging import Logger
 from uuid import UUID
 
-from audio_nest.services.i_user_audio_repository import IUserAudioRepository
 from audio_nest.domain.user_audio import UserAudio
+from audio_nest.domain.user_audio_page import UserAudioPage
+from audio_nest.exceptions.invalid_user_audio_cursor_exception import InvalidUserAudioCursorException
+from audio_nest.services.i_tracer import ITracer
+from audio_nest.services.i_user_audio_repository import IUserAudioRepository
 
 
 class UserAudioListGetter:
     _log: Logger = logging.getLogger(__name__)
+    _cursor_epoch: datetime = datetime(1970, 1, 1, tzinfo=timezone.utc)
     _user_audio_repository: IUserAudioRepository
+    _tracer: ITracer
 
-    def __init__(self, user_audio_repository: IUserAudioRepository) -> None:
+    def __init__(self, user_audio_repository: IUserAudioRepository, tracer: ITracer) -> None:
         self._user_audio_repository = user_audio_repository
+        self._tracer = tracer
+
+    async def get_user_audio_list(self, user_id: UUID, limit: int, cursor: str | None = None) -> UserAudioPage:
+        with self._tracer.trace_span('UserAudioListGetter.get_user_audio_list', {'audio_nest.user_id': str(user_id)}):
+            self._log.debug(f'Getting user \'{user_id}\' audio list...')
+            after_created_at: datetime | None = None
+            after_id: UUID | None = None
+            if cursor is not None:
+                after_created_at, after_id = self._decode_cursor(cursor)
+            user_audio_list: list[UserAudio] = await self._user_audio_repository.get_user_audio_list(
+                user_id=user_id,
+                limit=limit + 1,
+                after_created_at=after_created_at,
+                after_id=after_id
+            )
+            user_audio_page: UserAudioPage = UserAudioPage(user_audio_list=user_audio_list[:limit])
+            if len(user_audio_list) > limit:
+                user_audio_page.next_cursor = self._encode_cursor(user_audio_page.user_audio_list[-1])
+            self._log.debug(f'User \'{user_id}\' audio list retrieved')
+            return user_audio_page
+
+    @classmethod
+    def _encode_cursor(cls, user_audio: UserAudio) -> str:
+        created_at_us: int = (user_audio.created_at - cls._cursor_epoch) // timedelta(microseconds=1)
+        return base64.urlsafe_b64encode(struct.pack('>q', created_at_us) + user_audio.id.bytes).rstrip(b'=').decode()
 
-    async def get_user_audio_list(self, user_id: UUID) -> list[UserAudio]:
-        self._log.debug(f'Getting user \'{user_id}\' audio list...')
-        user_audio_list: list[UserAudio] = await self._user_audio_repository.get_user_audio_list(user_id)
-        self._log.debug(f'User \'{user_id}\' audio list retrieved')
-        return user_audio_list
+    @classmethod
+    def _decode_cursor(cls, cursor: str) -> tuple[datetime, UUID]:
+        try:
+            cursor_bytes: bytes = base64.urlsafe_b64decode(f'{cursor}{"=" * (-len(cursor) % 4)}')
+            created_at_us: int
+            (created_at_us,) = struct.unpack('>q', cursor_bytes[:8])
+            return cls._cursor_epoch + timedelta(microseconds=created_at_us), UUID(bytes=cursor_bytes[8:])
+        except (binascii.Error, struct.error, OverflowError, ValueError):
+            raise InvalidUserAudioCursorException(cursor)
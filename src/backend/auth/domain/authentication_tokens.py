@@ -0,0 +1,7 @@
+from dataclasses import dataclass, field
+
+
+@dataclass
+class AuthenticationTokens:
+    access_token: str = field(repr=False)
+    refresh_token: str = field(repr=False)
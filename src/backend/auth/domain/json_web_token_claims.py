@@ -0,0 +1,14 @@
+from dataclasses import dataclass
+from datetime import datetime
+from uuid import UUID
+
+from auth.domain.json_web_token_type import JsonWebTokenType
+
+
+@dataclass
+class JsonWebTokenClaims:
+    user_id: UUID
+    email: str
+    token_id: str
+    token_type: JsonWebTokenType
+    expiration_time: datetime
@@ -0,0 +1,6 @@
+from enum import StrEnum
+
+
+class JsonWebTokenType(StrEnum):
+    access = 'access'
+    refresh = 'refresh'
@@ -5,5 +5,5 @@ from uuid import UUID, uuid4
 @dataclass
 class User:
     email: str = field(repr=False)
-    hashed_password: str = field(repr=False)
+    hashed_password: str | None = field(default=None, repr=False)
     id: UUID = field(default_factory=uuid4)
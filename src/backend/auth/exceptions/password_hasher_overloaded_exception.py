@@ -0,0 +1,3 @@
+class PasswordHasherOverloadedException(Exception):
+    def __init__(self, max_pending: int) -> None:
+        super().__init__(f'Password hasher already has {max_pending} pending operations')
@@ -0,0 +1,16 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+
+
+class IRevokedTokensRepository(ABC):
+    @abstractmethod
+    async def revoke_token(self, token_id: str, expiration_time: datetime) -> None:
+        pass
+
+    @abstractmethod
+    async def revoke_token_if_not_revoked(self, token_id: str, expiration_time: datetime) -> bool:
+        pass
+
+    @abstractmethod
+    async def is_token_revoked(self, token_id: str) -> bool:
+        pass
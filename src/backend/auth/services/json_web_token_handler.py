@@ -1,42 +1,91 @@
 import logging
 from datetime import datetime, timedelta, timezone
 from logging import Logger
+from typing import Any
+from uuid import UUID, uuid4
 
 import jwt
 from jwt.exceptions import PyJWTError
 
+from auth.domain.json_web_token_claims import JsonWebTokenClaims
+from auth.domain.json_web_token_type import JsonWebTokenType
+from auth.domain.user import User
+
 
 class JsonWebTokenHandler:
     _log: Logger = logging.getLogger(__name__)
     _secret_key: str
     _algorithm: str
-    _expiration_days: int
+    _access_token_expiration: timedelta
+    _refresh_token_expiration: timedelta
 
-    def __init__(self, secret_key: str, algorithm: str, expiration_days: int) -> None:
+    def __init__(
+        self,
+        secret_key: str,
+        algorithm: str,
+        access_token_expiration_minutes: int,
+        refresh_token_expiration_days: int
+    ) -> None:
         self._secret_key = secret_key
         self._algorithm = algorithm
-        self._expiration_days = expiration_days
+        self._access_token_expiration = timedelta(minutes=access_token_expiration_minutes)
+        self._refresh_token_expiration = timedelta(days=refresh_token_expiration_days)
+
+    def create_access_token(self, user: User) -> str:
+        return self._create_token(user=user, token_type=JsonWebTokenType.access)
+
+    def create_refresh_token(self, user: User) -> str:
+        return self._create_token(user=user, token_type=JsonWebTokenType.refresh)
+
+    def decode_access_token(self, token: str) -> JsonWebTokenClaims | None:
+        return self._decode_token(token=token, token_type=JsonWebTokenType.access)
+
+    def decode_refresh_token(self, token: str) -> JsonWebTokenClaims | None:
+        return self._decode_token(token=token, token_type=JsonWebTokenType.refresh)
 
-    def create_access_token(self, subject: str) -> str:
-        self._log.debug(f'Creating access token for subject \'{subject}\'...')
-        access_token: str = jwt.encode(
+    def _create_token(self, user: User, token_type: JsonWebTokenType) -> str:
+        self._log.debug(f'Creating {token_type} token for user \'{user.id}\'...')
+        issued_at: datetime = datetime.now(timezone.utc)
+        token: str = jwt.encode(
             payload={
-                'sub': subject,
-                'exp': (datetime.now(timezone.utc) + timedelta(days=self._expiration_days))
+                'sub': str(user.id),
+                'email': user.email,
+                'jti': uuid4().hex,
+                'type': token_type,
+                'iat': issued_at,
+                'exp': issued_at + (
+                    self._access_token_expiration
+                    if token_type == JsonWebTokenType.access
+                    else self._refresh_token_expiration
+                )
             },
             key=self._secret_key,
             algorithm=self._algorithm
         )
-        self._log.debug(f'Access token for subject \'{subject}\' created')
-        return access_token
+        self._log.debug(f'{token_type.capitalize()} token for user \'{user.id}\' created')
+        return token
 
-    def decode_access_token(self, token: str) -> str | None:
-        self._log.debug('Decoding access token...')
+    def _decode_token(self, token: str, token_type: JsonWebTokenType) -> JsonWebTokenClaims | None:
+        self._log.debug(f'Decoding {token_type} token...')
         try:
-            payload: dict[str, str | int] = jwt.decode(jwt=token, key=self._secret_key, algorithms=[self._algorithm])
-            subject: str | None = payload.get('sub')
-            self._log.debug(f'Access token decoded with subject \'{subject}\'')
-            return subject
-        except PyJWTError:
-            self._log.debug('Access token decoding failed')
+            payload: dict[str, Any] = jwt.decode(
+                jwt=token,
+                key=self._secret_key,
+                algorithms=[self._algorithm],
+                options={'require': ['sub', 'email', 'jti', 'type', 'exp']}
+            )
+            if payload['type'] != token_type:
+                self._log.debug(f'Token decoding failed: expected {token_type} token, got {payload["type"]}')
+                return None
+            claims: JsonWebTokenClaims = JsonWebTokenClaims(
+                user_id=UUID(payload['sub']),
+                email=payload['email'],
+                token_id=payload['jti'],
+                token_type=token_type,
+                expiration_time=datetime.fromtimestamp(payload['exp'], tz=timezone.utc)
+            )
+            self._log.debug(f'{token_type.capitalize()} token decoded for user \'{claims.user_id}\'')
+            return claims
+        except (PyJWTError, ValueError):
+            self._log.debug(f'{token_type.capitalize()} token decoding failed')
             return None
@@ -1,24 +1,59 @@
+import asyncio
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from logging import Logger
+from typing import Callable, TypeVar
 
 from passlib.context import CryptContext
 
+from auth.exceptions.password_hasher_overloaded_exception import PasswordHasherOverloadedException
+
+
+T = TypeVar('T')
+
 
 class PasswordHasher:
     _log: Logger = logging.getLogger(__name__)
     _password_context: CryptContext
+    _executor: ThreadPoolExecutor
+    _max_pending: int
+    _pending_count: int
+    _rejected_count: int
 
-    def __init__(self, password_context: CryptContext = CryptContext(schemes=['bcrypt'], deprecated='auto')) -> None:
-        self._password_context = password_context
+    def __init__(self, rounds: int, max_workers: int, max_pending: int) -> None:
+        self._password_context = CryptContext(schemes=['bcrypt'], deprecated='auto', bcrypt__rounds=rounds)
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='password-hasher')
+        self._max_pending = max_pending
+        self._pending_count = 0
+        self._rejected_count = 0
 
-    def hash_password(self, password: str) -> str:
+    @property
+    def pending_count(self) -> int:
+        return self._pending_count
+
+    @property
+    def rejected_count(self) -> int:
+        return self._rejected_count
+
+    async def hash_password(self, password: str) -> str:
         self._log.debug('Hashing password...')
-        hashed_password: str = self._password_context.hash(password)
+        hashed_password: str = await self._run(self._password_context.hash, password)
         self._log.debug('Password hashed successfully')
         return hashed_password
 
-    def verify_password(self, password: str, hashed_password: str) -> bool:
+    async def verify_password(self, password: str, hashed_password: str) -> bool:
         self._log.debug('Verifying password against hashed password...')
-        result: bool = self._password_context.verify(secret=password, hash=hashed_password)
+        result: bool = await self._run(self._password_context.verify, secret=password, hash=hashed_password)
         self._log.debug(f'Password verification result: {result}')
         return result
+
+    async def _run(self, function: Callable[..., T], *args, **kwargs) -> T:
+        if self._pending_count >= self._max_pending:
+            self._rejected_count += 1
+            raise PasswordHasherOverloadedException(self._max_pending)
+        self._pending_count += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, partial(function, *args, **kwargs))
+        finally:
+            self._pending_count -= 1
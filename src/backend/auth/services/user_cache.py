@@ -0,0 +1,41 @@
+import logging
+import time
+from collections import OrderedDict
+from logging import Logger
+
+from auth.domain.user import User
+
+
+class UserCache:
+    _log: Logger = logging.getLogger(__name__)
+    _max_entries: int
+    _ttl_seconds: float
+    _users: OrderedDict[str, tuple[User, float]]
+
+    def __init__(self, max_entries: int, ttl_seconds: float) -> None:
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._users = OrderedDict()
+
+    def get_user(self, subject: str) -> User | None:
+        cached_user: tuple[User, float] | None = self._users.get(subject)
+        if cached_user is None:
+            return None
+        user: User
+        expiration_time: float
+        user, expiration_time = cached_user
+        if time.monotonic() >= expiration_time:
+            del self._users[subject]
+            return None
+        self._users.move_to_end(subject)
+        return user
+
+    def add_user(self, subject: str, user: User) -> None:
+        self._users[subject] = (user, time.monotonic() + self._ttl_seconds)
+        self._users.move_to_end(subject)
+        while len(self._users) > self._max_entries:
+            self._users.popitem(last=False)
+
+    def invalidate_user(self, subject: str) -> None:
+        self._log.debug(f'Invalidating cached user \'{subject}\'...')
+        self._users.pop(subject, None)
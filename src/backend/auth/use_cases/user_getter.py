@@ -1,28 +1,29 @@
 import logging
 from logging import Logger
 
+from audio_nest.services.i_tracer import ITracer
+from auth.domain.json_web_token_claims import JsonWebTokenClaims
 from auth.domain.user import User
 from auth.exceptions.invalid_user_credentials_exception import InvalidUserCredentialsException
-from auth.services.i_users_repository import IUsersRepository
 from auth.services.json_web_token_handler import JsonWebTokenHandler
 
 
 class UserGetter:
     _log: Logger = logging.getLogger(__name__)
-    _users_repository: IUsersRepository
     _json_web_token_handler: JsonWebTokenHandler
+    _tracer: ITracer
 
-    def __init__(self, users_repository: IUsersRepository, json_web_token_handler: JsonWebTokenHandler) -> None:
-        self._users_repository = users_repository
+    def __init__(self, json_web_token_handler: JsonWebTokenHandler, tracer: ITracer) -> None:
         self._json_web_token_handler = json_web_token_handler
+        self._tracer = tracer
 
     async def get_user_from_access_token(self, token: str) -> User:
-        self._log.debug('Getting user from access token...')
-        email: str | None = self._json_web_token_handler.decode_access_token(token)
-        if email is None:
-            raise InvalidUserCredentialsException
-        user: User | None = await self._users_repository.get_user_by_email(email)
-        if user is None:
-            raise InvalidUserCredentialsException
-        self._log.debug(f'User \'{email}\' retrieved from access token')
-        return user
+        with self._tracer.trace_span('UserGetter.get_user_from_access_token'):
+            self._log.debug('Getting user from access token...')
+            # Signature and expiration only: revocation is enforced on refresh tokens, access tokens are short-lived
+            claims: JsonWebTokenClaims | None = self._json_web_token_handler.decode_access_token(token)
+            if claims is None:
+                raise InvalidUserCredentialsException
+            user: User = User(email=claims.email, id=claims.user_id)
+            self._log.debug(f'User \'{user.id}\' retrieved from access token')
+            return user
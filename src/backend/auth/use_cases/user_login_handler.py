@@ -1,6 +1,8 @@
 import logging
 from logging import Logger
 
+from audio_nest.services.i_tracer import ITracer
+from auth.domain.authentication_tokens import AuthenticationTokens
 from auth.domain.user import User
 from auth.exceptions.invalid_user_credentials_exception import InvalidUserCredentialsException
 from auth.services.i_users_repository import IUsersRepository
@@ -13,25 +15,32 @@ class UserLoginHandler:
     _users_repository: IUsersRepository
     _json_web_token_handler: JsonWebTokenHandler
     _password_hasher: PasswordHasher
+    _tracer: ITracer
 
     def __init__(
         self,
         users_repository: IUsersRepository,
         json_web_token_handler: JsonWebTokenHandler,
-        password_hasher: PasswordHasher = PasswordHasher()
+        password_hasher: PasswordHasher,
+        tracer: ITracer
     ) -> None:
         self._users_repository = users_repository
         self._json_web_token_handler = json_web_token_handler
         self._password_hasher = password_hasher
+        self._tracer = tracer
 
-    async def log_user_in(self, email: str, password: str) -> str:
-        self._log.debug(f'Logging user with email \'{email}\' in...')
-        user: User | None = await self._users_repository.get_user_by_email(email)
-        if not user or not self._password_hasher.verify_password(
-            password=password,
-            hashed_password=user.hashed_password
-        ):
-            raise InvalidUserCredentialsException
-        access_token: str = self._json_web_token_handler.create_access_token(email)
-        self._log.debug(f'User with email \'{email}\' logged in')
-        return access_token
+    async def log_user_in(self, email: str, password: str) -> AuthenticationTokens:
+        with self._tracer.trace_span('UserLoginHandler.log_user_in'):
+            self._log.debug(f'Logging user with email \'{email}\' in...')
+            user: User | None = await self._users_repository.get_user_by_email(email)
+            if not user or not await self._password_hasher.verify_password(
+                password=password,
+                hashed_password=user.hashed_password
+            ):
+                raise InvalidUserCredentialsException
+            authentication_tokens: AuthenticationTokens = AuthenticationTokens(
+                access_token=self._json_web_token_handler.create_access_token(user),
+                refresh_token=self._json_web_token_handler.create_refresh_token(user)
+            )
+            self._log.debug(f'User with email \'{email}\' logged in')
+            return authentication_tokens
@@ -0,0 +1,44 @@
+import logging
+from logging import Logger
+
+from audio_nest.services.i_tracer import ITracer
+from auth.domain.json_web_token_claims import JsonWebTokenClaims
+from auth.exceptions.invalid_user_credentials_exception import InvalidUserCredentialsException
+from auth.services.i_revoked_tokens_repository import IRevokedTokensRepository
+from auth.services.json_web_token_handler import JsonWebTokenHandler
+
+
+class UserLogoutHandler:
+    _log: Logger = logging.getLogger(__name__)
+    _json_web_token_handler: JsonWebTokenHandler
+    _revoked_tokens_repository: IRevokedTokensRepository
+    _tracer: ITracer
+
+    def __init__(
+        self,
+        json_web_token_handler: JsonWebTokenHandler,
+        revoked_tokens_repository: IRevokedTokensRepository,
+        tracer: ITracer
+    ) -> None:
+        self._json_web_token_handler = json_web_token_handler
+        self._revoked_tokens_repository = revoked_tokens_repository
+        self._tracer = tracer
+
+    async def log_user_out(self, access_token: str, refresh_token: str | None = None) -> None:
+        with self._tracer.trace_span('UserLogoutHandler.log_user_out'):
+            self._log.debug('Logging user out...')
+            access_token_claims: JsonWebTokenClaims | None = self._json_web_token_handler.decode_access_token(
+                access_token
+            )
+            if access_token_claims is None:
+                raise InvalidUserCredentialsException
+            if refresh_token is not None:
+                refresh_token_claims: JsonWebTokenClaims | None = self._json_web_token_handler.decode_refresh_token(
+                    refresh_token
+                )
+                if refresh_token_claims is not None and refresh_token_claims.user_id == access_token_claims.user_id:
+                    await self._revoked_tokens_repository.revoke_token(
+                        token_id=refresh_token_claims.token_id,
+                        expiration_time=refresh_token_claims.expiration_time
+                    )
+            self._log.debug(f'User \'{access_token_claims.user_id}\' logged out')
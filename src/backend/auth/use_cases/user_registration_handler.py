@@ -1,25 +1,39 @@
 import logging
 from logging import Logger
 
+from audio_nest.services.i_tracer import ITracer
 from auth.domain.user import User
 from auth.exceptions.user_already_registered_exception import UserAlreadyRegisteredException
 from auth.services.i_users_repository import IUsersRepository
 from auth.services.password_hasher import PasswordHasher
+from auth.services.user_cache import UserCache
 
 
 class UserRegistrationHandler:
     _log: Logger = logging.getLogger(__name__)
     _users_repository: IUsersRepository
+    _user_cache: UserCache
     _password_hasher: PasswordHasher
+    _tracer: ITracer
 
-    def __init__(self, users_repository: IUsersRepository, password_hasher: PasswordHasher = PasswordHasher()) -> None:
+    def __init__(
+        self,
+        users_repository: IUsersRepository,
+        user_cache: UserCache,
+        password_hasher: PasswordHasher,
+        tracer: ITracer
+    ) -> None:
         self._users_repository = users_repository
+        self._user_cache = user_cache
         self._password_hasher = password_hasher
+        self._tracer = tracer
 
     async def register_user(self, email: str, password: str) -> None:
-        self._log.debug(f'Registering user with email \'{email}\'...')
-        if await self._users_repository.get_user_by_email(email):
-            raise UserAlreadyRegisteredException(email)
-        user: User = User(email=email, hashed_password=self._password_hasher.hash_password(password))
-        await self._users_repository.create_user(user)
-        self._log.debug(f'User with email \'{email}\' registered')
+        with self._tracer.trace_span('UserRegistrationHandler.register_user'):
+            self._log.debug(f'Registering user with email \'{email}\'...')
+            if await self._users_repository.get_user_by_email(email):
+                raise UserAlreadyRegisteredException(email)
+            user: User = User(email=email, hashed_password=await self._password_hasher.hash_password(password))
+            await self._users_repository.create_user(user)
+            self._user_cache.invalidate_user(email)
+            self._log.debug(f'User with email \'{email}\' registered')
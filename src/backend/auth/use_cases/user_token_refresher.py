@@ -0,0 +1,59 @@
+import logging
+from logging import Logger
+
+from audio_nest.services.i_tracer import ITracer
+from auth.domain.authentication_tokens import AuthenticationTokens
+from auth.domain.json_web_token_claims import JsonWebTokenClaims
+from auth.domain.user import User
+from auth.exceptions.invalid_user_credentials_exception import InvalidUserCredentialsException
+from auth.services.i_revoked_tokens_repository import IRevokedTokensRepository
+from auth.services.i_users_repository import IUsersRepository
+from auth.services.json_web_token_handler import JsonWebTokenHandler
+from auth.services.user_cache import UserCache
+
+
+class UserTokenRefresher:
+    _log: Logger = logging.getLogger(__name__)
+    _users_repository: IUsersRepository
+    _json_web_token_handler: JsonWebTokenHandler
+    _revoked_tokens_repository: IRevokedTokensRepository
+    _user_cache: UserCache
+    _tracer: ITracer
+
+    def __init__(
+        self,
+        users_repository: IUsersRepository,
+        json_web_token_handler: JsonWebTokenHandler,
+        revoked_tokens_repository: IRevokedTokensRepository,
+        user_cache: UserCache,
+        tracer: ITracer
+    ) -> None:
+        self._users_repository = users_repository
+        self._json_web_token_handler = json_web_token_handler
+        self._revoked_tokens_repository = revoked_tokens_repository
+        self._user_cache = user_cache
+        self._tracer = tracer
+
+    async def refresh_authentication_tokens(self, refresh_token: str) -> AuthenticationTokens:
+        with self._tracer.trace_span('UserTokenRefresher.refresh_authentication_tokens'):
+            self._log.debug('Refreshing authentication tokens...')
+            claims: JsonWebTokenClaims | None = self._json_web_token_handler.decode_refresh_token(refresh_token)
+            if claims is None or not await self._revoked_tokens_repository.revoke_token_if_not_revoked(
+                token_id=claims.token_id,
+                expiration_time=claims.expiration_time
+            ):
+                raise InvalidUserCredentialsException
+            user: User | None = self._user_cache.get_user(claims.email)
+            if user is None:
+                user = await self._users_repository.get_user_by_email(claims.email)
+                if user is None:
+                    raise InvalidUserCredentialsException
+                self._user_cache.add_user(subject=claims.email, user=user)
+            if user.id != claims.user_id:
+                raise InvalidUserCredentialsException
+            authentication_tokens: AuthenticationTokens = AuthenticationTokens(
+                access_token=self._json_web_token_handler.create_access_token(user),
+                refresh_token=self._json_web_token_handler.create_refresh_token(user)
+            )
+            self._log.debug(f'Authentication tokens for user \'{user.id}\' refreshed')
+            return authentication_tokens
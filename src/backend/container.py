@@ -1,25 +1,55 @@
 import logging
 import logging.config
+from asyncio import Task
 
 from dependency_injector.containers import DeclarativeContainer
-from dependency_injector.providers import Configuration, Factory, Resource
+from dependency_injector.providers import Callable, Configuration, Factory, List, Object, Resource, Selector, Singleton
+from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+from opentelemetry.sdk.trace.export import ConsoleSpanExporter
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
+from api.audio_file_response_factory import AudioFileResponseFactory
+from audio_nest.services.audio_download_worker_pool import AudioDownloadWorkerPool
+from audio_nest.use_cases.audio_download_job_getter import AudioDownloadJobGetter
+from audio_nest.use_cases.audio_download_job_scheduler import AudioDownloadJobScheduler
+from audio_nest.use_cases.audio_eviction_handler import handle_audio_eviction
+from audio_nest.use_cases.audio_evictor import AudioEvictor
+from audio_nest.use_cases.audio_file_migrator import AudioFileMigrator
 from audio_nest.use_cases.audio_getter import AudioGetter
+from audio_nest.use_cases.audio_rendition_getter import AudioRenditionGetter
 from audio_nest.use_cases.audio_sources_getter import AudioSourcesGetter
 from audio_nest.use_cases.user_audio_adder import UserAudioAdder
 from audio_nest.use_cases.user_audio_deleter import UserAudioDeleter
 from audio_nest.use_cases.user_audio_getter import UserAudioGetter
 from audio_nest.use_cases.user_audio_list_getter import UserAudioListGetter
 from auth.services.json_web_token_handler import JsonWebTokenHandler
+from auth.services.password_hasher import PasswordHasher
+from auth.services.user_cache import UserCache
 from auth.use_cases.user_getter import UserGetter
 from auth.use_cases.user_login_handler import UserLoginHandler
+from auth.use_cases.user_logout_handler import UserLogoutHandler
 from auth.use_cases.user_registration_handler import UserRegistrationHandler
+from auth.use_cases.user_token_refresher import UserTokenRefresher
+from ffmpeg.ffmpeg_audio_transcoder import FfmpegAudioTranscoder
+from memory.memory_cached_audio_sources_repository import MemoryCachedAudioSourcesRepository
+from open_telemetry.open_telemetry_tracer import OpenTelemetryTracer
+from prometheus.prometheus_metrics_exporter import PrometheusMetricsExporter
+from prometheus.prometheus_pipeline_collector import PrometheusPipelineCollector
+from prometheus.prometheus_stage_timer import PrometheusStageTimer
 from settings import Settings
+from sql.sql_audio_download_jobs_repository import SqlAudioDownloadJobsRepository
+from sql.sql_audio_rendition_repository import SqlAudioRenditionRepository
 from sql.sql_audio_repository import SqlAudioRepository
+from sql.sql_revoked_tokens_repository import SqlRevokedTokensRepository
 from sql.sql_session_maker_handler import handle_sql_session_maker
 from sql.sql_user_audio_repository import SqlUserAudioRepository
 from sql.sql_users_repository import SqlUsersRepository
+from storage.file_audio_download_lock import FileAudioDownloadLock
+from storage.flat_audio_file_layout import FlatAudioFileLayout
+from storage.local_audio_storage import LocalAudioStorage
+from storage.s3_audio_storage import S3AudioStorage
+from storage.sharded_audio_file_layout import ShardedAudioFileLayout
 from youtube.youtube_audio_downloader import YoutubeAudioDownloader
 from youtube.youtube_audio_sources_repository import YoutubeAudioSourcesRepository
 
@@ -28,69 +58,293 @@ class Container(DeclarativeContainer):
     # Configuration
     configuration: Configuration = Configuration(pydantic_settings=[Settings()])
 
+    # Metrics
+    stage_timer: Singleton[PrometheusStageTimer] = Singleton(PrometheusStageTimer)
+
+    # Tracing
+    tracing_span_exporter: Selector[ConsoleSpanExporter | InMemorySpanExporter | OTLPSpanExporter | None] = Selector(
+        configuration.tracing_exporter,
+        console=Singleton(ConsoleSpanExporter),
+        memory=Singleton(InMemorySpanExporter),
+        none=Object(None),
+        otlp=Singleton(OTLPSpanExporter, endpoint=configuration.tracing_otlp_endpoint)
+    )
+    tracer: Singleton[OpenTelemetryTracer] = Singleton(
+        OpenTelemetryTracer,
+        span_exporter=tracing_span_exporter,
+        service_name=configuration.tracing_service_name,
+        sample_ratio=configuration.tracing_sample_ratio
+    )
+
     # Resources
     logging: Resource[None] = Resource(logging.config.dictConfig, config=configuration.logging_config)
     sql_session_maker: Resource[async_sessionmaker[AsyncSession]] = Resource(
         handle_sql_session_maker,
-        database_path=configuration.database_path
+        database_path=configuration.database_path,
+        journal_mode=configuration.sqlite_journal_mode,
+        synchronous=configuration.sqlite_synchronous,
+        busy_timeout_ms=configuration.sqlite_busy_timeout_ms,
+        cache_size_kib=configuration.sqlite_cache_size_kib,
+        mmap_size_bytes=configuration.sqlite_mmap_size_bytes,
+        pool_type=configuration.sql_pool_type,
+        pool_size=configuration.sql_pool_size,
+        pool_max_overflow=configuration.sql_pool_max_overflow,
+        stage_timer=stage_timer
     )
 
     # Services
-    audio_downloader: Factory[YoutubeAudioDownloader] = Factory(
+    audio_download_lock: Singleton[FileAudioDownloadLock] = Singleton(
+        FileAudioDownloadLock,
+        directory_path=configuration.audio_directory_path,
+        lease_seconds=configuration.audio_download_lock_lease_seconds,
+        poll_interval_seconds=configuration.audio_download_lock_poll_interval_seconds
+    )
+    audio_download_worker_pool: Singleton[AudioDownloadWorkerPool] = Singleton(
+        AudioDownloadWorkerPool,
+        max_concurrency=configuration.audio_download_max_concurrency,
+        stage_timer=stage_timer
+    )
+    audio_download_jobs_repository: Factory[SqlAudioDownloadJobsRepository] = Factory(
+        SqlAudioDownloadJobsRepository,
+        sql_session_maker=sql_session_maker,
+        max_jobs=configuration.audio_download_jobs_max_count,
+        tracer=tracer
+    )
+    audio_downloader: Singleton[YoutubeAudioDownloader] = Singleton(
         YoutubeAudioDownloader,
         bit_rate_kbps=configuration.audio_bit_rate_kbps,
         codec=configuration.audio_codec,
         ffmpeg_path=configuration.ffmpeg_path,
-        download_directory_path=configuration.audio_directory_path
+        download_directory_path=configuration.audio_directory_path,
+        worker_pool=audio_download_worker_pool,
+        stage_timer=stage_timer,
+        tracer=tracer
+    )
+    audio_file_layout: Selector[FlatAudioFileLayout | ShardedAudioFileLayout] = Selector(
+        configuration.audio_file_layout,
+        flat=Singleton(FlatAudioFileLayout, directory_path=configuration.audio_directory_path),
+        sharded=Singleton(ShardedAudioFileLayout, directory_path=configuration.audio_directory_path)
+    )
+    audio_storage: Selector[LocalAudioStorage | S3AudioStorage] = Selector(
+        configuration.audio_storage_type,
+        local=Singleton(LocalAudioStorage, audio_file_layout=audio_file_layout),
+        s3=Singleton(
+            S3AudioStorage,
+            bucket_name=configuration.s3_bucket_name,
+            staging_directory_path=configuration.audio_directory_path,
+            endpoint_url=configuration.s3_endpoint_url,
+            region_name=configuration.s3_region_name,
+            access_key_id=configuration.s3_access_key_id,
+            secret_access_key=configuration.s3_secret_access_key,
+            key_prefix=configuration.s3_key_prefix,
+            presigned_url_expiration_seconds=configuration.s3_presigned_url_expiration_seconds,
+            multipart_threshold_bytes=configuration.s3_multipart_threshold_bytes,
+            multipart_chunk_size_bytes=configuration.s3_multipart_chunk_size_bytes
+        )
+    )
+    audio_file_response_factory: Singleton[AudioFileResponseFactory] = Singleton(
+        AudioFileResponseFactory,
+        audio_storage=audio_storage,
+        delivery_mode=configuration.audio_delivery_mode,
+        directory_path=configuration.audio_directory_path,
+        internal_path_prefix=configuration.audio_delivery_internal_path_prefix
     )
-    audio_repository: Factory[SqlAudioRepository] = Factory(SqlAudioRepository, sql_session_maker=sql_session_maker)
-    audio_sources_repository: Factory[YoutubeAudioSourcesRepository] = Factory(
-        YoutubeAudioSourcesRepository,
-        max_results=configuration.youtube_search_max_results
+    audio_rendition_repository: Factory[SqlAudioRenditionRepository] = Factory(
+        SqlAudioRenditionRepository,
+        sql_session_maker=sql_session_maker,
+        tracer=tracer
+    )
+    audio_repository: Factory[SqlAudioRepository] = Factory(
+        SqlAudioRepository,
+        sql_session_maker=sql_session_maker,
+        tracer=tracer
+    )
+    audio_sources_repository: Singleton[MemoryCachedAudioSourcesRepository] = Singleton(
+        MemoryCachedAudioSourcesRepository,
+        audio_sources_repository=Factory(
+            YoutubeAudioSourcesRepository,
+            stage_timer=stage_timer,
+            max_results=configuration.youtube_search_max_results,
+            tracer=tracer
+        ),
+        max_results=configuration.youtube_search_max_results,
+        max_entries=configuration.audio_sources_cache_max_entries,
+        ttl_seconds=configuration.audio_sources_cache_ttl_seconds,
+        stale_seconds=configuration.audio_sources_cache_stale_seconds,
+        tracer=tracer
+    )
+    audio_transcoder: Singleton[FfmpegAudioTranscoder] = Singleton(
+        FfmpegAudioTranscoder,
+        ffmpeg_path=configuration.ffmpeg_path,
+        worker_pool=audio_download_worker_pool,
+        stage_timer=stage_timer,
+        tracer=tracer
     )
     json_web_token_handler: Factory[JsonWebTokenHandler] = Factory(
         JsonWebTokenHandler,
         secret_key=configuration.json_web_token_secret_key,
         algorithm=configuration.json_web_token_algorithm,
-        expiration_days=configuration.json_web_token_expiration_days
+        access_token_expiration_minutes=configuration.json_web_token_access_token_expiration_minutes,
+        refresh_token_expiration_days=configuration.json_web_token_refresh_token_expiration_days
+    )
+    password_hasher: Singleton[PasswordHasher] = Singleton(
+        PasswordHasher,
+        rounds=configuration.password_hashing_rounds,
+        max_workers=configuration.password_hashing_max_workers,
+        max_pending=configuration.password_hashing_max_pending
+    )
+    revoked_tokens_repository: Factory[SqlRevokedTokensRepository] = Factory(
+        SqlRevokedTokensRepository,
+        sql_session_maker=sql_session_maker,
+        tracer=tracer
     )
     user_audio_repository: Factory[SqlUserAudioRepository] = Factory(
         SqlUserAudioRepository,
-        sql_session_maker=sql_session_maker
+        sql_session_maker=sql_session_maker,
+        tracer=tracer
+    )
+    user_cache: Singleton[UserCache] = Singleton(
+        UserCache,
+        max_entries=configuration.user_cache_max_entries,
+        ttl_seconds=configuration.user_cache_ttl_seconds
+    )
+    users_repository: Factory[SqlUsersRepository] = Factory(
+        SqlUsersRepository,
+        sql_session_maker=sql_session_maker,
+        tracer=tracer
     )
-    users_repository: Factory[SqlUsersRepository] = Factory(SqlUsersRepository, sql_session_maker=sql_session_maker)
 
     # Use cases
-    audio_getter: Factory[AudioGetter] = Factory(
+    audio_getter: Singleton[AudioGetter] = Singleton(
         AudioGetter,
         audio_downloader=audio_downloader,
-        audio_repository=audio_repository
+        audio_repository=audio_repository,
+        audio_storage=audio_storage,
+        audio_download_lock=audio_download_lock,
+        stage_timer=stage_timer,
+        tracer=tracer
+    )
+    audio_download_job_getter: Factory[AudioDownloadJobGetter] = Factory(
+        AudioDownloadJobGetter,
+        audio_download_jobs_repository=audio_download_jobs_repository,
+        audio_getter=audio_getter,
+        tracer=tracer
+    )
+    audio_download_job_scheduler: Singleton[AudioDownloadJobScheduler] = Singleton(
+        AudioDownloadJobScheduler,
+        audio_download_jobs_repository=audio_download_jobs_repository,
+        audio_getter=audio_getter,
+        progress_interval_seconds=configuration.audio_download_job_progress_interval_seconds,
+        stale_seconds=configuration.audio_download_job_stale_seconds,
+        tracer=tracer
+    )
+    audio_evictor: Singleton[AudioEvictor] = Singleton(
+        AudioEvictor,
+        audio_repository=audio_repository,
+        audio_rendition_repository=audio_rendition_repository,
+        audio_storage=audio_storage,
+        quota_bytes=configuration.audio_storage_quota_bytes,
+        max_evictions_per_run=configuration.audio_eviction_max_files_per_run,
+        orphan_grace_seconds=configuration.audio_orphan_grace_seconds,
+        tracer=tracer
+    )
+    audio_file_migrator: Factory[AudioFileMigrator] = Factory(
+        AudioFileMigrator,
+        audio_repository=audio_repository,
+        audio_file_layout=audio_file_layout,
+        batch_size=configuration.audio_file_migration_batch_size,
+        tracer=tracer
+    )
+    audio_rendition_getter: Factory[AudioRenditionGetter] = Factory(
+        AudioRenditionGetter,
+        audio_getter=audio_getter,
+        audio_transcoder=audio_transcoder,
+        audio_rendition_repository=audio_rendition_repository,
+        audio_storage=audio_storage,
+        audio_download_lock=audio_download_lock,
+        codec=configuration.audio_codec,
+        rendition_codec=configuration.audio_rendition_codec,
+        rendition_bit_rates_kbps=configuration.audio_rendition_bit_rates_kbps,
+        tracer=tracer
     )
     audio_sources_getter: Factory[AudioSourcesGetter] = Factory(
         AudioSourcesGetter,
-        audio_sources_repository=audio_sources_repository
+        audio_sources_repository=audio_sources_repository,
+        tracer=tracer
+    )
+    user_audio_adder: Factory[UserAudioAdder] = Factory(
+        UserAudioAdder,
+        user_audio_repository=user_audio_repository,
+        tracer=tracer
     )
-    user_audio_adder: Factory[UserAudioAdder] = Factory(UserAudioAdder, user_audio_repository=user_audio_repository)
     user_audio_deleter: Factory[UserAudioDeleter] = Factory(
         UserAudioDeleter,
-        user_audio_repository=user_audio_repository
+        user_audio_repository=user_audio_repository,
+        tracer=tracer
+    )
+    user_audio_getter: Factory[UserAudioGetter] = Factory(
+        UserAudioGetter,
+        user_audio_repository=user_audio_repository,
+        tracer=tracer
     )
-    user_audio_getter: Factory[UserAudioGetter] = Factory(UserAudioGetter, user_audio_repository=user_audio_repository)
     user_audio_list_getter: Factory[UserAudioListGetter] = Factory(
         UserAudioListGetter,
-        user_audio_repository=user_audio_repository
+        user_audio_repository=user_audio_repository,
+        tracer=tracer
     )
     user_getter: Factory[UserGetter] = Factory(
         UserGetter,
-        users_repository=users_repository,
-        json_web_token_handler=json_web_token_handler
+        json_web_token_handler=json_web_token_handler,
+        tracer=tracer
     )
     user_login_handler: Factory[UserLoginHandler] = Factory(
         UserLoginHandler,
         users_repository=users_repository,
-        json_web_token_handler=json_web_token_handler
+        json_web_token_handler=json_web_token_handler,
+        password_hasher=password_hasher,
+        tracer=tracer
+    )
+    user_logout_handler: Factory[UserLogoutHandler] = Factory(
+        UserLogoutHandler,
+        json_web_token_handler=json_web_token_handler,
+        revoked_tokens_repository=revoked_tokens_repository,
+        tracer=tracer
     )
     user_registration_handler: Factory[UserRegistrationHandler] = Factory(
         UserRegistrationHandler,
-        users_repository=users_repository
+        users_repository=users_repository,
+        user_cache=user_cache,
+        password_hasher=password_hasher,
+        tracer=tracer
+    )
+    user_token_refresher: Factory[UserTokenRefresher] = Factory(
+        UserTokenRefresher,
+        users_repository=users_repository,
+        json_web_token_handler=json_web_token_handler,
+        revoked_tokens_repository=revoked_tokens_repository,
+        user_cache=user_cache,
+        tracer=tracer
+    )
+
+    # Background tasks
+    audio_eviction: Resource[Task[None]] = Resource(
+        handle_audio_eviction,
+        audio_evictor=audio_evictor,
+        audio_eviction_lock=audio_download_lock,
+        interval_seconds=configuration.audio_eviction_interval_seconds
+    )
+
+    # Metrics export
+    pipeline_collector: Singleton[PrometheusPipelineCollector] = Singleton(
+        PrometheusPipelineCollector,
+        audio_getter=audio_getter,
+        audio_downloader=audio_downloader,
+        audio_download_worker_pool=audio_download_worker_pool,
+        audio_sources_repository=audio_sources_repository,
+        audio_evictor=audio_evictor,
+        is_multiprocess=Callable(PrometheusMetricsExporter.is_multiprocess)
+    )
+    metrics_exporter: Singleton[PrometheusMetricsExporter] = Singleton(
+        PrometheusMetricsExporter,
+        collectors=List(pipeline_collector)
     )
@@ -0,0 +1,97 @@
+import asyncio
+import logging
+from asyncio.subprocess import Process
+from logging import Logger
+from pathlib import Path
+from uuid import uuid4
+
+from yt_dlp.postprocessor.ffmpeg import ACODECS
+
+from audio_nest.domain.audio import Audio
+from audio_nest.domain.audio_codec import AudioCodec
+from audio_nest.domain.audio_download_priority import AudioDownloadPriority
+from audio_nest.exceptions.audio_transcoding_failed_exception import AudioTranscodingFailedException
+from audio_nest.services.audio_download_worker_pool import AudioDownloadWorkerPool
+from audio_nest.services.i_audio_transcoder import IAudioTranscoder
+from audio_nest.services.i_stage_timer import IStageTimer
+from audio_nest.services.i_tracer import ITracer
+
+
+class FfmpegAudioTranscoder(IAudioTranscoder):
+    _log: Logger = logging.getLogger(__name__)
+    _ffmpeg_executable_path: Path
+    _worker_pool: AudioDownloadWorkerPool
+    _stage_timer: IStageTimer
+    _tracer: ITracer
+
+    def __init__(
+        self,
+        ffmpeg_path: Path,
+        worker_pool: AudioDownloadWorkerPool,
+        stage_timer: IStageTimer,
+        tracer: ITracer
+    ) -> None:
+        self._ffmpeg_executable_path = ffmpeg_path if ffmpeg_path.is_file() else ffmpeg_path.joinpath('ffmpeg')
+        self._worker_pool = worker_pool
+        self._stage_timer = stage_timer
+        self._tracer = tracer
+
+    async def transcode_audio(
+        self,
+        audio: Audio,
+        codec: AudioCodec,
+        bit_rate_kbps: int,
+        priority: AudioDownloadPriority = AudioDownloadPriority.preview
+    ) -> Audio:
+        self._log.debug(f'Transcoding {audio} to {codec} at {bit_rate_kbps} kbps...')
+        file_extension: str
+        encoder: str
+        file_extension, encoder, _ = ACODECS[codec]
+        transcoded_audio: Audio = Audio(
+            source_id=audio.source_id,
+            file_path=audio.file_path.with_name(f'{audio.source_id}.{uuid4().hex}.{file_extension}'),
+            bit_rate_kbps=bit_rate_kbps,
+            codec=codec
+        )
+        try:
+            async with self._worker_pool.acquire(priority):
+                with (
+                    self._stage_timer.time_stage('ffmpeg_transcode'),
+                    self._tracer.trace_span(
+                        'ffmpeg.transcode',
+                        {
+                            'audio_nest.source_id': audio.source_id,
+                            'audio_nest.codec': codec.value,
+                            'audio_nest.bit_rate_kbps': bit_rate_kbps
+                        }
+                    )
+                ):
+                    process: Process = await asyncio.create_subprocess_exec(
+                        self._ffmpeg_executable_path,
+                        '-loglevel', 'error',
+                        '-i', audio.file_path,
+                        '-vn',
+                        '-acodec', encoder,
+                        '-b:a', f'{bit_rate_kbps}k',
+                        '-f', file_extension,
+                        transcoded_audio.file_path,
+                        stdout=asyncio.subprocess.DEVNULL,
+                        stderr=asyncio.subprocess.PIPE
+                    )
+                    try:
+                        stderr: bytes
+                        _, stderr = await process.communicate()
+                    finally:
+                        if process.returncode is None:
+                            process.kill()
+                            await process.wait()
+            if process.returncode != 0:
+                raise AudioTranscodingFailedException(
+                    source_id=audio.source_id,
+                    reason=stderr.decode(errors='replace').strip()
+                )
+        except BaseException:
+            transcoded_audio.file_path.unlink(missing_ok=True)
+            raise
+        self._log.debug(f'{audio} transcoded to {codec} at {bit_rate_kbps} kbps')
+        return transcoded_audio
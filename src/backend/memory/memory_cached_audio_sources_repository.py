@@ -0,0 +1,128 @@
+import asyncio
+import logging
+import time
+from asyncio import Task
+from collections import OrderedDict
+from dataclasses import dataclass
+from logging import Logger
+
+from audio_nest.domain.audio_source import AudioSource
+from audio_nest.services.i_audio_sources_repository import IAudioSourcesRepository
+from audio_nest.services.i_tracer import ITracer
+
+
+@dataclass
+class _CachedAudioSources:
+    audio_sources: list[AudioSource]
+    created_at: float
+
+
+class MemoryCachedAudioSourcesRepository(IAudioSourcesRepository):
+    _log: Logger = logging.getLogger(__name__)
+    _audio_sources_repository: IAudioSourcesRepository
+    _max_results: int
+    _max_entries: int
+    _ttl_seconds: float
+    _stale_seconds: float
+    _tracer: ITracer
+    _cached_audio_sources: OrderedDict[tuple[str, int], _CachedAudioSources]
+    _audio_sources_fetches: dict[tuple[str, int], Task[list[AudioSource]]]
+    _hits_count: int
+    _stale_hits_count: int
+    _misses_count: int
+    _coalesced_misses_count: int
+
+    def __init__(
+        self,
+        audio_sources_repository: IAudioSourcesRepository,
+        max_results: int,
+        max_entries: int,
+        ttl_seconds: float,
+        stale_seconds: float,
+        tracer: ITracer
+    ) -> None:
+        self._audio_sources_repository = audio_sources_repository
+        self._max_results = max_results
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._stale_seconds = stale_seconds
+        self._tracer = tracer
+        self._cached_audio_sources = OrderedDict()
+        self._audio_sources_fetches = {}
+        self._hits_count = 0
+        self._stale_hits_count = 0
+        self._misses_count = 0
+        self._coalesced_misses_count = 0
+
+    @property
+    def hits_count(self) -> int:
+        return self._hits_count
+
+    @property
+    def stale_hits_count(self) -> int:
+        return self._stale_hits_count
+
+    @property
+    def misses_count(self) -> int:
+        return self._misses_count
+
+    @property
+    def coalesced_misses_count(self) -> int:
+        return self._coalesced_misses_count
+
+    @property
+    def entries_count(self) -> int:
+        return len(self._cached_audio_sources)
+
+    async def get_audio_sources(self, search_query: str) -> list[AudioSource]:
+        with self._tracer.trace_span('MemoryCachedAudioSourcesRepository.get_audio_sources'):
+            key: tuple[str, int] = (' '.join(search_query.casefold().split()), self._max_results)
+            cached_audio_sources: _CachedAudioSources | None = self._cached_audio_sources.get(key)
+            age_seconds: float = time.monotonic() - cached_audio_sources.created_at if cached_audio_sources else 0.0
+            if cached_audio_sources is not None and age_seconds < self._ttl_seconds:
+                self._log.debug(f'Audio sources for search query \'{search_query}\' found in cache')
+                self._hits_count += 1
+                self._cached_audio_sources.move_to_end(key)
+                return list(cached_audio_sources.audio_sources)
+            if cached_audio_sources is not None and age_seconds < self._ttl_seconds + self._stale_seconds:
+                self._log.debug(
+                    f'Stale audio sources for search query \'{search_query}\' found in cache, refreshing...'
+                )
+                self._stale_hits_count += 1
+                self._cached_audio_sources.move_to_end(key)
+                if key not in self._audio_sources_fetches:
+                    self._fetch_audio_sources(key).add_done_callback(
+                        lambda audio_sources_fetch: self._log_refresh_exception(key, audio_sources_fetch)
+                    )
+                return list(cached_audio_sources.audio_sources)
+            self._log.debug(f'Audio sources for search query \'{search_query}\' not found in cache')
+            self._misses_count += 1
+            return list(await asyncio.shield(self._fetch_audio_sources(key)))
+
+    def _fetch_audio_sources(self, key: tuple[str, int]) -> Task[list[AudioSource]]:
+        audio_sources_fetch: Task[list[AudioSource]] | None = self._audio_sources_fetches.get(key)
+        if audio_sources_fetch is not None:
+            self._coalesced_misses_count += 1
+            return audio_sources_fetch
+        audio_sources_fetch = asyncio.create_task(self._fetch_and_cache_audio_sources(key))
+        audio_sources_fetch.add_done_callback(lambda _: self._audio_sources_fetches.pop(key, None))
+        self._audio_sources_fetches[key] = audio_sources_fetch
+        return audio_sources_fetch
+
+    async def _fetch_and_cache_audio_sources(self, key: tuple[str, int]) -> list[AudioSource]:
+        search_query: str
+        search_query, _ = key
+        audio_sources: list[AudioSource] = await self._audio_sources_repository.get_audio_sources(search_query)
+        self._cached_audio_sources[key] = _CachedAudioSources(audio_sources=audio_sources, created_at=time.monotonic())
+        self._cached_audio_sources.move_to_end(key)
+        while len(self._cached_audio_sources) > self._max_entries:
+            self._cached_audio_sources.popitem(last=False)
+        return audio_sources
+
+    def _log_refresh_exception(self, key: tuple[str, int], audio_sources_fetch: Task[list[AudioSource]]) -> None:
+        if not audio_sources_fetch.cancelled() and audio_sources_fetch.exception() is not None:
+            ex: BaseException = audio_sources_fetch.exception()
+            self._log.error(
+                f'Exception found while refreshing audio sources for search query \'{key[0]}\': '
+                f'{ex.__class__.__name__} - {ex}'
+            )
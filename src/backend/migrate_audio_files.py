@@ -0,0 +1,32 @@
+import asyncio
+import logging
+from logging import Logger
+
+from audio_nest.use_cases.audio_file_migrator import AudioFileMigrator
+from container import Container
+
+
+log: Logger = logging.getLogger(__name__)
+
+
+async def migrate_audio_files(container: Container) -> None:
+    await container.sql_session_maker.init()
+    try:
+        audio_file_migrator: AudioFileMigrator = await container.audio_file_migrator()
+        migrated_audio_count: int = await audio_file_migrator.migrate_audio_files()
+        log.info(f'{migrated_audio_count} audio files migrated to {container.configuration.audio_file_layout()} layout')
+    finally:
+        await container.sql_session_maker.shutdown()
+
+
+if __name__ == '__main__':
+    container: Container = Container()
+    container.logging.init()
+    log.info('Starting audio files migration...')
+    try:
+        asyncio.run(migrate_audio_files(container))
+    except Exception as ex:
+        log.error(f'Exception found while migrating audio files: {ex}')
+    finally:
+        log.info('Audio files migration stopped')
+        logging.shutdown()
@@ -0,0 +1,68 @@
+import logging
+from contextlib import AbstractContextManager, nullcontext
+from logging import Logger
+from typing import Any
+
+from opentelemetry.sdk.resources import Resource, SERVICE_NAME
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import BatchSpanProcessor, SpanExporter
+from opentelemetry.sdk.trace.sampling import ParentBased, TraceIdRatioBased
+from opentelemetry.trace import SpanKind, Tracer
+from opentelemetry.trace.propagation.tracecontext import TraceContextTextMapPropagator
+
+from audio_nest.services.i_tracer import ITracer
+
+
+class OpenTelemetryTracer(ITracer):
+    _log: Logger = logging.getLogger(__name__)
+    _instrumentation_name: str = 'audio_nest'
+    # Shared and stateless, so disabled tracing costs one attribute check per span and allocates nothing
+    _no_op_span: AbstractContextManager[None] = nullcontext()
+    _propagator: TraceContextTextMapPropagator = TraceContextTextMapPropagator()
+    _tracer_provider: TracerProvider | None
+    _tracer: Tracer | None
+
+    def __init__(self, span_exporter: SpanExporter | None, service_name: str, sample_ratio: float = 1.0) -> None:
+        self._tracer_provider = None
+        self._tracer = None
+        if span_exporter is not None:
+            self._log.debug(f'Enabling tracing with {span_exporter.__class__.__name__}...')
+            # Private provider instead of the global one, so each container exports to its own configured exporter
+            self._tracer_provider = TracerProvider(
+                resource=Resource.create({SERVICE_NAME: service_name}),
+                sampler=ParentBased(TraceIdRatioBased(sample_ratio))
+            )
+            self._tracer_provider.add_span_processor(BatchSpanProcessor(span_exporter))
+            self._tracer = self._tracer_provider.get_tracer(self._instrumentation_name)
+            self._log.debug(f'Tracing with {span_exporter.__class__.__name__} enabled')
+
+    @property
+    def is_enabled(self) -> bool:
+        return self._tracer is not None
+
+    def trace_span(
+        self,
+        name: str,
+        attributes: dict[str, str | int | float | bool] | None = None
+    ) -> AbstractContextManager[Any]:
+        if self._tracer is None:
+            return self._no_op_span
+        return self._tracer.start_as_current_span(name, attributes=attributes)
+
+    def trace_request(self, name: str, headers: dict[str, str]) -> AbstractContextManager[Any]:
+        if self._tracer is None:
+            return self._no_op_span
+        # Continues the trace of a W3C traceparent header, so spans of calling services share its trace ID
+        return self._tracer.start_as_current_span(
+            name,
+            context=self._propagator.extract(carrier=headers),
+            kind=SpanKind.SERVER
+        )
+
+    def flush(self) -> None:
+        if self._tracer_provider is not None:
+            self._tracer_provider.force_flush()
+
+    def shut_down(self) -> None:
+        if self._tracer_provider is not None:
+            self._tracer_provider.shutdown()
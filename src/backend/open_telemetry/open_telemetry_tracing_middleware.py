@@ -0,0 +1,47 @@
+from opentelemetry.trace import Span, StatusCode
+from starlette.routing import BaseRoute
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from open_telemetry.open_telemetry_tracer import OpenTelemetryTracer
+
+
+class OpenTelemetryTracingMiddleware:
+    _app: ASGIApp
+    _tracer: OpenTelemetryTracer
+
+    def __init__(self, app: ASGIApp, tracer: OpenTelemetryTracer) -> None:
+        self._app = app
+        self._tracer = tracer
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope['type'] != 'http' or not self._tracer.is_enabled:
+            await self._app(scope, receive, send)
+            return
+        method: str = scope['method']
+        status_code: int = 500
+
+        async def send_with_status_code(message: Message) -> None:
+            nonlocal status_code
+            if message['type'] == 'http.response.start':
+                status_code = message['status']
+            await send(message)
+
+        span: Span
+        with self._tracer.trace_request(
+            name=method,
+            headers={name.decode('latin-1'): value.decode('latin-1') for name, value in scope['headers']}
+        ) as span:
+            try:
+                await self._app(scope, receive, send_with_status_code)
+            finally:
+                span.set_attribute('http.request.method', method)
+                span.set_attribute('url.path', scope['path'])
+                span.set_attribute('http.response.status_code', status_code)
+                # Named after the route template set on the scope while routing, so span names stay low-cardinality
+                route: BaseRoute | None = scope.get('route')
+                route_path: str | None = getattr(route, 'path', None)
+                if route_path is not None:
+                    span.set_attribute('http.route', route_path)
+                    span.update_name(f'{method} {route_path}')
+                if status_code >= 500:
+                    span.set_status(StatusCode.ERROR)
@@ -0,0 +1,19 @@
+import logging
+from logging import LogRecord
+
+from opentelemetry import trace
+from opentelemetry.trace import format_span_id, format_trace_id, SpanContext
+
+
+class TraceContextLogFilter(logging.Filter):
+    _no_trace_id: str = '-'
+
+    def filter(self, record: LogRecord) -> bool:
+        span_context: SpanContext = trace.get_current_span().get_span_context()
+        if span_context.is_valid:
+            record.trace_id = format_trace_id(span_context.trace_id)
+            record.span_id = format_span_id(span_context.span_id)
+        else:
+            record.trace_id = self._no_trace_id
+            record.span_id = self._no_trace_id
+        return True
@@ -0,0 +1,8 @@
+from enum import StrEnum
+
+
+class TracingExporterType(StrEnum):
+    console = 'console'
+    memory = 'memory'
+    none = 'none'
+    otlp = 'otlp'
@@ -0,0 +1,47 @@
+import logging
+import os
+import shutil
+from logging import Logger
+from pathlib import Path
+
+from prometheus_client import CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry, generate_latest, multiprocess
+from prometheus_client.registry import Collector
+
+
+class PrometheusMetricsExporter:
+    _log: Logger = logging.getLogger(__name__)
+    _multiprocess_directory_variable: str = 'PROMETHEUS_MULTIPROC_DIR'
+    content_type: str = CONTENT_TYPE_LATEST
+    _registry: CollectorRegistry
+
+    def __init__(self, collectors: list[Collector] | None = None) -> None:
+        # Own registry per exporter, so collectors of each container are never registered twice in the global one
+        self._registry = CollectorRegistry()
+        if self.is_multiprocess():
+            # Each worker writes its own metric files, so every scrape aggregates all workers whichever one serves it
+            multiprocess.MultiProcessCollector(self._registry)
+        else:
+            self._registry.register(REGISTRY)
+        collector: Collector
+        for collector in collectors or []:
+            self._registry.register(collector)
+
+    @classmethod
+    def is_multiprocess(cls) -> bool:
+        return cls._multiprocess_directory_variable in os.environ
+
+    @classmethod
+    def prepare_multiprocess_directory(cls, directory_path: Path) -> None:
+        cls._log.debug(f'Preparing metrics multiprocess directory \'{directory_path}\'...')
+        shutil.rmtree(directory_path, ignore_errors=True)
+        directory_path.mkdir(parents=True)
+        # Read by the metrics client when imported, so it must be set before workers are started
+        os.environ[cls._multiprocess_directory_variable] = str(directory_path.resolve())
+        cls._log.debug(f'Metrics multiprocess directory \'{directory_path}\' prepared')
+
+    def export_metrics(self) -> bytes:
+        return generate_latest(self._registry)
+
+    def shut_down_worker(self) -> None:
+        if self.is_multiprocess():
+            multiprocess.mark_process_dead(os.getpid())
@@ -0,0 +1,61 @@
+import time
+
+from prometheus_client import Counter, Gauge, Histogram
+from starlette.routing import BaseRoute
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+class PrometheusMetricsMiddleware:
+    _unmatched_route: str = 'unmatched'
+    _request_duration_seconds: Histogram = Histogram(
+        name='audio_nest_http_request_duration_seconds',
+        documentation='Duration of HTTP requests until their response is fully sent',
+        labelnames=['method', 'route', 'status'],
+        buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+    )
+    _requests_in_progress: Gauge = Gauge(
+        name='audio_nest_http_requests_in_progress',
+        documentation='HTTP requests in progress',
+        labelnames=['method'],
+        multiprocess_mode='livesum'
+    )
+    _response_body_bytes: Counter = Counter(
+        name='audio_nest_http_response_body_bytes',
+        documentation='HTTP response body bytes sent by the application',
+        labelnames=['method', 'route']
+    )
+    _app: ASGIApp
+
+    def __init__(self, app: ASGIApp) -> None:
+        self._app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope['type'] != 'http':
+            await self._app(scope, receive, send)
+            return
+        method: str = scope['method']
+        status_code: int = 500
+        response_body_bytes: int = 0
+
+        async def send_with_metrics(message: Message) -> None:
+            nonlocal status_code, response_body_bytes
+            if message['type'] == 'http.response.start':
+                status_code = message['status']
+            elif message['type'] == 'http.response.body':
+                response_body_bytes += len(message.get('body', b''))
+            await send(message)
+
+        request_in_progress: Gauge = self._requests_in_progress.labels(method)
+        request_in_progress.inc()
+        start_time: float = time.perf_counter()
+        try:
+            await self._app(scope, receive, send_with_metrics)
+        finally:
+            duration_seconds: float = time.perf_counter() - start_time
+            request_in_progress.dec()
+            # Labelled by route template set on the scope while routing, so path parameters do not add series
+            route: BaseRoute | None = scope.get('route')
+            route_path: str = getattr(route, 'path', self._unmatched_route)
+            self._request_duration_seconds.labels(method, route_path, str(status_code)).observe(duration_seconds)
+            if response_body_bytes:
+                self._response_body_bytes.labels(method, route_path).inc(response_body_bytes)
@@ -0,0 +1,166 @@
+import os
+from typing import Iterable
+
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily, Metric
+from prometheus_client.registry import Collector
+
+from audio_nest.services.audio_download_worker_pool import AudioDownloadWorkerPool
+from audio_nest.use_cases.audio_evictor import AudioEvictor
+from audio_nest.use_cases.audio_getter import AudioGetter
+from memory.memory_cached_audio_sources_repository import MemoryCachedAudioSourcesRepository
+from youtube.youtube_audio_downloader import YoutubeAudioDownloader
+
+
+class PrometheusPipelineCollector(Collector):
+    _audio_getter: AudioGetter
+    _audio_downloader: YoutubeAudioDownloader
+    _audio_download_worker_pool: AudioDownloadWorkerPool
+    _audio_sources_repository: MemoryCachedAudioSourcesRepository
+    _audio_evictor: AudioEvictor
+    _label_names: list[str]
+    _label_values: list[str]
+
+    def __init__(
+        self,
+        audio_getter: AudioGetter,
+        audio_downloader: YoutubeAudioDownloader,
+        audio_download_worker_pool: AudioDownloadWorkerPool,
+        audio_sources_repository: MemoryCachedAudioSourcesRepository,
+        audio_evictor: AudioEvictor,
+        is_multiprocess: bool = False
+    ) -> None:
+        self._audio_getter = audio_getter
+        self._audio_downloader = audio_downloader
+        self._audio_download_worker_pool = audio_download_worker_pool
+        self._audio_sources_repository = audio_sources_repository
+        self._audio_evictor = audio_evictor
+        # Read from the worker answering the scrape, so each worker keeps its own series when several are running
+        self._label_names = ['worker'] if is_multiprocess else []
+        self._label_values = [str(os.getpid())] if is_multiprocess else []
+
+    def collect(self) -> Iterable[Metric]:
+        yield from self._collect_audio_downloads()
+        yield from self._collect_downloaded_audio()
+        yield from self._collect_audio_download_workers()
+        yield from self._collect_audio_sources_cache()
+        yield from self._collect_audio_eviction()
+
+    def _collect_audio_downloads(self) -> Iterable[Metric]:
+        audio_downloads: CounterMetricFamily = self._create_counter(
+            name='audio_nest_audio_downloads',
+            documentation='Audio download requests by whether they started a download or joined one in flight',
+            label_names=['outcome']
+        )
+        audio_downloads.add_metric(
+            [*self._label_values, 'started'],
+            self._audio_getter.started_audio_downloads_count
+        )
+        audio_downloads.add_metric(
+            [*self._label_values, 'coalesced'],
+            self._audio_getter.coalesced_audio_downloads_count
+        )
+        yield audio_downloads
+        audio_downloads_in_flight: GaugeMetricFamily = self._create_gauge(
+            name='audio_nest_audio_downloads_in_flight',
+            documentation='Audio downloads in flight that further requests are coalesced into'
+        )
+        audio_downloads_in_flight.add_metric(self._label_values, self._audio_getter.in_flight_audio_downloads_count)
+        yield audio_downloads_in_flight
+
+    def _collect_downloaded_audio(self) -> Iterable[Metric]:
+        downloaded_audio: CounterMetricFamily = self._create_counter(
+            name='audio_nest_downloaded_audio',
+            documentation='Audio downloaded from YouTube by processing path',
+            label_names=['processing_path']
+        )
+        downloaded_audio.add_metric([*self._label_values, 'remux'], self._audio_downloader.remuxed_audio_count)
+        downloaded_audio.add_metric([*self._label_values, 'transcode'], self._audio_downloader.transcoded_audio_count)
+        yield downloaded_audio
+
+    def _collect_audio_download_workers(self) -> Iterable[Metric]:
+        audio_download_workers: GaugeMetricFamily = self._create_gauge(
+            name='audio_nest_audio_download_workers',
+            documentation='Audio download workers by state',
+            label_names=['state']
+        )
+        audio_download_workers.add_metric(
+            [*self._label_values, 'active'],
+            self._audio_download_worker_pool.active_count
+        )
+        audio_download_workers.add_metric(
+            [*self._label_values, 'max'],
+            self._audio_download_worker_pool.max_concurrency
+        )
+        yield audio_download_workers
+        audio_download_queue_depth: GaugeMetricFamily = self._create_gauge(
+            name='audio_nest_audio_download_queue_depth',
+            documentation='Audio downloads waiting for a download worker'
+        )
+        audio_download_queue_depth.add_metric(self._label_values, self._audio_download_worker_pool.queue_depth)
+        yield audio_download_queue_depth
+
+    def _collect_audio_sources_cache(self) -> Iterable[Metric]:
+        audio_sources_cache_lookups: CounterMetricFamily = self._create_counter(
+            name='audio_nest_audio_sources_cache_lookups',
+            documentation='Audio sources cache lookups by result',
+            label_names=['result']
+        )
+        audio_sources_cache_lookups.add_metric(
+            [*self._label_values, 'hit'],
+            self._audio_sources_repository.hits_count
+        )
+        audio_sources_cache_lookups.add_metric(
+            [*self._label_values, 'stale_hit'],
+            self._audio_sources_repository.stale_hits_count
+        )
+        audio_sources_cache_lookups.add_metric(
+            [*self._label_values, 'miss'],
+            self._audio_sources_repository.misses_count
+        )
+        yield audio_sources_cache_lookups
+        audio_sources_cache_coalesced_fetches: CounterMetricFamily = self._create_counter(
+            name='audio_nest_audio_sources_cache_coalesced_fetches',
+            documentation='Audio sources fetches joined to one already in flight for the same search query'
+        )
+        audio_sources_cache_coalesced_fetches.add_metric(
+            self._label_values,
+            self._audio_sources_repository.coalesced_misses_count
+        )
+        yield audio_sources_cache_coalesced_fetches
+        audio_sources_cache_entries: GaugeMetricFamily = self._create_gauge(
+            name='audio_nest_audio_sources_cache_entries',
+            documentation='Search queries with audio sources in cache'
+        )
+        audio_sources_cache_entries.add_metric(self._label_values, self._audio_sources_repository.entries_count)
+        yield audio_sources_cache_entries
+
+    def _collect_audio_eviction(self) -> Iterable[Metric]:
+        evicted_audio: CounterMetricFamily = self._create_counter(
+            name='audio_nest_evicted_audio',
+            documentation='Audio evicted from storage'
+        )
+        evicted_audio.add_metric(self._label_values, self._audio_evictor.evicted_audio_count)
+        yield evicted_audio
+        reclaimed_bytes: CounterMetricFamily = self._create_counter(
+            name='audio_nest_audio_eviction_reclaimed_bytes',
+            documentation='Bytes deleted from storage by audio eviction'
+        )
+        reclaimed_bytes.add_metric(self._label_values, self._audio_evictor.reclaimed_bytes)
+        yield reclaimed_bytes
+        last_run_reclaimed_bytes: GaugeMetricFamily = self._create_gauge(
+            name='audio_nest_audio_eviction_last_run_reclaimed_bytes',
+            documentation='Bytes deleted from storage by the last audio eviction run over quota'
+        )
+        last_run_reclaimed_bytes.add_metric(self._label_values, self._audio_evictor.last_run_reclaimed_bytes)
+        yield last_run_reclaimed_bytes
+
+    def _create_counter(
+        self,
+        name: str,
+        documentation: str,
+        label_names: list[str] | None = None
+    ) -> CounterMetricFamily:
+        return CounterMetricFamily(name, documentation, labels=[*self._label_names, *(label_names or [])])
+
+    def _create_gauge(self, name: str, documentation: str, label_names: list[str] | None = None) -> GaugeMetricFamily:
+        return GaugeMetricFamily(name, documentation, labels=[*self._label_names, *(label_names or [])])
@@ -0,0 +1,51 @@
+import time
+from contextlib import contextmanager
+from typing import Generator
+
+from prometheus_client import Gauge, Histogram
+
+from audio_nest.services.i_stage_timer import IStageTimer
+
+
+class PrometheusStageTimer(IStageTimer):
+    _stage_duration_seconds: Histogram = Histogram(
+        name='audio_nest_stage_duration_seconds',
+        documentation='Duration of request and download pipeline stages',
+        labelnames=['stage'],
+        buckets=(0.001, 0.005, 0.025, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300)
+    )
+    _stages_in_progress: Gauge = Gauge(
+        name='audio_nest_stages_in_progress',
+        documentation='Request and download pipeline stages in progress',
+        labelnames=['stage'],
+        multiprocess_mode='livesum'
+    )
+    _stage_durations_seconds: dict[str, Histogram]
+    _stage_in_progress: dict[str, Gauge]
+
+    def __init__(self) -> None:
+        # Labelled metrics cached per stage, as resolving labels takes a lock on every observation
+        self._stage_durations_seconds = {}
+        self._stage_in_progress = {}
+
+    @contextmanager
+    def time_stage(self, stage: str) -> Generator[None, None, None]:
+        stage_in_progress: Gauge | None = self._stage_in_progress.get(stage)
+        if stage_in_progress is None:
+            stage_in_progress = self._stage_in_progress.setdefault(stage, self._stages_in_progress.labels(stage))
+        stage_in_progress.inc()
+        start_time: float = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe_stage_duration(stage, time.perf_counter() - start_time)
+            stage_in_progress.dec()
+
+    def observe_stage_duration(self, stage: str, duration_seconds: float) -> None:
+        stage_duration_seconds: Histogram | None = self._stage_durations_seconds.get(stage)
+        if stage_duration_seconds is None:
+            stage_duration_seconds = self._stage_durations_seconds.setdefault(
+                stage,
+                self._stage_duration_seconds.labels(stage)
+            )
+        stage_duration_seconds.observe(duration_seconds)
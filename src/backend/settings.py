@@ -4,22 +4,100 @@ from typing import Any
 from pydantic import Field
 from pydantic_settings import BaseSettings
 
+from api.audio_delivery_mode import AudioDeliveryMode
 from audio_nest.domain.audio_codec import AudioCodec
+from audio_nest.domain.audio_quality import AudioQuality
+from open_telemetry.trace_context_log_filter import TraceContextLogFilter
+from open_telemetry.tracing_exporter_type import TracingExporterType
+from sql.sql_pool_type import SqlPoolType
+from storage.audio_file_layout_type import AudioFileLayoutType
+from storage.audio_storage_type import AudioStorageType
 
 
 class Settings(BaseSettings):
+    app_backlog: int = Field(alias='APP_BACKLOG', default=2048)
+    app_graceful_shutdown_timeout_seconds: int = Field(alias='APP_GRACEFUL_SHUTDOWN_TIMEOUT_SECONDS', default=30)
     app_host: str = Field(alias='APP_HOST', default='0.0.0.0')
-    app_port: int = Field(alias='APP_HOST', default=8000)
+    app_keep_alive_timeout_seconds: int = Field(alias='APP_KEEP_ALIVE_TIMEOUT_SECONDS', default=5)
+    app_port: int = Field(alias='APP_PORT', default=8000)
+    app_reload: bool = Field(alias='APP_RELOAD', default=False)
+    app_workers: int = Field(alias='APP_WORKERS', default=1)
     audio_bit_rate_kbps: int = Field(alias='AUDIO_BIT_RATE_KBPS', default=320)
     audio_codec: AudioCodec = Field(alias='AUDIO_CODEC', default=AudioCodec.vorbis)
     audio_directory_path: Path = Field(alias='AUDIO_DIRECTORY_PATH', default=Path('./data/audio'))
+    audio_delivery_internal_path_prefix: str = Field(
+        alias='AUDIO_DELIVERY_INTERNAL_PATH_PREFIX',
+        default='/internal/audio/'
+    )
+    audio_delivery_mode: AudioDeliveryMode = Field(alias='AUDIO_DELIVERY_MODE', default=AudioDeliveryMode.direct)
+    audio_download_job_progress_interval_seconds: float = Field(
+        alias='AUDIO_DOWNLOAD_JOB_PROGRESS_INTERVAL_SECONDS',
+        default=1
+    )
+    audio_download_job_stale_seconds: float = Field(alias='AUDIO_DOWNLOAD_JOB_STALE_SECONDS', default=60)
+    audio_download_jobs_max_count: int = Field(alias='AUDIO_DOWNLOAD_JOBS_MAX_COUNT', default=1000)
+    audio_download_lock_lease_seconds: float = Field(alias='AUDIO_DOWNLOAD_LOCK_LEASE_SECONDS', default=60)
+    audio_download_lock_poll_interval_seconds: float = Field(
+        alias='AUDIO_DOWNLOAD_LOCK_POLL_INTERVAL_SECONDS',
+        default=0.5
+    )
+    audio_download_max_concurrency: int = Field(alias='AUDIO_DOWNLOAD_MAX_CONCURRENCY', default=2)
+    audio_eviction_interval_seconds: float = Field(alias='AUDIO_EVICTION_INTERVAL_SECONDS', default=600)
+    audio_eviction_max_files_per_run: int = Field(alias='AUDIO_EVICTION_MAX_FILES_PER_RUN', default=100)
+    audio_file_layout: AudioFileLayoutType = Field(alias='AUDIO_FILE_LAYOUT', default=AudioFileLayoutType.sharded)
+    audio_file_migration_batch_size: int = Field(alias='AUDIO_FILE_MIGRATION_BATCH_SIZE', default=500)
+    audio_orphan_grace_seconds: float = Field(alias='AUDIO_ORPHAN_GRACE_SECONDS', default=24 * 60 * 60)
+    audio_rendition_bit_rates_kbps: dict[AudioQuality, int] = Field(
+        alias='AUDIO_RENDITION_BIT_RATES_KBPS',
+        default={AudioQuality.low: 64, AudioQuality.medium: 128}
+    )
+    audio_rendition_codec: AudioCodec = Field(alias='AUDIO_RENDITION_CODEC', default=AudioCodec.opus)
+    audio_sources_cache_max_entries: int = Field(alias='AUDIO_SOURCES_CACHE_MAX_ENTRIES', default=1024)
+    audio_sources_cache_stale_seconds: float = Field(alias='AUDIO_SOURCES_CACHE_STALE_SECONDS', default=3600)
+    audio_sources_cache_ttl_seconds: float = Field(alias='AUDIO_SOURCES_CACHE_TTL_SECONDS', default=600)
+    audio_storage_quota_bytes: int = Field(alias='AUDIO_STORAGE_QUOTA_BYTES', default=10 * 1024 ** 3)
+    audio_storage_type: AudioStorageType = Field(alias='AUDIO_STORAGE_TYPE', default=AudioStorageType.local)
     database_path: Path = Field(alias='DATABASE_PATH', default=Path('./data/audio-nest.db'))
     ffmpeg_path: Path = Field(alias='FFMPEG_PATH', default=Path('.'))
     json_web_token_secret_key: str = Field(alias='JWT_SECRET_KEY', default='my_secret_key')
     json_web_token_algorithm: str = Field(alias='JWT_ALGORITHM', default='HS256')
-    json_web_token_expiration_days: int = Field(alias='JWT_ACCESS_TOKEN_EXPIRATION_DAYS', default=7)
+    json_web_token_access_token_expiration_minutes: int = Field(
+        alias='JWT_ACCESS_TOKEN_EXPIRATION_MINUTES',
+        default=15
+    )
+    json_web_token_refresh_token_expiration_days: int = Field(alias='JWT_REFRESH_TOKEN_EXPIRATION_DAYS', default=7)
     logging_level: str = Field(alias='LOGGING_LEVEL', default='INFO')
     logging_config: dict[str, Any] | None = None
+    metrics_multiprocess_directory_path: Path = Field(
+        alias='METRICS_MULTIPROCESS_DIRECTORY_PATH',
+        default=Path('./data/metrics')
+    )
+    password_hashing_max_pending: int = Field(alias='PASSWORD_HASHING_MAX_PENDING', default=16)
+    password_hashing_max_workers: int = Field(alias='PASSWORD_HASHING_MAX_WORKERS', default=2)
+    password_hashing_rounds: int = Field(alias='PASSWORD_HASHING_ROUNDS', default=12)
+    s3_access_key_id: str | None = Field(alias='S3_ACCESS_KEY_ID', default=None)
+    s3_bucket_name: str = Field(alias='S3_BUCKET_NAME', default='audio-nest')
+    s3_endpoint_url: str | None = Field(alias='S3_ENDPOINT_URL', default=None)
+    s3_key_prefix: str = Field(alias='S3_KEY_PREFIX', default='audio/')
+    s3_multipart_chunk_size_bytes: int = Field(alias='S3_MULTIPART_CHUNK_SIZE_BYTES', default=8 * 1024 * 1024)
+    s3_multipart_threshold_bytes: int = Field(alias='S3_MULTIPART_THRESHOLD_BYTES', default=8 * 1024 * 1024)
+    s3_presigned_url_expiration_seconds: int = Field(alias='S3_PRESIGNED_URL_EXPIRATION_SECONDS', default=300)
+    s3_region_name: str | None = Field(alias='S3_REGION_NAME', default=None)
+    s3_secret_access_key: str | None = Field(alias='S3_SECRET_ACCESS_KEY', default=None)
+    sql_pool_max_overflow: int = Field(alias='SQL_POOL_MAX_OVERFLOW', default=10)
+    sql_pool_size: int = Field(alias='SQL_POOL_SIZE', default=5)
+    sql_pool_type: SqlPoolType = Field(alias='SQL_POOL_TYPE', default=SqlPoolType.queue)
+    sqlite_busy_timeout_ms: int = Field(alias='SQLITE_BUSY_TIMEOUT_MS', default=5000)
+    sqlite_cache_size_kib: int = Field(alias='SQLITE_CACHE_SIZE_KIB', default=16384)
+    sqlite_journal_mode: str = Field(alias='SQLITE_JOURNAL_MODE', default='WAL')
+    sqlite_mmap_size_bytes: int = Field(alias='SQLITE_MMAP_SIZE_BYTES', default=256 * 1024 * 1024)
+    sqlite_synchronous: str = Field(alias='SQLITE_SYNCHRONOUS', default='NORMAL')
+    tracing_exporter: TracingExporterType = Field(alias='TRACING_EXPORTER', default=TracingExporterType.none)
+    tracing_otlp_endpoint: str | None = Field(alias='TRACING_OTLP_ENDPOINT', default=None)
+    tracing_sample_ratio: float = Field(alias='TRACING_SAMPLE_RATIO', default=1.0)
+    tracing_service_name: str = Field(alias='TRACING_SERVICE_NAME', default='audio-nest')
+    user_cache_max_entries: int = Field(alias='USER_CACHE_MAX_ENTRIES', default=10000)
+    user_cache_ttl_seconds: float = Field(alias='USER_CACHE_TTL_SECONDS', default=300)
     youtube_search_max_results: int = Field(alias='YOUTUBE_SEARCH_MAX_RESULTS', default=20)
 
     def __init__(self) -> None:
@@ -29,12 +107,20 @@ class Settings(BaseSettings):
             'formatters': {
                 'simple': {
                     'datefmt': '%d-%m-%Y %H:%M:%S',
-                    'format': '%(asctime)s.%(msecs)03d - [%(levelname)s] - [%(name)s] - %(message)s'
+                    'format': '%(asctime)s.%(msecs)03d - [%(levelname)s] - [%(name)s] - [%(trace_id)s] - %(message)s'
+                }
+            },
+            'filters': {
+                'trace_context': {
+                    '()': TraceContextLogFilter
                 }
             },
             'handlers': {
                 'console': {
                     'class': 'logging.StreamHandler',
+                    'filters': [
+                        'trace_context'
+                    ],
                     'formatter': 'simple'
                 }
             },
@@ -1,3 +1,5 @@
+from datetime import datetime
+
 from sqlalchemy.orm import Mapped, mapped_column
 
 from sql.domain.sql_base import SqlBase
@@ -8,4 +10,8 @@ class SqlAudio(SqlBase):
     file_path: Mapped[str] = mapped_column(nullable=False)
     bit_rate_kbps: Mapped[int] = mapped_column(nullable=False)
     codec: Mapped[str] = mapped_column(nullable=False)
+    size_bytes: Mapped[int] = mapped_column(nullable=False, default=0, server_default='0')
+    content_hash: Mapped[str | None] = mapped_column(default=None)
+    accessed_at: Mapped[datetime | None] = mapped_column(index=True, default=None)
+    orphaned_at: Mapped[datetime | None] = mapped_column(index=True, default=None)
     __tablename__: str = 'audio'
@@ -0,0 +1,17 @@
+from datetime import datetime
+
+from sqlalchemy.orm import Mapped, mapped_column
+
+from sql.domain.sql_base import SqlBase
+
+
+class SqlAudioDownloadJob(SqlBase):
+    id: Mapped[str] = mapped_column(primary_key=True)
+    source_id: Mapped[str] = mapped_column(nullable=False)
+    status: Mapped[str] = mapped_column(nullable=False)
+    created_at: Mapped[datetime] = mapped_column(index=True, nullable=False)
+    updated_at: Mapped[datetime | None] = mapped_column(index=True, default=None)
+    downloaded_bytes: Mapped[int] = mapped_column(nullable=False, default=0, server_default='0')
+    total_bytes: Mapped[int | None] = mapped_column(default=None)
+    error: Mapped[str | None] = mapped_column(default=None)
+    __tablename__: str = 'audio_download_jobs'
@@ -0,0 +1,15 @@
+from sqlalchemy import ForeignKey
+from sqlalchemy.orm import Mapped, mapped_column
+
+from sql.domain.sql_base import SqlBase
+
+
+class SqlAudioRendition(SqlBase):
+    source_id: Mapped[str] = mapped_column(ForeignKey('audio.source_id'), primary_key=True)
+    quality: Mapped[str] = mapped_column(primary_key=True)
+    file_path: Mapped[str] = mapped_column(nullable=False)
+    bit_rate_kbps: Mapped[int] = mapped_column(nullable=False)
+    codec: Mapped[str] = mapped_column(nullable=False)
+    size_bytes: Mapped[int] = mapped_column(nullable=False, default=0, server_default='0')
+    content_hash: Mapped[str | None] = mapped_column(default=None)
+    __tablename__: str = 'audio_rendition'
@@ -0,0 +1,11 @@
+from datetime import datetime
+
+from sqlalchemy.orm import Mapped, mapped_column
+
+from sql.domain.sql_base import SqlBase
+
+
+class SqlRevokedToken(SqlBase):
+    token_id: Mapped[str] = mapped_column(primary_key=True)
+    expiration_time: Mapped[datetime] = mapped_column(index=True, nullable=False)
+    __tablename__: str = 'revoked_tokens'
@@ -1,4 +1,6 @@
-from sqlalchemy import ForeignKey
+from datetime import datetime
+
+from sqlalchemy import ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from sql.domain.sql_audio import SqlAudio
@@ -7,8 +9,14 @@ from sql.domain.sql_base import SqlBase
 
 class SqlUserAudio(SqlBase):
     id: Mapped[str] = mapped_column(primary_key=True)
-    user_id: Mapped[str] = mapped_column(index=True, nullable=False)
+    user_id: Mapped[str] = mapped_column(nullable=False)
     audio_name: Mapped[str] = mapped_column(nullable=False)
     source_id: Mapped[str] = mapped_column(ForeignKey('audio.source_id'), index=True, nullable=False)
-    audio: Mapped[SqlAudio] = relationship()
+    # Rows added before creation times were recorded sort first, in id order
+    created_at: Mapped[datetime] = mapped_column(nullable=False, server_default='1970-01-01 00:00:00.000000')
+    audio: Mapped[SqlAudio] = relationship(lazy='joined', innerjoin=True)
     __tablename__: str = 'user_audio'
+    __table_args__: tuple[Index, ...] = (
+        Index('ix_user_audio_user_id_created_at_id', 'user_id', 'created_at', 'id'),
+        Index('ix_user_audio_user_id_source_id', 'user_id', 'source_id', unique=True)
+    )
@@ -0,0 +1,135 @@
+import logging
+from datetime import datetime, timezone
+from logging import Logger
+from uuid import UUID
+
+from sqlalchemy import CursorResult, delete, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from audio_nest.domain.audio_download_job import AudioDownloadJob
+from audio_nest.domain.audio_download_progress import AudioDownloadProgress
+from audio_nest.domain.audio_download_status import AudioDownloadStatus
+from audio_nest.services.i_audio_download_jobs_repository import IAudioDownloadJobsRepository
+from audio_nest.services.i_tracer import ITracer
+from sql.domain.sql_audio_download_job import SqlAudioDownloadJob
+
+
+class SqlAudioDownloadJobsRepository(IAudioDownloadJobsRepository):
+    _log: Logger = logging.getLogger(__name__)
+    _sql_session_maker: async_sessionmaker[AsyncSession]
+    _max_jobs: int
+    _tracer: ITracer
+
+    def __init__(self, sql_session_maker: async_sessionmaker[AsyncSession], max_jobs: int, tracer: ITracer) -> None:
+        self._sql_session_maker = sql_session_maker
+        self._max_jobs = max_jobs
+        self._tracer = tracer
+
+    async def add_audio_download_job(self, audio_download_job: AudioDownloadJob) -> None:
+        with self._tracer.trace_span(
+            'SqlAudioDownloadJobsRepository.add_audio_download_job',
+            {'audio_nest.audio_download_job_id': str(audio_download_job.id)}
+        ):
+            self._log.debug(f'Adding {audio_download_job}...')
+            created_at: datetime = datetime.now(timezone.utc)
+            session: AsyncSession
+            async with self._sql_session_maker() as session:
+                async with session.begin():
+                    session.add(
+                        SqlAudioDownloadJob(
+                            id=str(audio_download_job.id),
+                            source_id=audio_download_job.source_id,
+                            status=str(audio_download_job.progress.status),
+                            created_at=created_at,
+                            updated_at=created_at,
+                            downloaded_bytes=audio_download_job.progress.downloaded_bytes,
+                            total_bytes=audio_download_job.progress.total_bytes,
+                            error=audio_download_job.error
+                        )
+                    )
+                    await session.flush()
+                    await session.execute(
+                        delete(SqlAudioDownloadJob).where(
+                            SqlAudioDownloadJob.id.not_in(
+                                select(SqlAudioDownloadJob.id)
+                                .order_by(SqlAudioDownloadJob.created_at.desc())
+                                .limit(self._max_jobs)
+                            )
+                        )
+                    )
+            self._log.debug(f'{audio_download_job} added')
+
+    async def get_audio_download_job(self, audio_download_job_id: UUID) -> AudioDownloadJob | None:
+        with self._tracer.trace_span(
+            'SqlAudioDownloadJobsRepository.get_audio_download_job',
+            {'audio_nest.audio_download_job_id': str(audio_download_job_id)}
+        ):
+            self._log.debug(f'Getting audio download job \'{audio_download_job_id}\'...')
+            session: AsyncSession
+            async with self._sql_session_maker() as session:
+                sql_audio_download_job: SqlAudioDownloadJob | None = await session.get(
+                    entity=SqlAudioDownloadJob,
+                    ident=str(audio_download_job_id)
+                )
+            audio_download_job: AudioDownloadJob | None = None
+            if sql_audio_download_job:
+                audio_download_job = AudioDownloadJob(
+                    source_id=sql_audio_download_job.source_id,
+                    progress=AudioDownloadProgress(
+                        status=AudioDownloadStatus(sql_audio_download_job.status),
+                        downloaded_bytes=sql_audio_download_job.downloaded_bytes,
+                        total_bytes=sql_audio_download_job.total_bytes
+                    ),
+                    error=sql_audio_download_job.error,
+                    id=UUID(sql_audio_download_job.id)
+                )
+            self._log.debug(f'Audio download job \'{audio_download_job_id}\' retrieved')
+            return audio_download_job
+
+    async def update_audio_download_job(self, audio_download_job: AudioDownloadJob) -> None:
+        with self._tracer.trace_span(
+            'SqlAudioDownloadJobsRepository.update_audio_download_job',
+            {'audio_nest.audio_download_job_id': str(audio_download_job.id)}
+        ):
+            self._log.debug(f'Updating {audio_download_job}...')
+            session: AsyncSession
+            async with self._sql_session_maker() as session:
+                async with session.begin():
+                    await session.execute(
+                        update(SqlAudioDownloadJob)
+                        .where(SqlAudioDownloadJob.id == str(audio_download_job.id))
+                        .values(
+                            status=str(audio_download_job.progress.status),
+                            downloaded_bytes=audio_download_job.progress.downloaded_bytes,
+                            total_bytes=audio_download_job.progress.total_bytes,
+                            error=audio_download_job.error,
+                            updated_at=datetime.now(timezone.utc)
+                        )
+                    )
+            self._log.debug(f'{audio_download_job} updated')
+
+    async def fail_stale_audio_download_jobs(self, updated_before: datetime, error: str) -> int:
+        with self._tracer.trace_span('SqlAudioDownloadJobsRepository.fail_stale_audio_download_jobs'):
+            self._log.debug(f'Failing audio download jobs not updated since {updated_before}...')
+            session: AsyncSession
+            async with self._sql_session_maker() as session:
+                async with session.begin():
+                    result: CursorResult = await session.execute(
+                        update(SqlAudioDownloadJob)
+                        .where(
+                            SqlAudioDownloadJob.status.not_in(
+                                [str(AudioDownloadStatus.done), str(AudioDownloadStatus.failed)]
+                            ),
+                            or_(
+                                SqlAudioDownloadJob.updated_at <= updated_before,
+                                SqlAudioDownloadJob.updated_at.is_(None)
+                            )
+                        )
+                        .values(
+                            status=str(AudioDownloadStatus.failed),
+                            error=error,
+                            updated_at=datetime.now(timezone.utc)
+                        )
+                    )
+            self._log.debug(f'{result.rowcount} stale audio download jobs failed')
+            return result.rowcount
@@ -0,0 +1,98 @@
+import logging
+from logging import Logger
+from pathlib import Path
+from typing import Sequence
+
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from audio_nest.domain.audio_codec import AudioCodec
+from audio_nest.domain.audio_quality import AudioQuality
+from audio_nest.domain.audio_rendition import AudioRendition
+from audio_nest.services.i_audio_rendition_repository import IAudioRenditionRepository
+from audio_nest.services.i_tracer import ITracer
+from sql.domain.sql_audio_rendition import SqlAudioRendition
+
+
+class SqlAudioRenditionRepository(IAudioRenditionRepository):
+    _log: Logger = logging.getLogger(__name__)
+    _sql_session_maker: async_sessionmaker[AsyncSession]
+    _tracer: ITracer
+
+    def __init__(self, sql_session_maker: async_sessionmaker[AsyncSession], tracer: ITracer) -> None:
+        self._sql_session_maker = sql_session_maker
+        self._tracer = tracer
+
+    async def add_audio_rendition(self, audio_rendition: AudioRendition) -> None:
+        with self._tracer.trace_span('SqlAudioRenditionRepository.add_audio_rendition'):
+            self._log.debug(f'Adding {audio_rendition}...')
+            session: AsyncSession
+            async with self._sql_session_maker() as session:
+                async with session.begin():
+                    await session.merge(
+                        SqlAudioRendition(
+                            source_id=audio_rendition.source_id,
+                            quality=str(audio_rendition.quality),
+                            file_path=str(audio_rendition.file_path),
+                            bit_rate_kbps=audio_rendition.bit_rate_kbps,
+                            codec=str(audio_rendition.codec),
+                            size_bytes=self._get_audio_rendition_size_bytes(audio_rendition),
+                            content_hash=audio_rendition.content_hash
+                        )
+                    )
+            self._log.debug(f'{audio_rendition} added')
+
+    async def get_audio_rendition(self, source_id: str, quality: AudioQuality) -> AudioRendition | None:
+        with self._tracer.trace_span(
+            'SqlAudioRenditionRepository.get_audio_rendition',
+            {'audio_nest.source_id': source_id, 'audio_nest.quality': quality.value}
+        ):
+            self._log.debug(f'Getting {quality} quality audio rendition from source \'{source_id}\'...')
+            session: AsyncSession
+            async with self._sql_session_maker() as session:
+                sql_audio_rendition: SqlAudioRendition | None = await session.get(
+                    entity=SqlAudioRendition,
+                    ident=(source_id, str(quality))
+                )
+            audio_rendition: AudioRendition | None = None
+            if sql_audio_rendition:
+                audio_rendition = self._get_audio_rendition(sql_audio_rendition)
+            self._log.debug(f'{quality.capitalize()} quality audio rendition from source \'{source_id}\' retrieved')
+            return audio_rendition
+
+    async def delete_audio_renditions(self, source_id: str) -> list[AudioRendition]:
+        with self._tracer.trace_span(
+            'SqlAudioRenditionRepository.delete_audio_renditions',
+            {'audio_nest.source_id': source_id}
+        ):
+            self._log.debug(f'Deleting audio renditions from source \'{source_id}\'...')
+            session: AsyncSession
+            async with self._sql_session_maker() as session:
+                async with session.begin():
+                    sql_audio_renditions: Sequence[SqlAudioRendition] = (
+                        await session.scalars(select(SqlAudioRendition).where(SqlAudioRendition.source_id == source_id))
+                    ).all()
+                    await session.execute(delete(SqlAudioRendition).where(SqlAudioRendition.source_id == source_id))
+            audio_renditions: list[AudioRendition] = [
+                self._get_audio_rendition(sql_audio_rendition) for sql_audio_rendition in sql_audio_renditions
+            ]
+            self._log.debug(f'{len(audio_renditions)} audio renditions from source \'{source_id}\' deleted')
+            return audio_renditions
+
+    @staticmethod
+    def _get_audio_rendition_size_bytes(audio_rendition: AudioRendition) -> int:
+        if audio_rendition.size_bytes is not None:
+            return audio_rendition.size_bytes
+        return audio_rendition.file_path.stat().st_size if audio_rendition.file_path.is_file() else 0
+
+    @staticmethod
+    def _get_audio_rendition(sql_audio_rendition: SqlAudioRendition) -> AudioRendition:
+        return AudioRendition(
+            source_id=sql_audio_rendition.source_id,
+            file_path=Path(sql_audio_rendition.file_path),
+            bit_rate_kbps=sql_audio_rendition.bit_rate_kbps,
+            codec=AudioCodec(sql_audio_rendition.codec),
+            quality=AudioQuality(sql_audio_rendition.quality),
+            size_bytes=sql_audio_rendition.size_bytes,
+            content_hash=sql_audio_rendition.content_hash
+        )
@@ -1,35 +1,209 @@
 import logging
+from datetime import datetime, timedelta, timezone
 from logging import Logger
 from pathlib import Path
+from typing import Sequence
 
-from sqlalchemy import select
+from sqlalchemy import CursorResult, Select, delete, exists, func, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from audio_nest.domain.audio import Audio
 from audio_nest.domain.audio_codec import AudioCodec
+from audio_nest.domain.stored_audio import StoredAudio
 from audio_nest.services.i_audio_repository import IAudioRepository
+from audio_nest.services.i_tracer import ITracer
 from sql.domain.sql_audio import SqlAudio
+from sql.domain.sql_audio_rendition import SqlAudioRendition
+from sql.domain.sql_user_audio import SqlUserAudio
 
 
 class SqlAudioRepository(IAudioRepository):
     _log: Logger = logging.getLogger(__name__)
+    _access_time_resolution: timedelta = timedelta(minutes=1)
     _sql_session_maker: async_sessionmaker[AsyncSession]
+    _tracer: ITracer
 
-    def __init__(self, sql_session_maker: async_sessionmaker[AsyncSession]) -> None:
+    def __init__(self, sql_session_maker: async_sessionmaker[AsyncSession], tracer: ITracer) -> None:
         self._sql_session_maker = sql_session_maker
+        self._tracer = tracer
+
+    async def add_audio(self, audio: Audio) -> None:
+        with self._tracer.trace_span('SqlAudioRepository.add_audio'):
+            self._log.debug(f'Adding {audio}...')
+            session: AsyncSession
+            async with self._sql_session_maker() as session:
+                async with session.begin():
+                    await session.merge(
+                        SqlAudio(
+                            source_id=audio.source_id,
+                            file_path=str(audio.file_path),
+                            bit_rate_kbps=audio.bit_rate_kbps,
+                            codec=str(audio.codec),
+                            size_bytes=self._get_audio_size_bytes(audio),
+                            content_hash=audio.content_hash,
+                            accessed_at=datetime.now(timezone.utc)
+                        )
+                    )
+            self._log.debug(f'{audio} added')
 
     async def get_audio_from_source(self, source_id: str) -> Audio | None:
-        self._log.debug(f'Getting audio from source \'{source_id}\'...')
-        session: AsyncSession
-        async with self._sql_session_maker() as session:
-            sql_audio: SqlAudio | None = await session.get(entity=SqlAudio, ident=source_id)
-        audio: Audio | None = None
-        if sql_audio:
-            audio = Audio(
-                source_id=sql_audio.source_id,
-                file_path=Path(sql_audio.file_path),
-                bit_rate_kbps=sql_audio.bit_rate_kbps,
-                codec=AudioCodec(sql_audio.codec)
-            )
-        self._log.debug(f'Audio from source \'{source_id}\' retrieved')
-        return audio
+        with self._tracer.trace_span('SqlAudioRepository.get_audio_from_source', {'audio_nest.source_id': source_id}):
+            self._log.debug(f'Getting audio from source \'{source_id}\'...')
+            session: AsyncSession
+            async with self._sql_session_maker() as session:
+                sql_audio: SqlAudio | None = await session.get(entity=SqlAudio, ident=source_id)
+            audio: Audio | None = None
+            if sql_audio:
+                audio = self._get_audio(sql_audio)
+            self._log.debug(f'Audio from source \'{source_id}\' retrieved')
+            return audio
+
+    async def get_audio_list(self, limit: int, after_source_id: str | None = None) -> list[Audio]:
+        with self._tracer.trace_span('SqlAudioRepository.get_audio_list'):
+            self._log.debug(f'Getting up to {limit} audio after source \'{after_source_id}\'...')
+            statement: Select[tuple[SqlAudio]] = select(SqlAudio).order_by(SqlAudio.source_id).limit(limit)
+            if after_source_id is not None:
+                statement = statement.where(SqlAudio.source_id > after_source_id)
+            session: AsyncSession
+            async with self._sql_session_maker() as session:
+                sql_audio_list: Sequence[SqlAudio] = (await session.scalars(statement)).all()
+            audio_list: list[Audio] = [self._get_audio(sql_audio) for sql_audio in sql_audio_list]
+            self._log.debug(f'{len(audio_list)} audio retrieved')
+            return audio_list
+
+    async def update_audio_file_paths(self, file_paths: dict[str, Path]) -> None:
+        with self._tracer.trace_span('SqlAudioRepository.update_audio_file_paths'):
+            self._log.debug(f'Updating file paths of {len(file_paths)} audio...')
+            if file_paths:
+                session: AsyncSession
+                async with self._sql_session_maker() as session:
+                    async with session.begin():
+                        await session.execute(
+                            update(SqlAudio),
+                            [
+                                {'source_id': source_id, 'file_path': str(file_path)}
+                                for source_id, file_path in file_paths.items()
+                            ]
+                        )
+            self._log.debug(f'File paths of {len(file_paths)} audio updated')
+
+    async def is_audio_file_in_use(self, file_path: Path) -> bool:
+        with self._tracer.trace_span('SqlAudioRepository.is_audio_file_in_use'):
+            session: AsyncSession
+            async with self._sql_session_maker() as session:
+                return await session.scalar(select(exists().where(SqlAudio.file_path == str(file_path))))
+
+    async def update_audio_access_time(self, source_id: str) -> None:
+        with self._tracer.trace_span(
+            'SqlAudioRepository.update_audio_access_time',
+            {'audio_nest.source_id': source_id}
+        ):
+            self._log.debug(f'Updating access time of audio from source \'{source_id}\'...')
+            accessed_at: datetime = datetime.now(timezone.utc)
+            session: AsyncSession
+            async with self._sql_session_maker() as session:
+                async with session.begin():
+                    await session.execute(
+                        update(SqlAudio)
+                        .where(
+                            SqlAudio.source_id == source_id,
+                            or_(
+                                SqlAudio.accessed_at.is_(None),
+                                SqlAudio.accessed_at < accessed_at - self._access_time_resolution
+                            )
+                        )
+                        .values(accessed_at=accessed_at)
+                    )
+            self._log.debug(f'Access time of audio from source \'{source_id}\' updated')
+
+    async def get_total_audio_size_bytes(self) -> int:
+        with self._tracer.trace_span('SqlAudioRepository.get_total_audio_size_bytes'):
+            self._log.debug('Getting total audio size...')
+            session: AsyncSession
+            async with self._sql_session_maker() as session:
+                total_size_bytes: int = (
+                    await session.scalar(select(func.coalesce(func.sum(SqlAudio.size_bytes), 0)))
+                    + await session.scalar(select(func.coalesce(func.sum(SqlAudioRendition.size_bytes), 0)))
+                )
+            self._log.debug(f'Total audio size retrieved: {total_size_bytes} bytes')
+            return total_size_bytes
+
+    async def get_least_recently_used_unreferenced_audio(self, limit: int) -> list[StoredAudio]:
+        with self._tracer.trace_span('SqlAudioRepository.get_least_recently_used_unreferenced_audio'):
+            self._log.debug(f'Getting up to {limit} least recently used unreferenced audio...')
+            session: AsyncSession
+            async with self._sql_session_maker() as session:
+                sql_audio_list: Sequence[SqlAudio] = (
+                    await session.scalars(
+                        select(SqlAudio)
+                        .where(~self._is_audio_referenced())
+                        .order_by(SqlAudio.accessed_at.asc().nulls_first())
+                        .limit(limit)
+                    )
+                ).all()
+            stored_audio_list: list[StoredAudio] = [self._get_stored_audio(sql_audio) for sql_audio in sql_audio_list]
+            self._log.debug(f'{len(stored_audio_list)} least recently used unreferenced audio retrieved')
+            return stored_audio_list
+
+    async def get_orphaned_audio(self, orphaned_before: datetime, limit: int) -> list[StoredAudio]:
+        with self._tracer.trace_span('SqlAudioRepository.get_orphaned_audio'):
+            self._log.debug(f'Getting up to {limit} audio orphaned before {orphaned_before}...')
+            session: AsyncSession
+            async with self._sql_session_maker() as session:
+                sql_audio_list: Sequence[SqlAudio] = (
+                    await session.scalars(
+                        select(SqlAudio)
+                        .where(SqlAudio.orphaned_at <= orphaned_before, ~self._is_audio_referenced())
+                        .order_by(SqlAudio.orphaned_at)
+                        .limit(limit)
+                    )
+                ).all()
+            stored_audio_list: list[StoredAudio] = [self._get_stored_audio(sql_audio) for sql_audio in sql_audio_list]
+            self._log.debug(f'{len(stored_audio_list)} orphaned audio retrieved')
+            return stored_audio_list
+
+    async def delete_unreferenced_audio(self, source_id: str) -> bool:
+        with self._tracer.trace_span(
+            'SqlAudioRepository.delete_unreferenced_audio',
+            {'audio_nest.source_id': source_id}
+        ):
+            self._log.debug(f'Deleting unreferenced audio from source \'{source_id}\'...')
+            session: AsyncSession
+            async with self._sql_session_maker() as session:
+                async with session.begin():
+                    result: CursorResult = await session.execute(
+                        delete(SqlAudio).where(SqlAudio.source_id == source_id, ~self._is_audio_referenced())
+                    )
+            if result.rowcount == 0:
+                self._log.debug(f'Audio from source \'{source_id}\' not deleted: missing or referenced')
+                return False
+            self._log.debug(f'Unreferenced audio from source \'{source_id}\' deleted')
+            return True
+
+    @staticmethod
+    def _is_audio_referenced() -> exists:
+        return exists().where(SqlUserAudio.source_id == SqlAudio.source_id)
+
+    @staticmethod
+    def _get_audio_size_bytes(audio: Audio) -> int:
+        if audio.size_bytes is not None:
+            return audio.size_bytes
+        return audio.file_path.stat().st_size if audio.file_path.is_file() else 0
+
+    @staticmethod
+    def _get_audio(sql_audio: SqlAudio) -> Audio:
+        return Audio(
+            source_id=sql_audio.source_id,
+            file_path=Path(sql_audio.file_path),
+            bit_rate_kbps=sql_audio.bit_rate_kbps,
+            codec=AudioCodec(sql_audio.codec),
+            size_bytes=sql_audio.size_bytes,
+            content_hash=sql_audio.content_hash
+        )
+
+    def _get_stored_audio(self, sql_audio: SqlAudio) -> StoredAudio:
+        return StoredAudio(
+            audio=self._get_audio(sql_audio),
+            size_bytes=sql_audio.size_bytes,
+            accessed_at=sql_audio.accessed_at
+        )
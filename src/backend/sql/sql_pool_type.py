@@ -0,0 +1,7 @@
+from enum import StrEnum
+
+
+class SqlPoolType(StrEnum):
+    null = 'null'
+    queue = 'queue'
+    static = 'static'
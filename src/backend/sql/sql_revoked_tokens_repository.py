@@ -0,0 +1,51 @@
+import logging
+from datetime import datetime, timezone
+from logging import Logger
+
+from sqlalchemy import CursorResult, delete
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from audio_nest.services.i_tracer import ITracer
+from auth.services.i_revoked_tokens_repository import IRevokedTokensRepository
+from sql.domain.sql_revoked_token import SqlRevokedToken
+
+
+class SqlRevokedTokensRepository(IRevokedTokensRepository):
+    _log: Logger = logging.getLogger(__name__)
+    _sql_session_maker: async_sessionmaker[AsyncSession]
+    _tracer: ITracer
+
+    def __init__(self, sql_session_maker: async_sessionmaker[AsyncSession], tracer: ITracer) -> None:
+        self._sql_session_maker = sql_session_maker
+        self._tracer = tracer
+
+    async def revoke_token(self, token_id: str, expiration_time: datetime) -> None:
+        await self.revoke_token_if_not_revoked(token_id=token_id, expiration_time=expiration_time)
+
+    async def revoke_token_if_not_revoked(self, token_id: str, expiration_time: datetime) -> bool:
+        with self._tracer.trace_span('SqlRevokedTokensRepository.revoke_token_if_not_revoked'):
+            self._log.debug(f'Revoking token \'{token_id}\'...')
+            session: AsyncSession
+            async with self._sql_session_maker() as session:
+                async with session.begin():
+                    await session.execute(
+                        delete(SqlRevokedToken).where(SqlRevokedToken.expiration_time <= datetime.now(timezone.utc))
+                    )
+                    # The primary key lets a single worker insert the token, so concurrent revocations cannot both win
+                    result: CursorResult = await session.execute(
+                        insert(SqlRevokedToken)
+                        .values(token_id=token_id, expiration_time=expiration_time)
+                        .on_conflict_do_nothing(index_elements=[SqlRevokedToken.token_id])
+                    )
+            if result.rowcount == 0:
+                self._log.debug(f'Token \'{token_id}\' already revoked')
+                return False
+            self._log.debug(f'Token \'{token_id}\' revoked')
+            return True
+
+    async def is_token_revoked(self, token_id: str) -> bool:
+        with self._tracer.trace_span('SqlRevokedTokensRepository.is_token_revoked'):
+            session: AsyncSession
+            async with self._sql_session_maker() as session:
+                return await session.get(entity=SqlRevokedToken, ident=token_id) is not None
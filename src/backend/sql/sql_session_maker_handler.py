@@ -1,26 +1,146 @@
 import logging
+import time
 from logging import Logger
 from pathlib import Path
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator
 
+from sqlalchemy import Column, Connection, Index, Inspector, Table, event, inspect, text
 from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool, Pool, StaticPool
+from sqlalchemy.schema import CreateColumn
 
+from audio_nest.services.i_stage_timer import IStageTimer
 from sql.domain.sql_base import SqlBase
+from sql.sql_pool_type import SqlPoolType
 
 
 log: Logger = logging.getLogger(__name__)
+pool_classes: dict[SqlPoolType, type[Pool]] = {
+    SqlPoolType.null: NullPool,
+    SqlPoolType.queue: AsyncAdaptedQueuePool,
+    SqlPoolType.static: StaticPool
+}
+timed_sql_statement_types: set[str] = {'delete', 'insert', 'select', 'update'}
 
 
-async def handle_sql_session_maker(database_path: Path) -> AsyncGenerator[async_sessionmaker[AsyncSession], None]:
+async def handle_sql_session_maker(
+    database_path: Path,
+    journal_mode: str = 'WAL',
+    synchronous: str = 'NORMAL',
+    busy_timeout_ms: int = 5000,
+    cache_size_kib: int = 16384,
+    mmap_size_bytes: int = 256 * 1024 * 1024,
+    pool_type: SqlPoolType = SqlPoolType.queue,
+    pool_size: int = 5,
+    pool_max_overflow: int = 10,
+    stage_timer: IStageTimer | None = None
+) -> AsyncGenerator[async_sessionmaker[AsyncSession], None]:
     log.debug('Initializing SQL session maker...')
     database_path.parent.mkdir(parents=True, exist_ok=True)
-    engine: AsyncEngine = create_async_engine(f'sqlite+aiosqlite:///{database_path.resolve()}')
+    engine_options: dict[str, Any] = {'poolclass': pool_classes[pool_type]}
+    if pool_type == SqlPoolType.queue:
+        engine_options.update(pool_size=pool_size, max_overflow=pool_max_overflow)
+    engine: AsyncEngine = create_async_engine(f'sqlite+aiosqlite:///{database_path.resolve()}', **engine_options)
+    pragmas: dict[str, str | int] = {
+        'journal_mode': journal_mode,
+        'synchronous': synchronous,
+        'busy_timeout': busy_timeout_ms,
+        'cache_size': -cache_size_kib,
+        'mmap_size': mmap_size_bytes
+    }
+    event.listen(engine.sync_engine, 'connect', lambda connection, _: apply_sqlite_pragmas(connection, pragmas))
+    if stage_timer is not None:
+        listen_sql_statement_durations(engine=engine, stage_timer=stage_timer)
     session_maker: async_sessionmaker[AsyncSession] = async_sessionmaker(bind=engine, expire_on_commit=False)
     connection: AsyncConnection
     async with engine.begin() as connection:
-        await connection.run_sync(SqlBase.metadata.create_all)
+        await connection.run_sync(create_sql_schema)
     log.debug('SQL session maker initialized')
     yield session_maker
     log.debug('Closing SQL session maker...')
     await engine.dispose()
     log.debug('SQL session maker closed')
+
+
+def create_sql_schema(connection: Connection) -> None:
+    # Takes the write lock first so application workers starting together migrate the schema one at a time
+    connection.exec_driver_sql('BEGIN IMMEDIATE')
+    SqlBase.metadata.create_all(connection)
+    inspector: Inspector = inspect(connection)
+    table: Table
+    for table in SqlBase.metadata.sorted_tables:
+        existing_column_names: set[str] = {column['name'] for column in inspector.get_columns(table.name)}
+        column: Column
+        for column in table.columns:
+            if column.name not in existing_column_names:
+                log.info(f'Adding missing column \'{column.name}\' to table \'{table.name}\'...')
+                connection.execute(
+                    text(f'ALTER TABLE {table.name} ADD COLUMN {CreateColumn(column).compile(dialect=connection.dialect)}')
+                )
+                if column.name == 'size_bytes' and 'file_path' in existing_column_names:
+                    backfill_file_sizes(connection=connection, table=table)
+        existing_index_names: set[str] = {index['name'] for index in inspector.get_indexes(table.name)}
+        index: Index
+        for index in table.indexes:
+            if index.unique and index.name not in existing_index_names:
+                delete_duplicate_rows(connection=connection, table=table, index=index)
+            index.create(connection, checkfirst=True)
+
+
+def backfill_file_sizes(connection: Connection, table: Table) -> None:
+    # Rows written before sizes were recorded point at local files, which are measured once so the quota counts them
+    backfilled_rows_count: int = 0
+    rowid: int
+    file_path: str
+    for rowid, file_path in connection.execute(text(f'SELECT rowid, file_path FROM {table.name}')).all():
+        if Path(file_path).is_file():
+            connection.execute(
+                text(f'UPDATE {table.name} SET size_bytes = :size_bytes WHERE rowid = :rowid'),
+                {'size_bytes': Path(file_path).stat().st_size, 'rowid': rowid}
+            )
+            backfilled_rows_count += 1
+    log.info(f'Backfilled file size of {backfilled_rows_count} row(s) in table \'{table.name}\'')
+
+
+def delete_duplicate_rows(connection: Connection, table: Table, index: Index) -> None:
+    # Rows inserted before the unique index existed may collide on it; the oldest one by rowid is kept
+    index_column_names: str = ', '.join(column.name for column in index.columns)
+    log.info(f'Deleting duplicate rows from table \'{table.name}\' before creating unique index \'{index.name}\'...')
+    deleted_rows_count: int = connection.execute(
+        text(
+            f'DELETE FROM {table.name} WHERE rowid NOT IN '
+            f'(SELECT MIN(rowid) FROM {table.name} GROUP BY {index_column_names})'
+        )
+    ).rowcount
+    # Reported even when nothing was deleted, as it only happens once per table when its unique index is added
+    log.warning(f'Deleted {deleted_rows_count} duplicate row(s) from table \'{table.name}\' for index \'{index.name}\'')
+
+
+def listen_sql_statement_durations(engine: AsyncEngine, stage_timer: IStageTimer) -> None:
+    event.listen(engine.sync_engine, 'before_cursor_execute', start_sql_statement_timer)
+    event.listen(
+        engine.sync_engine,
+        'after_cursor_execute',
+        lambda connection, cursor, statement, *_: stage_timer.observe_stage_duration(
+            stage=f'sql_{get_sql_statement_type(statement)}',
+            duration_seconds=time.perf_counter() - connection.info['statement_start_time']
+        )
+    )
+
+
+def start_sql_statement_timer(connection: Connection, *_: Any) -> None:
+    connection.info['statement_start_time'] = time.perf_counter()
+
+
+def get_sql_statement_type(statement: str) -> str:
+    statement_type: str = statement.lstrip()[:6].lower()
+    return statement_type if statement_type in timed_sql_statement_types else 'other'
+
+
+def apply_sqlite_pragmas(connection: Any, pragmas: dict[str, str | int]) -> None:
+    name: str
+    value: str | int
+    for name, value in pragmas.items():
+        cursor: Any = connection.cursor()
+        cursor.execute(f'PRAGMA {name} = {value}')
+        cursor.close()
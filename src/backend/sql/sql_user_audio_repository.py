@@ -1,14 +1,17 @@
 import logging
+from datetime import datetime, timezone
 from logging import Logger
 from pathlib import Path
 from typing import Sequence
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import CursorResult, Select, exists, select, tuple_, update
+from sqlalchemy.dialects.sqlite import insert
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from audio_nest.domain.audio_codec import AudioCodec
 from audio_nest.domain.user_audio import UserAudio
+from audio_nest.services.i_tracer import ITracer
 from audio_nest.services.i_user_audio_repository import IUserAudioRepository
 from sql.domain.sql_audio import SqlAudio
 from sql.domain.sql_user_audio import SqlUserAudio
@@ -17,106 +20,130 @@ from sql.domain.sql_user_audio import SqlUserAudio
 class SqlUserAudioRepository(IUserAudioRepository):
     _log: Logger = logging.getLogger(__name__)
     _sql_session_maker: async_sessionmaker[AsyncSession]
+    _tracer: ITracer
 
-    def __init__(self, sql_session_maker: async_sessionmaker[AsyncSession]) -> None:
+    def __init__(self, sql_session_maker: async_sessionmaker[AsyncSession], tracer: ITracer) -> None:
         self._sql_session_maker = sql_session_maker
+        self._tracer = tracer
 
-    async def add_user_audio(self, user_audio: UserAudio) -> None:
-        self._log.debug(f'Adding {user_audio}...')
-        session: AsyncSession
-        async with self._sql_session_maker() as session:
-            async with session.begin():
-                if not await session.get(entity=SqlAudio, ident=user_audio.source_id):
-                    sql_audio: SqlAudio = SqlAudio(
-                        source_id=user_audio.source_id,
-                        file_path=str(user_audio.file_path),
-                        bit_rate_kbps=user_audio.bit_rate_kbps,
-                        codec=str(user_audio.codec)
+    async def add_user_audio(self, user_audio: UserAudio) -> bool:
+        with self._tracer.trace_span('SqlUserAudioRepository.add_user_audio'):
+            self._log.debug(f'Adding {user_audio}...')
+            session: AsyncSession
+            async with self._sql_session_maker() as session:
+                async with session.begin():
+                    await session.execute(
+                        insert(SqlAudio)
+                        .values(
+                            source_id=user_audio.source_id,
+                            file_path=str(user_audio.file_path),
+                            bit_rate_kbps=user_audio.bit_rate_kbps,
+                            codec=str(user_audio.codec),
+                            content_hash=user_audio.content_hash
+                        )
+                        .on_conflict_do_update(index_elements=[SqlAudio.source_id], set_={'orphaned_at': None})
                     )
-                    session.add(sql_audio)
-                session.add(
-                    SqlUserAudio(
-                        id=str(user_audio.id),
-                        user_id=str(user_audio.user_id),
-                        audio_name=user_audio.audio_name,
-                        source_id=user_audio.source_id
+                    result: CursorResult = await session.execute(
+                        insert(SqlUserAudio)
+                        .values(
+                            id=str(user_audio.id),
+                            user_id=str(user_audio.user_id),
+                            audio_name=user_audio.audio_name,
+                            source_id=user_audio.source_id,
+                            created_at=user_audio.created_at
+                        )
+                        .on_conflict_do_nothing(index_elements=[SqlUserAudio.user_id, SqlUserAudio.source_id])
                     )
-                )
-        self._log.debug(f'{user_audio} added')
+            if result.rowcount == 0:
+                self._log.debug(f'{user_audio} already added')
+                return False
+            self._log.debug(f'{user_audio} added')
+            return True
 
-    async def get_user_audio_from_source(self, source_id: str) -> UserAudio | None:
-        self._log.debug(f'Getting user audio from source \'{source_id}\'...')
-        session: AsyncSession
-        async with self._sql_session_maker() as session:
-            sql_user_audio: SqlUserAudio | None = (
-                await session.scalars(select(SqlUserAudio).where(SqlUserAudio.source_id == source_id))
-            ).first()
-        user_audio: UserAudio | None = None
-        if sql_user_audio:
-            user_audio = UserAudio(
-                id=UUID(sql_user_audio.id),
-                user_id=UUID(sql_user_audio.user_id),
-                audio_name=sql_user_audio.audio_name,
-                source_id=sql_user_audio.source_id,
-                file_path=Path(sql_user_audio.audio.file_path),
-                bit_rate_kbps=sql_user_audio.audio.bit_rate_kbps,
-                codec=AudioCodec(sql_user_audio.audio.codec)
+    async def get_user_audio_list(
+        self,
+        user_id: UUID,
+        limit: int | None = None,
+        after_created_at: datetime | None = None,
+        after_id: UUID | None = None
+    ) -> list[UserAudio]:
+        with self._tracer.trace_span(
+            'SqlUserAudioRepository.get_user_audio_list',
+            {'audio_nest.user_id': str(user_id)}
+        ):
+            self._log.debug(f'Getting user audio list for user \'{user_id}\'...')
+            statement: Select[tuple[SqlUserAudio]] = (
+                select(SqlUserAudio)
+                .where(SqlUserAudio.user_id == str(user_id))
+                .order_by(SqlUserAudio.created_at, SqlUserAudio.id)
+                .limit(limit)
             )
-        self._log.debug(f'User audio from source \'{source_id}\' retrieved')
-        return user_audio
-
-    async def get_user_audio_list(self, user_id: UUID) -> list[UserAudio]:
-        self._log.debug(f'Getting user audio list for user \'{user_id}\'...')
-        session: AsyncSession
-        async with self._sql_session_maker() as session:
-            sql_user_audio_list: Sequence[SqlUserAudio] = (
-                await session.scalars(select(SqlUserAudio).where(SqlUserAudio.user_id == str(user_id)))
-            ).all()
-        user_audio_list: list[UserAudio] = []
-        sql_user_audio: SqlUserAudio
-        for sql_user_audio in sql_user_audio_list:
-            user_audio_list.append(
-                UserAudio(
-                    id=UUID(sql_user_audio.id),
-                    user_id=UUID(sql_user_audio.user_id),
-                    audio_name=sql_user_audio.audio_name,
-                    source_id=sql_user_audio.source_id,
-                    file_path=Path(sql_user_audio.audio.file_path),
-                    bit_rate_kbps=sql_user_audio.audio.bit_rate_kbps,
-                    codec=AudioCodec(sql_user_audio.audio.codec)
+            if after_created_at is not None and after_id is not None:
+                statement = statement.where(
+                    tuple_(SqlUserAudio.created_at, SqlUserAudio.id) > tuple_(after_created_at, str(after_id))
                 )
-            )
-        self._log.debug(f'User audio list for user \'{user_id}\' retrieved')
-        return user_audio_list
+            session: AsyncSession
+            async with self._sql_session_maker() as session:
+                sql_user_audio_list: Sequence[SqlUserAudio] = (await session.scalars(statement)).all()
+            user_audio_list: list[UserAudio] = [
+                self._get_user_audio(sql_user_audio) for sql_user_audio in sql_user_audio_list
+            ]
+            self._log.debug(f'User audio list for user \'{user_id}\' retrieved')
+            return user_audio_list
 
     async def get_user_audio(self, user_audio_id: UUID) -> UserAudio | None:
-        self._log.debug(f'Getting user audio \'{user_audio_id}\'...')
-        session: AsyncSession
-        async with self._sql_session_maker() as session:
-            sql_user_audio: SqlUserAudio | None = await session.get(entity=SqlUserAudio, ident=str(user_audio_id))
-        user_audio: UserAudio | None = None
-        if sql_user_audio:
-            user_audio = UserAudio(
-                id=UUID(sql_user_audio.id),
-                user_id=UUID(sql_user_audio.user_id),
-                audio_name=sql_user_audio.audio_name,
-                source_id=sql_user_audio.source_id,
-                file_path=Path(sql_user_audio.audio.file_path),
-                bit_rate_kbps=sql_user_audio.audio.bit_rate_kbps,
-                codec=AudioCodec(sql_user_audio.audio.codec)
-            )
-        self._log.debug(f'User audio \'{user_audio_id}\' retrieved')
-        return user_audio
+        with self._tracer.trace_span(
+            'SqlUserAudioRepository.get_user_audio',
+            {'audio_nest.user_audio_id': str(user_audio_id)}
+        ):
+            self._log.debug(f'Getting user audio \'{user_audio_id}\'...')
+            session: AsyncSession
+            async with self._sql_session_maker() as session:
+                sql_user_audio: SqlUserAudio | None = await session.get(entity=SqlUserAudio, ident=str(user_audio_id))
+            user_audio: UserAudio | None = None
+            if sql_user_audio:
+                user_audio = self._get_user_audio(sql_user_audio)
+            self._log.debug(f'User audio \'{user_audio_id}\' retrieved')
+            return user_audio
 
     async def delete_user_audio(self, user_audio_id: UUID) -> None:
-        self._log.debug(f'Deleting user audio \'{user_audio_id}\'...')
-        session: AsyncSession
-        async with self._sql_session_maker() as session:
-            async with session.begin():
-                sql_user_audio: SqlUserAudio | None = await session.get(entity=SqlUserAudio, ident=str(user_audio_id))
-                if not sql_user_audio:
-                    self._log.debug(f'User audio \'{user_audio_id}\' not found')
-                    return
-                await session.delete(sql_user_audio)
-        self._log.debug(f'User audio \'{user_audio_id}\' deleted')
+        with self._tracer.trace_span(
+            'SqlUserAudioRepository.delete_user_audio',
+            {'audio_nest.user_audio_id': str(user_audio_id)}
+        ):
+            self._log.debug(f'Deleting user audio \'{user_audio_id}\'...')
+            session: AsyncSession
+            async with self._sql_session_maker() as session:
+                async with session.begin():
+                    sql_user_audio: SqlUserAudio | None = await session.get(
+                        entity=SqlUserAudio,
+                        ident=str(user_audio_id)
+                    )
+                    if not sql_user_audio:
+                        self._log.debug(f'User audio \'{user_audio_id}\' not found')
+                        return
+                    await session.delete(sql_user_audio)
+                    await session.flush()
+                    await session.execute(
+                        update(SqlAudio)
+                        .where(
+                            SqlAudio.source_id == sql_user_audio.source_id,
+                            ~exists().where(SqlUserAudio.source_id == SqlAudio.source_id)
+                        )
+                        .values(orphaned_at=datetime.now(timezone.utc))
+                    )
+            self._log.debug(f'User audio \'{user_audio_id}\' deleted')
 
+    @staticmethod
+    def _get_user_audio(sql_user_audio: SqlUserAudio) -> UserAudio:
+        return UserAudio(
+            id=UUID(sql_user_audio.id),
+            user_id=UUID(sql_user_audio.user_id),
+            audio_name=sql_user_audio.audio_name,
+            source_id=sql_user_audio.source_id,
+            file_path=Path(sql_user_audio.audio.file_path),
+            bit_rate_kbps=sql_user_audio.audio.bit_rate_kbps,
+            codec=AudioCodec(sql_user_audio.audio.codec),
+            content_hash=sql_user_audio.audio.content_hash,
+            created_at=sql_user_audio.created_at.replace(tzinfo=timezone.utc)
+        )
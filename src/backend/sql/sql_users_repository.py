@@ -5,6 +5,7 @@ from uuid import UUID
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
+from audio_nest.services.i_tracer import ITracer
 from auth.domain.user import User
 from auth.services.i_users_repository import IUsersRepository
 from sql.domain.sql_user import SqlUser
@@ -13,25 +14,31 @@ from sql.domain.sql_user import SqlUser
 class SqlUsersRepository(IUsersRepository):
     _log: Logger = logging.getLogger(__name__)
     _sql_session_maker: async_sessionmaker[AsyncSession]
+    _tracer: ITracer
 
-    def __init__(self, sql_session_maker: async_sessionmaker[AsyncSession]) -> None:
+    def __init__(self, sql_session_maker: async_sessionmaker[AsyncSession], tracer: ITracer) -> None:
         self._sql_session_maker = sql_session_maker
+        self._tracer = tracer
 
     async def get_user_by_email(self, email: str) -> User | None:
-        self._log.debug(f'Getting user with email \'{email}\'...')
-        session: AsyncSession
-        async with self._sql_session_maker() as session:
-            sql_user: SqlUser | None = (await session.scalars(select(SqlUser).where(SqlUser.email == email))).first()
-        user: User | None = None
-        if sql_user:
-            user = User(email=sql_user.email, hashed_password=sql_user.hashed_password, id=UUID(sql_user.id))
-        self._log.debug(f'User with email \'{email}\' retrieved')
-        return user
+        with self._tracer.trace_span('SqlUsersRepository.get_user_by_email'):
+            self._log.debug(f'Getting user with email \'{email}\'...')
+            session: AsyncSession
+            async with self._sql_session_maker() as session:
+                sql_user: SqlUser | None = (
+                    await session.scalars(select(SqlUser).where(SqlUser.email == email))
+                ).first()
+            user: User | None = None
+            if sql_user:
+                user = User(email=sql_user.email, hashed_password=sql_user.hashed_password, id=UUID(sql_user.id))
+            self._log.debug(f'User with email \'{email}\' retrieved')
+            return user
 
     async def create_user(self, user: User) -> None:
-        self._log.debug(f'Creating {user}...')
-        session: AsyncSession
-        async with self._sql_session_maker() as session:
-            async with session.begin():
-                session.add(SqlUser(id=str(user.id), email=user.email, hashed_password=user.hashed_password))
-        self._log.debug(f'{user} created')
+        with self._tracer.trace_span('SqlUsersRepository.create_user'):
+            self._log.debug(f'Creating {user}...')
+            session: AsyncSession
+            async with self._sql_session_maker() as session:
+                async with session.begin():
+                    session.add(SqlUser(id=str(user.id), email=user.email, hashed_password=user.hashed_password))
+            self._log.debug(f'{user} created')
@@ -0,0 +1,6 @@
+from enum import StrEnum
+
+
+class AudioFileLayoutType(StrEnum):
+    flat = 'flat'
+    sharded = 'sharded'
@@ -0,0 +1,6 @@
+from enum import StrEnum
+
+
+class AudioStorageType(StrEnum):
+    local = 'local'
+    s3 = 's3'
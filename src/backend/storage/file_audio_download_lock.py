@@ -0,0 +1,94 @@
+import asyncio
+import logging
+import os
+import socket
+import time
+from asyncio import Task
+from contextlib import suppress
+from logging import Logger
+from pathlib import Path
+from uuid import uuid4
+
+from audio_nest.services.i_audio_download_lock import IAudioDownloadLock
+
+
+class FileAudioDownloadLock(IAudioDownloadLock):
+    _log: Logger = logging.getLogger(__name__)
+    _lock_directory_name: str = '.locks'
+    _lock_directory_path: Path
+    _lease_seconds: float
+    _poll_interval_seconds: float
+    _lease_renewals: dict[str, Task[None]]
+
+    def __init__(self, directory_path: Path, lease_seconds: float, poll_interval_seconds: float) -> None:
+        self._lock_directory_path = directory_path.joinpath(self._lock_directory_name)
+        self._lease_seconds = lease_seconds
+        self._poll_interval_seconds = poll_interval_seconds
+        self._lease_renewals = {}
+
+    async def acquire(self, source_id: str, blocking: bool = True) -> bool:
+        self._log.debug(f'Acquiring download lock for source \'{source_id}\'...')
+        lock_file_path: Path = self._get_lock_file_path(source_id)
+        lock_file_path.parent.mkdir(parents=True, exist_ok=True)
+        while not self._try_create_lock_file(lock_file_path):
+            if self._try_break_stale_lock_file(lock_file_path):
+                continue
+            if not blocking:
+                self._log.debug(f'Download lock for source \'{source_id}\' held elsewhere')
+                return False
+            await asyncio.sleep(self._poll_interval_seconds)
+        self._lease_renewals[source_id] = asyncio.create_task(self._renew_lease(lock_file_path))
+        self._log.debug(f'Download lock for source \'{source_id}\' acquired')
+        return True
+
+    async def release(self, source_id: str) -> None:
+        self._log.debug(f'Releasing download lock for source \'{source_id}\'...')
+        lease_renewal: Task[None] | None = self._lease_renewals.pop(source_id, None)
+        if lease_renewal is not None:
+            lease_renewal.cancel()
+            with suppress(asyncio.CancelledError):
+                await lease_renewal
+        self._get_lock_file_path(source_id).unlink(missing_ok=True)
+        self._log.debug(f'Download lock for source \'{source_id}\' released')
+
+    def _get_lock_file_path(self, source_id: str) -> Path:
+        return self._lock_directory_path.joinpath(f'{source_id}.lock')
+
+    @staticmethod
+    def _try_create_lock_file(lock_file_path: Path) -> bool:
+        try:
+            file_descriptor: int = os.open(lock_file_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            return False
+        with os.fdopen(file_descriptor, 'w') as file:
+            file.write(f'{socket.gethostname()}:{os.getpid()}')
+        return True
+
+    def _try_break_stale_lock_file(self, lock_file_path: Path) -> bool:
+        if not self._is_lock_file_stale(lock_file_path):
+            return False
+        stale_lock_file_path: Path = lock_file_path.with_name(f'{lock_file_path.name}.{uuid4().hex}.stale')
+        try:
+            lock_file_path.rename(stale_lock_file_path)
+        except FileNotFoundError:
+            return True
+        if not self._is_lock_file_stale(stale_lock_file_path):
+            # Renewed or re-created between the check and the rename: hand the lease back unless already replaced
+            with suppress(FileExistsError):
+                os.link(stale_lock_file_path, lock_file_path)
+        else:
+            self._log.warning(f'Stale download lock \'{lock_file_path}\' broken')
+        stale_lock_file_path.unlink(missing_ok=True)
+        return True
+
+    def _is_lock_file_stale(self, lock_file_path: Path) -> bool:
+        try:
+            return time.time() - lock_file_path.stat().st_mtime > self._lease_seconds
+        except FileNotFoundError:
+            return False
+
+    async def _renew_lease(self, lock_file_path: Path) -> None:
+        while True:
+            await asyncio.sleep(self._lease_seconds / 3)
+            with suppress(FileNotFoundError):
+                os.utime(lock_file_path)
@@ -0,0 +1,23 @@
+import logging
+from logging import Logger
+from pathlib import Path
+
+from audio_nest.domain.audio import Audio
+from audio_nest.services.i_audio_file_layout import IAudioFileLayout
+
+
+class FlatAudioFileLayout(IAudioFileLayout):
+    _log: Logger = logging.getLogger(__name__)
+    _directory_path: Path
+
+    def __init__(self, directory_path: Path) -> None:
+        self._directory_path = directory_path
+
+    async def store_audio_file(self, audio: Audio) -> Path:
+        file_path: Path = self._directory_path.joinpath(f'{audio.source_id}{audio.file_path.suffix}')
+        if file_path != audio.file_path:
+            self._log.debug(f'Moving audio file \'{audio.file_path}\' to \'{file_path}\'...')
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            audio.file_path.replace(file_path)
+            self._log.debug(f'Audio file \'{audio.file_path}\' moved to \'{file_path}\'')
+        return file_path
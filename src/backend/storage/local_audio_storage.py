@@ -0,0 +1,47 @@
+import logging
+from contextlib import asynccontextmanager
+from logging import Logger
+from pathlib import Path
+from typing import AsyncGenerator, BinaryIO
+
+from audio_nest.domain.audio import Audio
+from audio_nest.services.i_audio_file_layout import IAudioFileLayout
+from audio_nest.services.i_audio_storage import IAudioStorage
+
+
+class LocalAudioStorage(IAudioStorage):
+    _log: Logger = logging.getLogger(__name__)
+    _read_chunk_size: int = 64 * 1024
+    _audio_file_layout: IAudioFileLayout
+
+    def __init__(self, audio_file_layout: IAudioFileLayout) -> None:
+        self._audio_file_layout = audio_file_layout
+
+    async def store_audio_file(self, audio: Audio) -> Path:
+        return await self._audio_file_layout.store_audio_file(audio)
+
+    async def is_audio_file_stored(self, file_path: Path) -> bool:
+        return file_path.is_file()
+
+    async def read_audio_file(self, file_path: Path) -> AsyncGenerator[bytes, None]:
+        file: BinaryIO
+        with file_path.open('rb') as file:
+            chunk: bytes
+            while chunk := file.read(self._read_chunk_size):
+                yield chunk
+
+    @asynccontextmanager
+    async def open_local_audio_file(self, file_path: Path) -> AsyncGenerator[Path, None]:
+        yield file_path
+
+    async def get_audio_file_url(self, file_path: Path) -> str | None:
+        return None
+
+    async def delete_audio_file(self, file_path: Path) -> int:
+        try:
+            size_bytes: int = file_path.stat().st_size
+            file_path.unlink()
+            return size_bytes
+        except FileNotFoundError:
+            self._log.debug(f'Audio file \'{file_path}\' already deleted')
+            return 0
@@ -0,0 +1,137 @@
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from logging import Logger
+from pathlib import Path
+from typing import Any, AsyncGenerator
+from uuid import uuid4
+
+import boto3
+from boto3.s3.transfer import TransferConfig
+from botocore.exceptions import ClientError
+
+from audio_nest.domain.audio import Audio
+from audio_nest.services.audio_content_hasher import get_audio_content_hash
+from audio_nest.services.i_audio_storage import IAudioStorage
+
+
+class S3AudioStorage(IAudioStorage):
+    _log: Logger = logging.getLogger(__name__)
+    _read_chunk_size: int = 64 * 1024
+    _bucket_name: str
+    _key_prefix: str
+    _presigned_url_expiration_seconds: int
+    _staging_directory_path: Path
+    _transfer_config: TransferConfig
+    _client: Any
+
+    def __init__(
+        self,
+        bucket_name: str,
+        staging_directory_path: Path,
+        endpoint_url: str | None = None,
+        region_name: str | None = None,
+        access_key_id: str | None = None,
+        secret_access_key: str | None = None,
+        key_prefix: str = '',
+        presigned_url_expiration_seconds: int = 300,
+        multipart_threshold_bytes: int = 8 * 1024 * 1024,
+        multipart_chunk_size_bytes: int = 8 * 1024 * 1024
+    ) -> None:
+        self._bucket_name = bucket_name
+        self._key_prefix = key_prefix
+        self._presigned_url_expiration_seconds = presigned_url_expiration_seconds
+        self._staging_directory_path = staging_directory_path
+        self._transfer_config = TransferConfig(
+            multipart_threshold=multipart_threshold_bytes,
+            multipart_chunksize=multipart_chunk_size_bytes
+        )
+        self._client = boto3.client(
+            's3',
+            endpoint_url=endpoint_url,
+            region_name=region_name,
+            aws_access_key_id=access_key_id,
+            aws_secret_access_key=secret_access_key
+        )
+
+    async def store_audio_file(self, audio: Audio) -> Path:
+        content_hash: str = audio.content_hash or await asyncio.to_thread(get_audio_content_hash, audio.file_path)
+        key: str = f'{self._key_prefix}{content_hash[:2]}/{content_hash[2:4]}/{content_hash}{audio.file_path.suffix}'
+        if await self._get_object_size_bytes(key) is None:
+            self._log.debug(f'Uploading audio file \'{audio.file_path}\' to \'{key}\'...')
+            # Split into concurrently uploaded parts above the multipart threshold
+            await asyncio.to_thread(
+                self._client.upload_file,
+                str(audio.file_path),
+                self._bucket_name,
+                key,
+                Config=self._transfer_config
+            )
+            self._log.debug(f'Audio file \'{audio.file_path}\' uploaded to \'{key}\'')
+        else:
+            self._log.debug(f'Audio file \'{audio.file_path}\' already stored as \'{key}\'')
+        audio.file_path.unlink()
+        return Path(key)
+
+    async def is_audio_file_stored(self, file_path: Path) -> bool:
+        return await self._get_object_size_bytes(file_path.as_posix()) is not None
+
+    async def read_audio_file(self, file_path: Path) -> AsyncGenerator[bytes, None]:
+        response: dict[str, Any] = await asyncio.to_thread(
+            self._client.get_object,
+            Bucket=self._bucket_name,
+            Key=file_path.as_posix()
+        )
+        body: Any = response['Body']
+        try:
+            chunk: bytes
+            while chunk := await asyncio.to_thread(body.read, self._read_chunk_size):
+                yield chunk
+        finally:
+            body.close()
+
+    @asynccontextmanager
+    async def open_local_audio_file(self, file_path: Path) -> AsyncGenerator[Path, None]:
+        local_file_path: Path = self._staging_directory_path.joinpath(f'{uuid4().hex}{file_path.suffix}')
+        local_file_path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            await asyncio.to_thread(
+                self._client.download_file,
+                self._bucket_name,
+                file_path.as_posix(),
+                str(local_file_path),
+                Config=self._transfer_config
+            )
+            yield local_file_path
+        finally:
+            local_file_path.unlink(missing_ok=True)
+
+    async def get_audio_file_url(self, file_path: Path) -> str | None:
+        return await asyncio.to_thread(
+            self._client.generate_presigned_url,
+            'get_object',
+            Params={'Bucket': self._bucket_name, 'Key': file_path.as_posix()},
+            ExpiresIn=self._presigned_url_expiration_seconds
+        )
+
+    async def delete_audio_file(self, file_path: Path) -> int:
+        key: str = file_path.as_posix()
+        size_bytes: int | None = await self._get_object_size_bytes(key)
+        if size_bytes is None:
+            self._log.debug(f'Audio file \'{key}\' already deleted')
+            return 0
+        await asyncio.to_thread(self._client.delete_object, Bucket=self._bucket_name, Key=key)
+        return size_bytes
+
+    async def _get_object_size_bytes(self, key: str) -> int | None:
+        try:
+            response: dict[str, Any] = await asyncio.to_thread(
+                self._client.head_object,
+                Bucket=self._bucket_name,
+                Key=key
+            )
+        except ClientError as ex:
+            if ex.response['Error']['Code'] in ('404', 'NoSuchKey', 'NotFound'):
+                return None
+            raise
+        return response['ContentLength']
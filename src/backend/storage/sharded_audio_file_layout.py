@@ -0,0 +1,44 @@
+import asyncio
+import logging
+from logging import Logger
+from pathlib import Path
+
+from audio_nest.domain.audio import Audio
+from audio_nest.services.audio_content_hasher import get_audio_content_hash
+from audio_nest.services.i_audio_file_layout import IAudioFileLayout
+
+
+class ShardedAudioFileLayout(IAudioFileLayout):
+    _log: Logger = logging.getLogger(__name__)
+    _directory_path: Path
+    _shard_levels: int
+    _shard_width: int
+
+    def __init__(self, directory_path: Path, shard_levels: int = 2, shard_width: int = 2) -> None:
+        self._directory_path = directory_path
+        self._shard_levels = shard_levels
+        self._shard_width = shard_width
+
+    async def store_audio_file(self, audio: Audio) -> Path:
+        return await asyncio.to_thread(self._store_audio_file, audio.file_path, audio.content_hash)
+
+    def _store_audio_file(self, current_file_path: Path, content_hash: str | None) -> Path:
+        content_hash = content_hash or get_audio_content_hash(current_file_path)
+        file_path: Path = self._directory_path.joinpath(
+            *(
+                content_hash[level * self._shard_width:(level + 1) * self._shard_width]
+                for level in range(self._shard_levels)
+            ),
+            f'{content_hash}{current_file_path.suffix}'
+        )
+        if file_path == current_file_path:
+            return file_path
+        if file_path.is_file():
+            self._log.debug(f'Audio file \'{current_file_path}\' already stored as \'{file_path}\'')
+            current_file_path.unlink()
+        else:
+            self._log.debug(f'Moving audio file \'{current_file_path}\' to \'{file_path}\'...')
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            current_file_path.replace(file_path)
+            self._log.debug(f'Audio file \'{current_file_path}\' moved to \'{file_path}\'')
+        return file_path
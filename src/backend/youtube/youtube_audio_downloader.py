@@ -1,55 +1,133 @@
 import asyncio
 import logging
+from asyncio.subprocess import Process
+from contextlib import ExitStack
 from logging import Logger
 from pathlib import Path
-from typing import Any
+from typing import Any, AsyncGenerator
+from uuid import uuid4
 
 from yt_dlp import YoutubeDL
 from yt_dlp.postprocessor.ffmpeg import ACODECS
 
 from audio_nest.domain.audio import Audio
 from audio_nest.domain.audio_codec import AudioCodec
+from audio_nest.domain.audio_download_priority import AudioDownloadPriority
+from audio_nest.domain.audio_download_progress import AudioDownloadProgress
+from audio_nest.domain.audio_download_status import AudioDownloadStatus
+from audio_nest.domain.audio_stream import AudioStream
+from audio_nest.exceptions.audio_download_failed_exception import AudioDownloadFailedException
+from audio_nest.services.audio_download_worker_pool import AudioDownloadWorkerPool
 from audio_nest.services.i_audio_downloader import IAudioDownloader
+from audio_nest.services.i_stage_timer import IStageTimer
+from audio_nest.services.i_tracer import ITracer
 
 
 class YoutubeAudioDownloader(IAudioDownloader):
     _log: Logger = logging.getLogger(__name__)
     _url_template: str = 'https://www.youtube.com/watch?v={video_id}'
     _output_file_template: str = '{output_file_path}.%(ext)s'
+    _stream_chunk_size: int = 64 * 1024
+    _format_template: str = 'bestaudio[acodec={codec}]/bestaudio/best'
     _bit_rate_kbps: int
     _codec: AudioCodec
     _file_extension: str
+    _encoder: str
     _ffmpeg_path: Path
+    _ffmpeg_executable_path: Path
     _download_directory_path: Path
+    _worker_pool: AudioDownloadWorkerPool
+    _stage_timer: IStageTimer
+    _tracer: ITracer
+    _remuxed_audio_count: int
+    _transcoded_audio_count: int
 
-    def __init__(self, bit_rate_kbps: int, codec: AudioCodec, ffmpeg_path: Path, download_directory_path: Path) -> None:
+    def __init__(
+        self,
+        bit_rate_kbps: int,
+        codec: AudioCodec,
+        ffmpeg_path: Path,
+        download_directory_path: Path,
+        worker_pool: AudioDownloadWorkerPool,
+        stage_timer: IStageTimer,
+        tracer: ITracer
+    ) -> None:
         self._bit_rate_kbps = bit_rate_kbps
         self._codec = codec
-        self._file_extension = ACODECS[codec][0]
+        self._file_extension, self._encoder, _ = ACODECS[codec]
         self._ffmpeg_path = ffmpeg_path
+        self._ffmpeg_executable_path = ffmpeg_path if ffmpeg_path.is_file() else ffmpeg_path.joinpath('ffmpeg')
         self._download_directory_path = download_directory_path
+        self._worker_pool = worker_pool
+        self._stage_timer = stage_timer
+        self._tracer = tracer
+        self._remuxed_audio_count = 0
+        self._transcoded_audio_count = 0
 
-    async def download_audio_from_source(self, source_id: str) -> Audio:
+    @property
+    def remuxed_audio_count(self) -> int:
+        return self._remuxed_audio_count
+
+    @property
+    def transcoded_audio_count(self) -> int:
+        return self._transcoded_audio_count
+
+    async def download_audio_from_source(
+        self,
+        source_id: str,
+        progress: AudioDownloadProgress | None = None,
+        priority: AudioDownloadPriority = AudioDownloadPriority.preview
+    ) -> Audio:
         self._log.debug(f'Downloading audio from YouTube video \'{source_id}\'...')
-        await asyncio.to_thread(self._download_audio_from_youtube, video_id=source_id)
-        audio: Audio = Audio(
-            source_id=source_id,
-            file_path=self._download_directory_path.joinpath(f'{source_id}.{self._file_extension}'),
-            bit_rate_kbps=self._bit_rate_kbps,
-            codec=self._codec
+        audio: Audio = self._get_audio(source_id)
+        youtube_video: dict[str, Any] = await self._worker_pool.run(
+            priority,
+            self._download_audio_from_youtube,
+            video_id=source_id,
+            output_file_path=audio.file_path,
+            progress=progress or AudioDownloadProgress()
         )
+        if self._is_remuxable(youtube_video):
+            audio.bit_rate_kbps = self._get_bit_rate_kbps(youtube_video)
+        self._record_processing_path(video_id=source_id, youtube_video=youtube_video)
         self._log.debug(f'Audio from YouTube video \'{source_id}\' downloaded')
         return audio
 
-    def _download_audio_from_youtube(self, video_id: str) -> None:
+    def stream_audio_from_source(
+        self,
+        source_id: str,
+        priority: AudioDownloadPriority = AudioDownloadPriority.preview
+    ) -> AudioStream:
+        audio: Audio = self._get_audio(source_id)
+        return AudioStream(audio=audio, chunks=self._stream_audio_from_youtube(audio=audio, priority=priority))
+
+    def _get_audio(self, video_id: str) -> Audio:
+        return Audio(
+            source_id=video_id,
+            # Unique staging name, so concurrent workers never write to the same file before it is moved into place
+            file_path=self._download_directory_path.joinpath(f'{video_id}.{uuid4().hex}.{self._file_extension}'),
+            bit_rate_kbps=self._bit_rate_kbps,
+            codec=self._codec
+        )
+
+    def _download_audio_from_youtube(
+        self,
+        video_id: str,
+        output_file_path: Path,
+        progress: AudioDownloadProgress
+    ) -> dict[str, Any]:
+        # Entered around the download, so stages and spans switched by yt-dlp hooks are closed even on failure
+        download_stage: ExitStack = ExitStack()
+        transcode_stage: ExitStack = ExitStack()
+        postprocessing_spans: ExitStack = ExitStack()
         youtube_downloader_options: dict[str, Any] = {
             'ffmpeg_location': self._ffmpeg_path,
-            'format': 'bestaudio/best',
+            'format': self._format_template.format(codec=self._codec),
             'keepvideo': False,
             'logger': self._log,
             'nocheckcertificate': True,
             'outtmpl': self._output_file_template.format(
-                output_file_path=self._download_directory_path.joinpath(video_id)
+                output_file_path=output_file_path.with_suffix('')
             ),
             'postprocessors': [
                 {
@@ -58,9 +136,127 @@ class YoutubeAudioDownloader(IAudioDownloader):
                     'preferredquality': str(self._bit_rate_kbps)
                 }
             ],
+            'postprocessor_hooks': [
+                lambda status: self._update_transcoding_progress(progress, status),
+                lambda status: self._time_transcoding(download_stage, transcode_stage, status),
+                lambda status: self._trace_postprocessing(postprocessing_spans, status)
+            ],
             'prefer_ffmpeg': True,
+            'progress_hooks': [lambda status: self._update_downloading_progress(progress, status)],
             'writethumbnail': False
         }
         youtube_downloader: YoutubeDL
+        with download_stage, transcode_stage, YoutubeDL(youtube_downloader_options) as youtube_downloader:
+            download_stage.enter_context(self._stage_timer.time_stage('youtube_download'))
+            # Extracted and downloaded in separate calls, so each phase is traced on its own
+            youtube_video: dict[str, Any] = self._extract_youtube_video(youtube_downloader, video_id)
+            with (
+                self._tracer.trace_span('yt_dlp.download', {'audio_nest.source_id': video_id}),
+                postprocessing_spans
+            ):
+                return youtube_downloader.process_ie_result(youtube_video, download=True)
+
+    def _is_remuxable(self, youtube_video: dict[str, Any]) -> bool:
+        return youtube_video.get('acodec') == self._codec
+
+    def _get_bit_rate_kbps(self, youtube_video: dict[str, Any]) -> int:
+        return round(youtube_video.get('abr') or self._bit_rate_kbps)
+
+    def _record_processing_path(self, video_id: str, youtube_video: dict[str, Any]) -> None:
+        if self._is_remuxable(youtube_video):
+            self._remuxed_audio_count += 1
+            self._log.info(f'Audio from YouTube video \'{video_id}\' remuxed from {youtube_video["acodec"]}')
+        else:
+            self._transcoded_audio_count += 1
+            self._log.info(
+                f'Audio from YouTube video \'{video_id}\' transcoded from {youtube_video.get("acodec")} to {self._codec}'
+            )
+
+    def _extract_youtube_video(self, youtube_downloader: YoutubeDL, video_id: str) -> dict[str, Any]:
+        with self._tracer.trace_span('yt_dlp.extract', {'audio_nest.source_id': video_id}):
+            return youtube_downloader.extract_info(self._url_template.format(video_id=video_id), download=False)
+
+    def _time_transcoding(self, download_stage: ExitStack, transcode_stage: ExitStack, status: dict[str, Any]) -> None:
+        if status['postprocessor'] != 'ExtractAudio':
+            return
+        if status['status'] == 'started':
+            download_stage.close()
+            transcode_stage.enter_context(self._stage_timer.time_stage('youtube_transcode'))
+        elif status['status'] == 'finished':
+            transcode_stage.close()
+
+    def _trace_postprocessing(self, postprocessing_spans: ExitStack, status: dict[str, Any]) -> None:
+        if status['status'] == 'started':
+            postprocessing_spans.enter_context(
+                self._tracer.trace_span('yt_dlp.postprocess', {'yt_dlp.postprocessor': status['postprocessor']})
+            )
+        elif status['status'] == 'finished':
+            postprocessing_spans.close()
+
+    @staticmethod
+    def _update_downloading_progress(progress: AudioDownloadProgress, status: dict[str, Any]) -> None:
+        if status['status'] == 'downloading':
+            progress.status = AudioDownloadStatus.downloading
+            progress.downloaded_bytes = status.get('downloaded_bytes') or 0
+            progress.total_bytes = status.get('total_bytes') or status.get('total_bytes_estimate')
+
+    @staticmethod
+    def _update_transcoding_progress(progress: AudioDownloadProgress, status: dict[str, Any]) -> None:
+        if status['status'] == 'started' and status['postprocessor'] == 'ExtractAudio':
+            progress.status = AudioDownloadStatus.transcoding
+
+    async def _stream_audio_from_youtube(
+        self,
+        audio: Audio,
+        priority: AudioDownloadPriority
+    ) -> AsyncGenerator[bytes, None]:
+        video_id: str = audio.source_id
+        async with self._worker_pool.acquire(priority):
+            with self._stage_timer.time_stage('youtube_stream'):
+                self._log.debug(f'Streaming audio from YouTube video \'{video_id}\'...')
+                youtube_video: dict[str, Any] = await self._worker_pool.run_acquired(
+                    self._get_youtube_video,
+                    video_id=video_id
+                )
+                encoding_arguments: list[str] = ['-acodec', self._encoder, '-b:a', f'{self._bit_rate_kbps}k']
+                if self._is_remuxable(youtube_video):
+                    encoding_arguments = ['-acodec', 'copy']
+                    audio.bit_rate_kbps = self._get_bit_rate_kbps(youtube_video)
+                self._record_processing_path(video_id=video_id, youtube_video=youtube_video)
+                process: Process = await asyncio.create_subprocess_exec(
+                    self._ffmpeg_executable_path,
+                    '-loglevel', 'error',
+                    '-headers',
+                    ''.join(f'{name}: {value}\r\n' for name, value in youtube_video['http_headers'].items()),
+                    '-i', youtube_video['url'],
+                    '-vn',
+                    *encoding_arguments,
+                    '-f', self._file_extension,
+                    'pipe:1',
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE
+                )
+                try:
+                    chunk: bytes
+                    while chunk := await process.stdout.read(self._stream_chunk_size):
+                        yield chunk
+                    if await process.wait() != 0:
+                        raise AudioDownloadFailedException(
+                            source_id=video_id,
+                            reason=(await process.stderr.read()).decode(errors='replace').strip()
+                        )
+                finally:
+                    if process.returncode is None:
+                        process.kill()
+                        await process.wait()
+                self._log.debug(f'Audio from YouTube video \'{video_id}\' streamed')
+
+    def _get_youtube_video(self, video_id: str) -> dict[str, Any]:
+        youtube_downloader_options: dict[str, Any] = {
+            'format': self._format_template.format(codec=self._codec),
+            'logger': self._log,
+            'nocheckcertificate': True
+        }
+        youtube_downloader: YoutubeDL
         with YoutubeDL(youtube_downloader_options) as youtube_downloader:
-            youtube_downloader.download([self._url_template.format(video_id=video_id)])
+            return self._extract_youtube_video(youtube_downloader, video_id)
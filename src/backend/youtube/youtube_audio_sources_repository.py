@@ -6,6 +6,8 @@ from typing import TypedDict
 from youtube_search import YoutubeSearch
 
 from audio_nest.services.i_audio_sources_repository import IAudioSourcesRepository
+from audio_nest.services.i_stage_timer import IStageTimer
+from audio_nest.services.i_tracer import ITracer
 from audio_nest.domain.audio_source import AudioSource
 
 
@@ -14,17 +16,26 @@ YoutubeVideo = TypedDict('YoutubeVideo', {'id': str, 'title': str, 'thumbnails':
 
 class YoutubeAudioSourcesRepository(IAudioSourcesRepository):
     _log: Logger = logging.getLogger(__name__)
+    _stage_timer: IStageTimer
+    _tracer: ITracer
     _max_results: int
 
-    def __init__(self, max_results: int = 20) -> None:
+    def __init__(self, stage_timer: IStageTimer, tracer: ITracer, max_results: int = 20) -> None:
+        self._stage_timer = stage_timer
+        self._tracer = tracer
         self._max_results = max_results
 
     async def get_audio_sources(self, search_query: str) -> list[AudioSource]:
         self._log.debug(f'Getting YouTube videos for search query \'{search_query}\'...')
         result: list[AudioSource] = []
-        youtube_videos: list[YoutubeVideo] = (
-            await asyncio.to_thread(YoutubeSearch, search_terms=search_query, max_results=self._max_results)
-        ).to_dict()
+        youtube_videos: list[YoutubeVideo]
+        with (
+            self._stage_timer.time_stage('youtube_search'),
+            self._tracer.trace_span('YoutubeAudioSourcesRepository.get_audio_sources')
+        ):
+            youtube_videos = (
+                await asyncio.to_thread(YoutubeSearch, search_terms=search_query, max_results=self._max_results)
+            ).to_dict()
         youtube_video: YoutubeVideo
         for youtube_video in youtube_videos:
             result.append(
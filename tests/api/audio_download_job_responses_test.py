@@ -0,0 +1,21 @@
+import json
+
+from fastapi.responses import JSONResponse
+
+from api.audio_download_job_responses import create_audio_download_job_accepted_response, is_async_response_preferred
+from audio_nest.domain.audio_download_job import AudioDownloadJob
+
+
+def test_async_response_is_preferred_only_when_requested() -> None:
+    assert is_async_response_preferred('wait=10, Respond-Async')
+    assert is_async_response_preferred('respond-async; wait=10')
+    assert not is_async_response_preferred('return=minimal')
+    assert not is_async_response_preferred(None)
+
+
+def test_accepted_response_locates_audio_download_job() -> None:
+    test_audio_download_job: AudioDownloadJob = AudioDownloadJob('test_source_id')
+    response: JSONResponse = create_audio_download_job_accepted_response(test_audio_download_job)
+    assert response.status_code == 202
+    assert response.headers['Location'] == f'/api/jobs/{test_audio_download_job.id}'
+    assert json.loads(response.body)['id'] == str(test_audio_download_job.id)
@@ -0,0 +1,191 @@
+import hashlib
+import re
+from pathlib import Path
+from unittest.mock import AsyncMock
+from urllib.parse import unquote
+
+import pytest
+from fastapi import FastAPI, Header, Response
+from fastapi.testclient import TestClient
+from httpx import Response as HttpResponse
+
+from api.audio_delivery_mode import AudioDeliveryMode
+from api.audio_file_response_factory import AudioFileResponseFactory
+from api.audio_request_parameters import get_audio_cache_control
+from audio_nest.domain.audio import Audio
+from audio_nest.domain.audio_codec import AudioCodec
+from audio_nest.domain.audio_quality import AudioQuality
+from audio_nest.services.i_audio_file_layout import IAudioFileLayout
+from audio_nest.services.i_audio_storage import IAudioStorage
+from storage.local_audio_storage import LocalAudioStorage
+
+
+test_content: bytes = bytes(range(256)) * 4
+test_etag: str = f'"{hashlib.sha256(test_content).hexdigest()}"'
+nginx_config_path: Path = Path(__file__).parents[2].joinpath('src', 'backend', 'nginx.conf')
+
+
+def create_test_client(audio_file_response_factory: AudioFileResponseFactory, audio: Audio) -> TestClient:
+    app: FastAPI = FastAPI()
+
+    @app.get('/audio')
+    async def get_audio(
+        quality: AudioQuality | None = None,
+        if_none_match: str | None = Header(default=None)
+    ) -> Response:
+        return await audio_file_response_factory.create_audio_file_response(
+            audio=audio,
+            cache_control=get_audio_cache_control(scope='public', quality=quality),
+            if_none_match=if_none_match
+        )
+
+    return TestClient(app)
+
+
+@pytest.fixture(scope='function')
+def test_audio(tmp_path: Path) -> Audio:
+    test_audio: Audio = Audio(
+        source_id='test_source_id',
+        file_path=tmp_path.joinpath('ab', 'cd', 'test audio.ogg'),
+        bit_rate_kbps=320,
+        codec=AudioCodec.vorbis,
+        content_hash=hashlib.sha256(test_content).hexdigest()
+    )
+    test_audio.file_path.parent.mkdir(parents=True)
+    test_audio.file_path.write_bytes(test_content)
+    return test_audio
+
+
+@pytest.fixture(scope='function')
+def test_client(test_audio: Audio, tmp_path: Path) -> TestClient:
+    return create_test_client(
+        audio_file_response_factory=AudioFileResponseFactory(
+            audio_storage=LocalAudioStorage(audio_file_layout=AsyncMock(spec=IAudioFileLayout)),
+            delivery_mode=AudioDeliveryMode.direct,
+            directory_path=tmp_path,
+            internal_path_prefix='/internal/audio/'
+        ),
+        audio=test_audio
+    )
+
+
+def test_audio_response_has_content_etag_and_cache_control(test_client: TestClient) -> None:
+    response: HttpResponse = test_client.get('/audio', params={'quality': 'low'})
+    assert response.status_code == 200
+    assert response.content == test_content
+    assert response.headers['ETag'] == test_etag
+    assert response.headers['Cache-Control'] == 'public, max-age=31536000, immutable'
+    assert response.headers['Accept-Ranges'] == 'bytes'
+    assert test_client.get('/audio').headers['Cache-Control'] == 'public, no-cache'
+
+
+def test_matching_if_none_match_is_not_modified(test_client: TestClient) -> None:
+    response: HttpResponse = test_client.get('/audio', headers={'If-None-Match': f'"other", W/{test_etag}'})
+    assert response.status_code == 304
+    assert response.content == b''
+    assert response.headers['ETag'] == test_etag
+    assert test_client.get('/audio', headers={'If-None-Match': '"other"'}).status_code == 200
+
+
+def test_range_is_served_from_requested_offset(test_client: TestClient) -> None:
+    response: HttpResponse = test_client.get('/audio', headers={'Range': 'bytes=1000-'})
+    assert response.status_code == 206
+    assert response.content == test_content[1000:]
+    assert response.headers['Content-Range'] == f'bytes 1000-{len(test_content) - 1}/{len(test_content)}'
+    response = test_client.get('/audio', headers={'Range': 'bytes=-24'})
+    assert response.status_code == 206
+    assert response.content == test_content[-24:]
+
+
+def test_if_range_is_checked_against_content_etag(test_client: TestClient) -> None:
+    response: HttpResponse = test_client.get('/audio', headers={'Range': 'bytes=512-767', 'If-Range': test_etag})
+    assert response.status_code == 206
+    assert response.content == test_content[512:768]
+    response = test_client.get('/audio', headers={'Range': 'bytes=512-767', 'If-Range': '"stale"'})
+    assert response.status_code == 200
+    assert response.content == test_content
+
+
+def test_unsatisfiable_range_is_rejected(test_client: TestClient) -> None:
+    response: HttpResponse = test_client.get('/audio', headers={'Range': f'bytes={len(test_content)}-'})
+    assert response.status_code == 416
+
+
+def test_x_accel_redirect_points_nginx_stand_in_at_stored_file(test_audio: Audio, tmp_path: Path) -> None:
+    nginx_config: str = nginx_config_path.read_text()
+    internal_location: re.Match[str] = re.search(r'location (\S+) \{\s*internal;\s*alias (\S+);', nginx_config)
+    assert internal_location is not None
+    internal_path_prefix: str = internal_location.group(1)
+    test_client: TestClient = create_test_client(
+        audio_file_response_factory=AudioFileResponseFactory(
+            audio_storage=LocalAudioStorage(audio_file_layout=AsyncMock(spec=IAudioFileLayout)),
+            delivery_mode=AudioDeliveryMode.x_accel_redirect,
+            directory_path=tmp_path,
+            internal_path_prefix=internal_path_prefix
+        ),
+        audio=test_audio
+    )
+    response: HttpResponse = test_client.get('/audio', params={'quality': 'low'})
+    assert response.status_code == 200
+    assert response.content == b''
+    assert response.headers['ETag'] == test_etag
+    assert response.headers['Cache-Control'] == 'public, max-age=31536000, immutable'
+    assert response.headers['Content-Type'] == 'audio/ogg'
+    internal_uri: str = response.headers['X-Accel-Redirect']
+    assert internal_uri.startswith(internal_path_prefix)
+    # Resolved the way the internal location does, with the alias pointed at this audio directory
+    assert tmp_path.joinpath(unquote(internal_uri.removeprefix(internal_path_prefix))).read_bytes() == test_content
+    assert test_client.get('/audio', headers={'If-None-Match': test_etag}).status_code == 304
+
+
+def test_x_sendfile_points_at_absolute_file_path(test_audio: Audio, tmp_path: Path) -> None:
+    test_client: TestClient = create_test_client(
+        audio_file_response_factory=AudioFileResponseFactory(
+            audio_storage=LocalAudioStorage(audio_file_layout=AsyncMock(spec=IAudioFileLayout)),
+            delivery_mode=AudioDeliveryMode.x_sendfile,
+            directory_path=tmp_path,
+            internal_path_prefix='/internal/audio/'
+        ),
+        audio=test_audio
+    )
+    response: HttpResponse = test_client.get('/audio')
+    assert response.content == b''
+    assert Path(response.headers['X-Sendfile']) == test_audio.file_path.resolve()
+
+
+def test_file_outside_audio_directory_is_served_directly(test_audio: Audio, tmp_path: Path) -> None:
+    test_client: TestClient = create_test_client(
+        audio_file_response_factory=AudioFileResponseFactory(
+            audio_storage=LocalAudioStorage(audio_file_layout=AsyncMock(spec=IAudioFileLayout)),
+            delivery_mode=AudioDeliveryMode.x_accel_redirect,
+            directory_path=tmp_path.joinpath('other'),
+            internal_path_prefix='/internal/audio/'
+        ),
+        audio=test_audio
+    )
+    response: HttpResponse = test_client.get('/audio')
+    assert 'X-Accel-Redirect' not in response.headers
+    assert response.content == test_content
+
+
+def test_audio_in_remote_storage_is_redirected_to_presigned_url(test_audio: Audio, tmp_path: Path) -> None:
+    test_url: str = 'https://bucket.s3.example.com/audio/ab/cd/abcd.ogg?X-Amz-Signature=signature'
+    audio_storage_mock: AsyncMock = AsyncMock(spec=IAudioStorage)
+    audio_storage_mock.get_audio_file_url.return_value = test_url
+    test_client: TestClient = create_test_client(
+        audio_file_response_factory=AudioFileResponseFactory(
+            audio_storage=audio_storage_mock,
+            delivery_mode=AudioDeliveryMode.x_accel_redirect,
+            directory_path=tmp_path,
+            internal_path_prefix='/internal/audio/'
+        ),
+        audio=test_audio
+    )
+    response: HttpResponse = test_client.get('/audio', params={'quality': 'low'}, follow_redirects=False)
+    assert response.status_code == 307
+    assert response.headers['Location'] == test_url
+    assert response.headers['Cache-Control'] == 'no-store'
+    assert response.headers['ETag'] == test_etag
+    assert 'X-Accel-Redirect' not in response.headers
+    audio_storage_mock.get_audio_file_url.assert_awaited_once_with(test_audio.file_path)
+    assert test_client.get('/audio', headers={'If-None-Match': test_etag}).status_code == 304
@@ -0,0 +1,28 @@
+from unittest.mock import MagicMock
+
+from api.audio_request_parameters import get_accepted_audio_codecs, get_audio_cache_control, get_audio_quality
+from audio_nest.domain.audio_codec import AudioCodec
+from audio_nest.domain.audio_quality import AudioQuality
+from audio_nest.use_cases.audio_rendition_getter import AudioRenditionGetter
+
+
+def test_accepted_audio_codecs_are_read_from_media_types_and_codecs_parameters() -> None:
+    assert get_accepted_audio_codecs('audio/opus, audio/flac;q=0, audio/webm; codecs="vorbis"') == {
+        AudioCodec.opus,
+        AudioCodec.vorbis
+    }
+    assert get_accepted_audio_codecs(None) == set()
+
+
+def test_explicit_audio_quality_is_preferred_over_accepted_audio_codecs() -> None:
+    audio_rendition_getter_mock: MagicMock = MagicMock(spec=AudioRenditionGetter)
+    audio_rendition_getter_mock.get_preferred_audio_quality.return_value = AudioQuality.low
+    assert get_audio_quality(AudioQuality.high, 'audio/opus', audio_rendition_getter_mock) == AudioQuality.high
+    audio_rendition_getter_mock.get_preferred_audio_quality.assert_not_called()
+    assert get_audio_quality(None, 'audio/opus', audio_rendition_getter_mock) == AudioQuality.low
+    audio_rendition_getter_mock.get_preferred_audio_quality.assert_called_once_with({AudioCodec.opus})
+
+
+def test_only_explicit_audio_quality_is_cached_as_immutable() -> None:
+    assert get_audio_cache_control(scope='private', quality=None) == 'private, no-cache'
+    assert get_audio_cache_control(scope='public', quality=AudioQuality.low) == 'public, max-age=31536000, immutable'
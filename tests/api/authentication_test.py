@@ -4,28 +4,36 @@ import pytest
 from fastapi.testclient import TestClient
 from httpx import Response
 
-from auth.authentication_service import AuthenticationService
+from auth.domain.authentication_tokens import AuthenticationTokens
 from auth.exceptions.invalid_user_credentials_exception import InvalidUserCredentialsException
 from auth.exceptions.user_already_registered_exception import UserAlreadyRegisteredException
+from auth.use_cases.user_login_handler import UserLoginHandler
+from auth.use_cases.user_registration_handler import UserRegistrationHandler
 from container import Container
 
 
 REGISTER_ENDPOINT: str = '/api/auth/register'
+TOKEN_ENDPOINT: str = '/api/auth/token'
 
 
 @pytest.fixture(scope='function')
-def authentication_service_mock() -> AsyncMock:
-    return AsyncMock(spec=AuthenticationService)
+def user_registration_handler_mock() -> AsyncMock:
+    return AsyncMock(spec=UserRegistrationHandler)
+
+
+@pytest.fixture(scope='function')
+def user_login_handler_mock() -> AsyncMock:
+    return AsyncMock(spec=UserLoginHandler)
 
 
 def test_user_is_registered(
     test_container: Container,
     test_client: TestClient,
-    authentication_service_mock: AsyncMock
+    user_registration_handler_mock: AsyncMock
 ) -> None:
     test_username: str = 'test_user'
     test_password: str = 'password123'
-    with test_container.authentication_service.override(authentication_service_mock):
+    with test_container.user_registration_handler.override(user_registration_handler_mock):
         response: Response = test_client.post(
             url=REGISTER_ENDPOINT,
             data={
@@ -34,18 +42,18 @@ def test_user_is_registered(
             }
         )
     assert response.status_code == 200
-    authentication_service_mock.register_user.assert_awaited_once_with(email=test_username, password=test_password)
+    user_registration_handler_mock.register_user.assert_awaited_once_with(email=test_username, password=test_password)
 
 
 def test_registering_user_already_registered_returns_http_200(
     test_container: Container,
     test_client: TestClient,
-    authentication_service_mock: AsyncMock
+    user_registration_handler_mock: AsyncMock
 ) -> None:
     test_username: str = 'test_user'
     test_password: str = 'password123'
-    authentication_service_mock.register_user.side_effect = UserAlreadyRegisteredException(test_username)
-    with test_container.authentication_service.override(authentication_service_mock):
+    user_registration_handler_mock.register_user.side_effect = UserAlreadyRegisteredException(test_username)
+    with test_container.user_registration_handler.override(user_registration_handler_mock):
         response: Response = test_client.post(
             url=REGISTER_ENDPOINT,
             data={
@@ -54,4 +62,46 @@ def test_registering_user_already_registered_returns_http_200(
             }
         )
     assert response.status_code == 200
-    authentication_service_mock.register_user.assert_awaited_once_with(email=test_username, password=test_password)
+    user_registration_handler_mock.register_user.assert_awaited_once_with(email=test_username, password=test_password)
+
+
+def test_authentication_tokens_are_returned_after_logging_user_in(
+    test_container: Container,
+    test_client: TestClient,
+    user_login_handler_mock: AsyncMock
+) -> None:
+    user_login_handler_mock.log_user_in.return_value = AuthenticationTokens(
+        access_token='test_access_token',
+        refresh_token='test_refresh_token'
+    )
+    with test_container.user_login_handler.override(user_login_handler_mock):
+        response: Response = test_client.post(
+            url=TOKEN_ENDPOINT,
+            data={
+                'username': 'test_user',
+                'password': 'password123'
+            }
+        )
+    assert response.status_code == 200
+    assert response.json() == {
+        'access_token': 'test_access_token',
+        'token_type': 'bearer',
+        'refresh_token': 'test_refresh_token'
+    }
+
+
+def test_logging_user_in_with_invalid_credentials_returns_http_401(
+    test_container: Container,
+    test_client: TestClient,
+    user_login_handler_mock: AsyncMock
+) -> None:
+    user_login_handler_mock.log_user_in.side_effect = InvalidUserCredentialsException
+    with test_container.user_login_handler.override(user_login_handler_mock):
+        response: Response = test_client.post(
+            url=TOKEN_ENDPOINT,
+            data={
+                'username': 'test_user',
+                'password': 'password123'
+            }
+        )
+    assert response.status_code == 401
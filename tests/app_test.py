@@ -0,0 +1,60 @@
+import os
+from pathlib import Path
+from typing import Generator
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app import App
+from container import Container
+
+
+@pytest.fixture(scope='function')
+def uvicorn_run_mock() -> Generator[MagicMock, None, None]:
+    with patch('app.uvicorn.run') as uvicorn_run_mock:
+        yield uvicorn_run_mock
+
+
+@pytest.fixture(scope='function')
+def container(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> Container:
+    monkeypatch.delenv('PROMETHEUS_MULTIPROC_DIR', raising=False)
+    container: Container = Container()
+    container.configuration.metrics_multiprocess_directory_path.override(tmp_path.joinpath('metrics'))
+    return container
+
+
+def test_single_worker_runs_application_instance(container: Container, uvicorn_run_mock: MagicMock) -> None:
+    app: App = App(container)
+    app.run()
+    assert uvicorn_run_mock.call_args.kwargs['app'] is app
+    assert uvicorn_run_mock.call_args.kwargs['factory'] is False
+    assert uvicorn_run_mock.call_args.kwargs['workers'] == 1
+
+
+def test_multiple_workers_run_application_factory(container: Container, uvicorn_run_mock: MagicMock) -> None:
+    container.configuration.app_workers.override(4)
+    container.configuration.app_backlog.override(512)
+    container.configuration.app_keep_alive_timeout_seconds.override(15)
+    App(container).run()
+    assert uvicorn_run_mock.call_args.kwargs['app'] == 'app:App.create'
+    assert uvicorn_run_mock.call_args.kwargs['factory'] is True
+    assert uvicorn_run_mock.call_args.kwargs['workers'] == 4
+    assert uvicorn_run_mock.call_args.kwargs['backlog'] == 512
+    assert uvicorn_run_mock.call_args.kwargs['timeout_keep_alive'] == 15
+
+
+def test_multiple_workers_share_metrics_directory(
+    container: Container,
+    uvicorn_run_mock: MagicMock,
+    tmp_path: Path
+) -> None:
+    tmp_path.joinpath('metrics').mkdir()
+    tmp_path.joinpath('metrics', 'counter_1.db').touch()
+    container.configuration.app_workers.override(2)
+    App(container).run()
+    assert os.environ['PROMETHEUS_MULTIPROC_DIR'] == str(tmp_path.joinpath('metrics'))
+    assert list(tmp_path.joinpath('metrics').iterdir()) == []
+
+
+def test_application_factory_creates_application() -> None:
+    assert isinstance(App.create(), App)
@@ -0,0 +1,165 @@
+import asyncio
+import dataclasses
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from audio_nest.domain.audio import Audio
+from audio_nest.domain.audio_codec import AudioCodec
+from audio_nest.domain.audio_download_job import AudioDownloadJob
+from audio_nest.domain.audio_download_priority import AudioDownloadPriority
+from audio_nest.domain.audio_download_progress import AudioDownloadProgress
+from audio_nest.domain.audio_download_status import AudioDownloadStatus
+from audio_nest.services.i_audio_download_jobs_repository import IAudioDownloadJobsRepository
+from audio_nest.services.i_tracer import ITracer
+from audio_nest.use_cases.audio_download_job_scheduler import AudioDownloadJobScheduler
+from audio_nest.use_cases.audio_getter import AudioGetter
+
+
+@pytest.fixture(scope='function')
+def tracer_mock() -> MagicMock:
+    return MagicMock(spec=ITracer)
+
+
+@pytest.fixture(scope='function')
+def audio_download_jobs_repository_mock() -> AsyncMock:
+    return AsyncMock(spec=IAudioDownloadJobsRepository)
+
+
+@pytest.fixture(scope='function')
+def audio_getter_mock() -> AsyncMock:
+    audio_getter_mock: AsyncMock = AsyncMock(spec=AudioGetter)
+    audio_getter_mock.get_audio_download_progress = MagicMock(return_value=None)
+    return audio_getter_mock
+
+
+@pytest.fixture(scope='function')
+def audio_download_job_scheduler(
+    audio_download_jobs_repository_mock: AsyncMock,
+    audio_getter_mock: AsyncMock,
+    tracer_mock: MagicMock
+) -> AudioDownloadJobScheduler:
+    return AudioDownloadJobScheduler(
+        audio_download_jobs_repository=audio_download_jobs_repository_mock,
+        audio_getter=audio_getter_mock,
+        progress_interval_seconds=0.01,
+        stale_seconds=60,
+        tracer=tracer_mock
+    )
+
+
+async def wait_forever(**_: object) -> None:
+    await asyncio.Event().wait()
+
+
+@pytest.mark.asyncio
+async def test_scheduled_audio_download_job_is_done(
+    audio_download_job_scheduler: AudioDownloadJobScheduler,
+    audio_download_jobs_repository_mock: AsyncMock,
+    audio_getter_mock: AsyncMock,
+    tmp_path: Path
+) -> None:
+    test_source_id: str = 'test_source_id'
+    test_audio: Audio = Audio(
+        source_id=test_source_id,
+        file_path=tmp_path.joinpath('test_audio.ogg'),
+        bit_rate_kbps=320,
+        codec=AudioCodec.vorbis,
+        size_bytes=5
+    )
+    audio_getter_mock.get_audio_from_source.return_value = test_audio
+    on_audio_downloaded_mock: AsyncMock = AsyncMock()
+    result: AudioDownloadJob = await audio_download_job_scheduler.schedule_audio_download(
+        source_id=test_source_id,
+        on_audio_downloaded=on_audio_downloaded_mock
+    )
+    assert result.progress.status == AudioDownloadStatus.queued
+    audio_download_jobs_repository_mock.add_audio_download_job.assert_awaited_once_with(result)
+    await asyncio.sleep(0.01)
+    audio_getter_mock.get_audio_from_source.assert_awaited_once_with(
+        source_id=test_source_id,
+        priority=AudioDownloadPriority.preview
+    )
+    on_audio_downloaded_mock.assert_awaited_once_with(test_audio)
+    audio_download_jobs_repository_mock.update_audio_download_job.assert_awaited_once_with(result)
+    assert result.progress.status == AudioDownloadStatus.done
+    assert result.progress.downloaded_bytes == 5
+    assert result.progress.percent == 100.0
+
+
+@pytest.mark.asyncio
+async def test_failed_audio_download_job_reports_error(
+    audio_download_job_scheduler: AudioDownloadJobScheduler,
+    audio_download_jobs_repository_mock: AsyncMock,
+    audio_getter_mock: AsyncMock
+) -> None:
+    audio_getter_mock.get_audio_from_source.side_effect = RuntimeError('Video unavailable')
+    on_audio_downloaded_mock: AsyncMock = AsyncMock()
+    result: AudioDownloadJob = await audio_download_job_scheduler.schedule_audio_download(
+        source_id='test_source_id',
+        on_audio_downloaded=on_audio_downloaded_mock
+    )
+    await asyncio.sleep(0.01)
+    on_audio_downloaded_mock.assert_not_awaited()
+    audio_download_jobs_repository_mock.update_audio_download_job.assert_awaited_once_with(result)
+    assert result.progress.status == AudioDownloadStatus.failed
+    assert result.error == 'Video unavailable'
+
+
+@pytest.mark.asyncio
+async def test_audio_download_progress_is_reported_while_running(
+    audio_download_job_scheduler: AudioDownloadJobScheduler,
+    audio_download_jobs_repository_mock: AsyncMock,
+    audio_getter_mock: AsyncMock
+) -> None:
+    audio_getter_mock.get_audio_from_source.side_effect = wait_forever
+    audio_getter_mock.get_audio_download_progress.return_value = AudioDownloadProgress(
+        status=AudioDownloadStatus.downloading,
+        downloaded_bytes=50,
+        total_bytes=100
+    )
+    reported_progress_list: list[AudioDownloadProgress] = []
+    audio_download_jobs_repository_mock.update_audio_download_job.side_effect = (
+        lambda audio_download_job: reported_progress_list.append(dataclasses.replace(audio_download_job.progress))
+    )
+    result: AudioDownloadJob = await audio_download_job_scheduler.schedule_audio_download('test_source_id')
+    await asyncio.sleep(0.05)
+    assert reported_progress_list[0] == AudioDownloadProgress(
+        status=AudioDownloadStatus.downloading,
+        downloaded_bytes=50,
+        total_bytes=100
+    )
+    audio_getter_mock.get_audio_download_progress.assert_called_with('test_source_id')
+    await audio_download_job_scheduler.cancel_audio_download_jobs()
+    assert result.progress.status == AudioDownloadStatus.failed
+
+
+@pytest.mark.asyncio
+async def test_cancelled_audio_download_job_is_failed(
+    audio_download_job_scheduler: AudioDownloadJobScheduler,
+    audio_download_jobs_repository_mock: AsyncMock,
+    audio_getter_mock: AsyncMock
+) -> None:
+    audio_getter_mock.get_audio_from_source.side_effect = wait_forever
+    result: AudioDownloadJob = await audio_download_job_scheduler.schedule_audio_download('test_source_id')
+    await asyncio.sleep(0)
+    await audio_download_job_scheduler.cancel_audio_download_jobs()
+    audio_download_jobs_repository_mock.update_audio_download_job.assert_awaited_once_with(result)
+    assert result.progress.status == AudioDownloadStatus.failed
+    assert result.error == 'Audio download job cancelled'
+
+
+@pytest.mark.asyncio
+async def test_stale_audio_download_jobs_are_failed(
+    audio_download_job_scheduler: AudioDownloadJobScheduler,
+    audio_download_jobs_repository_mock: AsyncMock
+) -> None:
+    audio_download_jobs_repository_mock.fail_stale_audio_download_jobs.return_value = 2
+    start_time: datetime = datetime.now(timezone.utc)
+    assert await audio_download_job_scheduler.fail_stale_audio_download_jobs() == 2
+    updated_before: datetime = (
+        audio_download_jobs_repository_mock.fail_stale_audio_download_jobs.await_args.kwargs['updated_before']
+    )
+    assert start_time - timedelta(seconds=60) <= updated_before <= datetime.now(timezone.utc) - timedelta(seconds=60)
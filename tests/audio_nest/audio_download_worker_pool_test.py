@@ -0,0 +1,95 @@
+import asyncio
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from audio_nest.domain.audio_download_priority import AudioDownloadPriority
+from audio_nest.services.audio_download_worker_pool import AudioDownloadWorkerPool
+from audio_nest.services.i_stage_timer import IStageTimer
+
+
+@pytest.fixture(scope='function')
+def stage_timer_mock() -> MagicMock:
+    return MagicMock(spec=IStageTimer)
+
+
+@pytest.fixture(scope='function')
+def audio_download_worker_pool(stage_timer_mock: MagicMock) -> AudioDownloadWorkerPool:
+    return AudioDownloadWorkerPool(max_concurrency=1, stage_timer=stage_timer_mock)
+
+
+@pytest.mark.asyncio
+async def test_function_is_run_in_worker_thread(
+    audio_download_worker_pool: AudioDownloadWorkerPool,
+    stage_timer_mock: MagicMock
+) -> None:
+    result: str = await audio_download_worker_pool.run(
+        AudioDownloadPriority.preview,
+        lambda: threading.current_thread().name
+    )
+    assert result.startswith('audio-download')
+    assert audio_download_worker_pool.active_count == 0
+    stage_timer_mock.observe_stage_duration.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_function_is_run_in_worker_thread_of_acquired_worker(
+    audio_download_worker_pool: AudioDownloadWorkerPool
+) -> None:
+    async with audio_download_worker_pool.acquire(AudioDownloadPriority.preview):
+        result: str = await audio_download_worker_pool.run_acquired(lambda: threading.current_thread().name)
+    assert result.startswith('audio-download')
+
+
+@pytest.mark.asyncio
+async def test_library_downloads_are_run_before_queued_previews(
+    audio_download_worker_pool: AudioDownloadWorkerPool,
+    stage_timer_mock: MagicMock
+) -> None:
+    run_order: list[str] = []
+    worker_released: asyncio.Event = asyncio.Event()
+
+    async def run(name: str, priority: AudioDownloadPriority) -> None:
+        async with audio_download_worker_pool.acquire(priority):
+            run_order.append(name)
+            await worker_released.wait()
+
+    downloads: list[asyncio.Task[None]] = [asyncio.create_task(run('first', AudioDownloadPriority.preview))]
+    await asyncio.sleep(0)
+    downloads.append(asyncio.create_task(run('preview', AudioDownloadPriority.preview)))
+    downloads.append(asyncio.create_task(run('library', AudioDownloadPriority.library)))
+    await asyncio.sleep(0)
+    assert audio_download_worker_pool.active_count == 1
+    assert audio_download_worker_pool.queue_depth == 2
+    worker_released.set()
+    await asyncio.gather(*downloads)
+    assert run_order == ['first', 'library', 'preview']
+    assert audio_download_worker_pool.active_count == 0
+    assert audio_download_worker_pool.queue_depth == 0
+    stages: tuple[str, ...]
+    wait_seconds: tuple[float, ...]
+    stages, wait_seconds = zip(*(
+        observe_call.args for observe_call in stage_timer_mock.observe_stage_duration.call_args_list
+    ))
+    assert stages == ('audio_download_queue_wait',) * 3
+    assert max(wait_seconds) > 0
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_does_not_hold_worker(audio_download_worker_pool: AudioDownloadWorkerPool) -> None:
+    worker_released: asyncio.Event = asyncio.Event()
+
+    async def run(priority: AudioDownloadPriority) -> None:
+        async with audio_download_worker_pool.acquire(priority):
+            await worker_released.wait()
+
+    first_download: asyncio.Task[None] = asyncio.create_task(run(AudioDownloadPriority.preview))
+    await asyncio.sleep(0)
+    cancelled_download: asyncio.Task[None] = asyncio.create_task(run(AudioDownloadPriority.library))
+    await asyncio.sleep(0)
+    cancelled_download.cancel()
+    worker_released.set()
+    await first_download
+    assert audio_download_worker_pool.active_count == 0
+    assert audio_download_worker_pool.queue_depth == 0
@@ -0,0 +1,50 @@
+import asyncio
+from asyncio import Task
+from unittest.mock import AsyncMock
+
+import pytest
+
+from audio_nest.services.i_audio_download_lock import IAudioDownloadLock
+from audio_nest.use_cases.audio_eviction_handler import run_audio_eviction
+from audio_nest.use_cases.audio_evictor import AudioEvictor
+
+
+@pytest.fixture(scope='function')
+def audio_evictor_mock() -> AsyncMock:
+    audio_evictor_mock: AsyncMock = AsyncMock(spec=AudioEvictor)
+    audio_evictor_mock.evict_orphaned_audio.return_value = 0
+    audio_evictor_mock.evict_audio.return_value = 0
+    return audio_evictor_mock
+
+
+async def run_audio_eviction_once(audio_evictor_mock: AsyncMock, audio_eviction_lock_mock: AsyncMock) -> None:
+    audio_eviction: Task[None] = asyncio.create_task(
+        run_audio_eviction(audio_evictor_mock, audio_eviction_lock_mock, interval_seconds=60)
+    )
+    await asyncio.sleep(0)
+    audio_eviction.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await audio_eviction
+
+
+@pytest.mark.asyncio
+async def test_audio_is_evicted_while_holding_the_audio_eviction_lock(audio_evictor_mock: AsyncMock) -> None:
+    audio_eviction_lock_mock: AsyncMock = AsyncMock(spec=IAudioDownloadLock)
+    audio_eviction_lock_mock.acquire.return_value = True
+    await run_audio_eviction_once(audio_evictor_mock, audio_eviction_lock_mock)
+    audio_eviction_lock_mock.acquire.assert_awaited_once_with('audio_eviction', blocking=False)
+    audio_evictor_mock.evict_orphaned_audio.assert_awaited_once()
+    audio_evictor_mock.evict_audio.assert_awaited_once()
+    audio_eviction_lock_mock.release.assert_awaited_once_with('audio_eviction')
+
+
+@pytest.mark.asyncio
+async def test_audio_is_not_evicted_while_another_worker_holds_the_audio_eviction_lock(
+    audio_evictor_mock: AsyncMock
+) -> None:
+    audio_eviction_lock_mock: AsyncMock = AsyncMock(spec=IAudioDownloadLock)
+    audio_eviction_lock_mock.acquire.return_value = False
+    await run_audio_eviction_once(audio_evictor_mock, audio_eviction_lock_mock)
+    audio_evictor_mock.evict_orphaned_audio.assert_not_awaited()
+    audio_evictor_mock.evict_audio.assert_not_awaited()
+    audio_eviction_lock_mock.release.assert_not_awaited()
@@ -0,0 +1,197 @@
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from audio_nest.domain.audio import Audio
+from audio_nest.domain.audio_codec import AudioCodec
+from audio_nest.domain.audio_quality import AudioQuality
+from audio_nest.domain.audio_rendition import AudioRendition
+from audio_nest.domain.stored_audio import StoredAudio
+from audio_nest.services.i_audio_file_layout import IAudioFileLayout
+from audio_nest.services.i_audio_rendition_repository import IAudioRenditionRepository
+from audio_nest.services.i_audio_repository import IAudioRepository
+from audio_nest.services.i_tracer import ITracer
+from audio_nest.use_cases.audio_evictor import AudioEvictor
+from storage.local_audio_storage import LocalAudioStorage
+
+
+@pytest.fixture(scope='function')
+def tracer_mock() -> MagicMock:
+    return MagicMock(spec=ITracer)
+
+
+@pytest.fixture(scope='function')
+def audio_repository_mock() -> AsyncMock:
+    audio_repository_mock: AsyncMock = AsyncMock(spec=IAudioRepository)
+    audio_repository_mock.is_audio_file_in_use.return_value = False
+    return audio_repository_mock
+
+
+@pytest.fixture(scope='function')
+def audio_rendition_repository_mock() -> AsyncMock:
+    audio_rendition_repository_mock: AsyncMock = AsyncMock(spec=IAudioRenditionRepository)
+    audio_rendition_repository_mock.delete_audio_renditions.return_value = []
+    return audio_rendition_repository_mock
+
+
+@pytest.fixture(scope='function')
+def audio_evictor(
+    audio_repository_mock: AsyncMock,
+    audio_rendition_repository_mock: AsyncMock,
+    tracer_mock: MagicMock
+) -> AudioEvictor:
+    return AudioEvictor(
+        audio_repository=audio_repository_mock,
+        audio_rendition_repository=audio_rendition_repository_mock,
+        audio_storage=LocalAudioStorage(audio_file_layout=AsyncMock(spec=IAudioFileLayout)),
+        quota_bytes=100,
+        max_evictions_per_run=10,
+        orphan_grace_seconds=60,
+        tracer=tracer_mock
+    )
+
+
+@pytest.mark.asyncio
+async def test_least_recently_used_audio_is_evicted_until_under_quota(
+    audio_evictor: AudioEvictor,
+    audio_repository_mock: AsyncMock,
+    tmp_path: Path
+) -> None:
+    test_stored_audio_list: list[StoredAudio] = []
+    i: int
+    for i in range(3):
+        test_audio: Audio = Audio(
+            source_id=f'test_source_id_{i}',
+            file_path=tmp_path.joinpath(f'test_audio_{i}.ogg'),
+            bit_rate_kbps=320,
+            codec=AudioCodec.vorbis
+        )
+        test_audio.file_path.write_bytes(b'0' * 50)
+        test_stored_audio_list.append(StoredAudio(audio=test_audio, size_bytes=50))
+    audio_repository_mock.get_total_audio_size_bytes.return_value = 200
+    audio_repository_mock.get_least_recently_used_unreferenced_audio.return_value = test_stored_audio_list
+    audio_repository_mock.delete_unreferenced_audio.side_effect = [False, True, True]
+    result: int = await audio_evictor.evict_audio()
+    audio_repository_mock.get_least_recently_used_unreferenced_audio.assert_awaited_once_with(10)
+    assert result == 100
+    assert audio_evictor.evicted_audio_count == 2
+    assert audio_evictor.reclaimed_bytes == 100
+    assert [file_path.name for file_path in tmp_path.iterdir()] == ['test_audio_0.ogg']
+
+
+@pytest.mark.asyncio
+async def test_nothing_is_evicted_under_quota(audio_evictor: AudioEvictor, audio_repository_mock: AsyncMock) -> None:
+    audio_repository_mock.get_total_audio_size_bytes.return_value = 100
+    assert await audio_evictor.evict_audio() == 0
+    audio_repository_mock.get_least_recently_used_unreferenced_audio.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_audio_orphaned_before_grace_period_is_evicted(
+    audio_evictor: AudioEvictor,
+    audio_repository_mock: AsyncMock,
+    tmp_path: Path
+) -> None:
+    test_audio: Audio = Audio(
+        source_id='test_source_id',
+        file_path=tmp_path.joinpath('test_audio.ogg'),
+        bit_rate_kbps=320,
+        codec=AudioCodec.vorbis
+    )
+    test_audio.file_path.write_bytes(b'0' * 50)
+    audio_repository_mock.get_orphaned_audio.return_value = [StoredAudio(audio=test_audio, size_bytes=50)]
+    audio_repository_mock.delete_unreferenced_audio.return_value = True
+    start_time: datetime = datetime.now(timezone.utc)
+    assert await audio_evictor.evict_orphaned_audio() == 50
+    orphaned_before: datetime = audio_repository_mock.get_orphaned_audio.await_args.kwargs['orphaned_before']
+    assert start_time - timedelta(seconds=60) <= orphaned_before <= datetime.now(timezone.utc) - timedelta(seconds=60)
+    audio_repository_mock.delete_unreferenced_audio.assert_awaited_once_with(test_audio.source_id)
+    assert not test_audio.file_path.exists()
+
+
+@pytest.mark.asyncio
+async def test_audio_file_shared_with_other_audio_is_kept(
+    audio_evictor: AudioEvictor,
+    audio_repository_mock: AsyncMock,
+    tmp_path: Path
+) -> None:
+    test_audio: Audio = Audio(
+        source_id='test_source_id',
+        file_path=tmp_path.joinpath('test_audio.ogg'),
+        bit_rate_kbps=320,
+        codec=AudioCodec.vorbis
+    )
+    test_audio.file_path.write_bytes(b'0' * 50)
+    audio_repository_mock.get_orphaned_audio.return_value = [StoredAudio(audio=test_audio, size_bytes=50)]
+    audio_repository_mock.delete_unreferenced_audio.return_value = True
+    audio_repository_mock.is_audio_file_in_use.return_value = True
+    assert await audio_evictor.evict_orphaned_audio() == 0
+    assert test_audio.file_path.exists()
+
+
+@pytest.mark.asyncio
+async def test_eviction_continues_when_evicted_audio_file_is_shared_with_other_audio(
+    audio_evictor: AudioEvictor,
+    audio_repository_mock: AsyncMock,
+    tmp_path: Path
+) -> None:
+    test_shared_audio: Audio = Audio(
+        source_id='test_shared_source_id',
+        file_path=tmp_path.joinpath('test_shared_audio.ogg'),
+        bit_rate_kbps=320,
+        codec=AudioCodec.vorbis
+    )
+    test_shared_audio.file_path.write_bytes(b'0' * 100)
+    test_audio: Audio = Audio(
+        source_id='test_source_id',
+        file_path=tmp_path.joinpath('test_audio.ogg'),
+        bit_rate_kbps=320,
+        codec=AudioCodec.vorbis
+    )
+    test_audio.file_path.write_bytes(b'0' * 100)
+    audio_repository_mock.get_total_audio_size_bytes.return_value = 200
+    audio_repository_mock.get_least_recently_used_unreferenced_audio.return_value = [
+        StoredAudio(audio=test_shared_audio, size_bytes=100),
+        StoredAudio(audio=test_audio, size_bytes=100)
+    ]
+    audio_repository_mock.delete_unreferenced_audio.return_value = True
+    audio_repository_mock.is_audio_file_in_use.side_effect = [True, False]
+    assert await audio_evictor.evict_audio() == 100
+    assert audio_evictor.evicted_audio_count == 2
+    assert [file_path.name for file_path in tmp_path.iterdir()] == ['test_shared_audio.ogg']
+
+
+@pytest.mark.asyncio
+async def test_audio_renditions_are_evicted_with_their_source_audio(
+    audio_evictor: AudioEvictor,
+    audio_repository_mock: AsyncMock,
+    audio_rendition_repository_mock: AsyncMock,
+    tmp_path: Path
+) -> None:
+    test_audio: Audio = Audio(
+        source_id='test_source_id',
+        file_path=tmp_path.joinpath('test_audio.ogg'),
+        bit_rate_kbps=320,
+        codec=AudioCodec.vorbis
+    )
+    test_audio.file_path.write_bytes(b'0' * 150)
+    test_audio_rendition: AudioRendition = AudioRendition(
+        source_id='test_source_id',
+        file_path=tmp_path.joinpath('test_audio.low.opus'),
+        bit_rate_kbps=64,
+        codec=AudioCodec.opus,
+        quality=AudioQuality.low
+    )
+    test_audio_rendition.file_path.write_bytes(b'0' * 30)
+    audio_repository_mock.get_total_audio_size_bytes.return_value = 180
+    audio_repository_mock.get_least_recently_used_unreferenced_audio.return_value = [
+        StoredAudio(audio=test_audio, size_bytes=150)
+    ]
+    audio_repository_mock.delete_unreferenced_audio.return_value = True
+    audio_rendition_repository_mock.delete_audio_renditions.return_value = [test_audio_rendition]
+    result: int = await audio_evictor.evict_audio()
+    audio_rendition_repository_mock.delete_audio_renditions.assert_awaited_once_with('test_source_id')
+    assert result == 180
+    assert list(tmp_path.iterdir()) == []
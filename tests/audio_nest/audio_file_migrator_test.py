@@ -0,0 +1,64 @@
+from pathlib import Path
+from typing import AsyncGenerator
+from unittest.mock import MagicMock
+
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from audio_nest.domain.audio import Audio
+from audio_nest.domain.audio_codec import AudioCodec
+from audio_nest.services.i_tracer import ITracer
+from audio_nest.use_cases.audio_file_migrator import AudioFileMigrator
+from sql.sql_audio_repository import SqlAudioRepository
+from sql.sql_session_maker_handler import handle_sql_session_maker
+from storage.sharded_audio_file_layout import ShardedAudioFileLayout
+
+
+@pytest.fixture(scope='function')
+def tracer_mock() -> MagicMock:
+    return MagicMock(spec=ITracer)
+
+
+@pytest_asyncio.fixture(scope='function')
+async def sql_audio_repository(tmp_path: Path, tracer_mock: MagicMock) -> AsyncGenerator[SqlAudioRepository, None]:
+    session_makers: AsyncGenerator[async_sessionmaker[AsyncSession], None] = handle_sql_session_maker(
+        tmp_path.joinpath('test.db')
+    )
+    yield SqlAudioRepository(await anext(session_makers), tracer_mock)
+    await anext(session_makers, None)
+
+
+@pytest.mark.asyncio
+async def test_flat_audio_files_are_migrated_in_batches(
+    sql_audio_repository: SqlAudioRepository,
+    tracer_mock: MagicMock,
+    tmp_path: Path
+) -> None:
+    audio_directory_path: Path = tmp_path.joinpath('audio')
+    audio_directory_path.mkdir()
+    test_audio_list: list[Audio] = [
+        Audio(
+            source_id=f'test_source_id_{i}',
+            file_path=audio_directory_path.joinpath(f'test_source_id_{i}.ogg'),
+            bit_rate_kbps=320,
+            codec=AudioCodec.vorbis
+        )
+        for i in range(5)
+    ]
+    audio: Audio
+    for audio in test_audio_list:
+        audio.file_path.write_bytes(audio.source_id.encode())
+        await sql_audio_repository.add_audio(audio)
+    audio_file_migrator: AudioFileMigrator = AudioFileMigrator(
+        audio_repository=sql_audio_repository,
+        audio_file_layout=ShardedAudioFileLayout(audio_directory_path),
+        batch_size=2,
+        tracer=tracer_mock
+    )
+    assert await audio_file_migrator.migrate_audio_files() == 5
+    assert await audio_file_migrator.migrate_audio_files() == 0
+    for audio in test_audio_list:
+        migrated_audio: Audio = await sql_audio_repository.get_audio_from_source(audio.source_id)
+        assert migrated_audio.file_path.parent.parent.parent == audio_directory_path
+        assert migrated_audio.file_path.read_bytes() == audio.source_id.encode()
@@ -1,12 +1,29 @@
+import asyncio
 from pathlib import Path
-from unittest.mock import AsyncMock
+from typing import Any, AsyncGenerator, Awaitable, Callable
+from unittest.mock import ANY, AsyncMock, MagicMock
 
 import pytest
 
 from audio_nest.domain.audio import Audio
 from audio_nest.domain.audio_codec import AudioCodec
+from audio_nest.domain.audio_download_priority import AudioDownloadPriority
+from audio_nest.domain.audio_download_progress import AudioDownloadProgress
+from audio_nest.domain.audio_stream import AudioStream
+from audio_nest.services.i_audio_download_lock import IAudioDownloadLock
+from audio_nest.services.i_audio_downloader import IAudioDownloader
+from audio_nest.services.i_audio_file_layout import IAudioFileLayout
 from audio_nest.services.i_audio_repository import IAudioRepository
+from audio_nest.services.i_audio_storage import IAudioStorage
+from audio_nest.services.i_stage_timer import IStageTimer
+from audio_nest.services.i_tracer import ITracer
 from audio_nest.use_cases.audio_getter import AudioGetter
+from storage.local_audio_storage import LocalAudioStorage
+
+
+@pytest.fixture(scope='function')
+def audio_downloader_mock() -> AsyncMock:
+    return AsyncMock(spec=IAudioDownloader)
 
 
 @pytest.fixture(scope='function')
@@ -15,20 +32,486 @@ def audio_repository_mock() -> AsyncMock:
 
 
 @pytest.fixture(scope='function')
-def audio_getter(audio_repository_mock: AsyncMock) -> AudioGetter:
-    return AudioGetter(audio_repository_mock)
+def audio_file_layout_mock() -> AsyncMock:
+    audio_file_layout_mock: AsyncMock = AsyncMock(spec=IAudioFileLayout)
+    audio_file_layout_mock.store_audio_file.side_effect = lambda audio: audio.file_path
+    return audio_file_layout_mock
+
+
+@pytest.fixture(scope='function')
+def audio_download_lock_mock() -> AsyncMock:
+    audio_download_lock_mock: AsyncMock = AsyncMock(spec=IAudioDownloadLock)
+    audio_download_lock_mock.acquire.return_value = True
+    return audio_download_lock_mock
+
+
+@pytest.fixture(scope='function')
+def stage_timer_mock() -> MagicMock:
+    return MagicMock(spec=IStageTimer)
+
+
+@pytest.fixture(scope='function')
+def tracer_mock() -> MagicMock:
+    return MagicMock(spec=ITracer)
+
+
+@pytest.fixture(scope='function')
+def audio_getter(
+    audio_downloader_mock: AsyncMock,
+    audio_repository_mock: AsyncMock,
+    audio_file_layout_mock: AsyncMock,
+    audio_download_lock_mock: AsyncMock,
+    stage_timer_mock: MagicMock,
+    tracer_mock: MagicMock
+) -> AudioGetter:
+    return AudioGetter(
+        audio_downloader=audio_downloader_mock,
+        audio_repository=audio_repository_mock,
+        audio_storage=LocalAudioStorage(audio_file_layout=audio_file_layout_mock),
+        audio_download_lock=audio_download_lock_mock,
+        stage_timer=stage_timer_mock,
+        tracer=tracer_mock
+    )
 
 
 @pytest.mark.asyncio
-async def test_audio_is_returned(audio_getter: AudioGetter, audio_repository_mock: AsyncMock) -> None:
+async def test_audio_is_returned(
+    audio_getter: AudioGetter,
+    audio_downloader_mock: AsyncMock,
+    audio_repository_mock: AsyncMock,
+    tmp_path: Path
+) -> None:
     test_source_id: str = 'test_source_id'
     test_audio: Audio = Audio(
-        source_id=test_source_id, 
-        file_path=Path('./test_audio.ogg'),
+        source_id=test_source_id,
+        file_path=tmp_path.joinpath('test_audio.ogg'),
         bit_rate_kbps=320,
         codec=AudioCodec.vorbis
     )
+    test_audio.file_path.touch()
     audio_repository_mock.get_audio_from_source.return_value = test_audio
     result: Audio = await audio_getter.get_audio_from_source(test_source_id)
     audio_repository_mock.get_audio_from_source.assert_awaited_once_with(test_source_id)
+    audio_repository_mock.update_audio_access_time.assert_awaited_once_with(test_source_id)
+    audio_downloader_mock.download_audio_from_source.assert_not_awaited()
+    assert result == test_audio
+
+
+@pytest.mark.asyncio
+async def test_downloaded_audio_is_added_to_repository(
+    audio_getter: AudioGetter,
+    audio_downloader_mock: AsyncMock,
+    audio_repository_mock: AsyncMock
+) -> None:
+    test_source_id: str = 'test_source_id'
+    test_audio: Audio = Audio(
+        source_id=test_source_id,
+        file_path=Path('./test_audio.ogg'),
+        bit_rate_kbps=320,
+        codec=AudioCodec.vorbis
+    )
+    audio_repository_mock.get_audio_from_source.return_value = None
+    audio_downloader_mock.download_audio_from_source.return_value = test_audio
+    result: Audio = await audio_getter.get_audio_from_source(test_source_id)
+    audio_downloader_mock.download_audio_from_source.assert_awaited_once_with(test_source_id, progress=ANY, priority=AudioDownloadPriority.preview)
+    audio_repository_mock.add_audio.assert_awaited_once_with(test_audio)
+    assert result == test_audio
+
+
+@pytest.mark.asyncio
+async def test_audio_download_is_guarded_by_download_lock(
+    audio_getter: AudioGetter,
+    audio_downloader_mock: AsyncMock,
+    audio_repository_mock: AsyncMock,
+    audio_download_lock_mock: AsyncMock
+) -> None:
+    test_source_id: str = 'test_source_id'
+    test_audio: Audio = Audio(
+        source_id=test_source_id,
+        file_path=Path('./test_audio.ogg'),
+        bit_rate_kbps=320,
+        codec=AudioCodec.vorbis
+    )
+    audio_repository_mock.get_audio_from_source.return_value = None
+    audio_downloader_mock.download_audio_from_source.side_effect = RuntimeError('download failed')
+    with pytest.raises(RuntimeError):
+        await audio_getter.get_audio_from_source(test_source_id)
+    audio_download_lock_mock.acquire.assert_awaited_once_with(test_source_id)
+    audio_download_lock_mock.release.assert_awaited_once_with(test_source_id)
+    audio_downloader_mock.download_audio_from_source.side_effect = None
+    audio_downloader_mock.download_audio_from_source.return_value = test_audio
+    assert await audio_getter.get_audio_from_source(test_source_id) == test_audio
+    assert audio_download_lock_mock.release.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_audio_downloaded_by_another_process_while_waiting_for_lock_is_not_downloaded_again(
+    audio_getter: AudioGetter,
+    audio_downloader_mock: AsyncMock,
+    audio_repository_mock: AsyncMock,
+    tmp_path: Path
+) -> None:
+    test_source_id: str = 'test_source_id'
+    test_audio: Audio = Audio(
+        source_id=test_source_id,
+        file_path=tmp_path.joinpath('test_audio.ogg'),
+        bit_rate_kbps=320,
+        codec=AudioCodec.vorbis
+    )
+    test_audio.file_path.touch()
+    audio_repository_mock.get_audio_from_source.side_effect = [None, test_audio]
+    result: Audio = await audio_getter.get_audio_from_source(test_source_id)
+    audio_downloader_mock.download_audio_from_source.assert_not_awaited()
+    audio_repository_mock.add_audio.assert_not_awaited()
+    assert result == test_audio
+
+
+@pytest.mark.asyncio
+async def test_downloaded_audio_is_stored_using_file_layout(
+    audio_getter: AudioGetter,
+    audio_downloader_mock: AsyncMock,
+    audio_repository_mock: AsyncMock,
+    audio_file_layout_mock: AsyncMock
+) -> None:
+    test_source_id: str = 'test_source_id'
+    test_file_path: Path = Path('./ab/cd/abcd.ogg')
+    test_audio: Audio = Audio(
+        source_id=test_source_id,
+        file_path=Path('./test_audio.ogg'),
+        bit_rate_kbps=320,
+        codec=AudioCodec.vorbis
+    )
+    audio_repository_mock.get_audio_from_source.return_value = None
+    audio_downloader_mock.download_audio_from_source.return_value = test_audio
+    audio_file_layout_mock.store_audio_file.side_effect = None
+    audio_file_layout_mock.store_audio_file.return_value = test_file_path
+    result: Audio = await audio_getter.get_audio_from_source(test_source_id)
+    audio_file_layout_mock.store_audio_file.assert_awaited_once_with(test_audio)
+    audio_repository_mock.add_audio.assert_awaited_once_with(test_audio)
+    assert result.file_path == test_file_path
+
+
+@pytest.mark.asyncio
+async def test_audio_with_missing_file_is_downloaded_again(
+    audio_getter: AudioGetter,
+    audio_downloader_mock: AsyncMock,
+    audio_repository_mock: AsyncMock,
+    tmp_path: Path
+) -> None:
+    test_source_id: str = 'test_source_id'
+    test_audio: Audio = Audio(
+        source_id=test_source_id,
+        file_path=tmp_path.joinpath('test_audio.ogg'),
+        bit_rate_kbps=320,
+        codec=AudioCodec.vorbis
+    )
+    audio_repository_mock.get_audio_from_source.return_value = test_audio
+    audio_downloader_mock.download_audio_from_source.return_value = test_audio
+    result: Audio = await audio_getter.get_audio_from_source(test_source_id)
+    audio_downloader_mock.download_audio_from_source.assert_awaited_once_with(test_source_id, progress=ANY, priority=AudioDownloadPriority.preview)
+    audio_repository_mock.add_audio.assert_awaited_once_with(test_audio)
     assert result == test_audio
+
+
+@pytest.mark.asyncio
+async def test_concurrent_audio_downloads_from_same_source_are_coalesced(
+    audio_getter: AudioGetter,
+    audio_downloader_mock: AsyncMock,
+    audio_repository_mock: AsyncMock
+) -> None:
+    test_source_id: str = 'test_source_id'
+    test_audio: Audio = Audio(
+        source_id=test_source_id,
+        file_path=Path('./test_audio.ogg'),
+        bit_rate_kbps=320,
+        codec=AudioCodec.vorbis
+    )
+    download_started: asyncio.Event = asyncio.Event()
+    download_released: asyncio.Event = asyncio.Event()
+
+    async def download_audio_from_source(*_: object, **__: object) -> Audio:
+        download_started.set()
+        await download_released.wait()
+        return test_audio
+
+    audio_repository_mock.get_audio_from_source.return_value = None
+    audio_downloader_mock.download_audio_from_source.side_effect = download_audio_from_source
+    downloads: list[asyncio.Task[Audio]] = [
+        asyncio.create_task(audio_getter.get_audio_from_source(test_source_id)) for _ in range(3)
+    ]
+    await download_started.wait()
+    await asyncio.sleep(0)
+    assert audio_getter.in_flight_audio_downloads_count == 1
+    assert audio_getter.get_audio_download_progress(test_source_id) == AudioDownloadProgress()
+    download_released.set()
+    results: list[Audio] = await asyncio.gather(*downloads)
+    audio_downloader_mock.download_audio_from_source.assert_awaited_once_with(test_source_id, progress=ANY, priority=AudioDownloadPriority.preview)
+    assert results == [test_audio] * 3
+    assert audio_getter.started_audio_downloads_count == 1
+    assert audio_getter.coalesced_audio_downloads_count == 2
+    assert audio_getter.in_flight_audio_downloads_count == 0
+    assert audio_getter.get_audio_download_progress(test_source_id) is None
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_does_not_cancel_shared_audio_download(
+    audio_getter: AudioGetter,
+    audio_downloader_mock: AsyncMock,
+    audio_repository_mock: AsyncMock
+) -> None:
+    test_source_id: str = 'test_source_id'
+    test_audio: Audio = Audio(
+        source_id=test_source_id,
+        file_path=Path('./test_audio.ogg'),
+        bit_rate_kbps=320,
+        codec=AudioCodec.vorbis
+    )
+    download_released: asyncio.Event = asyncio.Event()
+
+    async def download_audio_from_source(*_: object, **__: object) -> Audio:
+        await download_released.wait()
+        return test_audio
+
+    audio_repository_mock.get_audio_from_source.return_value = None
+    audio_downloader_mock.download_audio_from_source.side_effect = download_audio_from_source
+    cancelled_download: asyncio.Task[Audio] = asyncio.create_task(audio_getter.get_audio_from_source(test_source_id))
+    download: asyncio.Task[Audio] = asyncio.create_task(audio_getter.get_audio_from_source(test_source_id))
+    await asyncio.sleep(0.01)
+    cancelled_download.cancel()
+    download_released.set()
+    assert await download == test_audio
+    audio_downloader_mock.download_audio_from_source.assert_awaited_once_with(test_source_id, progress=ANY, priority=AudioDownloadPriority.preview)
+
+
+@pytest.mark.asyncio
+async def test_streamed_audio_is_tailed_by_concurrent_readers_and_added_to_repository(
+    audio_getter: AudioGetter,
+    audio_downloader_mock: AsyncMock,
+    audio_repository_mock: AsyncMock,
+    tmp_path: Path
+) -> None:
+    test_source_id: str = 'test_source_id'
+    test_audio: Audio = Audio(
+        source_id=test_source_id,
+        file_path=tmp_path.joinpath('test_audio.ogg'),
+        bit_rate_kbps=320,
+        codec=AudioCodec.vorbis
+    )
+    test_chunks: list[bytes] = [b'first', b'second', b'third']
+    chunk_released: asyncio.Event = asyncio.Event()
+
+    async def stream_chunks() -> AsyncGenerator[bytes, None]:
+        chunk: bytes
+        for chunk in test_chunks:
+            await chunk_released.wait()
+            chunk_released.clear()
+            yield chunk
+
+    async def read_chunks(audio_stream: AudioStream) -> bytes:
+        return b''.join([chunk async for chunk in audio_stream.chunks])
+
+    audio_repository_mock.get_audio_from_source.return_value = None
+    audio_downloader_mock.stream_audio_from_source.return_value = AudioStream(audio=test_audio, chunks=stream_chunks())
+    first_stream: AudioStream = await audio_getter.stream_audio_from_source(test_source_id)
+    first_read: asyncio.Task[bytes] = asyncio.create_task(read_chunks(first_stream))
+    chunk_released.set()
+    await asyncio.sleep(0.01)
+    second_stream: AudioStream = await audio_getter.stream_audio_from_source(test_source_id)
+    second_read: asyncio.Task[bytes] = asyncio.create_task(read_chunks(second_stream))
+    while not second_read.done():
+        chunk_released.set()
+        await asyncio.sleep(0.01)
+    assert await first_read == b''.join(test_chunks)
+    assert await second_read == b''.join(test_chunks)
+    assert test_audio.file_path.read_bytes() == b''.join(test_chunks)
+    audio_downloader_mock.stream_audio_from_source.assert_called_once_with(test_source_id, priority=AudioDownloadPriority.preview)
+    audio_repository_mock.add_audio.assert_awaited_once_with(test_audio)
+    assert audio_getter.in_flight_audio_downloads_count == 0
+
+
+@pytest.mark.asyncio
+async def test_streamed_audio_is_tailed_off_the_event_loop(
+    audio_getter: AudioGetter,
+    audio_downloader_mock: AsyncMock,
+    audio_repository_mock: AsyncMock,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch
+) -> None:
+    test_source_id: str = 'test_source_id'
+    test_audio: Audio = Audio(
+        source_id=test_source_id,
+        file_path=tmp_path.joinpath('test_audio.ogg'),
+        bit_rate_kbps=320,
+        codec=AudioCodec.vorbis
+    )
+    threaded_function_names: list[str] = []
+    to_thread: Callable[..., Awaitable[Any]] = asyncio.to_thread
+
+    async def record_to_thread(function: Callable[..., Any], *args: Any) -> Any:
+        threaded_function_names.append(function.__name__)
+        return await to_thread(function, *args)
+
+    async def stream_chunks() -> AsyncGenerator[bytes, None]:
+        yield b'first'
+        yield b'second'
+
+    monkeypatch.setattr(asyncio, 'to_thread', record_to_thread)
+    audio_repository_mock.get_audio_from_source.return_value = None
+    audio_downloader_mock.stream_audio_from_source.return_value = AudioStream(audio=test_audio, chunks=stream_chunks())
+    audio_stream: AudioStream = await audio_getter.stream_audio_from_source(test_source_id)
+    assert b''.join([chunk async for chunk in audio_stream.chunks]) == b'firstsecond'
+    assert 'open' in threaded_function_names
+    assert 'read' in threaded_function_names
+
+
+@pytest.mark.asyncio
+async def test_failed_audio_stream_removes_partial_file(
+    audio_getter: AudioGetter,
+    audio_downloader_mock: AsyncMock,
+    audio_repository_mock: AsyncMock,
+    audio_download_lock_mock: AsyncMock,
+    tmp_path: Path
+) -> None:
+    test_source_id: str = 'test_source_id'
+    test_audio: Audio = Audio(
+        source_id=test_source_id,
+        file_path=tmp_path.joinpath('test_audio.ogg'),
+        bit_rate_kbps=320,
+        codec=AudioCodec.vorbis
+    )
+
+    async def stream_chunks() -> AsyncGenerator[bytes, None]:
+        yield b'first'
+        raise RuntimeError('ffmpeg failed')
+
+    audio_repository_mock.get_audio_from_source.return_value = None
+    audio_downloader_mock.stream_audio_from_source.return_value = AudioStream(audio=test_audio, chunks=stream_chunks())
+    audio_stream: AudioStream = await audio_getter.stream_audio_from_source(test_source_id)
+    with pytest.raises(RuntimeError):
+        _ = [chunk async for chunk in audio_stream.chunks]
+    assert list(tmp_path.iterdir()) == []
+    audio_repository_mock.add_audio.assert_not_awaited()
+    audio_download_lock_mock.release.assert_awaited_once_with(test_source_id)
+
+
+@pytest.mark.asyncio
+async def test_download_lock_is_released_when_partial_audio_file_cannot_be_created(
+    audio_getter: AudioGetter,
+    audio_downloader_mock: AsyncMock,
+    audio_repository_mock: AsyncMock,
+    audio_download_lock_mock: AsyncMock,
+    tmp_path: Path
+) -> None:
+    test_source_id: str = 'test_source_id'
+    tmp_path.joinpath('not_a_directory').write_bytes(b'')
+    test_audio: Audio = Audio(
+        source_id=test_source_id,
+        file_path=tmp_path.joinpath('not_a_directory', 'test_audio.ogg'),
+        bit_rate_kbps=320,
+        codec=AudioCodec.vorbis
+    )
+    audio_repository_mock.get_audio_from_source.return_value = None
+    audio_downloader_mock.stream_audio_from_source.return_value = AudioStream(audio=test_audio, chunks=AsyncMock())
+    with pytest.raises(OSError):
+        await audio_getter.stream_audio_from_source(test_source_id)
+    audio_download_lock_mock.release.assert_awaited_once_with(test_source_id)
+    assert audio_getter.in_flight_audio_downloads_count == 0
+
+
+@pytest.mark.asyncio
+async def test_audio_stream_waits_for_download_locked_by_another_process(
+    audio_getter: AudioGetter,
+    audio_downloader_mock: AsyncMock,
+    audio_repository_mock: AsyncMock,
+    audio_download_lock_mock: AsyncMock,
+    tmp_path: Path
+) -> None:
+    test_source_id: str = 'test_source_id'
+    test_audio: Audio = Audio(
+        source_id=test_source_id,
+        file_path=tmp_path.joinpath('test_audio.ogg'),
+        bit_rate_kbps=320,
+        codec=AudioCodec.vorbis
+    )
+    test_audio.file_path.write_bytes(b'audio')
+    audio_download_lock_mock.acquire.side_effect = lambda source_id, blocking=True: blocking
+    audio_repository_mock.get_audio_from_source.side_effect = [None, test_audio]
+    audio_stream: AudioStream = await audio_getter.stream_audio_from_source(test_source_id)
+    assert b''.join([chunk async for chunk in audio_stream.chunks]) == b'audio'
+    audio_downloader_mock.stream_audio_from_source.assert_not_called()
+    audio_downloader_mock.download_audio_from_source.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_downloaded_audio_is_measured_before_being_moved_to_remote_storage(
+    audio_downloader_mock: AsyncMock,
+    audio_repository_mock: AsyncMock,
+    audio_download_lock_mock: AsyncMock,
+    stage_timer_mock: MagicMock,
+    tracer_mock: MagicMock,
+    tmp_path: Path
+) -> None:
+    test_source_id: str = 'test_source_id'
+    test_file_path: Path = Path('audio/ab/cd/abcd.ogg')
+    test_audio: Audio = Audio(
+        source_id=test_source_id,
+        file_path=tmp_path.joinpath('test_audio.ogg'),
+        bit_rate_kbps=320,
+        codec=AudioCodec.vorbis
+    )
+    test_audio.file_path.write_bytes(b'audio')
+    audio_storage_mock: AsyncMock = AsyncMock(spec=IAudioStorage)
+    audio_storage_mock.store_audio_file.return_value = test_file_path
+    audio_repository_mock.get_audio_from_source.return_value = None
+    audio_downloader_mock.download_audio_from_source.return_value = test_audio
+    audio_getter: AudioGetter = AudioGetter(
+        audio_downloader=audio_downloader_mock,
+        audio_repository=audio_repository_mock,
+        audio_storage=audio_storage_mock,
+        audio_download_lock=audio_download_lock_mock,
+        stage_timer=stage_timer_mock,
+        tracer=tracer_mock
+    )
+    result: Audio = await audio_getter.get_audio_from_source(test_source_id)
+    audio_repository_mock.add_audio.assert_awaited_once_with(test_audio)
+    assert result.file_path == test_file_path
+    assert result.size_bytes == 5
+    assert result.content_hash is not None
+
+
+@pytest.mark.asyncio
+async def test_audio_stream_is_read_from_storage(
+    audio_downloader_mock: AsyncMock,
+    audio_repository_mock: AsyncMock,
+    audio_download_lock_mock: AsyncMock,
+    stage_timer_mock: MagicMock,
+    tracer_mock: MagicMock
+) -> None:
+    test_source_id: str = 'test_source_id'
+    test_audio: Audio = Audio(
+        source_id=test_source_id,
+        file_path=Path('audio/ab/cd/abcd.ogg'),
+        bit_rate_kbps=320,
+        codec=AudioCodec.vorbis
+    )
+
+    async def read_audio_file(_: Path) -> AsyncGenerator[bytes, None]:
+        yield b'aud'
+        yield b'io'
+
+    audio_storage_mock: AsyncMock = AsyncMock(spec=IAudioStorage)
+    audio_storage_mock.is_audio_file_stored.return_value = True
+    audio_storage_mock.read_audio_file = read_audio_file
+    audio_repository_mock.get_audio_from_source.return_value = test_audio
+    audio_getter: AudioGetter = AudioGetter(
+        audio_downloader=audio_downloader_mock,
+        audio_repository=audio_repository_mock,
+        audio_storage=audio_storage_mock,
+        audio_download_lock=audio_download_lock_mock,
+        stage_timer=stage_timer_mock,
+        tracer=tracer_mock
+    )
+    audio_stream: AudioStream = await audio_getter.stream_audio_from_source(test_source_id)
+    assert b''.join([chunk async for chunk in audio_stream.chunks]) == b'audio'
+    audio_storage_mock.is_audio_file_stored.assert_awaited_once_with(test_audio.file_path)
+    audio_downloader_mock.stream_audio_from_source.assert_not_called()
@@ -0,0 +1,167 @@
+import hashlib
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from audio_nest.domain.audio import Audio
+from audio_nest.domain.audio_codec import AudioCodec
+from audio_nest.domain.audio_download_priority import AudioDownloadPriority
+from audio_nest.domain.audio_quality import AudioQuality
+from audio_nest.domain.audio_rendition import AudioRendition
+from audio_nest.services.i_audio_download_lock import IAudioDownloadLock
+from audio_nest.services.i_audio_file_layout import IAudioFileLayout
+from audio_nest.services.i_audio_rendition_repository import IAudioRenditionRepository
+from audio_nest.services.i_audio_transcoder import IAudioTranscoder
+from audio_nest.services.i_tracer import ITracer
+from audio_nest.use_cases.audio_getter import AudioGetter
+from audio_nest.use_cases.audio_rendition_getter import AudioRenditionGetter
+from storage.local_audio_storage import LocalAudioStorage
+
+
+@pytest.fixture(scope='function')
+def tracer_mock() -> MagicMock:
+    return MagicMock(spec=ITracer)
+
+
+@pytest.fixture(scope='function')
+def test_audio(tmp_path: Path) -> Audio:
+    test_audio: Audio = Audio(
+        source_id='test_source_id',
+        file_path=tmp_path.joinpath('test_source_id.ogg'),
+        bit_rate_kbps=320,
+        codec=AudioCodec.vorbis
+    )
+    test_audio.file_path.write_bytes(b'audio')
+    return test_audio
+
+
+@pytest.fixture(scope='function')
+def audio_getter_mock(test_audio: Audio) -> AsyncMock:
+    audio_getter_mock: AsyncMock = AsyncMock(spec=AudioGetter)
+    audio_getter_mock.get_audio_from_source.return_value = test_audio
+    return audio_getter_mock
+
+
+@pytest.fixture(scope='function')
+def audio_transcoder_mock() -> AsyncMock:
+    return AsyncMock(spec=IAudioTranscoder)
+
+
+@pytest.fixture(scope='function')
+def audio_rendition_repository_mock() -> AsyncMock:
+    audio_rendition_repository_mock: AsyncMock = AsyncMock(spec=IAudioRenditionRepository)
+    audio_rendition_repository_mock.get_audio_rendition.return_value = None
+    return audio_rendition_repository_mock
+
+
+@pytest.fixture(scope='function')
+def audio_file_layout_mock(tmp_path: Path) -> AsyncMock:
+    audio_file_layout_mock: AsyncMock = AsyncMock(spec=IAudioFileLayout)
+    audio_file_layout_mock.store_audio_file.side_effect = lambda audio: audio.file_path.replace(
+        tmp_path.joinpath(f'{audio.source_id}{audio.file_path.suffix}')
+    )
+    return audio_file_layout_mock
+
+
+@pytest.fixture(scope='function')
+def audio_rendition_getter(
+    audio_getter_mock: AsyncMock,
+    audio_transcoder_mock: AsyncMock,
+    audio_rendition_repository_mock: AsyncMock,
+    audio_file_layout_mock: AsyncMock,
+    tracer_mock: MagicMock
+) -> AudioRenditionGetter:
+    return AudioRenditionGetter(
+        audio_getter=audio_getter_mock,
+        audio_transcoder=audio_transcoder_mock,
+        audio_rendition_repository=audio_rendition_repository_mock,
+        audio_storage=LocalAudioStorage(audio_file_layout=audio_file_layout_mock),
+        audio_download_lock=AsyncMock(spec=IAudioDownloadLock),
+        codec=AudioCodec.vorbis,
+        rendition_codec=AudioCodec.opus,
+        rendition_bit_rates_kbps={AudioQuality.low: 64, AudioQuality.medium: 128},
+        tracer=tracer_mock
+    )
+
+
+@pytest.mark.asyncio
+async def test_high_quality_audio_is_source_audio(
+    audio_rendition_getter: AudioRenditionGetter,
+    audio_transcoder_mock: AsyncMock,
+    test_audio: Audio
+) -> None:
+    result: Audio = await audio_rendition_getter.get_audio_rendition('test_source_id', quality=AudioQuality.high)
+    audio_transcoder_mock.transcode_audio.assert_not_awaited()
+    assert result == test_audio
+
+
+@pytest.mark.asyncio
+async def test_missing_audio_rendition_is_transcoded_and_stored(
+    audio_rendition_getter: AudioRenditionGetter,
+    audio_getter_mock: AsyncMock,
+    audio_transcoder_mock: AsyncMock,
+    audio_rendition_repository_mock: AsyncMock,
+    test_audio: Audio,
+    tmp_path: Path
+) -> None:
+    test_transcoded_audio: Audio = Audio(
+        source_id='test_source_id',
+        file_path=tmp_path.joinpath('test_source_id.staging.opus'),
+        bit_rate_kbps=64,
+        codec=AudioCodec.opus
+    )
+    test_transcoded_audio.file_path.write_bytes(b'rendition')
+    audio_transcoder_mock.transcode_audio.return_value = test_transcoded_audio
+    result: Audio = await audio_rendition_getter.get_audio_rendition(
+        'test_source_id',
+        quality=AudioQuality.low,
+        priority=AudioDownloadPriority.library
+    )
+    audio_getter_mock.get_audio_from_source.assert_awaited_once_with(
+        source_id='test_source_id',
+        priority=AudioDownloadPriority.library
+    )
+    audio_transcoder_mock.transcode_audio.assert_awaited_once_with(
+        test_audio,
+        codec=AudioCodec.opus,
+        bit_rate_kbps=64,
+        priority=AudioDownloadPriority.library
+    )
+    assert result == AudioRendition(
+        source_id='test_source_id',
+        file_path=tmp_path.joinpath('test_source_id.low.opus'),
+        bit_rate_kbps=64,
+        codec=AudioCodec.opus,
+        quality=AudioQuality.low,
+        size_bytes=9,
+        content_hash=hashlib.sha256(b'rendition').hexdigest()
+    )
+    audio_rendition_repository_mock.add_audio_rendition.assert_awaited_once_with(result)
+
+
+@pytest.mark.asyncio
+async def test_stored_audio_rendition_is_not_transcoded_again(
+    audio_rendition_getter: AudioRenditionGetter,
+    audio_transcoder_mock: AsyncMock,
+    audio_rendition_repository_mock: AsyncMock,
+    tmp_path: Path
+) -> None:
+    test_audio_rendition: AudioRendition = AudioRendition(
+        source_id='test_source_id',
+        file_path=tmp_path.joinpath('test_source_id.medium.opus'),
+        bit_rate_kbps=128,
+        codec=AudioCodec.opus,
+        quality=AudioQuality.medium
+    )
+    test_audio_rendition.file_path.write_bytes(b'rendition')
+    audio_rendition_repository_mock.get_audio_rendition.return_value = test_audio_rendition
+    result: Audio = await audio_rendition_getter.get_audio_rendition('test_source_id', quality=AudioQuality.medium)
+    audio_transcoder_mock.transcode_audio.assert_not_awaited()
+    assert result == test_audio_rendition
+
+
+def test_preferred_audio_quality_follows_accepted_codecs(audio_rendition_getter: AudioRenditionGetter) -> None:
+    assert audio_rendition_getter.get_preferred_audio_quality(set()) == AudioQuality.high
+    assert audio_rendition_getter.get_preferred_audio_quality({AudioCodec.vorbis, AudioCodec.opus}) == AudioQuality.high
+    assert audio_rendition_getter.get_preferred_audio_quality({AudioCodec.opus}) == AudioQuality.medium
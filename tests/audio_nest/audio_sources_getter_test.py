@@ -1,20 +1,26 @@
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
 from audio_nest.domain.audio_source import AudioSource
 from audio_nest.services.i_audio_sources_repository import IAudioSourcesRepository
+from audio_nest.services.i_tracer import ITracer
 from audio_nest.use_cases.audio_sources_getter import AudioSourcesGetter
 
 
+@pytest.fixture(scope='function')
+def tracer_mock() -> MagicMock:
+    return MagicMock(spec=ITracer)
+
+
 @pytest.fixture(scope='function')
 def audio_sources_repository_mock() -> AsyncMock:
     return AsyncMock(spec=IAudioSourcesRepository)
 
 
 @pytest.fixture(scope='function')
-def audio_sources_getter(audio_sources_repository_mock: AsyncMock) -> AudioSourcesGetter:
-    return AudioSourcesGetter(audio_sources_repository_mock)
+def audio_sources_getter(audio_sources_repository_mock: AsyncMock, tracer_mock: MagicMock) -> AudioSourcesGetter:
+    return AudioSourcesGetter(audio_sources_repository_mock, tracer_mock)
 
 
 @pytest.mark.asyncio
@@ -1,5 +1,5 @@
 from pathlib import Path
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock
 from uuid import uuid4
 
 import pytest
@@ -7,18 +7,24 @@ import pytest
 from audio_nest.domain.audio_codec import AudioCodec
 from audio_nest.domain.user_audio import UserAudio
 from audio_nest.exceptions.user_audio_already_added_exception import UserAudioAlreadyAddedException
+from audio_nest.services.i_tracer import ITracer
 from audio_nest.services.i_user_audio_repository import IUserAudioRepository
 from audio_nest.use_cases.user_audio_adder import UserAudioAdder
 
 
+@pytest.fixture(scope='function')
+def tracer_mock() -> MagicMock:
+    return MagicMock(spec=ITracer)
+
+
 @pytest.fixture(scope='function')
 def user_audio_repository_mock() -> AsyncMock:
     return AsyncMock(spec=IUserAudioRepository)
 
 
 @pytest.fixture(scope='function')
-def user_audio_adder(user_audio_repository_mock: AsyncMock) -> UserAudioAdder:
-    return UserAudioAdder(user_audio_repository_mock)
+def user_audio_adder(user_audio_repository_mock: AsyncMock, tracer_mock: MagicMock) -> UserAudioAdder:
+    return UserAudioAdder(user_audio_repository_mock, tracer_mock)
 
 
 @pytest.mark.asyncio
@@ -30,12 +36,10 @@ async def test_user_audio_is_added(user_audio_adder: UserAudioAdder, user_audio_
         codec=AudioCodec.vorbis,
         id=uuid4(),
         user_id=uuid4(),
-        title='Test title',
-        artist='Test artist'
+        audio_name='Test Audio'
     )
-    user_audio_repository_mock.get_user_audio_from_source.return_value = None
+    user_audio_repository_mock.add_user_audio.return_value = True
     await user_audio_adder.add_user_audio(test_user_audio)
-    user_audio_repository_mock.get_user_audio_from_source.assert_awaited_once_with(test_user_audio.source_id)
     user_audio_repository_mock.add_user_audio.assert_awaited_once_with(test_user_audio)
 
 
@@ -51,11 +55,9 @@ async def test_adding_user_audio_from_existing_source_raises_exception(
         codec=AudioCodec.vorbis,
         id=uuid4(),
         user_id=uuid4(),
-        title='Test title',
-        artist='Test artist'
+        audio_name='Test Audio'
     )
-    user_audio_repository_mock.get_user_audio_from_source.return_value = test_user_audio
+    user_audio_repository_mock.add_user_audio.return_value = False
     with pytest.raises(UserAudioAlreadyAddedException):
         await user_audio_adder.add_user_audio(test_user_audio)
-    user_audio_repository_mock.get_user_audio_from_source.assert_awaited_once_with(test_user_audio.source_id)
-    user_audio_repository_mock.add_user_audio.assert_not_awaited()
+    user_audio_repository_mock.add_user_audio.assert_awaited_once_with(test_user_audio)
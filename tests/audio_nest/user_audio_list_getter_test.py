@@ -0,0 +1,69 @@
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+from uuid import UUID, uuid4
+
+import pytest
+
+from audio_nest.domain.audio_codec import AudioCodec
+from audio_nest.domain.user_audio import UserAudio
+from audio_nest.domain.user_audio_page import UserAudioPage
+from audio_nest.exceptions.invalid_user_audio_cursor_exception import InvalidUserAudioCursorException
+from audio_nest.services.i_tracer import ITracer
+from audio_nest.services.i_user_audio_repository import IUserAudioRepository
+from audio_nest.use_cases.user_audio_list_getter import UserAudioListGetter
+
+
+@pytest.fixture(scope='function')
+def tracer_mock() -> MagicMock:
+    return MagicMock(spec=ITracer)
+
+
+@pytest.fixture(scope='function')
+def user_audio_repository_mock() -> AsyncMock:
+    return AsyncMock(spec=IUserAudioRepository)
+
+
+@pytest.fixture(scope='function')
+def user_audio_list_getter(user_audio_repository_mock: AsyncMock, tracer_mock: MagicMock) -> UserAudioListGetter:
+    return UserAudioListGetter(user_audio_repository_mock, tracer_mock)
+
+
+@pytest.mark.asyncio
+async def test_next_cursor_points_after_last_returned_user_audio(
+    user_audio_list_getter: UserAudioListGetter,
+    user_audio_repository_mock: AsyncMock
+) -> None:
+    test_user_id: UUID = uuid4()
+    test_user_audio_list: list[UserAudio] = [
+        UserAudio(
+            source_id=f'test_source_id_{i}',
+            file_path=Path(f'./test_audio_{i}.ogg'),
+            bit_rate_kbps=320,
+            codec=AudioCodec.vorbis,
+            user_id=test_user_id,
+            audio_name=f'Test Audio {i}'
+        )
+        for i in range(3)
+    ]
+    user_audio_repository_mock.get_user_audio_list.return_value = test_user_audio_list
+    first_page: UserAudioPage = await user_audio_list_getter.get_user_audio_list(user_id=test_user_id, limit=2)
+    user_audio_repository_mock.get_user_audio_list.return_value = test_user_audio_list[2:]
+    second_page: UserAudioPage = await user_audio_list_getter.get_user_audio_list(
+        user_id=test_user_id,
+        limit=2,
+        cursor=first_page.next_cursor
+    )
+    user_audio_repository_mock.get_user_audio_list.assert_awaited_with(
+        user_id=test_user_id,
+        limit=3,
+        after_created_at=test_user_audio_list[1].created_at,
+        after_id=test_user_audio_list[1].id
+    )
+    assert first_page.user_audio_list == test_user_audio_list[:2]
+    assert second_page == UserAudioPage(user_audio_list=test_user_audio_list[2:])
+
+
+@pytest.mark.asyncio
+async def test_invalid_cursor_raises_exception(user_audio_list_getter: UserAudioListGetter) -> None:
+    with pytest.raises(InvalidUserAudioCursorException):
+        await user_audio_list_getter.get_user_audio_list(user_id=uuid4(), limit=2, cursor='invalid')
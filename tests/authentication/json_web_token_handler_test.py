@@ -1,26 +1,42 @@
 import pytest
 
+from auth.domain.json_web_token_claims import JsonWebTokenClaims
+from auth.domain.json_web_token_type import JsonWebTokenType
+from auth.domain.user import User
 from auth.services.json_web_token_handler import JsonWebTokenHandler
 
 
 @pytest.fixture(scope='function')
 def json_web_token_handler() -> JsonWebTokenHandler:
-    return JsonWebTokenHandler(secret_key='test_secret_key', algorithm='HS256', expiration_days=1)
+    return JsonWebTokenHandler(
+        secret_key='test_secret_key',
+        algorithm='HS256',
+        access_token_expiration_minutes=15,
+        refresh_token_expiration_days=1
+    )
 
 
 def test_access_token_is_created(json_web_token_handler: JsonWebTokenHandler) -> None:
-    access_token: str = json_web_token_handler.create_access_token('test_user')
+    access_token: str = json_web_token_handler.create_access_token(User(email='test@email.com'))
     assert isinstance(access_token, str)
     assert len(access_token) > 0
 
 
 def test_access_token_is_decoded(json_web_token_handler: JsonWebTokenHandler) -> None:
-    test_subject: str = 'test_user'
-    access_token: str = json_web_token_handler.create_access_token('test_user')
-    result: str = json_web_token_handler.decode_access_token(access_token)
-    assert result == test_subject
+    test_user: User = User(email='test@email.com')
+    access_token: str = json_web_token_handler.create_access_token(test_user)
+    result: JsonWebTokenClaims | None = json_web_token_handler.decode_access_token(access_token)
+    assert result.user_id == test_user.id
+    assert result.email == test_user.email
+    assert result.token_type == JsonWebTokenType.access
 
 
 def test_decoding_invalid_access_token_returns_none(json_web_token_handler: JsonWebTokenHandler) -> None:
-    result: str | None = json_web_token_handler.decode_access_token('invalid_token')
+    result: JsonWebTokenClaims | None = json_web_token_handler.decode_access_token('invalid_token')
     assert result is None
+
+
+def test_refresh_token_is_not_accepted_as_access_token(json_web_token_handler: JsonWebTokenHandler) -> None:
+    refresh_token: str = json_web_token_handler.create_refresh_token(User(email='test@email.com'))
+    assert json_web_token_handler.decode_access_token(refresh_token) is None
+    assert json_web_token_handler.decode_refresh_token(refresh_token).token_type == JsonWebTokenType.refresh
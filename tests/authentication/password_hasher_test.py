@@ -0,0 +1,29 @@
+import asyncio
+
+import pytest
+
+from auth.exceptions.password_hasher_overloaded_exception import PasswordHasherOverloadedException
+from auth.services.password_hasher import PasswordHasher
+
+
+@pytest.fixture(scope='function')
+def password_hasher() -> PasswordHasher:
+    return PasswordHasher(rounds=4, max_workers=1, max_pending=1)
+
+
+@pytest.mark.asyncio
+async def test_hashed_password_is_verified(password_hasher: PasswordHasher) -> None:
+    hashed_password: str = await password_hasher.hash_password('test_password')
+    assert await password_hasher.verify_password(password='test_password', hashed_password=hashed_password)
+    assert not await password_hasher.verify_password(password='wrong_password', hashed_password=hashed_password)
+    assert password_hasher.pending_count == 0
+
+
+@pytest.mark.asyncio
+async def test_excess_pending_operations_are_rejected(password_hasher: PasswordHasher) -> None:
+    hashing: asyncio.Task[str] = asyncio.create_task(password_hasher.hash_password('test_password'))
+    await asyncio.sleep(0)
+    with pytest.raises(PasswordHasherOverloadedException):
+        await password_hasher.hash_password('test_password')
+    await hashing
+    assert password_hasher.rejected_count == 1
@@ -0,0 +1,21 @@
+import pytest
+
+from auth.domain.user import User
+from auth.services.user_cache import UserCache
+
+
+def test_expired_and_least_recently_used_users_are_evicted(monkeypatch: pytest.MonkeyPatch) -> None:
+    current_time: float = 0
+    monkeypatch.setattr('auth.services.user_cache.time.monotonic', lambda: current_time)
+    user_cache: UserCache = UserCache(max_entries=2, ttl_seconds=60)
+    test_users: list[User] = [User(email=f'test_{i}@email.com', hashed_password='test_hashed_password') for i in range(3)]
+    user: User
+    for user in test_users:
+        user_cache.add_user(subject=user.email, user=user)
+    assert user_cache.get_user(test_users[0].email) is None
+    assert user_cache.get_user(test_users[1].email) == test_users[1]
+    current_time = 60
+    assert user_cache.get_user(test_users[2].email) is None
+    user_cache.add_user(subject=test_users[0].email, user=test_users[0])
+    user_cache.invalidate_user(test_users[0].email)
+    assert user_cache.get_user(test_users[0].email) is None
@@ -0,0 +1,68 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from audio_nest.services.i_tracer import ITracer
+from auth.domain.user import User
+from auth.exceptions.invalid_user_credentials_exception import InvalidUserCredentialsException
+from auth.services.i_revoked_tokens_repository import IRevokedTokensRepository
+from auth.services.json_web_token_handler import JsonWebTokenHandler
+from auth.use_cases.user_getter import UserGetter
+from container import Container
+
+
+@pytest.fixture(scope='function')
+def tracer_mock() -> MagicMock:
+    return MagicMock(spec=ITracer)
+
+
+@pytest.fixture(scope='function')
+def json_web_token_handler() -> JsonWebTokenHandler:
+    return JsonWebTokenHandler(
+        secret_key='test_secret_key',
+        algorithm='HS256',
+        access_token_expiration_minutes=15,
+        refresh_token_expiration_days=1
+    )
+
+
+@pytest.fixture(scope='function')
+def user_getter(json_web_token_handler: JsonWebTokenHandler, tracer_mock: MagicMock) -> UserGetter:
+    return UserGetter(json_web_token_handler=json_web_token_handler, tracer=tracer_mock)
+
+
+@pytest.mark.asyncio
+async def test_user_is_retrieved_from_access_token_claims(
+    user_getter: UserGetter,
+    json_web_token_handler: JsonWebTokenHandler
+) -> None:
+    test_user: User = User(email='test@email.com', hashed_password='test_hashed_password')
+    result: User = await user_getter.get_user_from_access_token(json_web_token_handler.create_access_token(test_user))
+    assert result == User(email=test_user.email, id=test_user.id)
+
+
+@pytest.mark.asyncio
+async def test_refresh_token_is_not_accepted_as_access_token(
+    user_getter: UserGetter,
+    json_web_token_handler: JsonWebTokenHandler
+) -> None:
+    refresh_token: str = json_web_token_handler.create_refresh_token(User(email='test@email.com'))
+    with pytest.raises(InvalidUserCredentialsException):
+        await user_getter.get_user_from_access_token(refresh_token)
+
+
+@pytest.mark.asyncio
+async def test_user_is_retrieved_without_accessing_repositories(test_container: Container) -> None:
+    revoked_tokens_repository_mock: AsyncMock = AsyncMock(spec=IRevokedTokensRepository)
+    users_repository_mock: AsyncMock = AsyncMock()
+    with (
+        test_container.revoked_tokens_repository.override(revoked_tokens_repository_mock),
+        test_container.users_repository.override(users_repository_mock),
+        test_container.sql_session_maker.override(MagicMock(side_effect=AssertionError('SQL session opened')))
+    ):
+        user_getter: UserGetter = test_container.user_getter()
+        test_user: User = User(email='test@email.com')
+        access_token: str = test_container.json_web_token_handler().create_access_token(test_user)
+        assert (await user_getter.get_user_from_access_token(access_token)).id == test_user.id
+    assert revoked_tokens_repository_mock.mock_calls == []
+    assert users_repository_mock.mock_calls == []
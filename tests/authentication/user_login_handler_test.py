@@ -0,0 +1,89 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from audio_nest.services.i_tracer import ITracer
+from auth.domain.authentication_tokens import AuthenticationTokens
+from auth.domain.user import User
+from auth.exceptions.invalid_user_credentials_exception import InvalidUserCredentialsException
+from auth.services.i_users_repository import IUsersRepository
+from auth.services.json_web_token_handler import JsonWebTokenHandler
+from auth.services.password_hasher import PasswordHasher
+from auth.use_cases.user_login_handler import UserLoginHandler
+
+
+@pytest.fixture(scope='function')
+def users_repository_mock() -> AsyncMock:
+    return AsyncMock(spec=IUsersRepository)
+
+
+@pytest.fixture(scope='function')
+def password_hasher_mock() -> AsyncMock:
+    return AsyncMock(spec=PasswordHasher)
+
+
+@pytest.fixture(scope='function')
+def json_web_token_handler() -> JsonWebTokenHandler:
+    return JsonWebTokenHandler(
+        secret_key='test_secret_key',
+        algorithm='HS256',
+        access_token_expiration_minutes=15,
+        refresh_token_expiration_days=1
+    )
+
+
+@pytest.fixture(scope='function')
+def user_login_handler(
+    users_repository_mock: AsyncMock,
+    json_web_token_handler: JsonWebTokenHandler,
+    password_hasher_mock: AsyncMock
+) -> UserLoginHandler:
+    return UserLoginHandler(
+        users_repository=users_repository_mock,
+        json_web_token_handler=json_web_token_handler,
+        password_hasher=password_hasher_mock,
+        tracer=MagicMock(spec=ITracer)
+    )
+
+
+@pytest.mark.asyncio
+async def test_authentication_tokens_are_returned_after_logging_user_in(
+    user_login_handler: UserLoginHandler,
+    users_repository_mock: AsyncMock,
+    password_hasher_mock: AsyncMock,
+    json_web_token_handler: JsonWebTokenHandler
+) -> None:
+    test_user: User = User(email='test@example.com', hashed_password='hashed_password')
+    users_repository_mock.get_user_by_email.return_value = test_user
+    password_hasher_mock.verify_password.return_value = True
+    result: AuthenticationTokens = await user_login_handler.log_user_in(email=test_user.email, password='password123')
+    password_hasher_mock.verify_password.assert_awaited_once_with(
+        password='password123',
+        hashed_password=test_user.hashed_password
+    )
+    assert json_web_token_handler.decode_access_token(result.access_token).user_id == test_user.id
+    assert json_web_token_handler.decode_refresh_token(result.refresh_token).user_id == test_user.id
+
+
+@pytest.mark.asyncio
+async def test_logging_user_in_with_invalid_email_raises_exception(
+    user_login_handler: UserLoginHandler,
+    users_repository_mock: AsyncMock,
+    password_hasher_mock: AsyncMock
+) -> None:
+    users_repository_mock.get_user_by_email.return_value = None
+    with pytest.raises(InvalidUserCredentialsException):
+        await user_login_handler.log_user_in(email='test@example.com', password='password123')
+    password_hasher_mock.verify_password.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_logging_user_in_with_invalid_password_raises_exception(
+    user_login_handler: UserLoginHandler,
+    users_repository_mock: AsyncMock,
+    password_hasher_mock: AsyncMock
+) -> None:
+    users_repository_mock.get_user_by_email.return_value = User(email='test@example.com', hashed_password='hashed')
+    password_hasher_mock.verify_password.return_value = False
+    with pytest.raises(InvalidUserCredentialsException):
+        await user_login_handler.log_user_in(email='test@example.com', password='password123')
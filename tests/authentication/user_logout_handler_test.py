@@ -0,0 +1,80 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from audio_nest.services.i_tracer import ITracer
+from auth.domain.json_web_token_claims import JsonWebTokenClaims
+from auth.domain.user import User
+from auth.exceptions.invalid_user_credentials_exception import InvalidUserCredentialsException
+from auth.services.i_revoked_tokens_repository import IRevokedTokensRepository
+from auth.services.json_web_token_handler import JsonWebTokenHandler
+from auth.use_cases.user_logout_handler import UserLogoutHandler
+
+
+@pytest.fixture(scope='function')
+def revoked_tokens_repository_mock() -> AsyncMock:
+    return AsyncMock(spec=IRevokedTokensRepository)
+
+
+@pytest.fixture(scope='function')
+def json_web_token_handler() -> JsonWebTokenHandler:
+    return JsonWebTokenHandler(
+        secret_key='test_secret_key',
+        algorithm='HS256',
+        access_token_expiration_minutes=15,
+        refresh_token_expiration_days=1
+    )
+
+
+@pytest.fixture(scope='function')
+def user_logout_handler(
+    json_web_token_handler: JsonWebTokenHandler,
+    revoked_tokens_repository_mock: AsyncMock
+) -> UserLogoutHandler:
+    return UserLogoutHandler(
+        json_web_token_handler=json_web_token_handler,
+        revoked_tokens_repository=revoked_tokens_repository_mock,
+        tracer=MagicMock(spec=ITracer)
+    )
+
+
+@pytest.mark.asyncio
+async def test_only_refresh_token_is_revoked_on_logout(
+    user_logout_handler: UserLogoutHandler,
+    json_web_token_handler: JsonWebTokenHandler,
+    revoked_tokens_repository_mock: AsyncMock
+) -> None:
+    test_user: User = User(email='test@email.com')
+    refresh_token: str = json_web_token_handler.create_refresh_token(test_user)
+    await user_logout_handler.log_user_out(
+        access_token=json_web_token_handler.create_access_token(test_user),
+        refresh_token=refresh_token
+    )
+    refresh_token_claims: JsonWebTokenClaims = json_web_token_handler.decode_refresh_token(refresh_token)
+    revoked_tokens_repository_mock.revoke_token.assert_awaited_once_with(
+        token_id=refresh_token_claims.token_id,
+        expiration_time=refresh_token_claims.expiration_time
+    )
+
+
+@pytest.mark.asyncio
+async def test_refresh_token_of_other_user_is_not_revoked_on_logout(
+    user_logout_handler: UserLogoutHandler,
+    json_web_token_handler: JsonWebTokenHandler,
+    revoked_tokens_repository_mock: AsyncMock
+) -> None:
+    await user_logout_handler.log_user_out(
+        access_token=json_web_token_handler.create_access_token(User(email='test@email.com')),
+        refresh_token=json_web_token_handler.create_refresh_token(User(email='other_test@email.com'))
+    )
+    revoked_tokens_repository_mock.revoke_token.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_logout_with_invalid_access_token_raises_exception(
+    user_logout_handler: UserLogoutHandler,
+    revoked_tokens_repository_mock: AsyncMock
+) -> None:
+    with pytest.raises(InvalidUserCredentialsException):
+        await user_logout_handler.log_user_out(access_token='invalid_access_token')
+    revoked_tokens_repository_mock.revoke_token.assert_not_awaited()
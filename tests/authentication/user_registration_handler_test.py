@@ -0,0 +1,65 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from audio_nest.services.i_tracer import ITracer
+from auth.domain.user import User
+from auth.exceptions.user_already_registered_exception import UserAlreadyRegisteredException
+from auth.services.i_users_repository import IUsersRepository
+from auth.services.password_hasher import PasswordHasher
+from auth.services.user_cache import UserCache
+from auth.use_cases.user_registration_handler import UserRegistrationHandler
+
+
+@pytest.fixture(scope='function')
+def users_repository_mock() -> AsyncMock:
+    return AsyncMock(spec=IUsersRepository)
+
+
+@pytest.fixture(scope='function')
+def password_hasher_mock() -> AsyncMock:
+    return AsyncMock(spec=PasswordHasher)
+
+
+@pytest.fixture(scope='function')
+def user_registration_handler(
+    users_repository_mock: AsyncMock,
+    password_hasher_mock: AsyncMock
+) -> UserRegistrationHandler:
+    return UserRegistrationHandler(
+        users_repository=users_repository_mock,
+        user_cache=UserCache(max_entries=10, ttl_seconds=60),
+        password_hasher=password_hasher_mock,
+        tracer=MagicMock(spec=ITracer)
+    )
+
+
+@pytest.mark.asyncio
+async def test_user_is_registered(
+    user_registration_handler: UserRegistrationHandler,
+    users_repository_mock: AsyncMock,
+    password_hasher_mock: AsyncMock
+) -> None:
+    test_email: str = 'test@example.com'
+    test_password: str = 'password123'
+    users_repository_mock.get_user_by_email.return_value = None
+    password_hasher_mock.hash_password.return_value = 'hashed_password'
+    await user_registration_handler.register_user(email=test_email, password=test_password)
+    users_repository_mock.get_user_by_email.assert_awaited_once_with(test_email)
+    password_hasher_mock.hash_password.assert_awaited_once_with(test_password)
+    created_user: User = users_repository_mock.create_user.await_args.args[0]
+    assert (created_user.email, created_user.hashed_password) == (test_email, 'hashed_password')
+
+
+@pytest.mark.asyncio
+async def test_registering_user_already_registered_raises_exception(
+    user_registration_handler: UserRegistrationHandler,
+    users_repository_mock: AsyncMock,
+    password_hasher_mock: AsyncMock
+) -> None:
+    test_email: str = 'test@example.com'
+    users_repository_mock.get_user_by_email.return_value = User(email=test_email, hashed_password='hashed_password')
+    with pytest.raises(UserAlreadyRegisteredException):
+        await user_registration_handler.register_user(email=test_email, password='password123')
+    password_hasher_mock.hash_password.assert_not_awaited()
+    users_repository_mock.create_user.assert_not_awaited()
@@ -0,0 +1,114 @@
+import asyncio
+from pathlib import Path
+from typing import AsyncGenerator
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from audio_nest.services.i_tracer import ITracer
+from auth.domain.authentication_tokens import AuthenticationTokens
+from auth.domain.user import User
+from auth.exceptions.invalid_user_credentials_exception import InvalidUserCredentialsException
+from auth.services.i_users_repository import IUsersRepository
+from auth.services.json_web_token_handler import JsonWebTokenHandler
+from auth.services.user_cache import UserCache
+from auth.use_cases.user_token_refresher import UserTokenRefresher
+from sql.sql_revoked_tokens_repository import SqlRevokedTokensRepository
+from sql.sql_session_maker_handler import handle_sql_session_maker
+
+
+@pytest.fixture(scope='function')
+def tracer_mock() -> MagicMock:
+    return MagicMock(spec=ITracer)
+
+
+@pytest.fixture(scope='function')
+def users_repository_mock() -> AsyncMock:
+    return AsyncMock(spec=IUsersRepository)
+
+
+@pytest.fixture(scope='function')
+def json_web_token_handler() -> JsonWebTokenHandler:
+    return JsonWebTokenHandler(
+        secret_key='test_secret_key',
+        algorithm='HS256',
+        access_token_expiration_minutes=15,
+        refresh_token_expiration_days=1
+    )
+
+
+@pytest_asyncio.fixture(scope='function')
+async def sql_session_maker(tmp_path: Path) -> AsyncGenerator[async_sessionmaker[AsyncSession], None]:
+    session_makers: AsyncGenerator[async_sessionmaker[AsyncSession], None] = handle_sql_session_maker(
+        tmp_path.joinpath('test.db')
+    )
+    yield await anext(session_makers)
+    await anext(session_makers, None)
+
+
+@pytest.fixture(scope='function')
+def user_token_refresher(
+    sql_session_maker: async_sessionmaker[AsyncSession],
+    users_repository_mock: AsyncMock,
+    json_web_token_handler: JsonWebTokenHandler,
+    tracer_mock: MagicMock
+) -> UserTokenRefresher:
+    return UserTokenRefresher(
+        users_repository=users_repository_mock,
+        json_web_token_handler=json_web_token_handler,
+        revoked_tokens_repository=SqlRevokedTokensRepository(sql_session_maker, tracer_mock),
+        user_cache=UserCache(max_entries=10, ttl_seconds=60),
+        tracer=tracer_mock
+    )
+
+
+@pytest.mark.asyncio
+async def test_refresh_token_is_rotated(
+    user_token_refresher: UserTokenRefresher,
+    users_repository_mock: AsyncMock,
+    json_web_token_handler: JsonWebTokenHandler
+) -> None:
+    test_user: User = User(email='test@email.com', hashed_password='test_hashed_password')
+    users_repository_mock.get_user_by_email.return_value = test_user
+    refresh_token: str = json_web_token_handler.create_refresh_token(test_user)
+    result: AuthenticationTokens = await user_token_refresher.refresh_authentication_tokens(refresh_token)
+    assert json_web_token_handler.decode_access_token(result.access_token).user_id == test_user.id
+    await user_token_refresher.refresh_authentication_tokens(result.refresh_token)
+    users_repository_mock.get_user_by_email.assert_awaited_once_with(test_user.email)
+    with pytest.raises(InvalidUserCredentialsException):
+        await user_token_refresher.refresh_authentication_tokens(refresh_token)
+
+
+@pytest.mark.asyncio
+async def test_concurrently_replayed_refresh_token_is_accepted_once(
+    user_token_refresher: UserTokenRefresher,
+    users_repository_mock: AsyncMock,
+    json_web_token_handler: JsonWebTokenHandler
+) -> None:
+    test_user: User = User(email='test@email.com', hashed_password='test_hashed_password')
+
+    async def get_user_by_email(_: str) -> User:
+        await asyncio.sleep(0)
+        return test_user
+
+    users_repository_mock.get_user_by_email.side_effect = get_user_by_email
+    refresh_token: str = json_web_token_handler.create_refresh_token(test_user)
+    results: list[AuthenticationTokens | BaseException] = await asyncio.gather(
+        user_token_refresher.refresh_authentication_tokens(refresh_token),
+        user_token_refresher.refresh_authentication_tokens(refresh_token),
+        return_exceptions=True
+    )
+    assert len([result for result in results if isinstance(result, AuthenticationTokens)]) == 1
+    assert len([result for result in results if isinstance(result, InvalidUserCredentialsException)]) == 1
+
+
+@pytest.mark.asyncio
+async def test_access_token_is_not_accepted_as_refresh_token(
+    user_token_refresher: UserTokenRefresher,
+    json_web_token_handler: JsonWebTokenHandler
+) -> None:
+    access_token: str = json_web_token_handler.create_access_token(User(email='test@email.com'))
+    with pytest.raises(InvalidUserCredentialsException):
+        await user_token_refresher.refresh_authentication_tokens(access_token)
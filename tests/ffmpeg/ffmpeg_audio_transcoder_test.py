@@ -0,0 +1,80 @@
+from pathlib import Path
+from typing import Generator
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from audio_nest.domain.audio import Audio
+from audio_nest.domain.audio_codec import AudioCodec
+from audio_nest.exceptions.audio_transcoding_failed_exception import AudioTranscodingFailedException
+from audio_nest.services.audio_download_worker_pool import AudioDownloadWorkerPool
+from audio_nest.services.i_tracer import ITracer
+from ffmpeg.ffmpeg_audio_transcoder import FfmpegAudioTranscoder
+from prometheus.prometheus_stage_timer import PrometheusStageTimer
+
+
+@pytest.fixture(scope='function')
+def tracer_mock() -> MagicMock:
+    return MagicMock(spec=ITracer)
+
+
+@pytest.fixture(scope='function')
+def ffmpeg_process_mock() -> Generator[MagicMock, None, None]:
+    with patch(
+        'ffmpeg.ffmpeg_audio_transcoder.asyncio.create_subprocess_exec',
+        new_callable=AsyncMock
+    ) as create_subprocess_exec_mock:
+        ffmpeg_process_mock: MagicMock = create_subprocess_exec_mock.return_value
+        ffmpeg_process_mock.communicate = AsyncMock(return_value=(None, b''))
+        ffmpeg_process_mock.returncode = 0
+        yield ffmpeg_process_mock
+
+
+@pytest.fixture(scope='function')
+def ffmpeg_audio_transcoder(tracer_mock: MagicMock) -> FfmpegAudioTranscoder:
+    return FfmpegAudioTranscoder(
+        ffmpeg_path=Path('.'),
+        worker_pool=AudioDownloadWorkerPool(max_concurrency=1, stage_timer=PrometheusStageTimer()),
+        stage_timer=PrometheusStageTimer(),
+        tracer=tracer_mock
+    )
+
+
+@pytest.fixture(scope='function')
+def test_audio(tmp_path: Path) -> Audio:
+    return Audio(
+        source_id='test_source_id',
+        file_path=tmp_path.joinpath('test_source_id.ogg'),
+        bit_rate_kbps=320,
+        codec=AudioCodec.vorbis
+    )
+
+
+@pytest.mark.asyncio
+async def test_audio_is_transcoded_within_timed_stage(
+    ffmpeg_audio_transcoder: FfmpegAudioTranscoder,
+    ffmpeg_process_mock: MagicMock,
+    test_audio: Audio,
+    tmp_path: Path
+) -> None:
+    result: Audio = await ffmpeg_audio_transcoder.transcode_audio(
+        audio=test_audio,
+        codec=AudioCodec.opus,
+        bit_rate_kbps=64
+    )
+    assert result.codec == AudioCodec.opus
+    assert result.bit_rate_kbps == 64
+    assert result.file_path.parent == tmp_path
+    assert result.file_path.suffix == '.opus'
+
+
+@pytest.mark.asyncio
+async def test_failed_transcoding_is_raised(
+    ffmpeg_audio_transcoder: FfmpegAudioTranscoder,
+    ffmpeg_process_mock: MagicMock,
+    test_audio: Audio
+) -> None:
+    ffmpeg_process_mock.communicate.return_value = (None, b'test error')
+    ffmpeg_process_mock.returncode = 1
+    with pytest.raises(AudioTranscodingFailedException):
+        await ffmpeg_audio_transcoder.transcode_audio(audio=test_audio, codec=AudioCodec.opus, bit_rate_kbps=64)
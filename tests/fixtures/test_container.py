@@ -1,19 +1,38 @@
+from pathlib import Path
 from unittest.mock import AsyncMock
 
 import pytest
 
+from audio_nest.services.i_audio_download_jobs_repository import IAudioDownloadJobsRepository
+from audio_nest.services.i_audio_rendition_repository import IAudioRenditionRepository
 from audio_nest.services.i_audio_repository import IAudioRepository
-from audio_nest.services.i_audio_sources_repository import IAudioSourcesRepository
+from audio_nest.services.i_audio_storage import IAudioStorage
 from audio_nest.services.i_user_audio_repository import IUserAudioRepository
-from audio_nest.services.i_users_repository import IUsersRepository
+from audio_nest.use_cases.audio_evictor import AudioEvictor
+from auth.services.i_revoked_tokens_repository import IRevokedTokensRepository
+from auth.services.i_users_repository import IUsersRepository
 from container import Container
+from memory.memory_cached_audio_sources_repository import MemoryCachedAudioSourcesRepository
 
 
 @pytest.fixture(scope='session', autouse=True)
-def test_container() -> Container:
+def test_container(tmp_path_factory: pytest.TempPathFactory) -> Container:
+    test_directory_path: Path = tmp_path_factory.mktemp('test_container')
+    audio_download_jobs_repository_mock: AsyncMock = AsyncMock(spec=IAudioDownloadJobsRepository)
+    audio_download_jobs_repository_mock.fail_stale_audio_download_jobs.return_value = 0
+    audio_evictor_mock: AsyncMock = AsyncMock(spec=AudioEvictor)
+    audio_evictor_mock.evict_audio.return_value = 0
+    audio_evictor_mock.evict_orphaned_audio.return_value = 0
     container: Container = Container()
+    container.configuration.audio_directory_path.override(test_directory_path.joinpath('audio'))
+    container.configuration.database_path.override(test_directory_path.joinpath('test.db'))
+    container.audio_download_jobs_repository.override(audio_download_jobs_repository_mock)
+    container.audio_evictor.override(audio_evictor_mock)
+    container.audio_rendition_repository.override(AsyncMock(spec=IAudioRenditionRepository))
     container.audio_repository.override(AsyncMock(spec=IAudioRepository))
-    container.audio_sources_repository.override(AsyncMock(spec=IAudioSourcesRepository))
+    container.audio_sources_repository.override(AsyncMock(spec=MemoryCachedAudioSourcesRepository))
+    container.audio_storage.override(AsyncMock(spec=IAudioStorage))
+    container.revoked_tokens_repository.override(AsyncMock(spec=IRevokedTokensRepository))
     container.user_audio_repository.override(AsyncMock(spec=IUserAudioRepository))
     container.users_repository.override(AsyncMock(spec=IUsersRepository))
     container.logging.init()
@@ -0,0 +1,103 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from audio_nest.domain.audio_source import AudioSource
+from audio_nest.services.i_audio_sources_repository import IAudioSourcesRepository
+from audio_nest.services.i_tracer import ITracer
+from memory.memory_cached_audio_sources_repository import MemoryCachedAudioSourcesRepository
+
+
+@pytest.fixture(scope='function')
+def audio_sources_repository_mock() -> AsyncMock:
+    return AsyncMock(spec=IAudioSourcesRepository)
+
+
+def create_cached_audio_sources_repository(
+    audio_sources_repository_mock: AsyncMock,
+    max_entries: int = 10,
+    ttl_seconds: float = 60,
+    stale_seconds: float = 60
+) -> MemoryCachedAudioSourcesRepository:
+    return MemoryCachedAudioSourcesRepository(
+        audio_sources_repository=audio_sources_repository_mock,
+        max_results=20,
+        max_entries=max_entries,
+        ttl_seconds=ttl_seconds,
+        stale_seconds=stale_seconds,
+        tracer=MagicMock(spec=ITracer)
+    )
+
+
+@pytest.mark.asyncio
+async def test_audio_sources_for_equivalent_search_queries_are_cached(audio_sources_repository_mock: AsyncMock) -> None:
+    test_audio_sources: list[AudioSource] = [AudioSource(id='audio_source_1', name='Audio Source 1')]
+    audio_sources_repository_mock.get_audio_sources.return_value = test_audio_sources
+    cached_audio_sources_repository: MemoryCachedAudioSourcesRepository = create_cached_audio_sources_repository(
+        audio_sources_repository_mock
+    )
+    first_result: list[AudioSource] = await cached_audio_sources_repository.get_audio_sources('Test  Query')
+    second_result: list[AudioSource] = await cached_audio_sources_repository.get_audio_sources(' test query ')
+    audio_sources_repository_mock.get_audio_sources.assert_awaited_once_with('test query')
+    assert first_result == second_result == test_audio_sources
+    assert cached_audio_sources_repository.misses_count == 1
+    assert cached_audio_sources_repository.hits_count == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_search_queries_are_coalesced(audio_sources_repository_mock: AsyncMock) -> None:
+    search_released: asyncio.Event = asyncio.Event()
+
+    async def get_audio_sources(_: str) -> list[AudioSource]:
+        await search_released.wait()
+        return []
+
+    audio_sources_repository_mock.get_audio_sources.side_effect = get_audio_sources
+    cached_audio_sources_repository: MemoryCachedAudioSourcesRepository = create_cached_audio_sources_repository(
+        audio_sources_repository_mock
+    )
+    searches: list[asyncio.Task[list[AudioSource]]] = [
+        asyncio.create_task(cached_audio_sources_repository.get_audio_sources('test query')) for _ in range(3)
+    ]
+    await asyncio.sleep(0)
+    search_released.set()
+    await asyncio.gather(*searches)
+    audio_sources_repository_mock.get_audio_sources.assert_awaited_once_with('test query')
+    assert cached_audio_sources_repository.coalesced_misses_count == 2
+
+
+@pytest.mark.asyncio
+async def test_stale_audio_sources_are_returned_while_refreshing(audio_sources_repository_mock: AsyncMock) -> None:
+    test_stale_audio_sources: list[AudioSource] = [AudioSource(id='audio_source_1', name='Audio Source 1')]
+    test_fresh_audio_sources: list[AudioSource] = [AudioSource(id='audio_source_2', name='Audio Source 2')]
+    audio_sources_repository_mock.get_audio_sources.side_effect = [test_stale_audio_sources, test_fresh_audio_sources]
+    cached_audio_sources_repository: MemoryCachedAudioSourcesRepository = create_cached_audio_sources_repository(
+        audio_sources_repository_mock,
+        ttl_seconds=0
+    )
+    await cached_audio_sources_repository.get_audio_sources('test query')
+    result: list[AudioSource] = await cached_audio_sources_repository.get_audio_sources('test query')
+    assert result == test_stale_audio_sources
+    await asyncio.sleep(0)
+    assert cached_audio_sources_repository.stale_hits_count == 1
+    assert audio_sources_repository_mock.get_audio_sources.await_count == 2
+    result = await cached_audio_sources_repository.get_audio_sources('test query')
+    assert result == test_fresh_audio_sources
+
+
+@pytest.mark.asyncio
+async def test_least_recently_used_audio_sources_are_evicted(audio_sources_repository_mock: AsyncMock) -> None:
+    audio_sources_repository_mock.get_audio_sources.return_value = []
+    cached_audio_sources_repository: MemoryCachedAudioSourcesRepository = create_cached_audio_sources_repository(
+        audio_sources_repository_mock,
+        max_entries=2
+    )
+    await cached_audio_sources_repository.get_audio_sources('first')
+    await cached_audio_sources_repository.get_audio_sources('second')
+    await cached_audio_sources_repository.get_audio_sources('first')
+    await cached_audio_sources_repository.get_audio_sources('third')
+    await cached_audio_sources_repository.get_audio_sources('first')
+    await cached_audio_sources_repository.get_audio_sources('second')
+    assert cached_audio_sources_repository.entries_count == 2
+    assert audio_sources_repository_mock.get_audio_sources.await_count == 4
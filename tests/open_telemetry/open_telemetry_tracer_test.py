@@ -0,0 +1,80 @@
+import pytest
+from opentelemetry.sdk.trace import ReadableSpan
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+from opentelemetry.trace import StatusCode
+
+from audio_nest.domain.audio_download_priority import AudioDownloadPriority
+from audio_nest.services.audio_download_worker_pool import AudioDownloadWorkerPool
+from open_telemetry.open_telemetry_tracer import OpenTelemetryTracer
+from prometheus.prometheus_stage_timer import PrometheusStageTimer
+
+
+@pytest.fixture(scope='function')
+def span_exporter() -> InMemorySpanExporter:
+    return InMemorySpanExporter()
+
+
+@pytest.fixture(scope='function')
+def tracer(span_exporter: InMemorySpanExporter) -> OpenTelemetryTracer:
+    return OpenTelemetryTracer(span_exporter=span_exporter, service_name='test-service')
+
+
+def get_finished_spans(tracer: OpenTelemetryTracer, span_exporter: InMemorySpanExporter) -> dict[str, ReadableSpan]:
+    tracer.flush()
+    return {span.name: span for span in span_exporter.get_finished_spans()}
+
+
+def test_nested_spans_are_exported_with_attributes(
+    tracer: OpenTelemetryTracer,
+    span_exporter: InMemorySpanExporter
+) -> None:
+    with tracer.trace_span('TestUseCase.run', {'audio_nest.source_id': 'test_source_id'}):
+        with tracer.trace_span('TestRepository.get'):
+            pass
+    spans: dict[str, ReadableSpan] = get_finished_spans(tracer, span_exporter)
+    assert spans['TestUseCase.run'].attributes['audio_nest.source_id'] == 'test_source_id'
+    assert spans['TestUseCase.run'].resource.attributes['service.name'] == 'test-service'
+    assert spans['TestRepository.get'].parent.span_id == spans['TestUseCase.run'].context.span_id
+    assert spans['TestRepository.get'].context.trace_id == spans['TestUseCase.run'].context.trace_id
+
+
+def test_raised_exception_is_recorded_on_span(
+    tracer: OpenTelemetryTracer,
+    span_exporter: InMemorySpanExporter
+) -> None:
+    with pytest.raises(ValueError):
+        with tracer.trace_span('TestUseCase.run'):
+            raise ValueError('test error')
+    span: ReadableSpan = get_finished_spans(tracer, span_exporter)['TestUseCase.run']
+    assert span.status.status_code == StatusCode.ERROR
+    assert span.events[0].name == 'exception'
+
+
+@pytest.mark.asyncio
+async def test_spans_in_worker_threads_are_nested_in_calling_span(
+    tracer: OpenTelemetryTracer,
+    span_exporter: InMemorySpanExporter
+) -> None:
+    audio_download_worker_pool: AudioDownloadWorkerPool = AudioDownloadWorkerPool(
+        max_concurrency=1,
+        stage_timer=PrometheusStageTimer()
+    )
+
+    def run_in_worker_thread() -> None:
+        with tracer.trace_span('yt_dlp.download'):
+            pass
+
+    with tracer.trace_span('TestUseCase.run'):
+        await audio_download_worker_pool.run(AudioDownloadPriority.preview, run_in_worker_thread)
+    spans: dict[str, ReadableSpan] = get_finished_spans(tracer, span_exporter)
+    assert spans['yt_dlp.download'].parent.span_id == spans['TestUseCase.run'].context.span_id
+
+
+def test_disabled_tracer_returns_shared_no_op_span() -> None:
+    tracer: OpenTelemetryTracer = OpenTelemetryTracer(span_exporter=None, service_name='test-service')
+    assert not tracer.is_enabled
+    assert tracer.trace_span('TestUseCase.run') is tracer.trace_span('TestRepository.get')
+    with tracer.trace_span('TestUseCase.run') as span:
+        assert span is None
+    tracer.flush()
+    tracer.shut_down()
@@ -0,0 +1,59 @@
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+from opentelemetry.sdk.trace import ReadableSpan
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+from opentelemetry.trace import SpanKind, StatusCode
+
+from open_telemetry.open_telemetry_tracer import OpenTelemetryTracer
+from open_telemetry.open_telemetry_tracing_middleware import OpenTelemetryTracingMiddleware
+
+
+def create_test_client(tracer: OpenTelemetryTracer) -> TestClient:
+    app: FastAPI = FastAPI()
+    app.add_middleware(middleware_class=OpenTelemetryTracingMiddleware, tracer=tracer)
+
+    @app.get('/test/{item_id}')
+    async def get_item(item_id: str) -> dict[str, str]:
+        with tracer.trace_span('TestUseCase.get_item'):
+            if item_id == 'error':
+                raise HTTPException(status_code=503)
+            return {'id': item_id}
+
+    return TestClient(app)
+
+
+def test_requests_are_traced_by_route_template() -> None:
+    span_exporter: InMemorySpanExporter = InMemorySpanExporter()
+    tracer: OpenTelemetryTracer = OpenTelemetryTracer(span_exporter=span_exporter, service_name='test-service')
+    assert create_test_client(tracer).get('/test/a').status_code == 200
+    tracer.flush()
+    use_case_span: ReadableSpan
+    request_span: ReadableSpan
+    use_case_span, request_span = span_exporter.get_finished_spans()
+    assert request_span.name == 'GET /test/{item_id}'
+    assert request_span.kind == SpanKind.SERVER
+    assert request_span.attributes['http.route'] == '/test/{item_id}'
+    assert request_span.attributes['url.path'] == '/test/a'
+    assert request_span.attributes['http.response.status_code'] == 200
+    assert use_case_span.parent.span_id == request_span.context.span_id
+
+
+def test_trace_of_traceparent_header_is_continued() -> None:
+    span_exporter: InMemorySpanExporter = InMemorySpanExporter()
+    tracer: OpenTelemetryTracer = OpenTelemetryTracer(span_exporter=span_exporter, service_name='test-service')
+    test_trace_id: str = '4bf92f3577b34da6a3ce929d0e0e4736'
+    test_parent_span_id: str = '00f067aa0ba902b7'
+    create_test_client(tracer).get(
+        '/test/error',
+        headers={'traceparent': f'00-{test_trace_id}-{test_parent_span_id}-01'}
+    )
+    tracer.flush()
+    request_span: ReadableSpan = span_exporter.get_finished_spans()[-1]
+    assert request_span.context.trace_id == int(test_trace_id, 16)
+    assert request_span.parent.span_id == int(test_parent_span_id, 16)
+    assert request_span.status.status_code == StatusCode.ERROR
+
+
+def test_requests_are_not_traced_when_tracing_is_disabled() -> None:
+    tracer: OpenTelemetryTracer = OpenTelemetryTracer(span_exporter=None, service_name='test-service')
+    assert create_test_client(tracer).get('/test/a').json() == {'id': 'a'}
@@ -0,0 +1,31 @@
+import logging
+from logging import LogRecord
+
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+from opentelemetry.trace import format_trace_id, get_current_span
+
+from open_telemetry.open_telemetry_tracer import OpenTelemetryTracer
+from open_telemetry.trace_context_log_filter import TraceContextLogFilter
+
+
+def create_log_record() -> LogRecord:
+    return logging.makeLogRecord({'msg': 'Test message'})
+
+
+def test_trace_id_of_current_span_is_added_to_log_record() -> None:
+    tracer: OpenTelemetryTracer = OpenTelemetryTracer(
+        span_exporter=InMemorySpanExporter(),
+        service_name='test-service'
+    )
+    log_record: LogRecord = create_log_record()
+    with tracer.trace_span('TestUseCase.run'):
+        assert TraceContextLogFilter().filter(log_record)
+        assert log_record.trace_id == format_trace_id(get_current_span().get_span_context().trace_id)
+    tracer.shut_down()
+
+
+def test_placeholder_trace_id_is_added_to_log_record_outside_span() -> None:
+    log_record: LogRecord = create_log_record()
+    assert TraceContextLogFilter().filter(log_record)
+    assert log_record.trace_id == '-'
+    assert log_record.span_id == '-'
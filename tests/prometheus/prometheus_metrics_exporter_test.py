@@ -0,0 +1,63 @@
+import multiprocessing
+from multiprocessing.context import SpawnProcess
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from audio_nest.services.audio_download_worker_pool import AudioDownloadWorkerPool
+from audio_nest.use_cases.audio_evictor import AudioEvictor
+from audio_nest.use_cases.audio_getter import AudioGetter
+from memory.memory_cached_audio_sources_repository import MemoryCachedAudioSourcesRepository
+from prometheus.prometheus_metrics_exporter import PrometheusMetricsExporter
+from prometheus.prometheus_pipeline_collector import PrometheusPipelineCollector
+from youtube.youtube_audio_downloader import YoutubeAudioDownloader
+
+
+def _time_stage_in_worker() -> None:
+    from prometheus.prometheus_stage_timer import PrometheusStageTimer
+    stage_timer: PrometheusStageTimer = PrometheusStageTimer()
+    stage_timer.observe_stage_duration('test_worker_stage', 1.5)
+
+
+def test_single_process_metrics_are_exported(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv('PROMETHEUS_MULTIPROC_DIR', raising=False)
+    assert b'audio_nest_stage_duration_seconds' in PrometheusMetricsExporter().export_metrics()
+
+
+def test_metrics_of_all_workers_are_exported(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    monkeypatch.delenv('PROMETHEUS_MULTIPROC_DIR', raising=False)
+    PrometheusMetricsExporter.prepare_multiprocess_directory(tmp_path)
+    processes: list[SpawnProcess] = [
+        multiprocessing.get_context('spawn').Process(target=_time_stage_in_worker) for _ in range(3)
+    ]
+    process: SpawnProcess
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join(timeout=30)
+        assert process.exitcode == 0
+    metrics: str = PrometheusMetricsExporter().export_metrics().decode()
+    assert 'audio_nest_stage_duration_seconds_count{stage="test_worker_stage"} 3.0' in metrics
+    assert 'audio_nest_stage_duration_seconds_sum{stage="test_worker_stage"} 4.5' in metrics
+
+
+def test_collector_metrics_are_exported(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv('PROMETHEUS_MULTIPROC_DIR', raising=False)
+    audio_downloader_mock: MagicMock = MagicMock(spec=YoutubeAudioDownloader)
+    audio_downloader_mock.remuxed_audio_count = 1
+    audio_downloader_mock.transcoded_audio_count = 0
+    metrics_exporter: PrometheusMetricsExporter = PrometheusMetricsExporter(
+        collectors=[
+            PrometheusPipelineCollector(
+                audio_getter=MagicMock(spec=AudioGetter),
+                audio_downloader=audio_downloader_mock,
+                audio_download_worker_pool=MagicMock(spec=AudioDownloadWorkerPool),
+                audio_sources_repository=MagicMock(spec=MemoryCachedAudioSourcesRepository),
+                audio_evictor=MagicMock(spec=AudioEvictor)
+            )
+        ]
+    )
+    metrics: bytes = metrics_exporter.export_metrics()
+    assert b'audio_nest_downloaded_audio_total{processing_path="remux"} 1.0' in metrics
+    assert b'audio_nest_stage_duration_seconds' in metrics
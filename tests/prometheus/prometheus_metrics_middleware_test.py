@@ -0,0 +1,44 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from httpx import Response as HttpResponse
+from prometheus_client import REGISTRY
+
+from prometheus.prometheus_metrics_middleware import PrometheusMetricsMiddleware
+
+
+def get_sample_value(name: str, labels: dict[str, str]) -> float:
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+def create_test_client() -> TestClient:
+    app: FastAPI = FastAPI()
+    app.add_middleware(middleware_class=PrometheusMetricsMiddleware)
+
+    @app.get('/test/{item_id}')
+    async def get_item(item_id: str) -> dict[str, str]:
+        return {'id': item_id}
+
+    return TestClient(app)
+
+
+def test_requests_are_measured_by_route_template() -> None:
+    test_client: TestClient = create_test_client()
+    request_labels: dict[str, str] = {'method': 'GET', 'route': '/test/{item_id}', 'status': '200'}
+    bytes_labels: dict[str, str] = {'method': 'GET', 'route': '/test/{item_id}'}
+    request_count: float = get_sample_value('audio_nest_http_request_duration_seconds_count', request_labels)
+    response_body_bytes: float = get_sample_value('audio_nest_http_response_body_bytes_total', bytes_labels)
+    responses: list[HttpResponse] = [test_client.get(f'/test/{item_id}') for item_id in ('a', 'bb')]
+    assert get_sample_value('audio_nest_http_request_duration_seconds_count', request_labels) == request_count + 2
+    assert get_sample_value('audio_nest_http_response_body_bytes_total', bytes_labels) == response_body_bytes + sum(
+        len(response.content) for response in responses
+    )
+    assert get_sample_value('audio_nest_http_requests_in_progress', {'method': 'GET'}) == 0
+
+
+def test_unmatched_requests_share_one_route_label() -> None:
+    test_client: TestClient = create_test_client()
+    request_labels: dict[str, str] = {'method': 'GET', 'route': 'unmatched', 'status': '404'}
+    request_count: float = get_sample_value('audio_nest_http_request_duration_seconds_count', request_labels)
+    assert test_client.get('/missing/a').status_code == 404
+    assert test_client.get('/missing/b').status_code == 404
+    assert get_sample_value('audio_nest_http_request_duration_seconds_count', request_labels) == request_count + 2
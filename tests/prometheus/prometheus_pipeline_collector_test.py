@@ -0,0 +1,96 @@
+from unittest.mock import MagicMock
+
+from prometheus_client import CollectorRegistry
+
+from audio_nest.services.audio_download_worker_pool import AudioDownloadWorkerPool
+from audio_nest.use_cases.audio_evictor import AudioEvictor
+from audio_nest.use_cases.audio_getter import AudioGetter
+from memory.memory_cached_audio_sources_repository import MemoryCachedAudioSourcesRepository
+from prometheus.prometheus_pipeline_collector import PrometheusPipelineCollector
+from youtube.youtube_audio_downloader import YoutubeAudioDownloader
+
+
+def create_audio_getter_mock() -> MagicMock:
+    audio_getter_mock: MagicMock = MagicMock(spec=AudioGetter)
+    audio_getter_mock.started_audio_downloads_count = 4
+    audio_getter_mock.coalesced_audio_downloads_count = 6
+    audio_getter_mock.in_flight_audio_downloads_count = 1
+    return audio_getter_mock
+
+
+def create_audio_downloader_mock() -> MagicMock:
+    audio_downloader_mock: MagicMock = MagicMock(spec=YoutubeAudioDownloader)
+    audio_downloader_mock.remuxed_audio_count = 3
+    audio_downloader_mock.transcoded_audio_count = 2
+    return audio_downloader_mock
+
+
+def create_audio_download_worker_pool_mock() -> MagicMock:
+    audio_download_worker_pool_mock: MagicMock = MagicMock(spec=AudioDownloadWorkerPool)
+    audio_download_worker_pool_mock.active_count = 2
+    audio_download_worker_pool_mock.max_concurrency = 2
+    audio_download_worker_pool_mock.queue_depth = 5
+    return audio_download_worker_pool_mock
+
+
+def create_audio_sources_repository_mock() -> MagicMock:
+    audio_sources_repository_mock: MagicMock = MagicMock(spec=MemoryCachedAudioSourcesRepository)
+    audio_sources_repository_mock.hits_count = 7
+    audio_sources_repository_mock.stale_hits_count = 2
+    audio_sources_repository_mock.misses_count = 3
+    audio_sources_repository_mock.coalesced_misses_count = 1
+    audio_sources_repository_mock.entries_count = 4
+    return audio_sources_repository_mock
+
+
+def create_audio_evictor_mock() -> MagicMock:
+    audio_evictor_mock: MagicMock = MagicMock(spec=AudioEvictor)
+    audio_evictor_mock.evicted_audio_count = 6
+    audio_evictor_mock.reclaimed_bytes = 600
+    audio_evictor_mock.last_run_reclaimed_bytes = 200
+    return audio_evictor_mock
+
+
+def test_pipeline_counters_are_collected() -> None:
+    registry: CollectorRegistry = CollectorRegistry()
+    registry.register(PrometheusPipelineCollector(
+        audio_getter=create_audio_getter_mock(),
+        audio_downloader=create_audio_downloader_mock(),
+        audio_download_worker_pool=create_audio_download_worker_pool_mock(),
+        audio_sources_repository=create_audio_sources_repository_mock(),
+        audio_evictor=create_audio_evictor_mock()
+    ))
+    assert registry.get_sample_value('audio_nest_downloaded_audio_total', {'processing_path': 'remux'}) == 3
+    assert registry.get_sample_value('audio_nest_downloaded_audio_total', {'processing_path': 'transcode'}) == 2
+    assert registry.get_sample_value('audio_nest_audio_downloads_total', {'outcome': 'started'}) == 4
+    assert registry.get_sample_value('audio_nest_audio_downloads_total', {'outcome': 'coalesced'}) == 6
+    assert registry.get_sample_value('audio_nest_audio_downloads_in_flight') == 1
+    assert registry.get_sample_value('audio_nest_audio_download_workers', {'state': 'active'}) == 2
+    assert registry.get_sample_value('audio_nest_audio_download_queue_depth') == 5
+    assert registry.get_sample_value('audio_nest_audio_sources_cache_lookups_total', {'result': 'hit'}) == 7
+    assert registry.get_sample_value('audio_nest_audio_sources_cache_lookups_total', {'result': 'stale_hit'}) == 2
+    assert registry.get_sample_value('audio_nest_audio_sources_cache_lookups_total', {'result': 'miss'}) == 3
+    assert registry.get_sample_value('audio_nest_audio_sources_cache_coalesced_fetches_total') == 1
+    assert registry.get_sample_value('audio_nest_audio_sources_cache_entries') == 4
+    assert registry.get_sample_value('audio_nest_evicted_audio_total') == 6
+    assert registry.get_sample_value('audio_nest_audio_eviction_reclaimed_bytes_total') == 600
+    assert registry.get_sample_value('audio_nest_audio_eviction_last_run_reclaimed_bytes') == 200
+
+
+def test_pipeline_counters_are_labelled_by_worker_in_multiprocess_mode() -> None:
+    registry: CollectorRegistry = CollectorRegistry()
+    registry.register(
+        PrometheusPipelineCollector(
+            audio_getter=create_audio_getter_mock(),
+            audio_downloader=create_audio_downloader_mock(),
+            audio_download_worker_pool=create_audio_download_worker_pool_mock(),
+            audio_sources_repository=create_audio_sources_repository_mock(),
+            audio_evictor=create_audio_evictor_mock(),
+            is_multiprocess=True
+        )
+    )
+    assert len({
+        sample.labels['worker']
+        for metric in registry.collect()
+        for sample in metric.samples
+    }) == 1
@@ -0,0 +1,36 @@
+import pytest
+from prometheus_client import REGISTRY
+
+from prometheus.prometheus_stage_timer import PrometheusStageTimer
+
+
+def get_sample_value(name: str, stage: str) -> float:
+    return REGISTRY.get_sample_value(name, {'stage': stage}) or 0.0
+
+
+@pytest.fixture(scope='function')
+def prometheus_stage_timer() -> PrometheusStageTimer:
+    return PrometheusStageTimer()
+
+
+def test_stage_is_timed_and_tracked_in_progress(prometheus_stage_timer: PrometheusStageTimer) -> None:
+    stage_count: float = get_sample_value('audio_nest_stage_duration_seconds_count', 'test_stage')
+    with prometheus_stage_timer.time_stage('test_stage'):
+        assert get_sample_value('audio_nest_stages_in_progress', 'test_stage') == 1
+    assert get_sample_value('audio_nest_stages_in_progress', 'test_stage') == 0
+    assert get_sample_value('audio_nest_stage_duration_seconds_count', 'test_stage') == stage_count + 1
+
+
+def test_failed_stage_is_timed(prometheus_stage_timer: PrometheusStageTimer) -> None:
+    stage_count: float = get_sample_value('audio_nest_stage_duration_seconds_count', 'test_failed_stage')
+    with pytest.raises(RuntimeError):
+        with prometheus_stage_timer.time_stage('test_failed_stage'):
+            raise RuntimeError()
+    assert get_sample_value('audio_nest_stages_in_progress', 'test_failed_stage') == 0
+    assert get_sample_value('audio_nest_stage_duration_seconds_count', 'test_failed_stage') == stage_count + 1
+
+
+def test_stage_duration_is_observed(prometheus_stage_timer: PrometheusStageTimer) -> None:
+    stage_sum: float = get_sample_value('audio_nest_stage_duration_seconds_sum', 'test_observed_stage')
+    prometheus_stage_timer.observe_stage_duration('test_observed_stage', 0.25)
+    assert get_sample_value('audio_nest_stage_duration_seconds_sum', 'test_observed_stage') == stage_sum + 0.25
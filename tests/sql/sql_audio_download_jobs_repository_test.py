@@ -0,0 +1,112 @@
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import AsyncGenerator
+from unittest.mock import MagicMock
+
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from audio_nest.domain.audio_download_job import AudioDownloadJob
+from audio_nest.domain.audio_download_progress import AudioDownloadProgress
+from audio_nest.domain.audio_download_status import AudioDownloadStatus
+from audio_nest.services.i_tracer import ITracer
+from sql.sql_audio_download_jobs_repository import SqlAudioDownloadJobsRepository
+from sql.sql_session_maker_handler import handle_sql_session_maker
+
+
+@pytest.fixture(scope='function')
+def tracer_mock() -> MagicMock:
+    return MagicMock(spec=ITracer)
+
+
+@pytest_asyncio.fixture(scope='function')
+async def sql_session_maker(tmp_path: Path) -> AsyncGenerator[async_sessionmaker[AsyncSession], None]:
+    session_makers: AsyncGenerator[async_sessionmaker[AsyncSession], None] = handle_sql_session_maker(
+        tmp_path.joinpath('test.db')
+    )
+    yield await anext(session_makers)
+    await anext(session_makers, None)
+
+
+@pytest.mark.asyncio
+async def test_audio_download_job_is_added_and_updated(
+    sql_session_maker: async_sessionmaker[AsyncSession],
+    tracer_mock: MagicMock
+) -> None:
+    sql_audio_download_jobs_repository: SqlAudioDownloadJobsRepository = SqlAudioDownloadJobsRepository(
+        sql_session_maker=sql_session_maker,
+        max_jobs=10,
+        tracer=tracer_mock
+    )
+    test_audio_download_job: AudioDownloadJob = AudioDownloadJob('test_source_id')
+    await sql_audio_download_jobs_repository.add_audio_download_job(test_audio_download_job)
+    assert (
+        await sql_audio_download_jobs_repository.get_audio_download_job(test_audio_download_job.id)
+    ) == test_audio_download_job
+    test_audio_download_job.progress = AudioDownloadProgress(
+        status=AudioDownloadStatus.done,
+        downloaded_bytes=100,
+        total_bytes=100
+    )
+    await sql_audio_download_jobs_repository.update_audio_download_job(test_audio_download_job)
+    assert (
+        await sql_audio_download_jobs_repository.get_audio_download_job(test_audio_download_job.id)
+    ) == test_audio_download_job
+
+
+@pytest.mark.asyncio
+async def test_oldest_audio_download_jobs_are_removed_over_max_jobs(
+    sql_session_maker: async_sessionmaker[AsyncSession],
+    tracer_mock: MagicMock
+) -> None:
+    sql_audio_download_jobs_repository: SqlAudioDownloadJobsRepository = SqlAudioDownloadJobsRepository(
+        sql_session_maker=sql_session_maker,
+        max_jobs=2,
+        tracer=tracer_mock
+    )
+    test_audio_download_jobs: list[AudioDownloadJob] = [AudioDownloadJob(f'test_source_id_{i}') for i in range(3)]
+    test_audio_download_job: AudioDownloadJob
+    for test_audio_download_job in test_audio_download_jobs:
+        await sql_audio_download_jobs_repository.add_audio_download_job(test_audio_download_job)
+    assert [
+        await sql_audio_download_jobs_repository.get_audio_download_job(test_audio_download_job.id)
+        for test_audio_download_job in test_audio_download_jobs
+    ] == [None, *test_audio_download_jobs[1:]]
+
+
+@pytest.mark.asyncio
+async def test_only_audio_download_jobs_in_progress_not_updated_since_given_time_are_failed(
+    sql_session_maker: async_sessionmaker[AsyncSession],
+    tracer_mock: MagicMock
+) -> None:
+    sql_audio_download_jobs_repository: SqlAudioDownloadJobsRepository = SqlAudioDownloadJobsRepository(
+        sql_session_maker=sql_session_maker,
+        max_jobs=10,
+        tracer=tracer_mock
+    )
+    test_stale_audio_download_job: AudioDownloadJob = AudioDownloadJob('test_source_id_0')
+    test_done_audio_download_job: AudioDownloadJob = AudioDownloadJob(
+        source_id='test_source_id_1',
+        progress=AudioDownloadProgress(status=AudioDownloadStatus.done, downloaded_bytes=100, total_bytes=100)
+    )
+    await sql_audio_download_jobs_repository.add_audio_download_job(test_stale_audio_download_job)
+    await sql_audio_download_jobs_repository.add_audio_download_job(test_done_audio_download_job)
+    updated_before: datetime = datetime.now(timezone.utc)
+    test_running_audio_download_job: AudioDownloadJob = AudioDownloadJob('test_source_id_2')
+    await sql_audio_download_jobs_repository.add_audio_download_job(test_running_audio_download_job)
+    assert await sql_audio_download_jobs_repository.fail_stale_audio_download_jobs(
+        updated_before=updated_before,
+        error='test_error'
+    ) == 1
+    stale_audio_download_job: AudioDownloadJob | None = (
+        await sql_audio_download_jobs_repository.get_audio_download_job(test_stale_audio_download_job.id)
+    )
+    assert stale_audio_download_job.progress.status == AudioDownloadStatus.failed
+    assert stale_audio_download_job.error == 'test_error'
+    assert (
+        await sql_audio_download_jobs_repository.get_audio_download_job(test_done_audio_download_job.id)
+    ) == test_done_audio_download_job
+    assert (
+        await sql_audio_download_jobs_repository.get_audio_download_job(test_running_audio_download_job.id)
+    ) == test_running_audio_download_job
@@ -0,0 +1,76 @@
+from pathlib import Path
+from typing import AsyncGenerator
+from unittest.mock import MagicMock
+
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from audio_nest.domain.audio import Audio
+from audio_nest.domain.audio_codec import AudioCodec
+from audio_nest.domain.audio_quality import AudioQuality
+from audio_nest.domain.audio_rendition import AudioRendition
+from audio_nest.services.i_tracer import ITracer
+from sql.sql_audio_rendition_repository import SqlAudioRenditionRepository
+from sql.sql_audio_repository import SqlAudioRepository
+from sql.sql_session_maker_handler import handle_sql_session_maker
+
+
+@pytest.fixture(scope='function')
+def tracer_mock() -> MagicMock:
+    return MagicMock(spec=ITracer)
+
+
+@pytest_asyncio.fixture(scope='function')
+async def sql_session_maker(tmp_path: Path) -> AsyncGenerator[async_sessionmaker[AsyncSession], None]:
+    session_makers: AsyncGenerator[async_sessionmaker[AsyncSession], None] = handle_sql_session_maker(
+        tmp_path.joinpath('test.db')
+    )
+    yield await anext(session_makers)
+    await anext(session_makers, None)
+
+
+@pytest.mark.asyncio
+async def test_audio_renditions_are_stored_per_quality_and_counted_in_total_size(
+    sql_session_maker: async_sessionmaker[AsyncSession],
+    tracer_mock: MagicMock,
+    tmp_path: Path
+) -> None:
+    sql_audio_repository: SqlAudioRepository = SqlAudioRepository(sql_session_maker, tracer_mock)
+    sql_audio_rendition_repository: SqlAudioRenditionRepository = SqlAudioRenditionRepository(
+        sql_session_maker,
+        tracer_mock
+    )
+    test_audio: Audio = Audio(
+        source_id='test_source_id',
+        file_path=tmp_path.joinpath('test_source_id.ogg'),
+        bit_rate_kbps=320,
+        codec=AudioCodec.vorbis
+    )
+    test_audio.file_path.write_bytes(b'0' * 100)
+    await sql_audio_repository.add_audio(test_audio)
+    test_audio_renditions: list[AudioRendition] = [
+        AudioRendition(
+            source_id='test_source_id',
+            file_path=tmp_path.joinpath(f'test_source_id.{quality}.opus'),
+            bit_rate_kbps=bit_rate_kbps,
+            codec=AudioCodec.opus,
+            quality=quality
+        )
+        for quality, bit_rate_kbps in ((AudioQuality.low, 64), (AudioQuality.medium, 128))
+    ]
+    audio_rendition: AudioRendition
+    for audio_rendition in test_audio_renditions:
+        audio_rendition.file_path.write_bytes(b'0' * audio_rendition.bit_rate_kbps)
+        await sql_audio_rendition_repository.add_audio_rendition(audio_rendition)
+    assert await sql_audio_rendition_repository.get_audio_rendition(
+        source_id='test_source_id',
+        quality=AudioQuality.low
+    ) == test_audio_renditions[0]
+    assert await sql_audio_repository.get_total_audio_size_bytes() == 100 + 64 + 128
+    assert await sql_audio_rendition_repository.delete_audio_renditions('test_source_id') == test_audio_renditions
+    assert await sql_audio_rendition_repository.get_audio_rendition(
+        source_id='test_source_id',
+        quality=AudioQuality.medium
+    ) is None
+    assert await sql_audio_repository.get_total_audio_size_bytes() == 100
@@ -0,0 +1,101 @@
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import AsyncGenerator
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from audio_nest.domain.audio import Audio
+from audio_nest.domain.audio_codec import AudioCodec
+from audio_nest.domain.stored_audio import StoredAudio
+from audio_nest.domain.user_audio import UserAudio
+from audio_nest.services.i_tracer import ITracer
+from sql.sql_audio_repository import SqlAudioRepository
+from sql.sql_session_maker_handler import handle_sql_session_maker
+from sql.sql_user_audio_repository import SqlUserAudioRepository
+
+
+@pytest.fixture(scope='function')
+def tracer_mock() -> MagicMock:
+    return MagicMock(spec=ITracer)
+
+
+@pytest_asyncio.fixture(scope='function')
+async def sql_session_maker(tmp_path: Path) -> AsyncGenerator[async_sessionmaker[AsyncSession], None]:
+    session_makers: AsyncGenerator[async_sessionmaker[AsyncSession], None] = handle_sql_session_maker(
+        tmp_path.joinpath('test.db')
+    )
+    yield await anext(session_makers)
+    await anext(session_makers, None)
+
+
+@pytest.mark.asyncio
+async def test_only_unreferenced_audio_is_evictable_in_access_order(
+    sql_session_maker: async_sessionmaker[AsyncSession],
+    tracer_mock: MagicMock,
+    tmp_path: Path
+) -> None:
+    sql_audio_repository: SqlAudioRepository = SqlAudioRepository(sql_session_maker, tracer_mock)
+    sql_user_audio_repository: SqlUserAudioRepository = SqlUserAudioRepository(sql_session_maker, tracer_mock)
+    test_audio_list: list[Audio] = [
+        Audio(
+            source_id=f'test_source_id_{i}',
+            file_path=tmp_path.joinpath(f'test_audio_{i}.ogg'),
+            bit_rate_kbps=320,
+            codec=AudioCodec.vorbis
+        )
+        for i in range(3)
+    ]
+    audio: Audio
+    for audio in test_audio_list:
+        audio.file_path.write_bytes(b'0' * 10)
+        await sql_audio_repository.add_audio(audio)
+    await sql_user_audio_repository.add_user_audio(
+        UserAudio(**test_audio_list[1].__dict__, user_id=uuid4(), audio_name='Test Audio')
+    )
+    result: list[StoredAudio] = await sql_audio_repository.get_least_recently_used_unreferenced_audio(limit=10)
+    assert await sql_audio_repository.get_total_audio_size_bytes() == 30
+    assert [stored_audio.audio for stored_audio in result] == [test_audio_list[0], test_audio_list[2]]
+    assert [stored_audio.size_bytes for stored_audio in result] == [10, 10]
+    assert not await sql_audio_repository.delete_unreferenced_audio(test_audio_list[1].source_id)
+    assert await sql_audio_repository.delete_unreferenced_audio(test_audio_list[0].source_id)
+    assert await sql_audio_repository.get_audio_from_source(test_audio_list[0].source_id) is None
+    assert await sql_audio_repository.get_total_audio_size_bytes() == 20
+
+
+@pytest.mark.asyncio
+async def test_audio_is_orphaned_when_last_user_audio_is_deleted(
+    sql_session_maker: async_sessionmaker[AsyncSession],
+    tracer_mock: MagicMock
+) -> None:
+    sql_audio_repository: SqlAudioRepository = SqlAudioRepository(sql_session_maker, tracer_mock)
+    sql_user_audio_repository: SqlUserAudioRepository = SqlUserAudioRepository(sql_session_maker, tracer_mock)
+    test_user_audio_list: list[UserAudio] = [
+        UserAudio(
+            source_id='test_source_id',
+            file_path=Path('./test_audio.ogg'),
+            bit_rate_kbps=320,
+            codec=AudioCodec.vorbis,
+            user_id=uuid4(),
+            audio_name='Test Audio'
+        )
+        for _ in range(2)
+    ]
+    user_audio: UserAudio
+    for user_audio in test_user_audio_list:
+        await sql_user_audio_repository.add_user_audio(user_audio)
+    orphaned_before: datetime = datetime.now(timezone.utc) + timedelta(minutes=1)
+    await sql_user_audio_repository.delete_user_audio(test_user_audio_list[0].id)
+    assert await sql_audio_repository.get_orphaned_audio(orphaned_before=orphaned_before, limit=10) == []
+    await sql_user_audio_repository.delete_user_audio(test_user_audio_list[1].id)
+    result: list[StoredAudio] = await sql_audio_repository.get_orphaned_audio(orphaned_before=orphaned_before, limit=10)
+    assert [stored_audio.audio.source_id for stored_audio in result] == ['test_source_id']
+    assert await sql_audio_repository.get_orphaned_audio(
+        orphaned_before=orphaned_before - timedelta(minutes=2),
+        limit=10
+    ) == []
+    await sql_user_audio_repository.add_user_audio(test_user_audio_list[0])
+    assert await sql_audio_repository.get_orphaned_audio(orphaned_before=orphaned_before, limit=10) == []
@@ -0,0 +1,76 @@
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import AsyncGenerator
+from unittest.mock import MagicMock
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from audio_nest.services.i_tracer import ITracer
+from sql.sql_revoked_tokens_repository import SqlRevokedTokensRepository
+from sql.sql_session_maker_handler import handle_sql_session_maker
+
+
+@pytest.fixture(scope='function')
+def tracer_mock() -> MagicMock:
+    return MagicMock(spec=ITracer)
+
+
+@pytest_asyncio.fixture(scope='function')
+async def sql_session_maker(tmp_path: Path) -> AsyncGenerator[async_sessionmaker[AsyncSession], None]:
+    session_makers: AsyncGenerator[async_sessionmaker[AsyncSession], None] = handle_sql_session_maker(
+        tmp_path.joinpath('test.db')
+    )
+    yield await anext(session_makers)
+    await anext(session_makers, None)
+
+
+@pytest.mark.asyncio
+async def test_token_revoked_by_one_worker_is_revoked_for_every_worker(
+    sql_session_maker: async_sessionmaker[AsyncSession],
+    tracer_mock: MagicMock,
+    tmp_path: Path
+) -> None:
+    other_session_makers: AsyncGenerator[async_sessionmaker[AsyncSession], None] = handle_sql_session_maker(
+        tmp_path.joinpath('test.db')
+    )
+    sql_revoked_tokens_repository: SqlRevokedTokensRepository = SqlRevokedTokensRepository(
+        sql_session_maker,
+        tracer_mock
+    )
+    other_sql_revoked_tokens_repository: SqlRevokedTokensRepository = SqlRevokedTokensRepository(
+        await anext(other_session_makers),
+        tracer_mock
+    )
+    expiration_time: datetime = datetime.now(timezone.utc) + timedelta(days=1)
+    assert not await other_sql_revoked_tokens_repository.is_token_revoked('test_token_id')
+    assert await sql_revoked_tokens_repository.revoke_token_if_not_revoked('test_token_id', expiration_time)
+    assert await other_sql_revoked_tokens_repository.is_token_revoked('test_token_id')
+    assert not await other_sql_revoked_tokens_repository.revoke_token_if_not_revoked('test_token_id', expiration_time)
+    await anext(other_session_makers, None)
+
+
+@pytest.mark.asyncio
+async def test_expired_tokens_are_removed_on_revocation(
+    sql_session_maker: async_sessionmaker[AsyncSession],
+    tracer_mock: MagicMock
+) -> None:
+    sql_revoked_tokens_repository: SqlRevokedTokensRepository = SqlRevokedTokensRepository(
+        sql_session_maker,
+        tracer_mock
+    )
+    await sql_revoked_tokens_repository.revoke_token(
+        token_id='expired_test_token_id',
+        expiration_time=datetime.now(timezone.utc) - timedelta(seconds=1)
+    )
+    await sql_revoked_tokens_repository.revoke_token(
+        token_id='test_token_id',
+        expiration_time=datetime.now(timezone.utc) + timedelta(days=1)
+    )
+    session: AsyncSession
+    async with sql_session_maker() as session:
+        assert (await session.execute(text('SELECT token_id FROM revoked_tokens'))).scalars().all() == [
+            'test_token_id'
+        ]
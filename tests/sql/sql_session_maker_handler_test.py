@@ -0,0 +1,146 @@
+import logging
+import sqlite3
+from pathlib import Path
+from typing import AsyncGenerator
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from audio_nest.services.i_stage_timer import IStageTimer
+from sql.sql_session_maker_handler import handle_sql_session_maker
+
+
+@pytest.mark.asyncio
+async def test_sqlite_pragmas_are_applied_on_every_connection(tmp_path: Path) -> None:
+    session_makers: AsyncGenerator[async_sessionmaker[AsyncSession], None] = handle_sql_session_maker(
+        database_path=tmp_path.joinpath('test.db'),
+        busy_timeout_ms=1234,
+        cache_size_kib=4096,
+        mmap_size_bytes=1048576
+    )
+    session_maker: async_sessionmaker[AsyncSession] = await anext(session_makers)
+    session: AsyncSession
+    async with session_maker() as session:
+        assert (await session.execute(text('PRAGMA journal_mode'))).scalar() == 'wal'
+        assert (await session.execute(text('PRAGMA synchronous'))).scalar() == 1
+        assert (await session.execute(text('PRAGMA busy_timeout'))).scalar() == 1234
+        assert (await session.execute(text('PRAGMA cache_size'))).scalar() == -4096
+        assert (await session.execute(text('PRAGMA mmap_size'))).scalar() == 1048576
+    await anext(session_makers, None)
+
+
+@pytest.mark.asyncio
+async def test_missing_columns_and_indexes_are_added_to_existing_tables(tmp_path: Path) -> None:
+    test_database_path: Path = tmp_path.joinpath('test.db')
+    connection: sqlite3.Connection
+    with sqlite3.connect(test_database_path) as connection:
+        connection.execute(
+            'CREATE TABLE audio ('
+            'source_id VARCHAR PRIMARY KEY, file_path VARCHAR NOT NULL, bit_rate_kbps INTEGER NOT NULL, '
+            'codec VARCHAR NOT NULL)'
+        )
+        connection.execute("INSERT INTO audio VALUES ('test_source_id', './test_audio.ogg', 320, 'vorbis')")
+    session_makers: AsyncGenerator[async_sessionmaker[AsyncSession], None] = handle_sql_session_maker(
+        test_database_path
+    )
+    session_maker: async_sessionmaker[AsyncSession] = await anext(session_makers)
+    session: AsyncSession
+    async with session_maker() as session:
+        assert (await session.execute(text('SELECT size_bytes, accessed_at FROM audio'))).one() == (0, None)
+        assert (await session.execute(text('PRAGMA index_info(ix_audio_accessed_at)'))).first() is not None
+    await anext(session_makers, None)
+
+
+@pytest.mark.asyncio
+async def test_file_sizes_are_backfilled_when_size_column_is_added(tmp_path: Path) -> None:
+    test_database_path: Path = tmp_path.joinpath('test.db')
+    test_audio_file_path: Path = tmp_path.joinpath('test_audio.ogg')
+    test_audio_file_path.write_bytes(b'0' * 100)
+    connection: sqlite3.Connection
+    with sqlite3.connect(test_database_path) as connection:
+        connection.execute(
+            'CREATE TABLE audio ('
+            'source_id VARCHAR PRIMARY KEY, file_path VARCHAR NOT NULL, bit_rate_kbps INTEGER NOT NULL, '
+            'codec VARCHAR NOT NULL)'
+        )
+        connection.executemany(
+            'INSERT INTO audio VALUES (?, ?, 320, \'vorbis\')',
+            [
+                ('test_source_id', str(test_audio_file_path)),
+                ('missing_test_source_id', str(tmp_path.joinpath('missing_test_audio.ogg')))
+            ]
+        )
+    session_makers: AsyncGenerator[async_sessionmaker[AsyncSession], None] = handle_sql_session_maker(
+        test_database_path
+    )
+    session_maker: async_sessionmaker[AsyncSession] = await anext(session_makers)
+    session: AsyncSession
+    async with session_maker() as session:
+        assert (await session.execute(text('SELECT source_id, size_bytes FROM audio ORDER BY source_id'))).all() == [
+            ('missing_test_source_id', 0),
+            ('test_source_id', 100)
+        ]
+    await anext(session_makers, None)
+
+
+@pytest.mark.asyncio
+async def test_duplicate_rows_are_deleted_keeping_the_oldest_before_unique_indexes_are_added(
+    tmp_path: Path,
+    caplog: pytest.LogCaptureFixture
+) -> None:
+    test_database_path: Path = tmp_path.joinpath('test.db')
+    connection: sqlite3.Connection
+    with sqlite3.connect(test_database_path) as connection:
+        connection.execute(
+            'CREATE TABLE user_audio ('
+            'id VARCHAR PRIMARY KEY, user_id VARCHAR NOT NULL, audio_name VARCHAR NOT NULL, source_id VARCHAR NOT NULL)'
+        )
+        connection.executemany(
+            'INSERT INTO user_audio VALUES (?, ?, ?, ?)',
+            [
+                ('test_id_3', 'test_user_id', 'Oldest', 'test_source_id'),
+                ('test_id_1', 'test_user_id', 'Newer', 'test_source_id'),
+                ('test_id_2', 'test_user_id', 'Other', 'other_test_source_id'),
+                ('test_id_4', 'other_test_user_id', 'Other user', 'test_source_id')
+            ]
+        )
+    session_makers: AsyncGenerator[async_sessionmaker[AsyncSession], None] = handle_sql_session_maker(
+        test_database_path
+    )
+    session_maker: async_sessionmaker[AsyncSession] = await anext(session_makers)
+    session: AsyncSession
+    async with session_maker() as session:
+        assert (await session.execute(text('SELECT id FROM user_audio ORDER BY id'))).scalars().all() == [
+            'test_id_2',
+            'test_id_3',
+            'test_id_4'
+        ]
+        assert (await session.execute(text('PRAGMA index_info(ix_user_audio_user_id_source_id)'))).first() is not None
+    await anext(session_makers, None)
+    assert [
+        record.getMessage() for record in caplog.records
+        if record.levelno == logging.WARNING and record.name == 'sql.sql_session_maker_handler'
+    ] == ['Deleted 1 duplicate row(s) from table \'user_audio\' for index \'ix_user_audio_user_id_source_id\'']
+
+
+@pytest.mark.asyncio
+async def test_sql_statement_durations_are_observed_by_statement_type(tmp_path: Path) -> None:
+    stage_timer_mock: MagicMock = MagicMock(spec=IStageTimer)
+    session_makers: AsyncGenerator[async_sessionmaker[AsyncSession], None] = handle_sql_session_maker(
+        database_path=tmp_path.joinpath('test.db'),
+        stage_timer=stage_timer_mock
+    )
+    session_maker: async_sessionmaker[AsyncSession] = await anext(session_makers)
+    stage_timer_mock.reset_mock()
+    session: AsyncSession
+    async with session_maker() as session:
+        await session.execute(text('SELECT 1'))
+        await session.execute(text('  update audio SET size_bytes = 0'))
+    assert [call.kwargs['stage'] for call in stage_timer_mock.observe_stage_duration.call_args_list] == [
+        'sql_select',
+        'sql_update'
+    ]
+    assert all(call.kwargs['duration_seconds'] >= 0 for call in stage_timer_mock.observe_stage_duration.call_args_list)
+    await anext(session_makers, None)
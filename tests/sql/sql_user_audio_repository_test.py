@@ -0,0 +1,92 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import AsyncGenerator
+from unittest.mock import MagicMock
+from uuid import UUID, uuid4
+
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from audio_nest.domain.audio_codec import AudioCodec
+from audio_nest.domain.user_audio import UserAudio
+from audio_nest.services.i_tracer import ITracer
+from sql.sql_session_maker_handler import handle_sql_session_maker
+from sql.sql_user_audio_repository import SqlUserAudioRepository
+
+
+@pytest.fixture(scope='function')
+def tracer_mock() -> MagicMock:
+    return MagicMock(spec=ITracer)
+
+
+@pytest_asyncio.fixture(scope='function')
+async def sql_user_audio_repository(
+    tracer_mock: MagicMock,
+    tmp_path: Path
+) -> AsyncGenerator[SqlUserAudioRepository, None]:
+    session_makers: AsyncGenerator[async_sessionmaker[AsyncSession], None] = handle_sql_session_maker(
+        tmp_path.joinpath('test.db')
+    )
+    yield SqlUserAudioRepository(await anext(session_makers), tracer_mock)
+    await anext(session_makers, None)
+
+
+@pytest.mark.asyncio
+async def test_user_audio_list_is_paginated_by_creation_time(sql_user_audio_repository: SqlUserAudioRepository) -> None:
+    test_user_id: UUID = uuid4()
+    test_created_at: datetime = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    test_user_audio_list: list[UserAudio] = [
+        UserAudio(
+            source_id=f'test_source_id_{i}',
+            file_path=Path(f'./test_audio_{i}.ogg'),
+            bit_rate_kbps=320,
+            codec=AudioCodec.vorbis,
+            user_id=test_user_id,
+            audio_name=f'Test Audio {i}',
+            created_at=test_created_at + timedelta(seconds=i % 3)
+        )
+        for i in range(5)
+    ]
+    user_audio: UserAudio
+    for user_audio in test_user_audio_list:
+        await sql_user_audio_repository.add_user_audio(user_audio)
+    test_user_audio_list.sort(key=lambda user_audio: (user_audio.created_at, str(user_audio.id)))
+    first_page: list[UserAudio] = await sql_user_audio_repository.get_user_audio_list(user_id=test_user_id, limit=3)
+    second_page: list[UserAudio] = await sql_user_audio_repository.get_user_audio_list(
+        user_id=test_user_id,
+        limit=3,
+        after_created_at=first_page[-1].created_at,
+        after_id=first_page[-1].id
+    )
+    assert first_page == test_user_audio_list[:3]
+    assert second_page == test_user_audio_list[3:]
+    assert [user_audio.created_at for user_audio in first_page + second_page] == [
+        user_audio.created_at for user_audio in test_user_audio_list
+    ]
+    assert await sql_user_audio_repository.get_user_audio_list(uuid4()) == []
+
+
+@pytest.mark.asyncio
+async def test_user_audio_from_same_source_is_added_once_per_user(
+    sql_user_audio_repository: SqlUserAudioRepository
+) -> None:
+    test_user_audio_list: list[UserAudio] = [
+        UserAudio(
+            source_id='test_source_id',
+            file_path=Path('./test_audio.ogg'),
+            bit_rate_kbps=320,
+            codec=AudioCodec.vorbis,
+            user_id=user_id,
+            audio_name='Test Audio'
+        )
+        for user_id in [uuid4(), uuid4()]
+    ]
+    results: list[bool] = await asyncio.gather(
+        *(sql_user_audio_repository.add_user_audio(user_audio) for user_audio in test_user_audio_list * 2)
+    )
+    assert sorted(results) == [False, False, True, True]
+    user_audio: UserAudio
+    for user_audio in test_user_audio_list:
+        assert await sql_user_audio_repository.get_user_audio_list(user_audio.user_id) == [user_audio]
@@ -0,0 +1,111 @@
+import asyncio
+import multiprocessing
+import os
+import time
+from multiprocessing.context import SpawnProcess
+from pathlib import Path
+
+import pytest
+
+from storage.file_audio_download_lock import FileAudioDownloadLock
+
+
+def _download_audio_with_lock(directory_path: Path, source_id: str) -> None:
+    asyncio.run(_download_audio_with_lock_async(directory_path=directory_path, source_id=source_id))
+
+
+async def _download_audio_with_lock_async(directory_path: Path, source_id: str) -> None:
+    file_audio_download_lock: FileAudioDownloadLock = FileAudioDownloadLock(
+        directory_path=directory_path,
+        lease_seconds=60,
+        poll_interval_seconds=0.01
+    )
+    await file_audio_download_lock.acquire(source_id)
+    try:
+        with directory_path.joinpath('holders.log').open('a') as holders_log:
+            holders_log.write(f'acquired {os.getpid()}\n')
+        audio_file_path: Path = directory_path.joinpath(f'{source_id}.ogg')
+        if not audio_file_path.is_file():
+            staging_file_path: Path = directory_path.joinpath(f'{source_id}.{os.getpid()}.ogg')
+            staging_file_path.write_bytes(b'audio')
+            await asyncio.sleep(0.1)
+            staging_file_path.replace(audio_file_path)
+            with directory_path.joinpath('downloads.log').open('a') as downloads_log:
+                downloads_log.write(f'{os.getpid()}\n')
+        with directory_path.joinpath('holders.log').open('a') as holders_log:
+            holders_log.write(f'released {os.getpid()}\n')
+    finally:
+        await file_audio_download_lock.release(source_id)
+
+
+@pytest.fixture(scope='function')
+def file_audio_download_lock(tmp_path: Path) -> FileAudioDownloadLock:
+    return FileAudioDownloadLock(directory_path=tmp_path, lease_seconds=1, poll_interval_seconds=0.01)
+
+
+def test_concurrent_processes_download_audio_once(tmp_path: Path) -> None:
+    processes: list[SpawnProcess] = [
+        multiprocessing.get_context('spawn').Process(
+            target=_download_audio_with_lock,
+            kwargs={'directory_path': tmp_path, 'source_id': 'test_source_id'}
+        )
+        for _ in range(4)
+    ]
+    process: SpawnProcess
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join(timeout=30)
+        assert process.exitcode == 0
+    holders: list[str] = tmp_path.joinpath('holders.log').read_text().splitlines()
+    assert len(holders) == 8
+    acquired: str
+    released: str
+    for acquired, released in zip(holders[::2], holders[1::2]):
+        assert acquired.startswith('acquired ')
+        assert released == acquired.replace('acquired', 'released')
+    assert len(tmp_path.joinpath('downloads.log').read_text().splitlines()) == 1
+    assert tmp_path.joinpath('test_source_id.ogg').read_bytes() == b'audio'
+    assert list(tmp_path.joinpath('.locks').iterdir()) == []
+
+
+@pytest.mark.asyncio
+async def test_lock_held_elsewhere_is_not_acquired_without_blocking(
+    file_audio_download_lock: FileAudioDownloadLock,
+    tmp_path: Path
+) -> None:
+    other_file_audio_download_lock: FileAudioDownloadLock = FileAudioDownloadLock(
+        directory_path=tmp_path,
+        lease_seconds=1,
+        poll_interval_seconds=0.01
+    )
+    assert await other_file_audio_download_lock.acquire('test_source_id')
+    assert not await file_audio_download_lock.acquire('test_source_id', blocking=False)
+    await other_file_audio_download_lock.release('test_source_id')
+    assert await file_audio_download_lock.acquire('test_source_id', blocking=False)
+    await file_audio_download_lock.release('test_source_id')
+
+
+@pytest.mark.asyncio
+async def test_renewed_lock_is_not_broken(file_audio_download_lock: FileAudioDownloadLock, tmp_path: Path) -> None:
+    other_file_audio_download_lock: FileAudioDownloadLock = FileAudioDownloadLock(
+        directory_path=tmp_path,
+        lease_seconds=0.3,
+        poll_interval_seconds=0.01
+    )
+    assert await other_file_audio_download_lock.acquire('test_source_id')
+    await asyncio.sleep(0.6)
+    assert not await file_audio_download_lock.acquire('test_source_id', blocking=False)
+    await other_file_audio_download_lock.release('test_source_id')
+
+
+@pytest.mark.asyncio
+async def test_stale_lock_is_broken(file_audio_download_lock: FileAudioDownloadLock, tmp_path: Path) -> None:
+    stale_lock_file_path: Path = tmp_path.joinpath('.locks', 'test_source_id.lock')
+    stale_lock_file_path.parent.mkdir()
+    stale_lock_file_path.write_text('crashed-host:1')
+    os.utime(stale_lock_file_path, (time.time() - 10, time.time() - 10))
+    assert await file_audio_download_lock.acquire('test_source_id', blocking=False)
+    assert stale_lock_file_path.read_text() != 'crashed-host:1'
+    await file_audio_download_lock.release('test_source_id')
+    assert list(stale_lock_file_path.parent.iterdir()) == []
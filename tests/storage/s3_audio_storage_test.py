@@ -0,0 +1,93 @@
+import hashlib
+import os
+from pathlib import Path
+from typing import Generator
+from uuid import uuid4
+
+import httpx
+import pytest
+
+from audio_nest.domain.audio import Audio
+from audio_nest.domain.audio_codec import AudioCodec
+from storage.s3_audio_storage import S3AudioStorage
+
+
+test_endpoint_url: str | None = os.environ.get('S3_TEST_ENDPOINT_URL')
+pytestmark = pytest.mark.skipif(test_endpoint_url is None, reason='S3_TEST_ENDPOINT_URL not set')
+
+
+@pytest.fixture(scope='function')
+def s3_audio_storage(tmp_path: Path) -> Generator[S3AudioStorage, None, None]:
+    s3_audio_storage: S3AudioStorage = S3AudioStorage(
+        bucket_name=f'audio-nest-test-{uuid4().hex}',
+        staging_directory_path=tmp_path.joinpath('staging'),
+        endpoint_url=test_endpoint_url,
+        region_name='us-east-1',
+        access_key_id=os.environ.get('S3_TEST_ACCESS_KEY_ID', 'minioadmin'),
+        secret_access_key=os.environ.get('S3_TEST_SECRET_ACCESS_KEY', 'minioadmin'),
+        key_prefix='audio/',
+        multipart_threshold_bytes=5 * 1024 * 1024,
+        multipart_chunk_size_bytes=5 * 1024 * 1024
+    )
+    s3_audio_storage._client.create_bucket(Bucket=s3_audio_storage._bucket_name)
+    yield s3_audio_storage
+    for s3_object in s3_audio_storage._client.list_objects_v2(Bucket=s3_audio_storage._bucket_name).get('Contents', []):
+        s3_audio_storage._client.delete_object(Bucket=s3_audio_storage._bucket_name, Key=s3_object['Key'])
+    s3_audio_storage._client.delete_bucket(Bucket=s3_audio_storage._bucket_name)
+
+
+@pytest.mark.asyncio
+async def test_audio_file_is_uploaded_in_parts_and_served_from_presigned_url(
+    s3_audio_storage: S3AudioStorage,
+    tmp_path: Path
+) -> None:
+    test_content: bytes = os.urandom(6 * 1024 * 1024)
+    test_content_hash: str = hashlib.sha256(test_content).hexdigest()
+    test_audio: Audio = Audio(
+        source_id='test_source_id',
+        file_path=tmp_path.joinpath('test_audio.ogg'),
+        bit_rate_kbps=320,
+        codec=AudioCodec.vorbis
+    )
+    test_audio.file_path.write_bytes(test_content)
+    result: Path = await s3_audio_storage.store_audio_file(test_audio)
+    assert result == Path(f'audio/{test_content_hash[:2]}/{test_content_hash[2:4]}/{test_content_hash}.ogg')
+    assert not test_audio.file_path.exists()
+    assert await s3_audio_storage.is_audio_file_stored(result)
+    head_object: dict = s3_audio_storage._client.head_object(Bucket=s3_audio_storage._bucket_name, Key=str(result))
+    assert head_object['ETag'].strip('"').endswith('-2')
+    audio_file_url: str | None = await s3_audio_storage.get_audio_file_url(result)
+    assert audio_file_url is not None
+    async with httpx.AsyncClient() as client:
+        response: httpx.Response = await client.get(audio_file_url, headers={'Range': 'bytes=0-99'})
+    assert response.status_code == 206
+    assert response.content == test_content[:100]
+    assert b''.join([chunk async for chunk in s3_audio_storage.read_audio_file(result)]) == test_content
+    local_file_path: Path
+    async with s3_audio_storage.open_local_audio_file(result) as local_file_path:
+        assert local_file_path.read_bytes() == test_content
+    assert not local_file_path.exists()
+    assert await s3_audio_storage.delete_audio_file(result) == len(test_content)
+    assert not await s3_audio_storage.is_audio_file_stored(result)
+    assert await s3_audio_storage.delete_audio_file(result) == 0
+
+
+@pytest.mark.asyncio
+async def test_audio_file_with_stored_content_is_not_uploaded_again(
+    s3_audio_storage: S3AudioStorage,
+    tmp_path: Path
+) -> None:
+    results: list[Path] = []
+    i: int
+    for i in range(2):
+        test_audio: Audio = Audio(
+            source_id=f'test_source_id_{i}',
+            file_path=tmp_path.joinpath(f'test_audio_{i}.ogg'),
+            bit_rate_kbps=320,
+            codec=AudioCodec.vorbis
+        )
+        test_audio.file_path.write_bytes(b'audio')
+        results.append(await s3_audio_storage.store_audio_file(test_audio))
+        assert not test_audio.file_path.exists()
+    assert results[0] == results[1]
+    assert s3_audio_storage._client.list_objects_v2(Bucket=s3_audio_storage._bucket_name)['KeyCount'] == 1
@@ -0,0 +1,59 @@
+import hashlib
+from pathlib import Path
+
+import pytest
+
+from audio_nest.domain.audio import Audio
+from audio_nest.domain.audio_codec import AudioCodec
+from storage.flat_audio_file_layout import FlatAudioFileLayout
+from storage.sharded_audio_file_layout import ShardedAudioFileLayout
+
+
+@pytest.fixture(scope='function')
+def sharded_audio_file_layout(tmp_path: Path) -> ShardedAudioFileLayout:
+    return ShardedAudioFileLayout(tmp_path)
+
+
+@pytest.mark.asyncio
+async def test_audio_file_is_moved_to_content_hash_shard(
+    sharded_audio_file_layout: ShardedAudioFileLayout,
+    tmp_path: Path
+) -> None:
+    test_content: bytes = b'test_content'
+    test_content_hash: str = hashlib.sha256(test_content).hexdigest()
+    test_audio: Audio = Audio(
+        source_id='test_source_id',
+        file_path=tmp_path.joinpath('test_source_id.ogg'),
+        bit_rate_kbps=320,
+        codec=AudioCodec.vorbis
+    )
+    test_audio.file_path.write_bytes(test_content)
+    result: Path = await sharded_audio_file_layout.store_audio_file(test_audio)
+    assert result == tmp_path.joinpath(test_content_hash[:2], test_content_hash[2:4], f'{test_content_hash}.ogg')
+    assert result.read_bytes() == test_content
+    assert not test_audio.file_path.exists()
+    test_audio.file_path = result
+    assert await sharded_audio_file_layout.store_audio_file(test_audio) == result
+    assert await FlatAudioFileLayout(tmp_path).store_audio_file(test_audio) == tmp_path.joinpath('test_source_id.ogg')
+
+
+@pytest.mark.asyncio
+async def test_audio_file_with_stored_content_is_deduplicated(
+    sharded_audio_file_layout: ShardedAudioFileLayout,
+    tmp_path: Path
+) -> None:
+    test_audio_list: list[Audio] = [
+        Audio(
+            source_id=f'test_source_id_{i}',
+            file_path=tmp_path.joinpath(f'test_source_id_{i}.ogg'),
+            bit_rate_kbps=320,
+            codec=AudioCodec.vorbis
+        )
+        for i in range(2)
+    ]
+    audio: Audio
+    for audio in test_audio_list:
+        audio.file_path.write_bytes(b'test_content')
+    results: list[Path] = [await sharded_audio_file_layout.store_audio_file(audio) for audio in test_audio_list]
+    assert results[0] == results[1]
+    assert [file_path for file_path in tmp_path.rglob('*') if file_path.is_file()] == [results[0]]
@@ -0,0 +1,167 @@
+from pathlib import Path
+from typing import Any, Callable, Generator
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from prometheus_client import REGISTRY
+
+from audio_nest.domain.audio import Audio
+from audio_nest.domain.audio_codec import AudioCodec
+from audio_nest.domain.audio_stream import AudioStream
+from audio_nest.services.audio_download_worker_pool import AudioDownloadWorkerPool
+from audio_nest.services.i_stage_timer import IStageTimer
+from audio_nest.services.i_tracer import ITracer
+from prometheus.prometheus_stage_timer import PrometheusStageTimer
+from youtube.youtube_audio_downloader import YoutubeAudioDownloader
+
+
+def get_stage_count(stage: str) -> float:
+    return REGISTRY.get_sample_value('audio_nest_stage_duration_seconds_count', {'stage': stage}) or 0.0
+
+
+def get_stage_in_progress(stage: str) -> float:
+    return REGISTRY.get_sample_value('audio_nest_stages_in_progress', {'stage': stage}) or 0.0
+
+
+@pytest.fixture(scope='function')
+def youtube_downloader_mock() -> Generator[MagicMock, None, None]:
+    with patch('youtube.youtube_audio_downloader.YoutubeDL') as youtube_downloader_class_mock:
+        yield youtube_downloader_class_mock.return_value.__enter__.return_value
+
+
+@pytest.fixture(scope='function')
+def stage_timer_mock() -> MagicMock:
+    return MagicMock(spec=IStageTimer)
+
+
+@pytest.fixture(scope='function')
+def tracer_mock() -> MagicMock:
+    return MagicMock(spec=ITracer)
+
+
+@pytest.fixture(scope='function')
+def youtube_audio_downloader(
+    stage_timer_mock: MagicMock,
+    tracer_mock: MagicMock,
+    tmp_path: Path
+) -> YoutubeAudioDownloader:
+    return YoutubeAudioDownloader(
+        bit_rate_kbps=128,
+        codec=AudioCodec.opus,
+        ffmpeg_path=Path('.'),
+        download_directory_path=tmp_path,
+        worker_pool=AudioDownloadWorkerPool(max_concurrency=1, stage_timer=PrometheusStageTimer()),
+        stage_timer=stage_timer_mock,
+        tracer=tracer_mock
+    )
+
+
+@pytest.mark.asyncio
+async def test_audio_in_target_codec_is_remuxed(
+    youtube_audio_downloader: YoutubeAudioDownloader,
+    youtube_downloader_mock: MagicMock,
+    tmp_path: Path
+) -> None:
+    test_youtube_video: dict[str, Any] = {'acodec': 'opus', 'abr': 135.2}
+    youtube_downloader_mock.extract_info.return_value = test_youtube_video
+    youtube_downloader_mock.process_ie_result.return_value = test_youtube_video
+    result: Audio = await youtube_audio_downloader.download_audio_from_source('test_video_id')
+    assert result == Audio(
+        source_id='test_video_id',
+        file_path=result.file_path,
+        bit_rate_kbps=135,
+        codec=AudioCodec.opus
+    )
+    assert result.file_path.parent == tmp_path
+    assert result.file_path.name.startswith('test_video_id.')
+    assert result.file_path.suffix == '.opus'
+    assert youtube_audio_downloader.remuxed_audio_count == 1
+    assert youtube_audio_downloader.transcoded_audio_count == 0
+
+
+@pytest.mark.asyncio
+async def test_audio_in_other_codec_is_transcoded(
+    youtube_audio_downloader: YoutubeAudioDownloader,
+    youtube_downloader_mock: MagicMock,
+    tmp_path: Path
+) -> None:
+    test_youtube_video: dict[str, Any] = {'acodec': 'mp4a.40.2', 'abr': 129.5}
+    youtube_downloader_mock.extract_info.return_value = test_youtube_video
+    youtube_downloader_mock.process_ie_result.return_value = test_youtube_video
+    result: Audio = await youtube_audio_downloader.download_audio_from_source('test_video_id')
+    assert result.bit_rate_kbps == 128
+    assert youtube_audio_downloader.remuxed_audio_count == 0
+    assert youtube_audio_downloader.transcoded_audio_count == 1
+
+
+@pytest.mark.asyncio
+async def test_audio_is_streamed_within_timed_stage(
+    youtube_downloader_mock: MagicMock,
+    tracer_mock: MagicMock,
+    tmp_path: Path
+) -> None:
+    youtube_audio_downloader: YoutubeAudioDownloader = YoutubeAudioDownloader(
+        bit_rate_kbps=128,
+        codec=AudioCodec.opus,
+        ffmpeg_path=Path('.'),
+        download_directory_path=tmp_path,
+        worker_pool=AudioDownloadWorkerPool(max_concurrency=1, stage_timer=PrometheusStageTimer()),
+        stage_timer=PrometheusStageTimer(),
+        tracer=tracer_mock
+    )
+    youtube_downloader_mock.extract_info.return_value = {
+        'acodec': 'opus',
+        'abr': 135.2,
+        'url': 'https://test.googlevideo.com/audio',
+        'http_headers': {'User-Agent': 'test'}
+    }
+    with patch(
+        'youtube.youtube_audio_downloader.asyncio.create_subprocess_exec',
+        new_callable=AsyncMock
+    ) as create_subprocess_exec_mock:
+        ffmpeg_process_mock: MagicMock = create_subprocess_exec_mock.return_value
+        ffmpeg_process_mock.stdout.read = AsyncMock(side_effect=[b'test_chunk', b''])
+        ffmpeg_process_mock.wait = AsyncMock(return_value=0)
+        ffmpeg_process_mock.returncode = 0
+        audio_stream: AudioStream = youtube_audio_downloader.stream_audio_from_source('test_video_id')
+        assert [chunk async for chunk in audio_stream.chunks] == [b'test_chunk']
+    assert audio_stream.audio.bit_rate_kbps == 135
+
+
+@pytest.mark.asyncio
+async def test_download_and_transcoding_are_timed_as_separate_stages(tracer_mock: MagicMock, tmp_path: Path) -> None:
+    youtube_audio_downloader: YoutubeAudioDownloader = YoutubeAudioDownloader(
+        bit_rate_kbps=128,
+        codec=AudioCodec.opus,
+        ffmpeg_path=Path('.'),
+        download_directory_path=tmp_path,
+        worker_pool=AudioDownloadWorkerPool(max_concurrency=1, stage_timer=PrometheusStageTimer()),
+        stage_timer=PrometheusStageTimer(),
+        tracer=tracer_mock
+    )
+    test_youtube_video: dict[str, Any] = {'acodec': 'mp4a.40.2', 'abr': 129.5}
+    stage_counts: dict[str, float] = {
+        stage: get_stage_count(stage) for stage in ('youtube_download', 'youtube_transcode')
+    }
+    with patch('youtube.youtube_audio_downloader.YoutubeDL') as youtube_downloader_class_mock:
+        youtube_downloader_mock: MagicMock = youtube_downloader_class_mock.return_value.__enter__.return_value
+        youtube_downloader_mock.extract_info.return_value = test_youtube_video
+
+        def process_youtube_video(youtube_video: dict[str, Any], download: bool) -> dict[str, Any]:
+            assert get_stage_in_progress('youtube_download') == 1
+            youtube_downloader_options: dict[str, Any] = youtube_downloader_class_mock.call_args.args[0]
+            status: str
+            for status in ('started', 'finished'):
+                hook: Callable[[dict[str, Any]], None]
+                for hook in youtube_downloader_options['postprocessor_hooks']:
+                    hook({'status': status, 'postprocessor': 'ExtractAudio'})
+                if status == 'started':
+                    assert get_stage_in_progress('youtube_download') == 0
+                    assert get_stage_in_progress('youtube_transcode') == 1
+            return youtube_video
+
+        youtube_downloader_mock.process_ie_result.side_effect = process_youtube_video
+        await youtube_audio_downloader.download_audio_from_source('test_video_id')
+    assert get_stage_count('youtube_download') == stage_counts['youtube_download'] + 1
+    assert get_stage_count('youtube_transcode') == stage_counts['youtube_transcode'] + 1
+    assert get_stage_in_progress('youtube_transcode') == 0